@@ -26,6 +26,10 @@
 #define HOMEINV_BASE (0x30000000u)
 #endif
 
+#ifdef HOMEINV_HOST_SIM
+// Host build against verify/model/virtual_chip.py (see fw/host/).
+#include "../host/homeinv_mmio_host.h"
+#else
 static inline void mmio_write32(uint32_t addr, uint32_t v) {
     *(volatile uint32_t *)addr = v;
 }
@@ -33,6 +37,7 @@ static inline void mmio_write32(uint32_t addr, uint32_t v) {
 static inline uint32_t mmio_read32(uint32_t addr) {
     return *(volatile uint32_t *)addr;
 }
+#endif // HOMEINV_HOST_SIM
 
 static inline uint32_t homeinv_read(uint32_t off) {
     return mmio_read32(HOMEINV_BASE + off);
@@ -90,6 +95,7 @@ static size_t adc_fifo_drain(uint32_t *out_words, size_t max_words) {
     return n;
 }
 
+#ifdef USE_REAL_ADC_INGEST
 // Wait (with a bounded spin) for CAPTURE_BUSY to assert at least once and then deassert.
 // This helps firmware avoid racing on slow SPI capture.
 static int adc_wait_capture_done(uint32_t timeout_iters) {
@@ -108,6 +114,7 @@ static int adc_wait_capture_done(uint32_t timeout_iters) {
 
     return -1;
 }
+#endif // USE_REAL_ADC_INGEST
 
 // -----------------------------------------------------------------------------
 // Example entrypoint
@@ -144,6 +151,12 @@ void homeinv_example_adc_fifo_dump(void) {
     size_t n = adc_fifo_drain(words, sizeof(words) / sizeof(words[0]));
 
     // TODO: print/log `n` and `words[]` using your platform logging.
+    // Logging one word per line as "fifo: %08X" lets the host decode the UART
+    // capture directly, ignoring any other log output:
+    //   python3 fw/tools/decode_adc_fifo.py --extract hex8 --line-prefix fifo: uart.log
+#ifdef HOMEINV_HOST_SIM
+    for (size_t i = 0; i < n; i++) printf("fifo: %08X\n", (unsigned)words[i]);
+#endif
     (void)n;
     (void)words;
 
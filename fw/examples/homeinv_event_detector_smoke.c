@@ -25,6 +25,10 @@
 #define HOMEINV_BASE (0x30000000u)
 #endif
 
+#ifdef HOMEINV_HOST_SIM
+// Host build against verify/model/virtual_chip.py (see fw/host/).
+#include "../host/homeinv_mmio_host.h"
+#else
 static inline void mmio_write32(uint32_t addr, uint32_t v) {
     *(volatile uint32_t *)addr = v;
 }
@@ -32,6 +36,7 @@ static inline void mmio_write32(uint32_t addr, uint32_t v) {
 static inline uint32_t mmio_read32(uint32_t addr) {
     return *(volatile uint32_t *)addr;
 }
+#endif // HOMEINV_HOST_SIM
 
 static inline uint32_t homeinv_read(uint32_t off) {
     return mmio_read32(HOMEINV_BASE + off);
@@ -79,6 +84,10 @@ void homeinv_example_event_detector_smoke(void) {
     uint32_t ts0  = homeinv_read(HOMEINV_REG_EVT_LAST_TS_CH0);
 
     // TODO: print/log c0, d0, ts_g, ts0.
+#ifdef HOMEINV_HOST_SIM
+    printf("EVT_COUNT_CH0=%u EVT_LAST_DELTA_CH0=%u EVT_LAST_TS=%u EVT_LAST_TS_CH0=%u\n", (unsigned)c0, (unsigned)d0,
+           (unsigned)ts_g, (unsigned)ts0);
+#endif
     (void)c0;
     (void)d0;
     (void)ts_g;
@@ -22,6 +22,10 @@
 #define HOMEINV_BASE 0x30000000u
 #endif
 
+#ifdef HOMEINV_HOST_SIM
+// Host build against verify/model/virtual_chip.py (see fw/host/).
+#include "../host/homeinv_mmio_host.h"
+#else
 static inline void mmio_write32(uint32_t addr, uint32_t data) {
   volatile uint32_t *p = (volatile uint32_t *)addr;
   *p = data;
@@ -31,6 +35,7 @@ static inline uint32_t mmio_read32(uint32_t addr) {
   volatile const uint32_t *p = (volatile const uint32_t *)addr;
   return *p;
 }
+#endif // HOMEINV_HOST_SIM
 
 static inline uint32_t homeinv_addr(uint32_t reg_off) {
   return (uint32_t)(HOMEINV_BASE + reg_off);
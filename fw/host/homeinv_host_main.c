@@ -0,0 +1,110 @@
+// homeinv_host_main.c
+//
+// Host driver for the fw/examples snippets against the virtual chip
+// (verify/model/virtual_chip.py). Build with `make -C fw/host`.
+//
+//   homeinv_host reg-smoke
+//   homeinv_host adc-fifo-dump          (prints "fifo: %08X" lines for decode_adc_fifo.py)
+//   homeinv_host event-smoke
+//   homeinv_host drain SECONDS [POLL_US] [burst]
+//
+// `drain` is a firmware-style streaming loop: one CTRL.START, then poll
+// ADC_FIFO_STATUS every POLL_US microseconds and pop LEVEL_WORDS words (one
+// read each), clearing OVERRUN when it is seen. With `burst`, each poll is a
+// single DRAIN request (STATUS read + pops, see fw/tools/homeinv_txn.py).
+// Run the chip with --mode stream to exercise it at a given ODR.
+
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include "../include/home_inventory_regmap.h"
+#include "homeinv_mmio_host.h"
+
+#ifndef HOMEINV_BASE
+#define HOMEINV_BASE (0x30000000u)
+#endif
+
+int homeinv_reg_smoke(void);
+void homeinv_example_adc_fifo_dump(void);
+void homeinv_example_event_detector_smoke(void);
+
+static double now_s(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+}
+
+static void sleep_us(unsigned us) {
+    struct timespec ts = {(time_t)(us / 1000000u), (long)(us % 1000000u) * 1000L};
+    nanosleep(&ts, NULL);
+}
+
+static int drain(double seconds, unsigned poll_us, int burst) {
+    const uint32_t st_adr = HOMEINV_BASE + HOMEINV_REG_ADC_FIFO_STATUS;
+    const uint32_t data_adr = HOMEINV_BASE + HOMEINV_REG_ADC_FIFO_DATA;
+    uint32_t words[64];
+    unsigned long long n_words = 0, polls = 0, overruns = 0;
+
+    mmio_write32(HOMEINV_BASE + HOMEINV_REG_CTRL, HOMEINV_CTRL_ENABLE_MASK | HOMEINV_CTRL_START_MASK);
+
+    const double t_end = now_s() + seconds;
+    while (now_s() < t_end) {
+        uint32_t st, level;
+        if (burst) {
+            // STATUS read and pops in one request (homeinv_txn.py DRAIN).
+            level = (uint32_t)homeinv_host_drain(st_adr, data_adr, words, sizeof(words) / sizeof(words[0]), &st);
+        } else {
+            st = mmio_read32(st_adr);
+            level = (st & HOMEINV_ADC_FIFO_STATUS_LEVEL_WORDS_MASK) >> HOMEINV_ADC_FIFO_STATUS_LEVEL_WORDS_SHIFT;
+            if (level > sizeof(words) / sizeof(words[0])) level = sizeof(words) / sizeof(words[0]);
+            for (uint32_t i = 0; i < level; i++) words[i] = mmio_read32(data_adr);
+        }
+        polls++;
+        if (st & HOMEINV_ADC_FIFO_STATUS_OVERRUN_MASK) {
+            overruns++;
+            mmio_write32(st_adr, HOMEINV_ADC_FIFO_STATUS_OVERRUN_MASK);
+        }
+        n_words += level;
+        if (poll_us) sleep_us(poll_us);
+    }
+
+    printf("drain: %llu words (%llu frames) in %llu polls, %llu overrun(s) seen\n", n_words, n_words / 9u, polls,
+           overruns);
+    homeinv_host_stats(stdout);
+    return overruns ? 1 : 0;
+}
+
+static int usage(const char *argv0) {
+    fprintf(stderr, "usage: %s reg-smoke | adc-fifo-dump | event-smoke | drain SECONDS [POLL_US] [burst]\n", argv0);
+    return 2;
+}
+
+int main(int argc, char **argv) {
+    if (argc < 2) return usage(argv[0]);
+
+    if (strcmp(argv[1], "reg-smoke") == 0) {
+        int rc = homeinv_reg_smoke();
+        homeinv_host_flush();
+        printf("reg-smoke: %s (rc=%d)\n", rc ? "FAIL" : "PASS", rc);
+        return rc;
+    }
+    if (strcmp(argv[1], "adc-fifo-dump") == 0) {
+        homeinv_example_adc_fifo_dump();
+        homeinv_host_flush();
+        return 0;
+    }
+    if (strcmp(argv[1], "event-smoke") == 0) {
+        homeinv_example_event_detector_smoke();
+        homeinv_host_flush();
+        return 0;
+    }
+    if (strcmp(argv[1], "drain") == 0 && argc >= 3) {
+        unsigned poll_us = argc >= 4 ? (unsigned)strtoul(argv[3], NULL, 0) : 100u;
+        int burst = argc >= 5 && strcmp(argv[4], "burst") == 0;
+        return drain(strtod(argv[2], NULL), poll_us, burst);
+    }
+    return usage(argv[0]);
+}
@@ -0,0 +1,183 @@
+// homeinv_mmio_host.c
+//
+// Unix-socket client for verify/model/virtual_chip.py (see homeinv_mmio_host.h).
+//
+// Request: 12 bytes little-endian {u8 op, u8 sel, u16 count, u32 addr, u32 data},
+// the batched transaction format of fw/tools/homeinv_txn.py. READ returns one
+// u32, READ_N returns count u32, DRAIN returns STATUS + min(LEVEL_WORDS, count)
+// u32, STATS returns u32 length + JSON, WRITE has no reply.
+
+#include "homeinv_mmio_host.h"
+
+#include <errno.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/socket.h>
+#include <sys/un.h>
+#include <unistd.h>
+
+#define OP_READ 1u
+#define OP_WRITE 2u
+#define OP_READ_N 3u
+#define OP_STATS 4u
+#define OP_DRAIN 6u
+
+#define LEVEL_WORDS_MASK 0x0000FFFFu
+
+#define REQ_BYTES 12u
+#define WBUF_REQS 256u
+
+static int g_fd = -1;
+static uint8_t g_wbuf[WBUF_REQS * REQ_BYTES];
+static size_t g_wlen;
+
+static void die(const char *what) {
+    fprintf(stderr, "homeinv_mmio_host: %s: %s\n", what, strerror(errno));
+    exit(2);
+}
+
+static int conn(void) {
+    if (g_fd >= 0) return g_fd;
+
+    const char *path = getenv("HOMEINV_SOCK");
+    if (!path || !*path) path = "/tmp/homeinv_vchip.sock";
+
+    struct sockaddr_un sa;
+    memset(&sa, 0, sizeof(sa));
+    sa.sun_family = AF_UNIX;
+    if (strlen(path) >= sizeof(sa.sun_path)) {
+        errno = ENAMETOOLONG;
+        die(path);
+    }
+    strcpy(sa.sun_path, path);
+
+    g_fd = socket(AF_UNIX, SOCK_STREAM, 0);
+    if (g_fd < 0) die("socket");
+    if (connect(g_fd, (struct sockaddr *)&sa, sizeof(sa)) != 0) {
+        fprintf(stderr, "homeinv_mmio_host: cannot connect to %s (is verify/model/virtual_chip.py running?)\n", path);
+        die("connect");
+    }
+    return g_fd;
+}
+
+static void put_u32(uint8_t *p, uint32_t v) {
+    p[0] = (uint8_t)v;
+    p[1] = (uint8_t)(v >> 8);
+    p[2] = (uint8_t)(v >> 16);
+    p[3] = (uint8_t)(v >> 24);
+}
+
+static uint32_t get_u32(const uint8_t *p) {
+    return (uint32_t)p[0] | ((uint32_t)p[1] << 8) | ((uint32_t)p[2] << 16) | ((uint32_t)p[3] << 24);
+}
+
+static void pack(uint8_t *p, uint8_t op, uint8_t sel, uint16_t count, uint32_t addr, uint32_t data) {
+    p[0] = op;
+    p[1] = sel;
+    p[2] = (uint8_t)count;
+    p[3] = (uint8_t)(count >> 8);
+    put_u32(p + 4, addr);
+    put_u32(p + 8, data);
+}
+
+static void send_all(const uint8_t *p, size_t n) {
+    int fd = conn();
+    while (n) {
+        ssize_t k = send(fd, p, n, 0);
+        if (k < 0) {
+            if (errno == EINTR) continue;
+            die("send");
+        }
+        p += k;
+        n -= (size_t)k;
+    }
+}
+
+static void recv_all(uint8_t *p, size_t n) {
+    int fd = conn();
+    while (n) {
+        ssize_t k = recv(fd, p, n, 0);
+        if (k == 0) {
+            errno = ECONNRESET;
+            die("recv");
+        }
+        if (k < 0) {
+            if (errno == EINTR) continue;
+            die("recv");
+        }
+        p += k;
+        n -= (size_t)k;
+    }
+}
+
+// Queue a request behind the buffered writes; flushes when the buffer is full.
+static void queue(uint8_t op, uint8_t sel, uint16_t count, uint32_t addr, uint32_t data) {
+    if (g_wlen + REQ_BYTES > sizeof(g_wbuf)) homeinv_host_flush();
+    pack(g_wbuf + g_wlen, op, sel, count, addr, data);
+    g_wlen += REQ_BYTES;
+}
+
+void homeinv_host_flush(void) {
+    if (g_wlen) {
+        send_all(g_wbuf, g_wlen);
+        g_wlen = 0;
+    }
+}
+
+void mmio_write32(uint32_t addr, uint32_t v) {
+    queue(OP_WRITE, 0xFu, 0u, addr, v);
+}
+
+uint32_t mmio_read32(uint32_t addr) {
+    uint8_t b[4];
+    queue(OP_READ, 0xFu, 0u, addr, 0u);
+    homeinv_host_flush();
+    recv_all(b, sizeof(b));
+    return get_u32(b);
+}
+
+void homeinv_host_read_n(uint32_t addr, uint32_t *out, size_t n) {
+    static uint8_t b[4u * 0xFFFFu];
+    while (n) {
+        uint16_t k = (uint16_t)(n > 0xFFFFu ? 0xFFFFu : n);
+        queue(OP_READ_N, 0xFu, k, addr, 0u);
+        homeinv_host_flush();
+        recv_all(b, 4u * k);
+        for (uint16_t i = 0; i < k; i++) out[i] = get_u32(b + 4u * i);
+        out += k;
+        n -= k;
+    }
+}
+
+size_t homeinv_host_drain(uint32_t status_addr, uint32_t data_addr, uint32_t *out, size_t max_words, uint32_t *status) {
+    uint8_t b[4u * 64u];
+    uint16_t k = (uint16_t)(max_words > 0xFFFFu ? 0xFFFFu : max_words);
+    queue(OP_DRAIN, 0u, k, data_addr, status_addr);  // sel bit0=0: any word count
+    homeinv_host_flush();
+    recv_all(b, 4u);
+    uint32_t st = get_u32(b);
+    if (status) *status = st;
+    size_t n = st & LEVEL_WORDS_MASK;
+    if (n > k) n = k;
+    for (size_t done = 0; done < n;) {
+        size_t c = n - done > 64u ? 64u : n - done;
+        recv_all(b, 4u * c);
+        for (size_t i = 0; i < c; i++) out[done + i] = get_u32(b + 4u * i);
+        done += c;
+    }
+    return n;
+}
+
+void homeinv_host_stats(FILE *f) {
+    uint8_t b[4];
+    queue(OP_STATS, 0u, 0u, 0u, 0u);
+    homeinv_host_flush();
+    recv_all(b, sizeof(b));
+    uint32_t n = get_u32(b);
+    char *js = malloc((size_t)n + 1u);
+    if (!js) die("malloc");
+    recv_all((uint8_t *)js, n);
+    js[n] = '\0';
+    fprintf(f, "%s\n", js);
+    free(js);
+}
@@ -0,0 +1,45 @@
+// homeinv_mmio_host.h
+//
+// Host (Linux/macOS) replacement for the examples' MMIO glue. Building an
+// example with -DHOMEINV_HOST_SIM routes mmio_read32/mmio_write32 to the
+// virtual chip (verify/model/virtual_chip.py) over a Unix socket instead of
+// dereferencing a bus address.
+//
+// The socket path comes from $HOMEINV_SOCK (default /tmp/homeinv_vchip.sock).
+// Writes are posted and buffered; any read flushes them first, so the order of
+// accesses seen by the virtual chip is exactly program order.
+
+#ifndef HOMEINV_MMIO_HOST_H
+#define HOMEINV_MMIO_HOST_H
+
+#include <stddef.h>
+#include <stdint.h>
+#include <stdio.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+void mmio_write32(uint32_t addr, uint32_t v);
+uint32_t mmio_read32(uint32_t addr);
+
+// n back-to-back reads of one address in a single request (e.g. a FIFO drain
+// of LEVEL_WORDS from ADC_FIFO_DATA). Same bus sequence as n mmio_read32 calls.
+void homeinv_host_read_n(uint32_t addr, uint32_t *out, size_t n);
+
+// One conditional drain: read LEVEL_WORDS from status_addr, then pop
+// min(level, max_words) words from data_addr, all in one request. Returns the
+// number of words stored in `out`; *status gets the STATUS word that was read.
+size_t homeinv_host_drain(uint32_t status_addr, uint32_t data_addr, uint32_t *out, size_t max_words, uint32_t *status);
+
+// Send buffered writes now.
+void homeinv_host_flush(void);
+
+// Print the virtual chip's statistics (JSON) to `f`.
+void homeinv_host_stats(FILE *f);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // HOMEINV_MMIO_HOST_H
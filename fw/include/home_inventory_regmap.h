@@ -91,6 +91,31 @@
 #define HOMEINV_REG_EVT_THRESH_CH6   0x00000498u
 #define HOMEINV_REG_EVT_THRESH_CH7   0x0000049Cu
 
+// -----------------------------
+// Register arrays (NAME(i) = byte offset of element i)
+// -----------------------------
+#define HOMEINV_REG_ADC_RAW_CH(i)            (0x00000210u + 4u * (uint32_t)(i))
+#define HOMEINV_REG_ADC_RAW_CH_COUNT         8u
+#define HOMEINV_REG_ADC_RAW_CH_STRIDE        4u
+#define HOMEINV_REG_TARE_CH(i)               (0x00000300u + 4u * (uint32_t)(i))
+#define HOMEINV_REG_TARE_CH_COUNT            8u
+#define HOMEINV_REG_TARE_CH_STRIDE           4u
+#define HOMEINV_REG_SCALE_CH(i)              (0x00000320u + 4u * (uint32_t)(i))
+#define HOMEINV_REG_SCALE_CH_COUNT           8u
+#define HOMEINV_REG_SCALE_CH_STRIDE          4u
+#define HOMEINV_REG_EVT_COUNT_CH(i)          (0x00000400u + 4u * (uint32_t)(i))
+#define HOMEINV_REG_EVT_COUNT_CH_COUNT       8u
+#define HOMEINV_REG_EVT_COUNT_CH_STRIDE      4u
+#define HOMEINV_REG_EVT_LAST_DELTA_CH(i)     (0x00000420u + 4u * (uint32_t)(i))
+#define HOMEINV_REG_EVT_LAST_DELTA_CH_COUNT  8u
+#define HOMEINV_REG_EVT_LAST_DELTA_CH_STRIDE 4u
+#define HOMEINV_REG_EVT_LAST_TS_CH(i)        (0x00000448u + 4u * (uint32_t)(i))
+#define HOMEINV_REG_EVT_LAST_TS_CH_COUNT     8u
+#define HOMEINV_REG_EVT_LAST_TS_CH_STRIDE    4u
+#define HOMEINV_REG_EVT_THRESH_CH(i)         (0x00000480u + 4u * (uint32_t)(i))
+#define HOMEINV_REG_EVT_THRESH_CH_COUNT      8u
+#define HOMEINV_REG_EVT_THRESH_CH_STRIDE     4u
+
 // -----------------------------
 // Register reset values
 // -----------------------------
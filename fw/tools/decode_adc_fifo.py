@@ -13,27 +13,122 @@ This tool helps during bring-up when you have a raw dump of FIFO reads (from a
 logic analyzer log, UART printf, etc.) and want to sanity-check ordering and
 sign-extension.
 
-Input format: one 32-bit word per line, in hex or decimal.
+Input format (default `--format text`): one 32-bit word per line, in hex or
+decimal.
 Examples of accepted tokens:
   0x00001001
   00001001
   4097
 
+Noisy UART/printf logs: `--extract {0x,hex8,dec}` pulls matching words out of
+each line and ignores everything else (log prefixes, timestamps, ...), and
+`--line-prefix MARKER` restricts decoding to lines containing MARKER, taking
+tokens from the text after it. For example, the output of
+fw/examples/homeinv_adc_fifo_dump.c logged as `fifo: %08X` lines decodes with:
+  python3 fw/tools/decode_adc_fifo.py --extract hex8 --line-prefix fifo: uart.log
+
+Binary input (`--format bin` / `--format bin-be`, requires NumPy): raw
+little-/big-endian u32 FIFO reads, as written directly by capture rigs. Files
+are memory-mapped and viewed as 32-bit words without copying, so
+`--skip-words` / `--max-frames` only touch the pages they need.
+
 Usage:
   python3 fw/tools/decode_adc_fifo.py dump.txt
   cat dump.txt | python3 fw/tools/decode_adc_fifo.py -
+  python3 fw/tools/decode_adc_fifo.py --format bin capture.u32 --skip-words 900 --max-frames 10
+  cat /dev/ttyUSB0 | python3 fw/tools/decode_adc_fifo.py --csv -
+  python3 fw/tools/decode_adc_fifo.py --selftest   # NumPy renderer vs per-frame fallback
+
+Input is decoded as a stream: each frame is printed as soon as its 9th word
+arrives and only the partial frame is buffered, so the tool also works as a
+live monitor on an unbounded dump. With `--max-frames`, reading stops at the
+last requested frame (and the trailing-word warning is skipped).
+
+Dropped FIFO words (OVERRUN) shift every later frame. `--auto-align` (requires
+NumPy) finds the frame phase from the data itself: channel words must be
+sign-extended samples and STATUS must be zero-extended, so only one of the 9
+phases fits. The first lock and every later re-lock are reported on stderr and
+can be saved with `--resync-index resyncs.csv` (frame,word_offset,skipped_words).
+  python3 fw/tools/decode_adc_fifo.py --format bin --auto-align --resync-index rs.csv capture.u32
+
+Columnar output (requires NumPy): `--out frames.npz` writes one array per
+column (frame, status, ch0..ch7 as int32, plus ch0_u32..ch7_u32 with
+`--show-unsigned`) in large buffered batches; `.arrow`/`.feather` (Arrow IPC)
+and `.parquet` additionally need pyarrow. Loading them back is a single call:
+  d = numpy.load("frames.npz"); d["ch3"]
+  t = pyarrow.ipc.open_file("frames.arrow").read_all()
+
+`--summary` (requires NumPy) prints per-channel count, min, max, mean, std,
+peak-to-peak and how many low-order codes were hit, without printing or keeping
+the frames; `--summary-json` prints the same as JSON, plus the full low-bit code
+histogram (`--hist-bits`, default 8). Statistics are accumulated block by block, so
+memory stays flat on arbitrarily long dumps.
+
+Calibration: `--calibration cal.yaml` applies spec/fixed_point.md's
+((raw - TARE_CHx) * SCALE_CHx) >> 16 bit-exactly (int64 arithmetic, arithmetic
+shift) and adds calibrated columns to every output mode. The file has the same
+shape as the `calibration` block of spec/regmap_v1.yaml, with each register's
+`value` (or `reset`) taken as its setting; an optional block-level
+`grams_per_count` enables `--grams`:
+  name: calibration
+  grams_per_count: 0.0125
+  registers:
+    - {name: TARE_CH0, value: -1532}
+    - {name: SCALE_CH0, value: 0x00012000}
 
 Exit code is non-zero on malformed input.
+
+Performance:
+  `--jobs N` spreads tokenizing and rendering over N worker processes; the
+  output (including the sign-extension warning count) is byte-identical to a
+  single-process run.
+  When NumPy is installed, frames are decoded as an (N, 9) uint32 matrix
+  (status column + int32 channel columns, sign-extension checked in bulk) and
+  rendered to stdout in large byte blocks. Without NumPy the tool falls back to the
+  original per-frame path; output is identical either way.
 """
 
 from __future__ import annotations
 
+import abc
 import argparse
+import collections
+import functools
+import itertools
+import json
+import math
+import os
 import re
+import shutil
+import struct
 import sys
+import tempfile
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Any, BinaryIO, Callable, Deque, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
+try:
+    import numpy as np
+except ImportError:  # optional: only needed for the fast decode path
+    np = None
+
+
+WORDS_PER_FRAME = 9
+N_CHANNELS = 8
+
+# Frames per rendered output block on the NumPy path. Large enough to amortize
+# the per-block cost, small enough to bound the temporary byte matrices.
+_FMT_BLOCK_FRAMES = 16384
+
+# Frames per task handed to a --jobs worker for rendering.
+_PAR_CHUNK_FRAMES = 65536
+
+T = TypeVar("T")
+
+# Upper bound for one read from the input stream. Pipes return less as soon as
+# any data is available.
+_READ_CHUNK_BYTES = 1 << 20
+_ALIGN_PIECE_WORDS = _READ_CHUNK_BYTES // 4  # --auto-align scores mapped input in 1 MiB pieces
 
 _HEX_RE = re.compile(r"^(0x)?[0-9a-fA-F]+$")
 
@@ -81,27 +176,229 @@ def _signext_ok(u: int, *, bits: int) -> bool:
     return (u & upper_mask) == expect
 
 
+def _parse_line(ln: int, raw: str) -> List[int]:
+    s = raw.strip()
+    if not s or s.startswith("#"):
+        return []
+
+    words: List[int] = []
+    # If the line contains multiple tokens (e.g. C array dumps), split.
+    for tok in re.split(r"[\s\[\]{}()]+", s):
+        tok = tok.strip()
+        if not tok:
+            continue
+        # Further split on commas/semicolons.
+        for subtok in re.split(r"[;,]", tok):
+            subtok = subtok.strip()
+            if not subtok:
+                continue
+            try:
+                words.append(_parse_u32(subtok))
+            except Exception as e:
+                raise ValueError(f"line {ln}: cannot parse token '{subtok}': {e}")
+    return words
+
+
 def _read_words(lines: Iterable[str]) -> List[int]:
     words: List[int] = []
     for ln, raw in enumerate(lines, 1):
-        s = raw.strip()
-        if not s or s.startswith("#"):
-            continue
+        words.extend(_parse_line(ln, raw))
+    return words
+
+
+def _read_chunks(stream: BinaryIO) -> Iterator[bytes]:
+    """Yield raw input as it arrives.
+
+    read1() returns whatever is already buffered or available on a pipe/tty
+    instead of blocking until a full chunk is read, which is what lets the
+    decoder act as a live monitor.
+    """
+
+    read = getattr(stream, "read1", stream.read)
+    while True:
+        chunk = read(_READ_CHUNK_BYTES)
+        if not chunk:
+            return
+        yield chunk
+
+
+# Fast chunk tokenizer
+#
+# Text input is tokenized a whole read at a time with C-level bytes operations.
+# In the default (strict) mode a chunk that only contains hex digits, `x` and
+# separators is split and converted in bulk; anything else drops to the exact
+# per-line parser above so error messages keep their line numbers.
 
-        # If the line contains multiple tokens (e.g. C array dumps), split.
-        for tok in re.split(r"[\s\[\]{}()]+", s):
-            tok = tok.strip()
-            if not tok:
+_SEP_BYTES = b" \t\r\n\v\f[]{}();,"
+_STRICT_BYTES = _SEP_BYTES + b"0123456789abcdefABCDEFx"
+_SEP_TO_SPACE = bytes.maketrans(_SEP_BYTES, b" " * len(_SEP_BYTES))
+
+# --extract patterns for noisy UART/printf logs: everything that does not match
+# is ignored instead of aborting the run.
+_EXTRACT_RES = {
+    "0x": re.compile(rb"(?<![0-9A-Za-z_])0[xX]([0-9A-Fa-f]{1,8})(?![0-9A-Za-z_])"),
+    "hex8": re.compile(rb"(?<![0-9A-Za-z_])([0-9A-Fa-f]{8})(?![0-9A-Za-z_])"),
+    "dec": re.compile(rb"(?<![0-9A-Za-z_.:+-])([0-9]{1,10})(?![0-9A-Za-z_.:])"),
+}
+
+
+@dataclass(frozen=True)
+class TokenizerConfig:
+    extract: Optional[str] = None  # key of _EXTRACT_RES; None = strict tokens
+    line_prefix: Optional[bytes] = None  # only lines containing this are decoded
+
+
+def _be_words(raw: bytes) -> Sequence[int]:
+    if np is not None:
+        return np.frombuffer(raw, dtype=">u4")
+    return list(struct.unpack(f">{len(raw) // 4}I", raw))
+
+
+def _hex8_words(payload: bytes) -> Optional[Sequence[int]]:
+    """Fixed-width fast path: every token is exactly 8 hex digits."""
+
+    toks = payload.split()
+    if not toks or set(map(len, toks)) != {8}:
+        return None
+    try:
+        return _be_words(bytes.fromhex(b"".join(toks).decode("ascii")))
+    except ValueError:
+        return None
+
+
+def _strict_words(payload: bytes) -> Optional[Sequence[int]]:
+    """Bulk strict-mode parse, or None when the exact parser must decide."""
+
+    if payload.translate(None, _STRICT_BYTES):
+        return None
+    payload = b" " + payload.translate(_SEP_TO_SPACE) + b" "
+    if b"x" in payload and b" 0x " not in payload:
+        # Only a leading 0x on a token is legal; drop it so %08X-style dumps
+        # with a prefix still take the fixed-width path.
+        stripped = payload.replace(b" 0x", b" ")
+        if b"x" not in stripped:
+            payload = stripped
+    words = _hex8_words(payload)
+    if words is not None:
+        return words
+    try:
+        vals = list(map(int, payload.split(), itertools.repeat(16)))
+    except ValueError:
+        return None
+    if vals and max(vals) > 0xFFFF_FFFF:
+        return None
+    return vals
+
+
+def _extract_words(payload: bytes, mode: str) -> Sequence[int]:
+    if mode == "hex8":
+        words = _hex8_words(payload)
+        if words is not None:
+            return words
+    toks = _EXTRACT_RES[mode].findall(payload)
+    vals = list(map(int, toks, itertools.repeat(10 if mode == "dec" else 16)))
+    if mode == "dec":
+        for v in vals:
+            if v > 0xFFFF_FFFF:
+                raise ValueError(f"decimal token out of u32 range: {v}")
+    return vals
+
+
+def _parse_lines_exact(data: bytes, ln0: int, prefix: Optional[bytes]) -> List[int]:
+    words: List[int] = []
+    for ln, raw in enumerate(data.decode("utf-8").split("\n"), ln0 + 1):
+        if prefix is not None:
+            pos = raw.find(prefix.decode("utf-8"))
+            if pos < 0:
                 continue
-            # Further split on commas/semicolons.
-            for subtok in re.split(r"[;,]", tok):
-                subtok = subtok.strip()
-                if not subtok:
-                    continue
-                try:
-                    words.append(_parse_u32(subtok))
-                except Exception as e:
-                    raise ValueError(f"line {ln}: cannot parse token '{subtok}': {e}")
+            raw = raw[pos + len(prefix) :]
+        words.extend(_parse_line(ln, raw))
+    return words
+
+
+@functools.lru_cache(maxsize=None)
+def _prefix_re(prefix: bytes) -> "re.Pattern[bytes]":
+    return re.compile(rb"^[^\n]*?" + re.escape(prefix) + rb"([^\n]*)$", re.M)
+
+
+def _tokenize_chunk(data: bytes, ln0: int, cfg: TokenizerConfig) -> Sequence[int]:
+    """Words in `data`, a run of whole lines starting after line `ln0`."""
+
+    payload = data
+    if cfg.line_prefix:
+        payload = b"\n".join(_prefix_re(cfg.line_prefix).findall(data))
+
+    if cfg.extract is not None:
+        return _extract_words(payload, cfg.extract)
+    if b"#" not in payload:
+        words = _strict_words(payload)
+        if words is not None:
+            return words
+    return _parse_lines_exact(data, ln0, cfg.line_prefix)
+
+
+def _iter_line_chunks(stream: BinaryIO) -> Iterator[Tuple[bytes, int]]:
+    """Yield (data, ln0) runs of whole lines as they arrive on `stream`.
+
+    Only the trailing partial line is carried between reads; `ln0` is the
+    number of lines before the run, for error messages.
+    """
+
+    ln = 0
+    tail = b""
+    for chunk in _read_chunks(stream):
+        data = tail + chunk
+        cut = data.rfind(b"\n") + 1
+        tail = data[cut:]
+        if not cut:
+            continue
+        yield data[: cut - 1], ln
+        ln += data.count(b"\n", 0, cut)
+
+    if tail:
+        yield tail, ln
+
+
+def _iter_text_words(stream: BinaryIO, cfg: TokenizerConfig = TokenizerConfig()) -> Iterator[Sequence[int]]:
+    """Tokenize a text stream into batches of words, one batch per read."""
+
+    for data, ln0 in _iter_line_chunks(stream):
+        words = _tokenize_chunk(data, ln0, cfg)
+        if len(words):
+            yield words
+
+
+def _iter_bin_words(stream: BinaryIO, *, big_endian: bool) -> Iterator["np.ndarray"]:
+    """Streaming counterpart of `_map_words_bin` for pipes (e.g. stdin)."""
+
+    dtype = np.dtype(">u4" if big_endian else "<u4")
+    tail = b""
+    for chunk in _read_chunks(stream):
+        data = tail + chunk
+        n = len(data) // 4
+        tail = data[n * 4 :]
+        if n:
+            yield np.frombuffer(data, dtype=dtype, count=n)
+
+    if tail:
+        print(f"[warn] input size is not a multiple of 4 bytes: {len(tail)} trailing byte(s) ignored", file=sys.stderr)
+
+
+def _map_words_bin(path: str, *, big_endian: bool) -> "np.ndarray":
+    """Return a raw u32 capture file as a 1-D memory-mapped word array.
+
+    Trailing bytes that do not form a whole word are ignored with a warning.
+    """
+
+    dtype = np.dtype(">u4" if big_endian else "<u4")
+    n_bytes = os.path.getsize(path)
+    if n_bytes >= 4:
+        words = np.memmap(path, dtype=dtype, mode="r", shape=(n_bytes // 4,))
+    else:
+        words = np.empty(0, dtype=dtype)
+
+    if n_bytes % 4:
+        print(f"[warn] input size is not a multiple of 4 bytes: {n_bytes % 4} trailing byte(s) ignored", file=sys.stderr)
     return words
 
 
@@ -127,12 +424,1302 @@ def _frames_from_words(words: List[int], *, start_index: int = 0) -> List[Frame]
     return frames
 
 
+def _cal_unit(args: argparse.Namespace) -> Optional[str]:
+    """Suffix of the calibrated columns: "cal" (counts), "g" (grams) or None."""
+
+    if args.cal is None:
+        return None
+    return "g" if args.grams else "cal"
+
+
+def _fmt_cal_py(raw: int, ch: int, args: argparse.Namespace) -> str:
+    """Calibrated value right-aligned like the NumPy renderer's text columns."""
+
+    counts = _calibrate_py(raw, ch, args.cal)
+    if args.grams:
+        return f"{_fmt_milli(_milli(counts * args.cal.grams_per_count[ch])):>{_GRAMS_WIDTH}}"
+    return f"{counts:{_COUNTS_WIDTH}d}"
+
+
+def _format_frames_py(frames: List[Frame], args: argparse.Namespace) -> Tuple[str, int]:
+    """Per-frame fallback formatter (used when NumPy is unavailable).
+
+    Returns the rendered text and the number of sign-extension violations.
+    """
+
+    bad_signext = 0
+    out: List[str] = []
+
+    if args.csv:
+        for fr in frames:
+            ch_i32 = [_to_i32(u) for u in fr.ch_u32]
+            if not args.no_check_signext:
+                for u in fr.ch_u32:
+                    if not _signext_ok(u, bits=args.bits_per_sample):
+                        bad_signext += 1
+
+            row = [str(fr.idx), f"0x{fr.status_u32:08X}"] + [str(x) for x in ch_i32]
+            if args.show_unsigned:
+                row += [f"0x{u:08X}" for u in fr.ch_u32]
+            if args.cal is not None:
+                row += [_fmt_cal_py(x, ch, args).strip() for ch, x in enumerate(ch_i32)]
+            out.append(",".join(row))
+
+    else:
+        for fr in frames:
+            out.append(f"frame {fr.idx}:")
+            out.append(f"  status: 0x{fr.status_u32:08X}")
+            for ch, u in enumerate(fr.ch_u32):
+                i = _to_i32(u)
+                if not args.no_check_signext and not _signext_ok(u, bits=args.bits_per_sample):
+                    bad_signext += 1
+                    signext_note = f"  [warn: not sign-extended {args.bits_per_sample}-bit]"
+                else:
+                    signext_note = ""
+
+                if args.cal is None:
+                    cal_note = ""
+                else:
+                    cal_note = f"  {_cal_unit(args)}={_fmt_cal_py(i, ch, args)}"
+
+                if args.show_unsigned:
+                    out.append(f"  ch{ch}: i32={i:11d}  u32=0x{u:08X}{cal_note}{signext_note}")
+                else:
+                    out.append(f"  ch{ch}: i32={i:11d}  (0x{u:08X}){cal_note}{signext_note}")
+            out.append("")
+
+    return "".join(ln + "\n" for ln in out), bad_signext
+
+
+@dataclass
+class StreamStats:
+    """Running totals for a streamed decode."""
+
+    words: int = 0  # words read from the input, including skipped ones
+    frames: int = 0  # complete frames handed to the formatter
+    truncated: bool = False  # stopped reading early because of --max-frames
+    tail_words: int = 0  # unframed words left at end of input (--auto-align)
+
+
+def _concat(head: Sequence[int], tail: Sequence[int]) -> Sequence[int]:
+    if isinstance(tail, list):
+        return list(head) + tail
+    return np.concatenate((np.asarray(head, dtype=tail.dtype), tail))
+
+
+def iter_frames(
+    batches: Iterable[Sequence[int]],
+    *,
+    skip_words: int = 0,
+    max_frames: Optional[int] = None,
+    stats: Optional[StreamStats] = None,
+) -> Iterator[Tuple[int, Sequence[int]]]:
+    """Frame a stream of word batches into (first_frame_index, n*9 words) chunks.
+
+    Each chunk is yielded as soon as its frames are complete; only the partial
+    trailing frame is buffered between batches. Input stops being pulled once
+    `max_frames` frames have been yielded.
+    """
+
+    if stats is None:
+        stats = StreamStats()
+    if max_frames is not None and max_frames <= 0:
+        stats.truncated = True
+        return
+
+    to_skip = skip_words
+    carry: Sequence[int] = []
+    for batch in batches:
+        stats.words += len(batch)
+        if to_skip:
+            drop = min(to_skip, len(batch))
+            batch = batch[drop:]
+            to_skip -= drop
+        if len(carry):
+            batch = _concat(carry, batch)
+
+        n = len(batch) // WORDS_PER_FRAME
+        if max_frames is not None:
+            n = min(n, max_frames - stats.frames)
+        carry = batch[n * WORDS_PER_FRAME :]
+
+        if n:
+            idx0 = stats.frames
+            stats.frames += n
+            yield idx0, batch[: n * WORDS_PER_FRAME]
+
+        if max_frames is not None and stats.frames >= max_frames:
+            stats.truncated = True
+            return
+
+
+@dataclass
+class FrameBlock:
+    """Column view of consecutive decoded frames (NumPy path)."""
+
+    idx0: int
+    status_u32: "np.ndarray"  # (N,) uint32
+    ch_u32: "np.ndarray"  # (N, 8) uint32
+    ch_i32: "np.ndarray"  # (N, 8) int32 (same buffer as ch_u32)
+    bad_signext: Optional["np.ndarray"]  # (N, 8) bool, None when checks are disabled
+
+    def __len__(self) -> int:
+        return len(self.status_u32)
+
+
+def _signext_bad_mask(ch_u32: "np.ndarray", *, bits: int) -> "np.ndarray":
+    """Vectorized inverse of `_signext_ok` over a whole uint32 array.
+
+    Adding 2**(bits-1) (mod 2**32) maps every valid sign-extended `bits`-wide
+    value into [0, 2**bits), so a single masked compare against the upper bits
+    flags every violation.
+    """
+
+    if bits <= 0 or bits > 32:
+        raise ValueError("bits must be in [1, 32]")
+    if bits == 32:
+        return np.zeros(ch_u32.shape, dtype=bool)
+
+    bias = np.uint32(1 << (bits - 1))
+    upper_mask = np.uint32((0xFFFF_FFFF << bits) & 0xFFFF_FFFF)
+    return ((ch_u32 + bias) & upper_mask) != 0
+
+
+def decode_frames(mat: "np.ndarray", *, idx0: int = 0, bits: int = 24, check_signext: bool = True) -> FrameBlock:
+    """Decode an (N, 9) uint32 frame matrix into status/channel columns.
+
+    Non-native byte orders (e.g. a big-endian memmap) are converted here, one
+    block at a time.
+    """
+
+    mat = np.asarray(mat, dtype=np.uint32)
+    ch_u32 = mat[:, 1:WORDS_PER_FRAME]
+    return FrameBlock(
+        idx0=idx0,
+        status_u32=mat[:, 0],
+        ch_u32=ch_u32,
+        ch_i32=ch_u32.view(np.int32),
+        bad_signext=_signext_bad_mask(ch_u32, bits=bits) if check_signext else None,
+    )
+
+
+# Calibration (--calibration)
+#
+# spec/fixed_point.md: code_scaled = ((raw - TARE_CHx) * SCALE_CHx) >> 16, with
+# TARE a signed 32-bit LSB offset and SCALE an unsigned Q16.16 multiplier. The
+# subtraction and product are done in int64 (no 32-bit wrap of raw - TARE), and
+# >> 16 is an arithmetic shift, i.e. it rounds toward -inf like the RV32 `sra`
+# firmware sees.
+
+
+# Calibrated values: |counts| <= 2**48 (|raw - TARE| < 2**32, SCALE < 2**32,
+# >> 16), which always fits the counts column; grams widen their column as needed.
+_MAX_CAL_COUNTS = 1 << 48
+_COUNTS_WIDTH = 16
+_GRAMS_WIDTH = 18
+
+
+@dataclass
+class Calibration:
+    """Per-channel TARE/SCALE (register values) and optional grams per scaled count."""
+
+    tare: Tuple[int, ...] = (0,) * N_CHANNELS
+    scale: Tuple[int, ...] = (0x0001_0000,) * N_CHANNELS
+    grams_per_count: Optional[Tuple[float, ...]] = None
+
+
+def _reg_int(value: object, name: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"{name}: expected an integer, got {value!r}")
+    return value if isinstance(value, int) else int(value.replace("_", ""), 0)
+
+
+def _find_calibration_block(doc: object) -> dict:
+    """Accept a whole regmap, a list of blocks, {calibration: block} or the block itself."""
+
+    if isinstance(doc, dict) and "registers" in doc:
+        return doc
+    if isinstance(doc, dict) and isinstance(doc.get("calibration"), dict):
+        return _find_calibration_block(doc["calibration"])
+    blocks = doc.get("blocks") if isinstance(doc, dict) else doc
+    if isinstance(blocks, list):
+        for blk in blocks:
+            if isinstance(blk, dict) and blk.get("name") == "calibration":
+                return blk
+    raise ValueError("no 'calibration' block with a 'registers' list found")
+
+
+def _calibration_entries(reg: dict) -> List[Tuple[str, int, object]]:
+    """(flat name, channel, raw value) for a TARE_CHx/SCALE_CHx entry or a
+    `count:` array entry named TARE_CH/SCALE_CH (value: scalar or list)."""
+
+    name = str(reg.get("name", ""))
+    raw = reg.get("value", reg.get("reset"))
+    m = re.fullmatch(r"(TARE|SCALE)_CH([0-7])", name)
+    if m is not None:
+        return [(name, int(m.group(2)), raw)]
+    if name not in ("TARE_CH", "SCALE_CH") or reg.get("count") is None:
+        return []
+    n = min(_reg_int(reg["count"], f"{name}.count"), N_CHANNELS)
+    if isinstance(raw, list):
+        if len(raw) != n:
+            raise ValueError(f"{name}: expected {n} values, got {len(raw)}")
+        return [(f"{name}{i}", i, raw[i]) for i in range(n)]
+    return [(f"{name}{i}", i, raw) for i in range(n)]
+
+
+def load_calibration(path: str) -> Calibration:
+    """Read TARE_CHx / SCALE_CHx from a file shaped like the `calibration` block of
+    spec/regmap_v1.yaml.
+
+    Each register takes its `value` (falling back to `reset`, so the spec itself
+    loads as the identity transform); missing registers keep their reset value.
+    An optional block-level `grams_per_count` (number or list of 8) enables
+    gram output. .json files are read with the stdlib, anything else as YAML.
+    """
+
+    with open(path, "r", encoding="utf-8") as f:
+        if path.lower().endswith(".json"):
+            doc = json.load(f)
+        else:
+            try:
+                import yaml
+            except ImportError:
+                raise SystemExit("YAML calibration files require PyYAML (pip install pyyaml), or use .json")
+            doc = yaml.safe_load(f)
+
+    blk = _find_calibration_block(doc)
+    tare, scale = list(Calibration.tare), list(Calibration.scale)
+    for reg in blk["registers"]:
+        for name, ch, raw in _calibration_entries(reg):
+            if raw is None:
+                continue
+            v = _reg_int(raw, name)
+            if name.startswith("TARE"):
+                if not -(1 << 31) <= v < (1 << 32):
+                    raise ValueError(f"{name}: {v} does not fit in 32 bits")
+                tare[ch] = v - (1 << 32) if v >= (1 << 31) else v
+            else:
+                if not 0 <= v < (1 << 32):
+                    raise ValueError(f"{name}: {v} is not an unsigned 32-bit Q16.16 value")
+                scale[ch] = v
+
+    gpc = blk.get("grams_per_count")
+    if gpc is not None:
+        gpc = [float(gpc)] * N_CHANNELS if isinstance(gpc, (int, float)) else [float(g) for g in gpc]
+        if len(gpc) != N_CHANNELS:
+            raise ValueError(f"grams_per_count: expected 1 or {N_CHANNELS} values, got {len(gpc)}")
+        for g in gpc:
+            if not math.isfinite(g * _MAX_CAL_COUNTS):
+                raise ValueError(f"grams_per_count: {g} is out of range")
+    return Calibration(tare=tuple(tare), scale=tuple(scale), grams_per_count=tuple(gpc) if gpc else None)
+
+
+def calibrate(ch_i32: "np.ndarray", cal: Calibration) -> "np.ndarray":
+    """Apply ((raw - TARE) * SCALE) >> 16 to an (N, 8) int32 block; returns int64."""
+
+    zeroed = ch_i32.astype(np.int64) - np.asarray(cal.tare, dtype=np.int64)
+    # |zeroed| < 2**32 but zeroed * SCALE can reach 2**64, so split SCALE into
+    # 16-bit halves: (z*s) >> 16 == z*(s >> 16) + ((z*(s & 0xFFFF)) >> 16)
+    # exactly (floor shift), and every partial product stays below 2**48.
+    scale = np.asarray(cal.scale, dtype=np.int64)
+    return zeroed * (scale >> 16) + ((zeroed * (scale & 0xFFFF)) >> 16)
+
+
+def _calibrate_py(raw: int, ch: int, cal: Calibration) -> int:
+    return ((raw - cal.tare[ch]) * cal.scale[ch]) >> 16
+
+
+def _cal_values(ch_i32: "np.ndarray", cal: Optional[Calibration], grams: bool) -> Optional["np.ndarray"]:
+    """Calibrated counts (int64), or grams (float64) when `grams` is set."""
+
+    if cal is None:
+        return None
+    counts = calibrate(ch_i32, cal)
+    return counts * np.asarray(cal.grams_per_count) if grams else counts
+
+
+def _milli(grams: float) -> int:
+    """Grams -> integer milligrams, rounded half-to-even like np.rint."""
+
+    return round(grams * 1000)
+
+
+def _fmt_milli(m: int) -> str:
+    return f"{'-' if m < 0 else ''}{abs(m) // 1000}.{abs(m) % 1000:03d}"
+
+
+# Frame-phase auto-alignment (--auto-align)
+#
+# Every input word gets two violation flags: "bad as a channel word" (not a
+# sign-extended `bits`-wide sample) and "bad as STATUS" (not zero-extended, see
+# docs/ADC_STATUS_WORD_POLICY.md). Framing a window at phase r makes every word
+# at position r (mod 9) a STATUS word, so its violation count is
+#   base + D[r],  base = sum(bad_ch),  D[r] = sum over i = r (mod 9) of (bad_status - bad_ch)
+# which is one reshape + sum for all windows and all 9 phases at once. Only the
+# two windows around a detected slip are looked at word by word.
+
+
+@dataclass
+class Resync:
+    """A point where auto-alignment (re)locked onto a frame phase."""
+
+    frame: int  # index of the first output frame after the lock
+    word_offset: int  # input word offset of that frame's STATUS word
+    skipped_words: int  # input words discarded to reach it
+
+
+def _phase_costs(words: "np.ndarray", *, bits: int, window_words: int) -> "np.ndarray":
+    """Invariant violations per window for each of the 9 phases: (n_windows, 9).
+
+    `words` must hold a whole number of windows; phase r is relative to words[0].
+    """
+
+    bad_ch = _signext_bad_mask(words, bits=bits)
+    bad_status = (words >> np.uint32(bits)) != 0 if bits < 32 else np.zeros(words.shape, dtype=bool)
+    n_win = len(words) // window_words
+    d = bad_status.astype(np.int32) - bad_ch
+    per_phase = d.reshape(n_win, -1, WORDS_PER_FRAME).sum(axis=1)
+    base = bad_ch.reshape(n_win, -1).sum(axis=1, dtype=np.int64)
+    return base[:, None] + per_phase
+
+
+# Cost of one phase switch in `_phase_segments`, in invariant violations.
+_SWITCH_PENALTY = 4
+
+
+def _role_costs(seg: "np.ndarray", *, bits: int) -> "np.ndarray":
+    """(len(seg), 9) violations of each word under each phase (relative to seg[0])."""
+
+    bad_ch = _signext_bad_mask(seg, bits=bits)
+    bad_status = (seg >> np.uint32(bits)) != 0 if bits < 32 else np.zeros(seg.shape, dtype=bool)
+    is_status = (np.arange(len(seg)) % WORDS_PER_FRAME)[:, None] == np.arange(WORDS_PER_FRAME)
+    return np.where(is_status, bad_status[:, None], bad_ch[:, None]).astype(np.int32)
+
+
+def _phase_segments(seg: "np.ndarray", *, bits: int) -> List[Tuple[int, int]]:
+    """Most likely piecewise framing of `seg`, starting at phase 0.
+
+    A small Viterbi pass over the 9 phases (each switch costs _SWITCH_PENALTY).
+    Returns [(first_word, phase), ...], one entry per constant-phase run.
+    """
+
+    cost = _role_costs(seg, bits=bits)
+    acc = np.full(WORDS_PER_FRAME, _SWITCH_PENALTY, dtype=np.int64)
+    acc[0] = 0
+    came_from = np.empty(cost.shape, dtype=np.int8)
+    phases = np.arange(WORDS_PER_FRAME, dtype=np.int8)
+    for i in range(len(seg)):
+        j = int(np.argmin(acc))
+        switch = acc[j] + _SWITCH_PENALTY < acc
+        came_from[i] = np.where(switch, j, phases)
+        acc = np.where(switch, acc[j] + _SWITCH_PENALTY, acc) + cost[i]
+
+    path = np.empty(len(seg), dtype=np.int8)
+    state = int(np.argmin(acc))
+    for i in range(len(seg) - 1, -1, -1):
+        path[i] = state
+        state = int(came_from[i, state])
+
+    starts = np.flatnonzero(np.diff(path)) + 1
+    return [(0, int(path[0]))] + [(int(i), int(path[i])) for i in starts]
+
+
+def _switch_range(seg: "np.ndarray", old: int, new: int, *, bits: int) -> Tuple[int, int]:
+    """First and last switch-over index from phase `old` to `new` in `seg` with
+    the fewest total violations. Words in between fit both framings equally
+    well, so neither side trusts them."""
+
+    cost = _role_costs(seg, bits=bits)
+    before = np.concatenate(([0], np.cumsum(cost[:, old])))
+    after = cost[:, new].sum() - np.concatenate(([0], np.cumsum(cost[:, new])))
+    total = before + after
+    best = np.flatnonzero(total == total.min())
+    return int(best[0]), int(best[-1])
+
+
+def iter_aligned_frames(
+    batches: Iterable[Sequence[int]],
+    *,
+    bits: int = 24,
+    window_frames: int = 64,
+    skip_words: int = 0,
+    max_frames: Optional[int] = None,
+    stats: Optional[StreamStats] = None,
+    resyncs: Optional[List[Resync]] = None,
+    on_resync: Optional[Callable[[Resync], None]] = None,
+) -> Iterator[Tuple[int, "np.ndarray"]]:
+    """Like `iter_frames`, but finds the frame phase itself.
+
+    The first window locks onto the best-scoring of the 9 phases. Afterwards a
+    window whose score under the current phase collapses (another phase has at
+    least window_frames/8 fewer violations) triggers a re-lock: that window and
+    the one before it are split into constant-phase runs (several slips can
+    land close together), frames straddling a switch-over are dropped and
+    framing continues at the new phase. Every lock is appended to `resyncs`.
+
+    A slip of a whole number of frames leaves the phase unchanged and cannot be
+    detected here; it costs one mixed-up frame.
+    """
+
+    if stats is None:
+        stats = StreamStats()
+    if resyncs is None:
+        resyncs = []
+    if max_frames is not None and max_frames <= 0:
+        stats.truncated = True
+        return
+
+    window_words = window_frames * WORDS_PER_FRAME
+    buf = np.empty(0, dtype=np.uint32)
+    buf_off = skip_words  # input word offset of buf[0]
+    to_skip = skip_words
+    locked = False
+
+    def lock(phase: int) -> None:
+        r = Resync(frame=stats.frames, word_offset=buf_off + phase, skipped_words=phase)
+        resyncs.append(r)
+        if on_resync is not None:
+            on_resync(r)
+
+    def emit(n_frames: int) -> Iterator[Tuple[int, "np.ndarray"]]:
+        if max_frames is not None:
+            n_frames = min(n_frames, max_frames - stats.frames)
+        if n_frames > 0:
+            idx0 = stats.frames
+            stats.frames += n_frames
+            yield idx0, buf[: n_frames * WORDS_PER_FRAME]
+
+    def full() -> bool:
+        if max_frames is not None and stats.frames >= max_frames:
+            stats.truncated = True
+            return True
+        return False
+
+    def pieces() -> Iterator["np.ndarray"]:
+        nonlocal to_skip
+        for batch in batches:
+            stats.words += len(batch)
+            for off in range(0, len(batch), _ALIGN_PIECE_WORDS):
+                piece = batch[off : off + _ALIGN_PIECE_WORDS]
+                if to_skip:
+                    drop = min(to_skip, len(piece))
+                    piece = piece[drop:]
+                    to_skip -= drop
+                if len(piece):
+                    yield np.asarray(piece, dtype=np.uint32)
+        yield np.empty(0, dtype=np.uint32)  # end-of-input marker
+
+    for piece in pieces():
+        final = len(piece) == 0
+        buf = np.concatenate((buf, piece)) if len(buf) else piece
+
+        while True:
+            if final:
+                n_words = len(buf) // WORDS_PER_FRAME * WORDS_PER_FRAME
+                if n_words < WORDS_PER_FRAME * 2:
+                    break
+                win = n_words
+            else:
+                n_words = len(buf) // window_words * window_words
+                if n_words == 0:
+                    break
+                win = window_words
+
+            costs = _phase_costs(buf[:n_words], bits=bits, window_words=win)
+
+            if not locked:
+                phase = int(np.argmin(costs[0]))
+                lock(phase)
+                buf, buf_off = buf[phase:], buf_off + phase
+                locked = True
+                continue
+
+            best = costs.min(axis=1)
+            margin = max(2, win // WORDS_PER_FRAME // 8)
+            collapsed = np.flatnonzero(costs[:, 0] - best >= margin)
+            if len(collapsed) == 0:
+                consumed = n_words
+                yield from emit(consumed // WORDS_PER_FRAME)
+                if full():
+                    return
+                buf, buf_off = buf[consumed:], buf_off + consumed
+                if final:
+                    break
+                continue
+
+            # The slip may have started late in the previous window, and drops
+            # often come in bursts: segment both windows into constant-phase
+            # runs and only keep frames that sit wholly inside one run.
+            k = int(collapsed[0])
+            lo = max(0, k - 1) * win
+            hi = min(n_words, (k + 1) * win)
+            if lo:
+                yield from emit(lo // WORDS_PER_FRAME)
+                if full():
+                    return
+                buf, buf_off = buf[lo:], buf_off + lo
+
+            region = buf[: hi - lo]
+            runs = _phase_segments(region, bits=bits)
+            if runs[0][1] != 0:
+                runs.insert(0, (0, 0))
+            if len(runs) == 1:
+                # Too little evidence to justify a switch (short final window).
+                consumed = len(region)
+                yield from emit(consumed // WORDS_PER_FRAME)
+                if full():
+                    return
+                buf, buf_off = buf[consumed:], buf_off + consumed
+                continue
+
+            # Trusted span of each run: the tie range around every switch
+            # fits both framings equally well, so neither side keeps it.
+            bounds = [b for b, _ in runs] + [len(region)]
+            spans = [[bounds[i], bounds[i + 1]] for i in range(len(runs))]
+            for i in range(1, len(runs)):
+                a0, a1 = bounds[i - 1], bounds[i + 1]
+                first, last = _switch_range(
+                    region[a0:a1],
+                    (runs[i - 1][1] - a0) % WORDS_PER_FRAME,
+                    (runs[i][1] - a0) % WORDS_PER_FRAME,
+                    bits=bits,
+                )
+                spans[i - 1][1] = min(spans[i - 1][1], a0 + first)
+                spans[i][0] = max(spans[i][0], a0 + last)
+
+            yield from emit(spans[0][1] // WORDS_PER_FRAME)
+            if full():
+                return
+            done = spans[0][1] // WORDS_PER_FRAME * WORDS_PER_FRAME  # region words consumed
+            buf, buf_off = buf[done:], buf_off + done
+            for i in range(1, len(runs)):
+                phase = runs[i][1]
+                start = max(spans[i][0], done)
+                start += (phase - start) % WORDS_PER_FRAME
+                buf, buf_off = buf[start - done :], buf_off + start - done
+                r = Resync(frame=stats.frames, word_offset=buf_off, skipped_words=start - done)
+                resyncs.append(r)
+                if on_resync is not None:
+                    on_resync(r)
+                done = start
+                if i == len(runs) - 1:
+                    break  # the last run is rescored together with what follows
+                n = max(0, spans[i][1] - start) // WORDS_PER_FRAME
+                yield from emit(n)
+                if full():
+                    return
+                buf, buf_off = buf[n * WORDS_PER_FRAME :], buf_off + n * WORDS_PER_FRAME
+                done += n * WORDS_PER_FRAME
+
+        if final:
+            break
+
+    # Too short to score: frame whatever is left at the current phase.
+    if len(buf) >= WORDS_PER_FRAME and not full():
+        if not locked:
+            lock(0)
+        yield from emit(len(buf) // WORDS_PER_FRAME)
+        buf = buf[len(buf) // WORDS_PER_FRAME * WORDS_PER_FRAME :]
+    stats.tail_words = len(buf)
+
+
+# Output rendering (NumPy path)
+#
+# Each output row is assembled as a fixed-width uint8 matrix: literal byte
+# strings are broadcast, hex fields come from a nibble lookup table and decimal
+# fields from per-digit columns. Variable-width fields are padded with NUL, which
+# is stripped from the whole block in one pass before writing.
+
+_HEX_DIGITS = None if np is None else np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+_PAD = 0
+
+
+def _lit(n: int, text: str) -> "np.ndarray":
+    return np.broadcast_to(np.frombuffer(text.encode("ascii"), dtype=np.uint8), (n, len(text)))
+
+
+def _hex_cols(u32: "np.ndarray") -> "np.ndarray":
+    """Render uint32 values as %08X into an (N, 8) uint8 matrix."""
+
+    shifts = np.arange(28, -4, -4, dtype=np.uint32)
+    return _HEX_DIGITS[(u32[:, None] >> shifts) & np.uint32(0xF)]
+
+
+def _dec_cols(vals: "np.ndarray", width: int, *, pad: int = _PAD, neg: Optional["np.ndarray"] = None) -> "np.ndarray":
+    """Render integers right-aligned in `width` columns (like %{width}d).
+
+    `pad` is the fill byte: space for fixed-width text, NUL for fields that are
+    stripped down to %d afterwards. `neg` overrides where the minus sign goes
+    (for "-0" integer parts).
+    """
+
+    v = vals.astype(np.int64)
+    if neg is None:
+        neg = v < 0
+    q = np.abs(v).astype(np.uint64)
+
+    out = np.full((len(v), width), pad, dtype=np.uint8)
+    out[:, width - 1] = 48 + q % 10
+    q //= 10
+    ndig = np.ones(len(v), dtype=np.int8)
+    for col in range(width - 2, -1, -1):
+        live = q != 0
+        if not live.any():
+            break
+        q, digit = np.divmod(q, 10)
+        out[:, col] = np.where(live, 48 + digit, out[:, col])
+        ndig += live
+    sign_col = width - 1 - ndig.astype(np.int64)
+    rows = np.flatnonzero(neg & (sign_col >= 0))
+    out[rows, sign_col[rows]] = ord("-")
+    return out
+
+
+def _ndigits(q: "np.ndarray") -> "np.ndarray":
+    """Decimal digit count of non-negative int64 values."""
+
+    n = np.ones(len(q), dtype=np.int64)
+    for k in range(1, 19):
+        n += q >= 10**k
+    return n
+
+
+def _str_cols(texts: List[str], width: int, *, pad: int = _PAD) -> "np.ndarray":
+    """Right-align strings in max(width, longest) columns."""
+
+    w = max([width] + [len(t) for t in texts])
+    text = "".join(t.rjust(w, chr(pad)) for t in texts).encode("ascii")
+    return np.frombuffer(bytearray(text), dtype=np.uint8).reshape(-1, w)
+
+
+def _widen(cols: "np.ndarray", width: int, *, pad: int = _PAD) -> "np.ndarray":
+    """Turn the fill beyond the first `width` columns into NUL, so a column widened
+    for its longest row strips back to %{width}s on every other row."""
+
+    extra = cols.shape[1] - width
+    if extra > 0 and pad != _PAD:
+        head = cols[:, :extra]
+        head[head == pad] = _PAD
+    return cols
+
+
+def _milli_cols(grams: "np.ndarray", width: int, *, pad: int = _PAD) -> "np.ndarray":
+    """Render grams as fixed-point %.3f (rounded like `_milli`), right-aligned in
+    `width` columns; longer values widen the column like %{width}s does.
+
+    Milligram values outside int64 are rendered by `_fmt_milli` instead.
+    """
+
+    mf = np.rint(grams * 1000)
+    if not (np.abs(mf) < 2.0**63).all():
+        return _widen(_str_cols([_fmt_milli(_milli(g)) for g in grams.tolist()], width, pad=pad), width, pad=pad)
+    m = mf.astype(np.int64)
+    q = np.abs(m)
+    neg = m < 0
+    frac = q % 1000
+    whole = q // 1000
+    need = int((_ndigits(whole) + neg).max(initial=0))
+    digits = 48 + np.stack([frac // 100, frac // 10 % 10, frac % 10], axis=1).astype(np.uint8)
+    cols = _dec_cols(whole, max(width - 4, need), pad=pad, neg=neg)
+    return _widen(np.concatenate([cols, _lit(len(m), "."), digits], axis=1), width, pad=pad)
+
+
+def _cal_cols(vals: "np.ndarray", grams: bool, *, pad: int = _PAD) -> "np.ndarray":
+    if grams:
+        return _milli_cols(vals, _GRAMS_WIDTH, pad=pad)
+    return _dec_cols(vals, _COUNTS_WIDTH, pad=pad)
+
+
+def _render(pieces: List["np.ndarray"], *, strip_pad: bool) -> bytes:
+    flat = np.concatenate(pieces, axis=1).ravel()
+    if strip_pad:
+        flat = flat[flat != _PAD]
+    return flat.tobytes()
+
+
+def _index_cols(blk: FrameBlock) -> "np.ndarray":
+    idx = np.arange(blk.idx0, blk.idx0 + len(blk), dtype=np.int64)
+    return _dec_cols(idx, len(str(blk.idx0 + len(blk) - 1)))
+
+
+def _block_bounds(start: int, stop: int, block: int) -> Iterator[Tuple[int, int]]:
+    """Split frame indices [start, stop) into blocks that never straddle a power
+    of ten, so indices within a block share one width and need no NUL padding."""
+
+    while start < stop:
+        end = min(stop, start + block, 10 ** len(str(start)))
+        yield start, end
+        start = end
+
+
+def _csv_header(show_unsigned: bool, cal_unit: Optional[str] = None) -> str:
+    cols = ["frame", "status_hex"] + [f"ch{i}_i32" for i in range(N_CHANNELS)]
+    if show_unsigned:
+        cols += [f"ch{i}_u32_hex" for i in range(N_CHANNELS)]
+    if cal_unit:
+        cols += [f"ch{i}_{cal_unit}" for i in range(N_CHANNELS)]
+    return ",".join(cols) + "\n"
+
+
+def _format_block(
+    blk: FrameBlock,
+    *,
+    csv: bool,
+    show_unsigned: bool,
+    bits: int,
+    cal: Optional[Calibration] = None,
+    grams: bool = False,
+) -> bytes:
+    """Render a FrameBlock byte-for-byte as the per-frame printer would."""
+
+    n = len(blk)
+    pieces: List["np.ndarray"] = []
+    calv = _cal_values(blk.ch_i32, cal, grams)
+
+    if csv:
+        pieces += [_index_cols(blk), _lit(n, ",0x"), _hex_cols(blk.status_u32)]
+        for ch in range(N_CHANNELS):
+            pieces += [_lit(n, ","), _dec_cols(blk.ch_i32[:, ch], 11)]
+        if show_unsigned:
+            for ch in range(N_CHANNELS):
+                pieces += [_lit(n, ",0x"), _hex_cols(blk.ch_u32[:, ch])]
+        if calv is not None:
+            for ch in range(N_CHANNELS):
+                pieces += [_lit(n, ","), _cal_cols(calv[:, ch], grams)]
+        pieces.append(_lit(n, "\n"))
+        return _render(pieces, strip_pad=True)
+
+    note = f"  [warn: not sign-extended {bits}-bit]".encode("ascii")
+    note_row = np.frombuffer(note, dtype=np.uint8)
+    has_notes = blk.bad_signext is not None and bool(blk.bad_signext.any())
+    strip_pad = has_notes
+
+    pieces += [_lit(n, "frame "), _index_cols(blk), _lit(n, ":\n  status: 0x"), _hex_cols(blk.status_u32), _lit(n, "\n")]
+    for ch in range(N_CHANNELS):
+        pieces += [_lit(n, f"  ch{ch}: i32="), _dec_cols(blk.ch_i32[:, ch], 11, pad=ord(" "))]
+        pieces += [_lit(n, "  u32=0x" if show_unsigned else "  (0x"), _hex_cols(blk.ch_u32[:, ch])]
+        if not show_unsigned:
+            pieces.append(_lit(n, ")"))
+        if calv is not None:
+            cols = _cal_cols(calv[:, ch], grams, pad=ord(" "))
+            strip_pad |= cols.shape[1] > (_GRAMS_WIDTH if grams else _COUNTS_WIDTH)
+            pieces += [_lit(n, "  g=" if grams else "  cal="), cols]
+        if has_notes:
+            pieces.append(np.where(blk.bad_signext[:, ch, None], note_row, np.uint8(_PAD)).astype(np.uint8))
+        pieces.append(_lit(n, "\n"))
+    pieces.append(_lit(n, "\n"))
+    return _render(pieces, strip_pad=strip_pad)
+
+
+def _format_chunk(idx0: int, words: Sequence[int], args: argparse.Namespace) -> Tuple[bytes, int]:
+    """Render one framed chunk from `iter_frames`.
+
+    Returns the output bytes and the number of sign-extension violations. This
+    is also the unit of work handed to `--jobs` worker processes.
+    """
+
+    if np is None:
+        n = len(words) // WORDS_PER_FRAME
+        frs = [Frame(idx=idx0 + i, status_u32=words[i * 9], ch_u32=words[i * 9 + 1 : i * 9 + 9]) for i in range(n)]
+        text, bad = _format_frames_py(frs, args)
+        return text.encode("ascii"), bad
+
+    arr = words if isinstance(words, np.ndarray) else np.asarray(words, dtype=np.uint32)
+    mat = arr.reshape(-1, WORDS_PER_FRAME)
+    out: List[bytes] = []
+    bad_signext = 0
+    for start, stop in _block_bounds(idx0, idx0 + len(mat), _FMT_BLOCK_FRAMES):
+        blk = decode_frames(
+            mat[start - idx0 : stop - idx0],
+            idx0=start,
+            bits=args.bits_per_sample,
+            check_signext=not args.no_check_signext,
+        )
+        if blk.bad_signext is not None:
+            bad_signext += int(np.count_nonzero(blk.bad_signext))
+        out.append(
+            _format_block(
+                blk,
+                csv=args.csv,
+                show_unsigned=args.show_unsigned,
+                bits=args.bits_per_sample,
+                cal=args.cal,
+                grams=args.grams,
+            )
+        )
+    return b"".join(out), bad_signext
+
+
+# Columnar output (--out)
+#
+# Decoded blocks are appended to per-column buffers and flushed in batches of
+# _COL_BATCH_FRAMES rows, so each backend sees a few large contiguous writes
+# instead of one call per frame. Columns: frame (int64), status (uint32),
+# ch0..ch7 (int32) and, with --show-unsigned, ch0_u32..ch7_u32 (uint32).
+
+_COL_BATCH_FRAMES = 1 << 20
+_COL_FORMATS = {".npz": "npz", ".arrow": "arrow", ".feather": "arrow", ".parquet": "parquet"}
+
+
+def _column_specs(show_unsigned: bool, cal_unit: Optional[str] = None) -> List[Tuple[str, str]]:
+    """(name, little-endian NumPy dtype) of every output column."""
+
+    specs = [("frame", "<i8"), ("status", "<u4")] + [(f"ch{i}", "<i4") for i in range(N_CHANNELS)]
+    if show_unsigned:
+        specs += [(f"ch{i}_u32", "<u4") for i in range(N_CHANNELS)]
+    if cal_unit:
+        specs += [(f"ch{i}_{cal_unit}", "<f8" if cal_unit == "g" else "<i8") for i in range(N_CHANNELS)]
+    return specs
+
+
+def _block_columns(blk: FrameBlock, show_unsigned: bool, calv: Optional["np.ndarray"] = None) -> List["np.ndarray"]:
+    cols = [np.arange(blk.idx0, blk.idx0 + len(blk), dtype=np.int64), blk.status_u32]
+    cols += [blk.ch_i32[:, i] for i in range(N_CHANNELS)]
+    if show_unsigned:
+        cols += [blk.ch_u32[:, i] for i in range(N_CHANNELS)]
+    if calv is not None:
+        cols += [calv[:, i] for i in range(N_CHANNELS)]
+    return [np.ascontiguousarray(c) for c in cols]
+
+
+class ColumnarWriter(abc.ABC):
+    """Buffers decoded blocks and hands them to `_flush` in large batches.
+
+    Used as a context manager: a clean exit writes the footer/archive, an
+    exception (or a failing close) discards the partial output file.
+    """
+
+    def __init__(self, path: str, *, show_unsigned: bool = False, cal_unit: Optional[str] = None) -> None:
+        self.path = path
+        self.specs = _column_specs(show_unsigned, cal_unit)
+        self.show_unsigned = show_unsigned
+        self.rows = 0
+        self._pending: List[List["np.ndarray"]] = []
+        self._pending_rows = 0
+
+    def write(self, blk: FrameBlock, calv: Optional["np.ndarray"] = None) -> None:
+        if len(blk) == 0:
+            return
+        self._pending.append(_block_columns(blk, self.show_unsigned, calv))
+        self._pending_rows += len(blk)
+        if self._pending_rows >= _COL_BATCH_FRAMES:
+            self._drain()
+
+    def close(self) -> None:
+        self._drain()
+        self._finish()
+
+    def _drain(self) -> None:
+        if not self._pending:
+            return
+        cols = [np.concatenate(parts) for parts in zip(*self._pending)]
+        self._pending, self._pending_rows = [], 0
+        self._flush(cols)
+        self.rows += len(cols[0])
+
+    def abort(self) -> None:
+        """Release the underlying writer and remove the partial output."""
+
+        self._pending, self._pending_rows = [], 0
+        try:
+            self._abort()
+        finally:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    @abc.abstractmethod
+    def _flush(self, cols: List["np.ndarray"]) -> None:
+        """Append one batch of columns (in `specs` order)."""
+
+    @abc.abstractmethod
+    def _finish(self) -> None:
+        """Write the trailer / archive after the last batch."""
+
+    @abc.abstractmethod
+    def _abort(self) -> None:
+        """Close whatever `_flush` writes to, without finishing the file."""
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if exc[0] is not None:
+            self.abort()
+            return
+        try:
+            self.close()
+        except BaseException:
+            self.abort()
+            raise
+
+
+class NpzWriter(ColumnarWriter):
+    """`np.load`-compatible .npz (uncompressed, one array per column).
+
+    The row count is only known at the end, so columns are spooled to
+    temporary files and copied into the archive behind their .npy headers.
+    """
+
+    def __init__(self, path: str, **kw: Any) -> None:
+        super().__init__(path, **kw)
+        self._spool = [tempfile.TemporaryFile() for _ in self.specs]
+
+    def _flush(self, cols: List["np.ndarray"]) -> None:
+        for f, c, (_, dtype) in zip(self._spool, cols, self.specs):
+            f.write(c.astype(dtype, copy=False).data)
+
+    def _finish(self) -> None:
+        import zipfile
+
+        with zipfile.ZipFile(self.path, "w", zipfile.ZIP_STORED, allowZip64=True) as zf:
+            for (name, dtype), f in zip(self.specs, self._spool):
+                with zf.open(name + ".npy", "w", force_zip64=True) as member:
+                    header = {"descr": dtype, "fortran_order": False, "shape": (self.rows,)}
+                    np.lib.format.write_array_header_2_0(member, header)
+                    f.seek(0)
+                    shutil.copyfileobj(f, member, _READ_CHUNK_BYTES)
+                f.close()
+
+    def _abort(self) -> None:
+        for f in self._spool:
+            f.close()
+
+
+class ArrowWriter(ColumnarWriter):
+    """Arrow IPC file (.arrow/.feather v2) or Parquet via pyarrow; one record
+    batch / row group per flush."""
+
+    def __init__(self, path: str, *, parquet: bool = False, **kw: Any) -> None:
+        super().__init__(path, **kw)
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise SystemExit("Arrow/Parquet output requires pyarrow (pip install pyarrow)")
+        self._pa = pa
+        self._schema = pa.schema([pa.field(name, pa.from_numpy_dtype(np.dtype(dtype))) for name, dtype in self.specs])
+        if parquet:
+            import pyarrow.parquet as pq
+
+            self._writer = pq.ParquetWriter(path, self._schema)
+        else:
+            self._writer = pa.ipc.new_file(path, self._schema)
+        self._parquet = parquet
+
+    def _flush(self, cols: List["np.ndarray"]) -> None:
+        batch = self._pa.RecordBatch.from_arrays([self._pa.array(c) for c in cols], schema=self._schema)
+        if self._parquet:
+            self._writer.write_table(self._pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+
+    def _finish(self) -> None:
+        self._writer.close()
+
+    def _abort(self) -> None:
+        try:
+            self._writer.close()
+        except Exception:
+            pass  # the file is removed anyway; keep the original error
+
+
+def open_columnar(
+    path: str, fmt: Optional[str] = None, *, show_unsigned: bool = False, cal_unit: Optional[str] = None
+) -> ColumnarWriter:
+    """Writer for `path`; `fmt` (npz/arrow/parquet) defaults to the file extension."""
+
+    if fmt is None:
+        fmt = _COL_FORMATS.get(os.path.splitext(path)[1].lower())
+        if fmt is None:
+            raise SystemExit(f"cannot infer output format from {path!r}; use --out-format")
+    if fmt == "npz":
+        return NpzWriter(path, show_unsigned=show_unsigned, cal_unit=cal_unit)
+    return ArrowWriter(path, parquet=fmt == "parquet", show_unsigned=show_unsigned, cal_unit=cal_unit)
+
+
+def _write_columnar(frames: Iterable[Tuple[int, Sequence[int]]], args: argparse.Namespace, writer: ColumnarWriter) -> int:
+    """Decode framed chunks from `iter_frames` into `writer`.
+
+    Returns the number of sign-extension violations seen.
+    """
+
+    bad_signext = 0
+    for idx0, words in frames:
+        mat = np.asarray(words, dtype=np.uint32).reshape(-1, WORDS_PER_FRAME)
+        blk = decode_frames(mat, idx0=idx0, bits=args.bits_per_sample, check_signext=not args.no_check_signext)
+        if blk.bad_signext is not None:
+            bad_signext += int(np.count_nonzero(blk.bad_signext))
+        writer.write(blk, _cal_values(blk.ch_i32, args.cal, args.grams))
+    return bad_signext
+
+
+# Per-channel summary (--summary)
+#
+# Count/mean/M2 are merged block by block (Chan et al.'s parallel form of
+# Welford's update): each block's moments come from one vectorized pass and are
+# folded into the running totals, so memory does not grow with the input. The
+# LSB histogram counts the low `hist_bits` bits of every code, which is enough
+# to spot stuck or missing low-order codes without a 2**24-bin table.
+
+
+class ChannelSummary:
+    """Streaming count/min/max/mean/std/peak-to-peak and low-bit code histogram
+    for the 8 channels.
+
+    Moments are taken over raw codes (unit "lsb"), calibrated counts ("cal") or
+    grams ("g"); the histogram always covers the raw codes.
+    """
+
+    def __init__(self, *, hist_bits: int = 8, unit: str = "lsb") -> None:
+        if not 1 <= hist_bits <= 16:
+            raise ValueError("hist_bits must be in [1, 16]")
+        self.hist_bits = hist_bits
+        self.unit = unit
+        self.count = 0
+        self.mean = np.zeros(N_CHANNELS)
+        self.m2 = np.zeros(N_CHANNELS)
+        self.min = np.full(N_CHANNELS, np.inf)
+        self.max = np.full(N_CHANNELS, -np.inf)
+        self.hist = np.zeros((N_CHANNELS, 1 << hist_bits), dtype=np.int64)
+
+    def update(self, ch_i32: "np.ndarray", values: Optional["np.ndarray"] = None) -> None:
+        """Fold in an (N, 8) block of signed samples (and their calibrated `values`)."""
+
+        n = len(ch_i32)
+        if n == 0:
+            return
+        x = (ch_i32 if values is None else values).astype(np.float64)
+        mean_b = x.mean(axis=0)
+        m2_b = ((x - mean_b) ** 2).sum(axis=0)
+        total = self.count + n
+        delta = mean_b - self.mean
+        self.mean += delta * (n / total)
+        self.m2 += m2_b + delta**2 * (self.count * n / total)
+        self.count = total
+
+        self.min = np.minimum(self.min, x.min(axis=0))
+        self.max = np.maximum(self.max, x.max(axis=0))
+        low = (ch_i32.view(np.uint32) & np.uint32((1 << self.hist_bits) - 1)).astype(np.intp)
+        bins = 1 << self.hist_bits
+        self.hist += np.bincount((low + np.arange(N_CHANNELS) * bins).ravel(), minlength=N_CHANNELS * bins).reshape(
+            N_CHANNELS, bins
+        )
+
+    def rows(self) -> List[dict]:
+        """One dict per channel (JSON-ready)."""
+
+        num = float if self.unit == "g" else int
+        out = []
+        for i in range(N_CHANNELS):
+            row = {"channel": i, "count": self.count}
+            if self.count:
+                std = (self.m2[i] / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+                row.update(
+                    min=num(self.min[i]),
+                    max=num(self.max[i]),
+                    mean=float(self.mean[i]),
+                    std=float(std),
+                    p2p=num(self.max[i] - self.min[i]),
+                    lsb_codes_seen=int(np.count_nonzero(self.hist[i])),
+                    lsb_hist=self.hist[i].tolist(),
+                )
+            out.append(row)
+        return out
+
+    def format_table(self) -> str:
+        num = ".3f" if self.unit == "g" else "d"
+        lines = [] if self.unit == "lsb" else [f"# min/max/mean/std/p2p in {'grams' if self.unit == 'g' else 'calibrated counts'}"]
+        lines.append(
+            f"{'ch':>3} {'count':>10} {'min':>12} {'max':>12} {'mean':>14} {'std':>12} {'p2p':>12} "
+            f"{'lsb_codes':>9}"
+        )
+        for row in self.rows():
+            if not row["count"]:
+                lines.append(f"{row['channel']:>3} {0:>10}")
+                continue
+            codes = f"{row['lsb_codes_seen']}/{1 << self.hist_bits}"
+            lines.append(
+                f"{row['channel']:>3} {row['count']:>10} {row['min']:>12{num}} {row['max']:>12{num}} "
+                f"{row['mean']:>14.3f} {row['std']:>12.3f} {row['p2p']:>12{num}} {codes:>9}"
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _summarize(frames: Iterable[Tuple[int, Sequence[int]]], args: argparse.Namespace, summary: ChannelSummary) -> int:
+    """Fold framed chunks from `iter_frames` into `summary`.
+
+    Returns the number of sign-extension violations seen.
+    """
+
+    bad_signext = 0
+    for idx0, words in frames:
+        mat = np.asarray(words, dtype=np.uint32).reshape(-1, WORDS_PER_FRAME)
+        for start in range(0, len(mat), _FMT_BLOCK_FRAMES):
+            blk = decode_frames(
+                mat[start : start + _FMT_BLOCK_FRAMES],
+                idx0=idx0 + start,
+                bits=args.bits_per_sample,
+                check_signext=not args.no_check_signext,
+            )
+            if blk.bad_signext is not None:
+                bad_signext += int(np.count_nonzero(blk.bad_signext))
+            summary.update(blk.ch_i32, _cal_values(blk.ch_i32, args.cal, args.grams))
+    return bad_signext
+
+
+# Parallel decode (--jobs)
+#
+# The main process reads the input and cuts it at line (or word) boundaries;
+# workers tokenize those chunks. Framing, --skip-words and --max-frames stay in
+# the main process (iter_frames), so every frame chunk carries its absolute
+# index. Workers then render the frame chunks, and results are written back
+# strictly in submission order, which keeps the output byte-identical to a
+# single-process run.
+
+
+def _ordered_map(executor: Executor, fn: Callable[..., T], tasks: Iterable[tuple], window: int) -> Iterator[T]:
+    """Like executor.map, but lazy: at most `window` tasks are in flight."""
+
+    pending: Deque["Future[T]"] = collections.deque()
+    for task in tasks:
+        pending.append(executor.submit(fn, *task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _split_frame_chunks(frames: Iterable[Tuple[int, Sequence[int]]], n_frames: int) -> Iterator[Tuple[int, Sequence[int]]]:
+    """Re-cut framed chunks into pieces of at most `n_frames` frames."""
+
+    step = n_frames * WORDS_PER_FRAME
+    for idx0, words in frames:
+        for off in range(0, len(words), step):
+            yield idx0 + off // WORDS_PER_FRAME, words[off : off + step]
+
+
+def _write_frames(
+    frames: Iterable[Tuple[int, Sequence[int]]],
+    args: argparse.Namespace,
+    out: BinaryIO,
+    *,
+    executor: Optional[Executor] = None,
+    window: int = 1,
+) -> int:
+    """Format framed chunks from `iter_frames` to `out`, flushing after each one.
+
+    Returns the number of sign-extension violations seen.
+    """
+
+    if executor is None:
+        results: Iterable[Tuple[bytes, int]] = (_format_chunk(idx0, words, args) for idx0, words in frames)
+    else:
+        tasks = ((idx0, words, args) for idx0, words in _split_frame_chunks(frames, _PAR_CHUNK_FRAMES))
+        results = _ordered_map(executor, _format_chunk, tasks, window)
+
+    bad_signext = 0
+    header_done = False
+    for data, bad in results:
+        if args.csv and not header_done:
+            out.write(_csv_header(args.show_unsigned, _cal_unit(args)).encode("ascii"))
+            header_done = True
+        bad_signext += bad
+        out.write(data)
+        out.flush()
+    return bad_signext
+
+
+def selftest() -> int:
+    """Check that the NumPy renderer matches the per-frame fallback byte for byte,
+    including calibrated gram values too wide for their column or for int64."""
+
+    if np is None:
+        raise SystemExit("--selftest requires NumPy (pip install numpy)")
+    failures = 0
+    rng = np.random.default_rng(1)
+    words = rng.integers(-(1 << 23), 1 << 23, size=(64, WORDS_PER_FRAME)).astype(np.uint32)
+    words[:, 0] &= 0xFFFF
+    words[:4, 1:] = np.array([-(1 << 31), (1 << 31) - 1, -1, 0], dtype=np.int64).astype(np.uint32)[:, None]
+    words[5, 3] = 0x0100_0000  # not sign-extended: exercises the note column
+    flat = words.ravel()
+    frames = [Frame(idx=i, status_u32=int(w[0]), ch_u32=[int(x) for x in w[1:]]) for i, w in enumerate(words)]
+    cal = Calibration(
+        tare=(0, 0, -(1 << 31), (1 << 31) - 1, 1532, 0, 0, 0),
+        scale=(0x0001_0000, 0xFFFF_FFFF, 0xFFFF_FFFF, 0xFFFF_FFFF, 0x0001_2000, 0x8000_0000, 1, 0),
+        grams_per_count=(0.0125, 0.5, 40.0, 1e6, -3.5, 1e12, 0.001, 2.0),
+    )
+    for csv, show_unsigned, cal_arg, grams in itertools.product((False, True), (False, True), (None, cal), (False, True)):
+        if grams and cal_arg is None:
+            continue
+        args = argparse.Namespace(
+            csv=csv, show_unsigned=show_unsigned, bits_per_sample=24, no_check_signext=False, cal=cal_arg, grams=grams
+        )
+        got, bad = _format_chunk(0, flat, args)
+        text, exp_bad = _format_frames_py(frames, args)
+        name = f"csv={csv} show_unsigned={show_unsigned} cal={cal_arg is not None} grams={grams}"
+        if got != text.encode("ascii") or bad != exp_bad:
+            failures += 1
+            exp_lines, got_lines = text.splitlines(), got.decode("ascii", "replace").splitlines()
+            diff = next((i for i, (a, b) in enumerate(zip(exp_lines, got_lines)) if a != b), min(len(exp_lines), len(got_lines)))
+            print(f"FAIL {name}: NumPy output differs from fallback at line {diff + 1}", file=sys.stderr)
+    print("selftest:", "PASS" if failures == 0 else f"{failures} failure(s)")
+    return 0 if failures == 0 else 1
+
+
 def main(argv: List[str]) -> int:
     ap = argparse.ArgumentParser(description="Decode ADC FIFO 9-word frames")
     ap.add_argument(
         "path",
+        nargs="?",
         help="Input file path, or '-' for stdin",
     )
+    ap.add_argument(
+        "--format",
+        choices=["text", "bin", "bin-be"],
+        default="text",
+        help="Input format: text tokens, or raw little-/big-endian u32 words (default: text)",
+    )
+    ap.add_argument(
+        "--extract",
+        choices=sorted(_EXTRACT_RES),
+        default=None,
+        help=(
+            "Lenient text mode for noisy UART/printf logs: pull out every 0x-prefixed hex literal (0x), "
+            "standalone 8-digit hex token (hex8) or standalone decimal token (dec) and ignore the rest"
+        ),
+    )
+    ap.add_argument(
+        "--line-prefix",
+        default=None,
+        help="Only decode text lines containing this marker; tokens are taken from the text after it",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Decode with N worker processes (0 = one per CPU); output is identical to --jobs 1 (default: 1)",
+    )
+    ap.add_argument(
+        "--auto-align",
+        action="store_true",
+        help=(
+            "Find the frame phase from the channel sign-extension / STATUS zero-extension invariants "
+            "and re-lock after slips (e.g. OVERRUN drops) instead of trusting --skip-words alone"
+        ),
+    )
+    ap.add_argument(
+        "--align-window",
+        type=int,
+        default=64,
+        help="Frames per scoring window for --auto-align (default: 64)",
+    )
+    ap.add_argument(
+        "--resync-index",
+        default=None,
+        help="With --auto-align, write detected lock/resync points as CSV (frame,word_offset,skipped_words)",
+    )
     ap.add_argument(
         "--skip-words",
         type=int,
@@ -166,78 +1753,193 @@ def main(argv: List[str]) -> int:
         action="store_true",
         help="Also print channel words as unsigned u32",
     )
+    ap.add_argument(
+        "--calibration",
+        default=None,
+        help=(
+            "Apply ((raw - TARE_CHx) * SCALE_CHx) >> 16 from a file shaped like the calibration block of "
+            "spec/regmap_v1.yaml (YAML or .json); adds chN_cal columns"
+        ),
+    )
+    ap.add_argument(
+        "--grams",
+        action="store_true",
+        help="With --calibration, report grams (calibrated counts * grams_per_count from the file) instead",
+    )
+    ap.add_argument(
+        "--summary",
+        action="store_true",
+        help="Print per-channel statistics (count/min/max/mean/std/p2p, LSB code histogram) instead of frames",
+    )
+    ap.add_argument(
+        "--summary-json",
+        action="store_true",
+        help="Like --summary, but print JSON including the full --hist-bits code histogram",
+    )
+    ap.add_argument(
+        "--hist-bits",
+        type=int,
+        default=8,
+        help="Low-order bits covered by the --summary code histogram (default: 8)",
+    )
+    ap.add_argument(
+        "--out",
+        default=None,
+        help="Write decoded frames to a columnar file (.npz, .arrow/.feather or .parquet) instead of stdout",
+    )
+    ap.add_argument(
+        "--out-format",
+        choices=["npz", "arrow", "parquet"],
+        default=None,
+        help="Columnar format for --out (default: from the file extension; arrow/parquet need pyarrow)",
+    )
+    ap.add_argument(
+        "--selftest",
+        action="store_true",
+        help="Check the NumPy renderer against the per-frame fallback on built-in data (requires NumPy)",
+    )
 
     args = ap.parse_args(argv)
+    args.summary = args.summary or args.summary_json
 
-    if args.path == "-":
-        lines = sys.stdin
-    else:
-        lines = open(args.path, "r", encoding="utf-8")
-
-    try:
-        words = _read_words(lines)
-    finally:
-        if args.path != "-":
-            lines.close()
+    if args.selftest:
+        return selftest()
+    if not args.path:
+        ap.error("path is required (or use --selftest)")
 
-    if args.skip_words:
-        if args.skip_words > len(words):
-            raise SystemExit(f"--skip-words={args.skip_words} exceeds input length {len(words)}")
+    if args.format != "text" and np is None:
+        raise SystemExit(f"--format {args.format} requires NumPy (pip install numpy)")
+    if args.auto_align and np is None:
+        raise SystemExit("--auto-align requires NumPy (pip install numpy)")
+    if args.align_window < 2:
+        raise SystemExit("--align-window must be >= 2")
+    if args.out and np is None:
+        raise SystemExit("--out requires NumPy (pip install numpy)")
+    if args.out_format and not args.out:
+        raise SystemExit("--out-format requires --out")
+    if args.summary and np is None:
+        raise SystemExit("--summary requires NumPy (pip install numpy)")
+    if args.summary and args.out:
+        raise SystemExit("--summary and --out are mutually exclusive")
+    if not 1 <= args.hist_bits <= 16:
+        raise SystemExit("--hist-bits must be in [1, 16]")
+    args.cal = None
+    if args.calibration:
+        try:
+            args.cal = load_calibration(args.calibration)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"--calibration {args.calibration}: {e}")
+        if args.grams and args.cal.grams_per_count is None:
+            raise SystemExit(f"--grams: {args.calibration} has no grams_per_count")
+    elif args.grams:
+        raise SystemExit("--grams requires --calibration")
+    summary = ChannelSummary(hist_bits=args.hist_bits, unit=_cal_unit(args) or "lsb") if args.summary else None
+    writer = (
+        open_columnar(args.out, args.out_format, show_unsigned=args.show_unsigned, cal_unit=_cal_unit(args))
+        if args.out
+        else None
+    )
 
-    frames = _frames_from_words(words, start_index=args.skip_words)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    window = 2 * jobs
 
-    leftover = (len(words) - args.skip_words) % 9
-    if leftover:
-        print(
-            f"[warn] input length after skip is not multiple of 9: {leftover} trailing word(s) ignored",
-            file=sys.stderr,
-        )
+    stats = StreamStats()
+    stream: Optional[BinaryIO] = None
+    batches: Iterable[Sequence[int]]
+    if args.format != "text" and args.path != "-":
+        batches = [_map_words_bin(args.path, big_endian=args.format == "bin-be")]
+    else:
+        stream = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+        if args.format == "text":
+            cfg = TokenizerConfig(
+                extract=args.extract,
+                line_prefix=args.line_prefix.encode("utf-8") if args.line_prefix else None,
+            )
+            if executor is None:
+                batches = _iter_text_words(stream, cfg)
+            else:
+                tasks = ((data, ln0, cfg) for data, ln0 in _iter_line_chunks(stream))
+                batches = _ordered_map(executor, _tokenize_chunk, tasks, window)
+        else:
+            batches = _iter_bin_words(stream, big_endian=args.format == "bin-be")
 
-    if args.max_frames is not None:
-        frames = frames[: args.max_frames]
+    resyncs: List[Resync] = []
 
-    if not frames:
-        print("no complete frames found", file=sys.stderr)
-        return 2
+    def report_resync(r: Resync) -> None:
+        if len(resyncs) == 1:
+            print(f"[info] auto-align: locked at input word {r.word_offset} ({r.skipped_words} word(s) skipped)", file=sys.stderr)
+        else:
+            print(
+                f"[warn] auto-align: framing slipped; re-locked at input word {r.word_offset} "
+                f"before frame {r.frame} ({r.skipped_words} word(s) dropped)",
+                file=sys.stderr,
+            )
 
-    bad_signext = 0
+    sys.stdout.flush()
+    try:
+        if args.auto_align:
+            frames = iter_aligned_frames(
+                batches,
+                bits=args.bits_per_sample,
+                window_frames=args.align_window,
+                skip_words=args.skip_words,
+                max_frames=args.max_frames,
+                stats=stats,
+                resyncs=resyncs,
+                on_resync=report_resync,
+            )
+        else:
+            frames = iter_frames(batches, skip_words=args.skip_words, max_frames=args.max_frames, stats=stats)
+        if summary is not None:
+            bad_signext = _summarize(frames, args, summary)
+        elif writer is not None:
+            with writer:
+                bad_signext = _write_columnar(frames, args, writer)
+        else:
+            bad_signext = _write_frames(frames, args, sys.stdout.buffer, executor=executor, window=window)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if stream is not None and args.path != "-":
+            stream.close()
 
-    if args.csv:
-        # CSV header
-        cols = ["frame", "status_hex"] + [f"ch{i}_i32" for i in range(8)]
-        if args.show_unsigned:
-            cols += [f"ch{i}_u32_hex" for i in range(8)]
-        print(",".join(cols))
+    if args.resync_index:
+        with open(args.resync_index, "w", encoding="utf-8") as f:
+            f.write("frame,word_offset,skipped_words\n")
+            for r in resyncs:
+                f.write(f"{r.frame},{r.word_offset},{r.skipped_words}\n")
 
-        for fr in frames:
-            ch_i32 = [_to_i32(u) for u in fr.ch_u32]
-            if not args.no_check_signext:
-                for u in fr.ch_u32:
-                    if not _signext_ok(u, bits=args.bits_per_sample):
-                        bad_signext += 1
+    # Input length checks need the whole input; skip them when --max-frames
+    # stopped the read early.
+    if args.auto_align:
+        if args.skip_words > stats.words:
+            raise SystemExit(f"--skip-words={args.skip_words} exceeds input length {stats.words}")
+        if len(resyncs) > 1:
+            print(f"[warn] auto-align: {len(resyncs) - 1} resync point(s) detected", file=sys.stderr)
+        if stats.tail_words and not stats.truncated:
+            print(f"[warn] {stats.tail_words} trailing word(s) after the last complete frame ignored", file=sys.stderr)
+    elif not stats.truncated:
+        if args.skip_words > stats.words:
+            raise SystemExit(f"--skip-words={args.skip_words} exceeds input length {stats.words}")
 
-            row = [str(fr.idx), f"0x{fr.status_u32:08X}"] + [str(x) for x in ch_i32]
-            if args.show_unsigned:
-                row += [f"0x{u:08X}" for u in fr.ch_u32]
-            print(",".join(row))
+        leftover = (stats.words - args.skip_words) % 9
+        if leftover:
+            print(
+                f"[warn] input length after skip is not multiple of 9: {leftover} trailing word(s) ignored",
+                file=sys.stderr,
+            )
 
-    else:
-        for fr in frames:
-            print(f"frame {fr.idx}:")
-            print(f"  status: 0x{fr.status_u32:08X}")
-            for ch, u in enumerate(fr.ch_u32):
-                i = _to_i32(u)
-                if not args.no_check_signext and not _signext_ok(u, bits=args.bits_per_sample):
-                    bad_signext += 1
-                    signext_note = f"  [warn: not sign-extended {args.bits_per_sample}-bit]"
-                else:
-                    signext_note = ""
+    if stats.frames == 0:
+        print("no complete frames found", file=sys.stderr)
+        return 2
 
-                if args.show_unsigned:
-                    print(f"  ch{ch}: i32={i:11d}  u32=0x{u:08X}{signext_note}")
-                else:
-                    print(f"  ch{ch}: i32={i:11d}  (0x{u:08X}){signext_note}")
-            print("")
+    if summary is not None:
+        if args.summary_json:
+            doc = {"frames": stats.frames, "unit": summary.unit, "hist_bits": summary.hist_bits, "channels": summary.rows()}
+            sys.stdout.write(json.dumps(doc) + "\n")
+        else:
+            sys.stdout.write(summary.format_table())
 
     if (not args.no_check_signext) and bad_signext:
         print(
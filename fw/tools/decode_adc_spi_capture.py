@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""Decode ADS131M08 SPI logic-analyzer captures into SoC FIFO words.
+
+This is the host-side twin of rtl/adc/adc_spi_frame_capture.v +
+adc_streaming_ingest.v: it takes a sampled SCLK/CS_N/MISO capture of the ADC
+bus (spec/ads131m08_interface.md) and produces the same 32-bit words the SoC
+would later pop from ADC_FIFO_DATA, so a bench capture can be compared
+word-for-word with a FIFO dump using fw/tools/decode_adc_fifo.py.
+
+Bus contract (defaults match the RTL):
+  - SPI mode 1 (CPOL=0, CPHA=1), MSB-first; MISO is sampled on the trailing
+    (falling) SCLK edge while CS_N is low.
+  - One CS_N-low window per frame: 10 words x 24 bits (STATUS/RESPONSE,
+    CH0..CH7, OUTPUT_CRC).
+  - The first 9 words are kept (`--words-out`), i.e. the CRC word is dropped.
+    STATUS is zero-extended and CH0..CH7 are sign-extended to 32 bits, exactly
+    like the ingest tap / FIFO.
+
+Input formats (`--format`, default from the file extension):
+  csv  sigrok-cli `-O csv` output or any CSV with one sample per row; ';'/'#'
+       comment lines are skipped and an optional header row names the columns.
+  sr   sigrok session files (.sr); logic chunks are read straight out of the
+       zip archive.
+  raw  sigrok-cli `-O binary` output: `--unitsize` bytes per sample, one bit
+       per logic channel.
+Signals are selected with `--sclk/--cs/--miso`, either by channel name (CSV
+header / .sr probe name) or by 0-based index (CSV column / logic bit).
+
+Output (`--out-format`): `text` writes one 0x%08X word per line (the default
+decode_adc_fifo.py input format), `bin` writes raw little-endian u32 words
+(`decode_adc_fifo.py --format bin`).
+
+Usage:
+  sigrok-cli -d fx2lafw -c samplerate=24m --time 200 -O csv -o bus.csv
+  python3 fw/tools/decode_adc_spi_capture.py bus.csv --sclk D0 --cs D1 --miso D2 \\
+      | python3 fw/tools/decode_adc_fifo.py -
+  python3 fw/tools/decode_adc_spi_capture.py bus.sr --sclk SCLK --cs CS_N --miso MISO \\
+      --out-format bin -o frames.u32
+
+Performance: samples are processed in large chunks (NumPy required). SCLK and
+CS_N edges are found with vectorized comparisons against the previous sample,
+MISO bits are grouped into frames with searchsorted over the CS_N edges, and
+complete frames are packed into words with numpy.packbits; only the edge state
+and the bits of the frame straddling a chunk boundary are carried over.
+
+Frames whose CS_N window holds fewer bits than a full frame (aborted
+transfers, capture starting mid-frame) are dropped and counted; extra bits
+beyond a full frame are ignored. Exit code is non-zero on malformed input.
+"""
+
+from __future__ import annotations
+
+import argparse
+import configparser
+import os
+import re
+import sys
+import zipfile
+from dataclasses import dataclass, field
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # required; reported from main() with an install hint
+    np = None
+
+
+# Upper bound for one read from the input stream / one .sr logic member.
+_READ_CHUNK_BYTES = 1 << 22
+
+_FORMATS = ("csv", "sr", "raw")
+
+
+# -----------------------------------------------------------------------------
+# Sample sources
+#
+# Every reader yields (n_samples, 3) uint8 arrays of 0/1 values with the columns
+# in (sclk, cs, miso) order.
+# -----------------------------------------------------------------------------
+
+
+def _pick(names: Sequence[str], sel: str, what: str) -> int:
+    """Resolve a --sclk/--cs/--miso selector against the available channel names."""
+
+    if sel in names:
+        return list(names).index(sel)
+    if re.fullmatch(r"\d+", sel):
+        idx = int(sel)
+        if names and idx >= len(names):
+            raise ValueError(f"{what} index {idx} out of range ({len(names)} channels)")
+        return idx
+    raise ValueError(f"{what} channel {sel!r} not found (have: {', '.join(names) or 'no names'})")
+
+
+def _iter_blocks(stream: BinaryIO) -> Iterator[bytes]:
+    """Yield newline-terminated blocks of at most about _READ_CHUNK_BYTES."""
+
+    tail = b""
+    while True:
+        chunk = stream.read(_READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        data = tail + chunk
+        cut = data.rfind(b"\n") + 1
+        tail = data[cut:]
+        if cut:
+            yield data[:cut]
+    if tail.strip():
+        yield tail + b"\n"
+
+
+def _csv_fast(data: bytes, ncols: int) -> Optional["np.ndarray"]:
+    """Parse rows of single-digit fields (`0,1,1\\n`) as a byte matrix, else None."""
+
+    width = 2 * ncols
+    if len(data) % width:
+        return None
+    mat = np.frombuffer(data, dtype=np.uint8).reshape(-1, width)
+    seps = mat[:, 1::2]
+    if not ((seps[:, :-1] == ord(",")).all() and (seps[:, -1] == ord("\n")).all()):
+        return None
+    digits = mat[:, 0::2] - ord("0")
+    if (digits > 1).any():
+        return None
+    return digits
+
+
+def _csv_slow(data: bytes, cols: Sequence[int], ln0: int) -> "np.ndarray":
+    rows: List[List[int]] = []
+    for i, raw in enumerate(data.split(b"\n")):
+        line = raw.strip()
+        if not line or line[:1] in (b";", b"#"):
+            continue
+        fields = line.split(b",")
+        try:
+            rows.append([int(fields[c]) for c in cols])
+        except (IndexError, ValueError):
+            raise ValueError(f"line {ln0 + i}: cannot parse sample row {line[:80]!r}")
+    out = np.array(rows, dtype=np.int64).reshape(-1, len(cols))
+    if ((out < 0) | (out > 1)).any():
+        raise ValueError(f"line {ln0}+: logic values must be 0 or 1")
+    return out.astype(np.uint8)
+
+
+def iter_csv_samples(stream: BinaryIO, sel: Tuple[str, str, str]) -> Iterator["np.ndarray"]:
+    """Yield (sclk, cs, miso) sample blocks from a sigrok/generic CSV export."""
+
+    ncols = 0
+    cols: Optional[List[int]] = None
+    ln = 1
+    for block in _iter_blocks(stream):
+        block = block.replace(b"\r", b"")
+        if cols is None:
+            # Consume comments and the optional header row from the first block.
+            lines = block.split(b"\n")
+            skip = 0
+            names: List[str] = []
+            for raw in lines:
+                line = raw.strip()
+                if not line or line[:1] in (b";", b"#"):
+                    skip += 1
+                    continue
+                fields = [f.strip().decode("utf-8", "replace") for f in line.split(b",")]
+                ncols = len(fields)
+                if not all(re.fullmatch(r"[-+0-9.eE]+", f) for f in fields):
+                    names = fields
+                    skip += 1
+                break
+            else:
+                ln += len(lines) - 1
+                continue
+            cols = [_pick(names, s, w) for s, w in zip(sel, ("--sclk", "--cs", "--miso"))]
+            if max(cols) >= ncols:
+                raise ValueError(f"column {max(cols)} out of range ({ncols} columns)")
+            block = b"\n".join(lines[skip:])
+            ln += skip
+            if not block.strip():
+                continue
+
+        n_lines = block.count(b"\n")
+        mat = _csv_fast(block, ncols)
+        yield mat[:, cols] if mat is not None else _csv_slow(block, cols, ln)
+        ln += n_lines
+
+
+def _bits(raw: bytes, unitsize: int, bits: Sequence[int]) -> "np.ndarray":
+    samples = np.frombuffer(raw, dtype=np.uint8).reshape(-1, unitsize)
+    out = np.empty((len(samples), len(bits)), dtype=np.uint8)
+    for j, b in enumerate(bits):
+        np.bitwise_and(samples[:, b >> 3] >> (b & 7), 1, out=out[:, j])
+    return out
+
+
+def iter_raw_samples(stream: BinaryIO, sel: Tuple[str, str, str], unitsize: int) -> Iterator["np.ndarray"]:
+    """Yield (sclk, cs, miso) sample blocks from sigrok-cli `-O binary` output."""
+
+    bits = [_pick([], s, w) for s, w in zip(sel, ("--sclk", "--cs", "--miso"))]
+    if max(bits) >= 8 * unitsize:
+        raise ValueError(f"logic bit {max(bits)} out of range for --unitsize {unitsize}")
+    step = _READ_CHUNK_BYTES - _READ_CHUNK_BYTES % unitsize
+    tail = b""
+    while True:
+        chunk = stream.read(step)
+        if not chunk:
+            break
+        data = tail + chunk
+        n = len(data) - len(data) % unitsize
+        tail = data[n:]
+        if n:
+            yield _bits(data[:n], unitsize, bits)
+    if tail:
+        print(f"[warn] {len(tail)} trailing byte(s) do not form a whole sample; ignored", file=sys.stderr)
+
+
+def iter_sr_samples(path: str, sel: Tuple[str, str, str]) -> Iterator["np.ndarray"]:
+    """Yield (sclk, cs, miso) sample blocks from a sigrok .sr session archive."""
+
+    with zipfile.ZipFile(path) as zf:
+        meta = configparser.ConfigParser(interpolation=None)
+        meta.read_string(zf.read("metadata").decode("utf-8"))
+        dev = next((s for s in meta.sections() if s.startswith("device")), None)
+        if dev is None:
+            raise ValueError("metadata has no [device N] section")
+        sec = meta[dev]
+        unitsize = int(sec.get("unitsize", "1"))
+        n_probes = int(sec.get("total probes", "0"))
+        names = [sec.get(f"probe{i + 1}", "") for i in range(n_probes)]
+        bits = [_pick(names, s, w) for s, w in zip(sel, ("--sclk", "--cs", "--miso"))]
+        if max(bits) >= 8 * unitsize:
+            raise ValueError(f"logic bit {max(bits)} out of range for unitsize {unitsize}")
+
+        prefix = sec.get("capturefile", "logic-1")
+        members = [m for m in zf.namelist() if m == prefix or m.startswith(prefix + "-")]
+        members.sort(key=lambda m: int(m.rsplit("-", 1)[1]) if m != prefix else 0)
+        if not members:
+            raise ValueError(f"no {prefix} data in archive")
+
+        step = _READ_CHUNK_BYTES - _READ_CHUNK_BYTES % unitsize
+        tail = b""
+        for m in members:
+            with zf.open(m) as f:
+                while True:
+                    chunk = f.read(step)
+                    if not chunk:
+                        break
+                    data = tail + chunk
+                    n = len(data) - len(data) % unitsize
+                    tail = data[n:]
+                    if n:
+                        yield _bits(data[:n], unitsize, bits)
+
+
+# -----------------------------------------------------------------------------
+# Bus decoder
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class SpiConfig:
+    cpol: int = 0
+    cpha: int = 1
+    bits_per_word: int = 24
+    words_per_frame: int = 10
+    words_out: int = 9
+
+    @property
+    def frame_bits(self) -> int:
+        return self.bits_per_word * self.words_per_frame
+
+
+@dataclass
+class CaptureStats:
+    samples: int = 0
+    frames: int = 0
+    short_frames: int = 0
+    long_frames: int = 0
+    leading_bits: int = 0
+    open_bits: int = 0
+
+
+@dataclass
+class _BusState:
+    sclk: int = -1
+    cs: int = -1
+    # True while inside a CS_N-low window that began with an observed falling
+    # edge (bits before the first CS_N fall belong to no frame).
+    in_frame: bool = False
+    carry: "np.ndarray" = field(default_factory=lambda: np.empty(0, dtype=np.uint8))
+
+
+class SpiFrameDecoder:
+    """Incremental SCLK/CS_N/MISO -> frame-word decoder.
+
+    feed() takes (n, 3) 0/1 sample blocks and returns an (m, words_out) uint32
+    matrix of the frames completed inside the block.
+    """
+
+    def __init__(self, cfg: SpiConfig = SpiConfig()) -> None:
+        self.cfg = cfg
+        self.stats = CaptureStats()
+        self._st = _BusState()
+
+    def feed(self, samples: "np.ndarray") -> "np.ndarray":
+        cfg, st = self.cfg, self._st
+        n = len(samples)
+        if n == 0:
+            return np.empty((0, cfg.words_out), dtype=np.uint32)
+        self.stats.samples += n
+        sclk, cs, miso = samples[:, 0], samples[:, 1], samples[:, 2]
+
+        # Previous-sample views; the first capture sample produces no edges.
+        sclk_prev = np.empty_like(sclk)
+        sclk_prev[0] = sclk[0] if st.sclk < 0 else st.sclk
+        sclk_prev[1:] = sclk[:-1]
+        cs_prev = np.empty_like(cs)
+        cs_prev[0] = cs[0] if st.cs < 0 else st.cs
+        cs_prev[1:] = cs[:-1]
+        st.sclk, st.cs = int(sclk[-1]), int(cs[-1])
+
+        idle = cfg.cpol
+        if cfg.cpha:  # trailing edge: active -> idle
+            edge = (sclk_prev != idle) & (sclk == idle)
+        else:  # leading edge: idle -> active
+            edge = (sclk_prev == idle) & (sclk != idle)
+        bit_pos = np.flatnonzero(edge & (cs == 0))
+        bits = miso[bit_pos]
+
+        cs_fall = np.flatnonzero((cs_prev == 1) & (cs == 0))
+        cs_rise = np.flatnonzero((cs_prev == 0) & (cs == 1))
+
+        # Frame windows in this block: a window carried over from the previous
+        # block (start -1) plus one per CS_N fall. A rise before the first
+        # window start closes a CS_N-low stretch that began before the capture
+        # did; that stretch is not a frame.
+        starts = np.concatenate(([-1], cs_fall)) if st.in_frame else cs_fall
+        n_closed = int((cs_rise > starts[0]).sum()) if len(starts) else 0
+        n_win = len(starts)
+        win = np.searchsorted(starts, bit_pos, side="right") - 1
+        lead = win < 0
+        if lead.any():
+            self.stats.leading_bits += int(lead.sum())
+            bits, win = bits[~lead], win[~lead]
+
+        if st.in_frame and len(st.carry):
+            bits = np.concatenate((st.carry, bits))
+            win = np.concatenate((np.zeros(len(st.carry), dtype=win.dtype), win))
+
+        counts = np.bincount(win, minlength=n_win) if n_win else np.zeros(0, dtype=np.int64)
+        closed = min(n_closed, n_win)
+        st.in_frame = n_win > closed
+        st.carry = bits[win == n_win - 1].copy() if st.in_frame else np.empty(0, dtype=np.uint8)
+
+        fb = cfg.frame_bits
+        c = counts[:closed]
+        self.stats.short_frames += int((c < fb).sum())
+        self.stats.long_frames += int((c > fb).sum())
+        full = np.flatnonzero(c >= fb)
+        if len(full) == 0:
+            return np.empty((0, cfg.words_out), dtype=np.uint32)
+
+        first = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        take = (first[full, None] + np.arange(fb)).ravel()
+        words = _pack_words(bits[take].reshape(len(full), cfg.words_per_frame, cfg.bits_per_word))
+        self.stats.frames += len(full)
+        return _soc_words(words[:, : cfg.words_out], cfg.bits_per_word)
+
+    def finish(self) -> None:
+        """Account for a frame still open at the end of the capture."""
+
+        if self._st.in_frame:
+            self.stats.open_bits += len(self._st.carry)
+            self._st.in_frame = False
+            self._st.carry = np.empty(0, dtype=np.uint8)
+
+
+def _pack_words(bits: "np.ndarray") -> "np.ndarray":
+    """Pack (..., B) MSB-first 0/1 arrays into right-justified uint32 words."""
+
+    width = bits.shape[-1]
+    packed = np.packbits(bits, axis=-1).astype(np.uint32)
+    words = np.zeros(packed.shape[:-1], dtype=np.uint32)
+    for i in range(packed.shape[-1]):
+        words = (words << 8) | packed[..., i]
+    return words >> (8 * packed.shape[-1] - width)
+
+
+def _soc_words(words: "np.ndarray", bits_per_word: int) -> "np.ndarray":
+    """Apply the ingest tap's extension: STATUS as-is, channels sign-extended."""
+
+    out = words.copy()
+    if bits_per_word < 32 and out.shape[1] > 1:
+        ch = out[:, 1:]
+        sign = np.uint32(1 << (bits_per_word - 1))
+        ext = np.uint32((0xFFFF_FFFF << bits_per_word) & 0xFFFF_FFFF)
+        ch |= np.where(ch & sign, ext, np.uint32(0))
+    return out
+
+
+def _write_words(out: BinaryIO, words: "np.ndarray", fmt: str) -> None:
+    flat = words.ravel()
+    if fmt == "bin":
+        out.write(flat.astype("<u4").tobytes())
+    elif len(flat):
+        out.write(("\n".join(map("0x{:08X}".format, flat.tolist())) + "\n").encode("ascii"))
+
+
+def _guess_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".sr":
+        return "sr"
+    if ext in (".bin", ".raw"):
+        return "raw"
+    return "csv"
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description="Decode ADS131M08 SPI logic-analyzer captures into SoC FIFO words")
+    ap.add_argument("path", help="Capture file path, or '-' for stdin (csv/raw only)")
+    ap.add_argument(
+        "--format",
+        choices=_FORMATS,
+        default=None,
+        help="Capture format (default: from the extension; .sr -> sr, .bin/.raw -> raw, else csv)",
+    )
+    ap.add_argument("--sclk", default="SCLK", help="SCLK channel name or 0-based index (default: SCLK)")
+    ap.add_argument("--cs", default="CS_N", help="CS_N channel name or 0-based index (default: CS_N)")
+    ap.add_argument("--miso", default="MISO", help="MISO (ADC DOUT) channel name or 0-based index (default: MISO)")
+    ap.add_argument("--unitsize", type=int, default=1, help="Bytes per sample for --format raw (default: 1)")
+    ap.add_argument("--cpol", type=int, choices=[0, 1], default=0, help="SCLK idle level (default: 0)")
+    ap.add_argument(
+        "--cpha",
+        type=int,
+        choices=[0, 1],
+        default=1,
+        help="1 = sample MISO on the trailing SCLK edge, 0 = on the leading edge (default: 1)",
+    )
+    ap.add_argument("--bits-per-word", type=int, default=24, help="SPI word width (default: 24)")
+    ap.add_argument("--words-per-frame", type=int, default=10, help="SPI words per CS_N frame (default: 10)")
+    ap.add_argument(
+        "--words-out",
+        type=int,
+        default=9,
+        help="Leading words kept per frame, as the ingest WORDS_OUT parameter (default: 9, drops OUTPUT_CRC)",
+    )
+    ap.add_argument(
+        "--out-format",
+        choices=["text", "bin"],
+        default="text",
+        help="Output 0x%%08X lines (text) or raw little-endian u32 (bin) (default: text)",
+    )
+    ap.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+
+    args = ap.parse_args(argv)
+
+    if np is None:
+        raise SystemExit("decode_adc_spi_capture.py requires NumPy (pip install numpy)")
+    if not 1 <= args.bits_per_word <= 32:
+        raise SystemExit("--bits-per-word must be in [1, 32]")
+    if args.words_per_frame < 1 or not 1 <= args.words_out <= args.words_per_frame:
+        raise SystemExit("--words-out must be in [1, --words-per-frame]")
+    if args.unitsize < 1:
+        raise SystemExit("--unitsize must be >= 1")
+    fmt = args.format or _guess_format(args.path)
+    if fmt == "sr" and args.path == "-":
+        raise SystemExit("--format sr needs a file path (zip archives are not streamable)")
+
+    cfg = SpiConfig(
+        cpol=args.cpol,
+        cpha=args.cpha,
+        bits_per_word=args.bits_per_word,
+        words_per_frame=args.words_per_frame,
+        words_out=args.words_out,
+    )
+    dec = SpiFrameDecoder(cfg)
+    sel = (args.sclk, args.cs, args.miso)
+
+    stream: Optional[BinaryIO] = None
+    out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        if fmt == "sr":
+            blocks = iter_sr_samples(args.path, sel)
+        else:
+            stream = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+            if fmt == "raw":
+                blocks = iter_raw_samples(stream, sel, args.unitsize)
+            else:
+                blocks = iter_csv_samples(stream, sel)
+        for block in blocks:
+            _write_words(out, dec.feed(block), args.out_format)
+        dec.finish()
+    except (ValueError, KeyError, zipfile.BadZipFile, configparser.Error) as e:
+        print(f"[error] {args.path}: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if stream is not None and stream is not sys.stdin.buffer:
+            stream.close()
+        if out is not sys.stdout.buffer:
+            out.close()
+        else:
+            out.flush()
+
+    s = dec.stats
+    print(f"[info] {s.samples} samples, {s.frames} frame(s)", file=sys.stderr)
+    if s.short_frames:
+        print(f"[warn] {s.short_frames} CS_N window(s) shorter than {cfg.frame_bits} bits dropped", file=sys.stderr)
+    if s.long_frames:
+        print(f"[warn] {s.long_frames} CS_N window(s) longer than {cfg.frame_bits} bits; extra bits ignored", file=sys.stderr)
+    if s.leading_bits:
+        print(f"[warn] capture starts mid-frame: {s.leading_bits} leading bit(s) ignored", file=sys.stderr)
+    if s.open_bits:
+        print(f"[warn] capture ends mid-frame: {s.open_bits} trailing bit(s) ignored", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
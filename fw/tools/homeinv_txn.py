@@ -0,0 +1,504 @@
+#!/usr/bin/env python3
+"""Batched register transactions for host bridges (UART/SPI debug link, virtual chip).
+
+Every register access over a debug bridge costs a full round trip, so the
+spec/firmware_api.md drain pattern (read ADC_FIFO_STATUS, then ADC_FIFO_DATA
+word by word) is bound by link latency, not bandwidth. A Txn queues reads,
+writes, repeated reads and conditional FIFO drains; a Transport ships the whole
+queue as one request and returns every result at once:
+
+  txn = Txn()
+  txn.write(ADC_FIFO_STATUS, OVERRUN_MASK)          # W1C, posted
+  lvl = txn.read(ADC_FIFO_STATUS)
+  fifo = txn.drain(64, whole_frames=True)           # read LEVEL_WORDS, pop min(level, 64)
+  res = SocketTransport("/tmp/homeinv_vchip.sock").run(txn)
+  res[lvl], res[fifo], res.status(fifo), res.words()
+
+The drain is evaluated on the far side: it reads ADC_FIFO_STATUS, pops
+min(LEVEL_WORDS, max_words) words from ADC_FIFO_DATA (rounded down to whole
+9-word frames with whole_frames=True) and returns the status word plus the
+popped words, so one request drains a burst without a status round trip.
+
+Wire format (shared with verify/model/virtual_chip.py, which serves it): a
+request is a concatenation of 12-byte records, little-endian
+{u8 op, u8 sel, u16 count, u32 addr, u32 data}; replies follow in order.
+  1 READ    addr                     -> u32
+  2 WRITE   addr, data, sel          (no reply)
+  3 READ_N  addr, count              -> count x u32
+  4 STATS                            -> u32 length + JSON (virtual chip only)
+  5 RESET                            (no reply; virtual chip only)
+  6 DRAIN   addr=DATA, data=STATUS, count=max words, sel bit0=whole frames
+                                     -> u32 status + n x u32, n from status
+Addresses on the wire are CPU addresses (base + offset).
+
+Transports:
+  SocketTransport(path)     Unix socket to verify/model/virtual_chip.py
+  LoopbackTransport(target) in-process: encodes, executes against any object
+                            with read32(off)/write32(off, data, sel) (RegBank,
+                            VirtualChip, ...) and decodes, so tests exercise the
+                            same bytes a bridge would see
+Both accept rtt_s= to model link latency per exchange.
+
+Usage:
+  python3 fw/tools/homeinv_txn.py --selftest
+  python3 fw/tools/homeinv_txn.py bench --rtt-ms 2            # loopback, modelled link
+  python3 fw/tools/homeinv_txn.py bench --sock /tmp/homeinv_vchip.sock --seconds 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import io
+import json
+import socket
+import struct
+import sys
+import time
+from array import array
+from typing import Callable, Deque, Dict, List, Protocol, Sequence, Tuple, Union
+
+DEFAULT_BASE = 0x3000_0000
+DEFAULT_SOCK = "/tmp/homeinv_vchip.sock"
+
+# spec/regmap_v1.yaml
+CTRL = 0x100
+CTRL_ENABLE_START = 0x3
+ADC_FIFO_STATUS = 0x208
+ADC_FIFO_DATA = 0x20C
+LEVEL_WORDS_MASK = 0x0000FFFF
+OVERRUN_MASK = 1 << 16
+WORDS_PER_FRAME = 9
+
+OP_READ, OP_WRITE, OP_READ_N, OP_STATS, OP_RESET, OP_DRAIN = 1, 2, 3, 4, 5, 6
+REQ = struct.Struct("<BBHII")
+MAX_COUNT = 0xFFFF
+
+_U32 = struct.Struct("<I")
+
+Result = Union[int, "array[int]", Dict[str, object], None]
+
+
+class Target(Protocol):
+    def read32(self, off: int) -> int: ...
+
+    def write32(self, off: int, data: int, sel: int = 0xF) -> None: ...
+
+
+def drain_count(status: int, max_words: int, whole_frames: bool) -> int:
+    """Words a DRAIN pops for a given ADC_FIFO_STATUS read (both sides use this)."""
+
+    n = min(status & LEVEL_WORDS_MASK, max_words)
+    return n - n % WORDS_PER_FRAME if whole_frames else n
+
+
+# ---------------------------------------------------------------------------
+# Builder / results
+# ---------------------------------------------------------------------------
+
+
+class Txn:
+    """A queue of register operations shipped as one request.
+
+    Offsets are register byte offsets (HOMEINV_REG_*); the transport adds the
+    base. Methods that produce data return a handle for indexing the Results.
+    """
+
+    __slots__ = ("ops",)
+
+    def __init__(self) -> None:
+        # (op, sel, count, off, data)
+        self.ops: List[Tuple[int, int, int, int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def _add(self, op: int, sel: int, count: int, off: int, data: int) -> int:
+        self.ops.append((op, sel, count, off, data & 0xFFFFFFFF))
+        return len(self.ops) - 1
+
+    def read(self, off: int) -> int:
+        return self._add(OP_READ, 0xF, 0, off, 0)
+
+    def write(self, off: int, data: int, sel: int = 0xF) -> None:
+        self._add(OP_WRITE, sel & 0xF, 0, off, data)
+
+    def read_n(self, off: int, n: int) -> int:
+        """n back-to-back reads of one register (e.g. pop n FIFO words)."""
+
+        if not 0 <= n <= MAX_COUNT:
+            raise ValueError(f"read_n: count {n} out of range 0..{MAX_COUNT}")
+        return self._add(OP_READ_N, 0xF, n, off, 0)
+
+    def drain(
+        self,
+        max_words: int = MAX_COUNT,
+        *,
+        whole_frames: bool = False,
+        data: int = ADC_FIFO_DATA,
+        status: int = ADC_FIFO_STATUS,
+    ) -> int:
+        """Read LEVEL_WORDS from `status`, then pop min(level, max_words) from `data`."""
+
+        if not 0 <= max_words <= MAX_COUNT:
+            raise ValueError(f"drain: max_words {max_words} out of range 0..{MAX_COUNT}")
+        return self._add(OP_DRAIN, int(whole_frames), max_words, data, status)
+
+    def clear_overrun(self) -> None:
+        """W1C ADC_FIFO_STATUS.OVERRUN with a full-word write (firmware_api.md)."""
+
+        self.write(ADC_FIFO_STATUS, OVERRUN_MASK)
+
+    def stats(self) -> int:
+        return self._add(OP_STATS, 0, 0, 0, 0)
+
+    def encode(self, base: int = DEFAULT_BASE) -> bytes:
+        out = bytearray(REQ.size * len(self.ops))
+        for i, (op, sel, count, off, data) in enumerate(self.ops):
+            # DRAIN carries the STATUS address in its data field.
+            d = (base + data) & 0xFFFFFFFF if op == OP_DRAIN else data
+            REQ.pack_into(out, i * REQ.size, op, sel, count, (base + off) & 0xFFFFFFFF, d)
+        return bytes(out)
+
+
+class Results:
+    """Per-handle results of one Txn: int for read, array('I') for read_n/drain."""
+
+    __slots__ = ("values", "_status")
+
+    def __init__(self, values: List[Result], status: Dict[int, int]) -> None:
+        self.values = values
+        self._status = status
+
+    def __getitem__(self, handle: int) -> Result:
+        return self.values[handle]
+
+    def status(self, handle: int) -> int:
+        """ADC_FIFO_STATUS as read by a drain."""
+
+        return self._status[handle]
+
+    def words(self) -> "array[int]":
+        """All read_n/drain words, concatenated in request order."""
+
+        out = array("I")
+        for v in self.values:
+            if isinstance(v, array):
+                out.extend(v)
+        return out
+
+
+def _words(read_exact: Callable[[int], bytes], n: int) -> "array[int]":
+    """n little-endian u32 words off the wire (host byte order and item size agnostic)."""
+
+    return array("I", struct.unpack(f"<{n}I", read_exact(4 * n))) if n else array("I")
+
+
+def decode(txn: Txn, read_exact: Callable[[int], bytes]) -> Results:
+    """Parse the replies of `txn`, pulling bytes with read_exact(n)."""
+
+    values: List[Result] = []
+    status: Dict[int, int] = {}
+    for i, (op, sel, count, _off, _data) in enumerate(txn.ops):
+        if op == OP_READ:
+            values.append(_U32.unpack(read_exact(4))[0])
+        elif op == OP_READ_N:
+            values.append(_words(read_exact, count))
+        elif op == OP_DRAIN:
+            st = _U32.unpack(read_exact(4))[0]
+            n = drain_count(st, count, bool(sel & 1))
+            status[i] = st
+            values.append(_words(read_exact, n))
+        elif op == OP_STATS:
+            (n,) = _U32.unpack(read_exact(4))
+            values.append(json.loads(read_exact(n)))
+        else:
+            values.append(None)
+    return Results(values, status)
+
+
+# ---------------------------------------------------------------------------
+# Far side
+# ---------------------------------------------------------------------------
+
+
+def execute(target: Target, payload: bytes, base: int = DEFAULT_BASE) -> bytes:
+    """Run whole 12-byte records from `payload` against `target`; return the replies.
+
+    This is the bridge/virtual-chip side of the protocol. STATS and RESET call
+    target.report() / target.reset() when the target has them. Every record is
+    checked before any runs, so a bad op rejects the whole batch instead of
+    failing after earlier reads have popped the FIFO.
+    """
+
+    records = list(REQ.iter_unpack(payload))
+    ok = {OP_READ, OP_WRITE, OP_READ_N, OP_DRAIN}
+    if hasattr(target, "report"):
+        ok.add(OP_STATS)
+    if hasattr(target, "reset"):
+        ok.add(OP_RESET)
+    for op, *_ in records:
+        if op not in ok:
+            raise ValueError(f"unsupported request op {op}")
+
+    out = bytearray()
+    rd, wr = target.read32, target.write32
+    for op, sel, count, addr, data in records:
+        off = (addr - base) & 0xFFFFFFFF
+        if op == OP_READ:
+            out += _U32.pack(rd(off))
+        elif op == OP_WRITE:
+            wr(off, data, sel)
+        elif op == OP_READ_N:
+            out += struct.pack(f"<{count}I", *[rd(off) for _ in range(count)])
+        elif op == OP_DRAIN:
+            st = rd((data - base) & 0xFFFFFFFF)
+            out += _U32.pack(st)
+            n = drain_count(st, count, bool(sel & 1))
+            out += struct.pack(f"<{n}I", *[rd(off) for _ in range(n)])
+        elif op == OP_STATS:
+            js = json.dumps(target.report()).encode()  # type: ignore[attr-defined]
+            out += _U32.pack(len(js)) + js
+        else:  # OP_RESET
+            target.reset()  # type: ignore[attr-defined]
+    return bytes(out)
+
+
+# ---------------------------------------------------------------------------
+# Transports
+# ---------------------------------------------------------------------------
+
+
+class Transport:
+    """Ships a Txn as one request; subclasses provide _exchange()."""
+
+    def __init__(self, *, base: int = DEFAULT_BASE, rtt_s: float = 0.0) -> None:
+        self.base = base
+        self.rtt_s = rtt_s
+        self.exchanges = 0
+
+    def _exchange(self, payload: bytes, txn: Txn) -> Results:
+        raise NotImplementedError
+
+    def run(self, txn: Txn) -> Results:
+        self.exchanges += 1
+        if self.rtt_s:
+            time.sleep(self.rtt_s)
+        return self._exchange(txn.encode(self.base), txn)
+
+    # Single-access conveniences (one exchange each).
+
+    def read32(self, off: int) -> int:
+        t = Txn()
+        h = t.read(off)
+        return int(self.run(t)[h])  # type: ignore[arg-type]
+
+    def write32(self, off: int, data: int, sel: int = 0xF) -> None:
+        t = Txn()
+        t.write(off, data, sel)
+        self.run(t)
+
+
+class LoopbackTransport(Transport):
+    """In-process stand-in for a bridge: encode, execute against `target`, decode."""
+
+    def __init__(self, target: Target, **kw: float) -> None:
+        super().__init__(**kw)  # type: ignore[arg-type]
+        self.target = target
+
+    def _exchange(self, payload: bytes, txn: Txn) -> Results:
+        reply = io.BytesIO(execute(self.target, payload, self.base))
+
+        def read_exact(n: int) -> bytes:
+            b = reply.read(n)
+            if len(b) != n:
+                raise ValueError(f"short reply: wanted {n} bytes, got {len(b)}")
+            return b
+
+        return decode(txn, read_exact)
+
+
+class SocketTransport(Transport):
+    """Unix stream socket to verify/model/virtual_chip.py."""
+
+    def __init__(self, path: str = DEFAULT_SOCK, **kw: float) -> None:
+        super().__init__(**kw)  # type: ignore[arg-type]
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+
+    def _read_exact(self, n: int) -> bytes:
+        buf = bytearray(n)
+        view = memoryview(buf)
+        got = 0
+        while got < n:
+            k = self.sock.recv_into(view[got:])
+            if not k:
+                raise ConnectionError("bridge closed the connection")
+            got += k
+        return bytes(buf)
+
+    def _exchange(self, payload: bytes, txn: Txn) -> Results:
+        self.sock.sendall(payload)
+        return decode(txn, self._read_exact)
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+# ---------------------------------------------------------------------------
+# Self-test / benchmark
+# ---------------------------------------------------------------------------
+
+
+class _FifoTarget:
+    """Tiny ADC FIFO stand-in for --selftest/bench: `frames` 9-word frames queued up front,
+    refilled with one frame per `refill` reads of ADC_FIFO_STATUS (0 = never)."""
+
+    def __init__(self, frames: int = 0, refill: int = 0, depth: int = 16) -> None:
+        self.fifo: Deque[int] = collections.deque()
+        self.regs: Dict[int, int] = {}
+        self.depth = depth
+        self.refill = refill
+        self.frame_no = 0
+        self.status_reads = 0
+        self.overrun = False
+        for _ in range(frames):
+            self.push_frame()
+
+    def push_frame(self) -> None:
+        self.frame_no += 1
+        for w in [0] + [(self.frame_no << 8) | ch for ch in range(8)]:
+            if len(self.fifo) < self.depth:
+                self.fifo.append(w)
+            else:
+                self.overrun = True
+
+    def read32(self, off: int) -> int:
+        if off == ADC_FIFO_STATUS:
+            self.status_reads += 1
+            if self.refill and self.status_reads % self.refill == 0:
+                self.push_frame()
+            return len(self.fifo) | (OVERRUN_MASK if self.overrun else 0)
+        if off == ADC_FIFO_DATA:
+            return self.fifo.popleft() if self.fifo else 0
+        return self.regs.get(off, 0)
+
+    def write32(self, off: int, data: int, sel: int = 0xF) -> None:
+        if off == ADC_FIFO_STATUS:
+            if data & OVERRUN_MASK and sel & 0b0100:
+                self.overrun = False
+        else:
+            self.regs[off] = data
+
+
+def selftest() -> int:
+    failures = 0
+
+    def expect(got: object, exp: object, msg: str) -> None:
+        nonlocal failures
+        if got != exp:
+            failures += 1
+            print(f"FAIL {msg}: got {got!r}, expected {exp!r}", file=sys.stderr)
+
+    tgt = _FifoTarget(frames=2)  # 18 words pushed, 16 kept, OVERRUN set
+    tr = LoopbackTransport(tgt)
+    t = Txn()
+    t.write(0x400, 0x1234_5678)
+    a = t.read(0x400)
+    d1 = t.drain(whole_frames=True)
+    d2 = t.drain()
+    t.clear_overrun()
+    s = t.read(ADC_FIFO_STATUS)
+    e = t.read_n(ADC_FIFO_DATA, 2)
+    res = tr.run(t)
+    expect(tr.exchanges, 1, "one exchange per Txn")
+    expect(res[a], 0x1234_5678, "posted write visible to later read")
+    expect(res.status(d1), 16 | OVERRUN_MASK, "drain status word")
+    expect(list(res[d1]), [0] + [(1 << 8) | ch for ch in range(8)], "whole-frame drain pops one frame")  # type: ignore[arg-type]
+    expect(len(res[d2]), 7, "second drain pops the partial frame")  # type: ignore[arg-type]
+    expect(res[s], 0, "OVERRUN cleared, FIFO empty")
+    expect(list(res[e]), [0, 0], "empty pops return 0")  # type: ignore[arg-type]
+    expect(len(res.words()), 18, "words() concatenates read_n/drain results")
+    expect(drain_count(20, 64, True), 18, "drain_count rounds to frames")
+    expect(drain_count(20, 5, False), 5, "drain_count honours max_words")
+    expect(len(Txn().encode()), 0, "empty Txn")
+    try:
+        Txn().read_n(ADC_FIFO_DATA, MAX_COUNT + 1)
+        expect(True, False, "read_n count range")
+    except ValueError:
+        pass
+    tgt = _FifoTarget(frames=1)
+    t = Txn()
+    t.drain()
+    try:
+        execute(tgt, t.encode() + REQ.pack(99, 0, 0, 0, 0))
+        expect(True, False, "unsupported op rejected")
+    except ValueError:
+        pass
+    expect(tgt.read32(ADC_FIFO_STATUS) & LEVEL_WORDS_MASK, 9, "rejected batch pops nothing")
+
+    print("selftest:", "PASS" if failures == 0 else f"{failures} failure(s)")
+    return 0 if failures == 0 else 1
+
+
+def _drain_words_single(tr: Transport, limit: int = 64) -> int:
+    """Firmware pattern over a bridge: one round trip per register access."""
+
+    n = 0
+    level = tr.read32(ADC_FIFO_STATUS) & LEVEL_WORDS_MASK
+    while level and n < limit:
+        tr.read32(ADC_FIFO_DATA)
+        n += 1
+        level = tr.read32(ADC_FIFO_STATUS) & LEVEL_WORDS_MASK
+    return n
+
+
+def _drain_words_batched(tr: Transport, drains: int) -> int:
+    t = Txn()
+    for _ in range(drains):
+        t.drain(whole_frames=True)
+    return len(tr.run(t).words())
+
+
+def bench(tr: Transport, seconds: float, drains: int) -> None:
+    for label, fn in (("per-access", lambda: _drain_words_single(tr)), (f"batched x{drains}", lambda: _drain_words_batched(tr, drains))):
+        tr.exchanges = 0
+        words = 0
+        t0 = time.perf_counter()
+        while time.perf_counter() - t0 < seconds:
+            words += fn()
+        dt = time.perf_counter() - t0
+        print(f"{label:>14}: {words / dt:12.0f} words/s  {tr.exchanges / dt:10.0f} exchanges/s  {words / max(tr.exchanges, 1):6.2f} words/exchange")
+
+
+def main(argv: Sequence[str]) -> int:
+    ap = argparse.ArgumentParser(description="Batched register transactions over a host bridge")
+    ap.add_argument("--selftest", action="store_true", help="Run the loopback self-test")
+    sub = ap.add_subparsers(dest="cmd")
+    b = sub.add_parser("bench", help="Compare per-access and batched FIFO drains")
+    b.add_argument("--sock", help="Virtual chip socket (default: in-process loopback FIFO)")
+    b.add_argument("--base", type=lambda s: int(s, 0), default=DEFAULT_BASE)
+    b.add_argument("--rtt-ms", type=float, default=0.0, help="Modelled link round-trip time per exchange")
+    b.add_argument("--seconds", type=float, default=1.0)
+    b.add_argument("--drains", type=int, default=4, help="DRAIN records per batched request")
+    args = ap.parse_args(argv)
+
+    if args.selftest:
+        return selftest()
+    if args.cmd != "bench":
+        ap.print_help()
+        return 2
+
+    rtt = args.rtt_ms / 1e3
+    tr: Transport
+    if args.sock:
+        tr = SocketTransport(args.sock, base=args.base, rtt_s=rtt)
+        tr.write32(CTRL, CTRL_ENABLE_START)  # stream mode starts on the first START
+    else:
+        tr = LoopbackTransport(_FifoTarget(refill=1), base=args.base, rtt_s=rtt)
+    bench(tr, args.seconds, args.drains)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
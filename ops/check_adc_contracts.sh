@@ -8,11 +8,17 @@ set -euo pipefail
 #     - pinout mapping contract
 #     - CLKIN source/frequency contract
 #     - streaming FIFO/ingest contract
+#     - DRDY naming/polarity contract (harness)
 #
 # Why:
 #   These checks are intentionally simple + text-based so they run on low-disk
 #   setups and can be embedded in CI / preflight scripts.
 #
+#   All four run in one ops/contract_gate.py process: the docs are parsed once
+#   (cached across runs), a contract is only re-evaluated when one of its input
+#   files changed, and the harness-side checks share one harness_audit pass.
+#   Every contract is reported; the exit code is the first failing one's.
+#
 # Usage:
 #   bash ops/check_adc_contracts.sh
 #   bash ops/check_adc_contracts.sh --strict
@@ -20,71 +26,8 @@ set -euo pipefail
 #   bash ops/check_adc_contracts.sh --strict --harness ../home-inventory-chip-openmpw
 
 ROOT_DIR=$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)
-cd "$ROOT_DIR"
-
-STRICT=0
-HARNESS_REPO=""
-
-while [[ $# -gt 0 ]]; do
-  case "$1" in
-    --strict)
-      STRICT=1
-      shift
-      ;;
-    --harness)
-      HARNESS_REPO="${2:-}"
-      [[ -z "$HARNESS_REPO" ]] && { echo "ERROR: --harness requires a path" >&2; exit 2; }
-      shift 2
-      ;;
-    -h|--help)
-      sed -n '1,120p' "$0"
-      exit 0
-      ;;
-    *)
-      echo "ERROR: unknown arg: $1" >&2
-      exit 2
-      ;;
-  esac
-done
-
-HARNESS_REPO_DEFAULT="../home-inventory-chip-openmpw"
-if [[ -z "$HARNESS_REPO" && -d "$HARNESS_REPO_DEFAULT" ]]; then
-  HARNESS_REPO="$HARNESS_REPO_DEFAULT"
-fi
-
-strict_flag=""
-if [[ $STRICT -eq 1 ]]; then
-  strict_flag="--strict"
-fi
-
-banner() { echo "==> $*"; }
-
-banner "ADC pinout contract ${STRICT:+(STRICT)}"
-if [[ -n "$HARNESS_REPO" ]]; then
-  bash ops/check_adc_pinout_contract.sh $strict_flag --harness "$HARNESS_REPO"
-else
-  bash ops/check_adc_pinout_contract.sh $strict_flag
-fi
-
-banner "ADC CLKIN contract ${STRICT:+(STRICT)}"
-if [[ -n "$HARNESS_REPO" ]]; then
-  bash ops/check_adc_clkin_contract.sh $strict_flag --harness "$HARNESS_REPO"
-else
-  bash ops/check_adc_clkin_contract.sh $strict_flag
-fi
-
-banner "ADC streaming contract ${STRICT:+(STRICT)}"
-if [[ -n "$HARNESS_REPO" ]]; then
-  bash ops/check_adc_streaming_contract.sh $strict_flag --harness "$HARNESS_REPO"
-else
-  bash ops/check_adc_streaming_contract.sh $strict_flag
-fi
-
-banner "ADC DRDY naming/polarity contract ${STRICT:+(STRICT)}"
-if [[ -n "$HARNESS_REPO" ]]; then
-  bash ops/check_adc_drdy_contract.sh $strict_flag --harness "$HARNESS_REPO"
-else
-  bash ops/check_adc_drdy_contract.sh $strict_flag
-fi
 
-banner "DONE: ADC contract checks passed"
\ No newline at end of file
+# Without --harness (or --harness=PATH), ../home-inventory-chip-openmpw is used
+# when it exists (contract_gate.py --default-harness).
+exec python3 "$ROOT_DIR/ops/contract_gate.py" --default-harness \
+  --contract pinout --contract clkin --contract streaming --contract drdy "$@"
@@ -0,0 +1,1026 @@
+#!/usr/bin/env python3
+"""One-pass gate for the ADC and decision contracts (docs, decisions, RTL).
+
+Why:
+- ops/check_adc_contracts.sh used to fan out to one grep script per contract,
+  and each of them re-read and re-grepped its docs/, decisions/ and rtl/ inputs
+  (and walked the harness checkout again for its harness-side check).
+- Here every input file is parsed once into a small queryable model: markdown
+  heading sections plus the decision `Status` line, or Verilog modules
+  (parameters, ports), instances (parameter overrides, port connections) and
+  `ifdef` blocks. Every contract is a query against those models, evaluated in
+  one process; the harness-side checks of all selected contracts run as a
+  single tools/harness_audit.py pass.
+
+Caching ($CONTRACT_CACHE_DIR, default ~/.cache/home-inventory/contracts; set it
+to an empty string to disable):
+- Parsed models are stored per file and reused while (mtime_ns, size) is
+  unchanged, or while the SHA-256 still matches (touch, checkout).
+- Each contract's outcome is stored with the SHA-256 of its input files and is
+  only re-evaluated when one of them (or --strict) changed. Harness-side checks
+  are never cached.
+- Both are also keyed on the SHA-256 of this file, so editing a parser or a
+  contract invalidates them without a manual version bump.
+
+Usage:
+  python3 ops/contract_gate.py                       # every contract
+  python3 ops/contract_gate.py --strict --harness ../home-inventory-chip-openmpw
+  python3 ops/contract_gate.py --contract drdy --default-harness   # sibling checkout if present
+  python3 ops/contract_gate.py --contract pinout --contract clkin --strict
+  python3 ops/contract_gate.py --json
+  python3 ops/contract_gate.py --dump rtl/home_inventory_wb.v
+  python3 ops/contract_gate.py --list
+
+Exit codes (the same as the per-contract scripts, which now wrap this):
+  0 = every selected contract passed (WARN allowed)
+  1 = a contract failed
+  2 = missing input / cannot parse / bad invocation
+With several contracts the first non-zero code in contract order is returned
+(where the old fan-out stopped), but every contract is evaluated and reported.
+
+Stdlib only; --harness additionally needs PyYAML (tools/harness_audit.py rules).
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+import cache_paths  # noqa: E402
+DEFAULT_HARNESS = ROOT.parent / "home-inventory-chip-openmpw"  # sibling checkout, see --default-harness
+
+_CACHE_FILE = "contracts.json"
+_SOURCE_SHA: Optional[str] = None
+
+
+def cache_dir() -> Optional[Path]:
+    return cache_paths.cache_dir("contracts", "CONTRACT_CACHE_DIR")
+
+
+def source_hash() -> str:
+    """SHA-256 of this module: parsers and contracts live here, so it keys the cache."""
+
+    global _SOURCE_SHA
+    if _SOURCE_SHA is None:
+        _SOURCE_SHA = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+    return _SOURCE_SHA
+
+
+# ---------------------------------------------------------------------------
+# Markdown model
+# ---------------------------------------------------------------------------
+
+_HEADING_RE = re.compile(r"^(#{1,6})[ \t]+(.*?)[ \t]*$")
+_FENCE_RE = re.compile(r"^[ \t]{0,3}(```|~~~)")
+_STATUS_INLINE_RE = re.compile(r"^.*\*\*Status:\*\*\s*")
+_BOLD_RE = re.compile(r"^.*\*\*([^*]+)\*\*.*$")
+
+
+@dataclass
+class Section:
+    level: int
+    title: str
+    start: int  # heading line (1-based)
+    end: int  # last line of the section (inclusive)
+
+
+@dataclass
+class Markdown:
+    path: str
+    lines: List[str]
+    sections: List[Section]
+    status: Optional[str]  # decision Status, when the doc carries one
+    status_line: Optional[int]
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Markdown":
+        return cls(d["path"], d["lines"], [Section(**s) for s in d["sections"]], d["status"], d["status_line"])
+
+    def section(self, title: str, level: Optional[int] = None) -> Optional[Section]:
+        """First section whose heading contains `title` (optionally at `level`)."""
+
+        for s in self.sections:
+            if title in s.title and (level is None or s.level == level):
+                return s
+        return None
+
+    def grep(self, rx: "re.Pattern[str]", section: Optional[Section] = None) -> List[Tuple[int, str]]:
+        lo, hi = (section.start, section.end) if section is not None else (1, len(self.lines))
+        return [(n, self.lines[n - 1]) for n in range(lo, hi + 1) if rx.search(self.lines[n - 1])]
+
+
+def parse_markdown(text: str, path: str) -> Markdown:
+    lines = text.splitlines()
+    heads: List[Tuple[int, str, int]] = []  # (level, title, line)
+    fence: Optional[str] = None
+    for n, line in enumerate(lines, 1):
+        m = _FENCE_RE.match(line)
+        if m is not None:
+            if fence is None:
+                fence = m.group(1)
+            elif m.group(1) == fence:
+                fence = None
+            continue
+        if fence is None:
+            h = _HEADING_RE.match(line)
+            if h is not None:
+                heads.append((len(h.group(1)), h.group(2), n))
+    sections: List[Section] = []
+    for i, (level, title, start) in enumerate(heads):
+        end = len(lines)
+        for lv, _, ln in heads[i + 1 :]:
+            if lv <= level:
+                end = ln - 1
+                break
+        sections.append(Section(level, title, start, end))
+
+    # Decision templates (see ops/check_required_decisions.sh history):
+    # "- **Status:** Decided" / "**Status:** Decided" anywhere, else the first
+    # bold line of a "## Status" section ("**Accepted (v1 baseline)**").
+    status: Optional[str] = None
+    status_line: Optional[int] = None
+    for n, line in enumerate(lines, 1):
+        if "**Status:**" in line:
+            status = re.sub(r"\s*\*\*.*$", "", _STATUS_INLINE_RE.sub("", line).rstrip())
+            status_line = n
+            break
+    else:
+        for s in sections:
+            if s.level == 2 and s.title == "Status":
+                for n in range(s.start + 1, s.end + 1):
+                    m = _BOLD_RE.match(lines[n - 1])
+                    if m is not None:
+                        status, status_line = m.group(1), n
+                        break
+                break
+    return Markdown(path, lines, sections, status or None, status_line if status else None)
+
+
+# ---------------------------------------------------------------------------
+# Verilog model
+# ---------------------------------------------------------------------------
+
+_COMMENT_RE = re.compile(r'"(?:\\.|[^"\\\n])*"|//[^\n]*|/\*.*?\*/', re.S)
+_DIRECTIVE_RE = re.compile(r"^[ \t]*`(ifdef|ifndef|elsif|else|endif)\b[ \t]*([A-Za-z_]\w*)?")
+_MODULE_RE = re.compile(r"\bmodule\s+([A-Za-z_]\w*)\s*")
+_INST_HEAD_RE = re.compile(r"\b([A-Za-z_]\w*)(?:\s*#\s*\(|\s+([A-Za-z_]\w*)\s*(?:\[[^\]]*\]\s*)?\()")
+_INST_NAME_RE = re.compile(r"\s*([A-Za-z_]\w*)\s*(?:\[[^\]]*\]\s*)?\(")
+_NAMED_RE = re.compile(r"\s*\.\s*([A-Za-z_]\w*)\s*\((.*)\)\s*\Z", re.S)
+_ASSIGN_RE = re.compile(r"([A-Za-z_]\w*)\s*(?:\[[^\]]*\]\s*)*=(?!=)\s*(.*)\Z", re.S)
+_PARAM_DECL_RE = re.compile(r"\b(parameter|localparam)\b(.*?);", re.S)
+_SUBROUTINE_RE = re.compile(r"\b(function|task)\b.*?\bend\1\b", re.S)
+_PORT_DECL_RE = re.compile(r"\b(input|output|inout)\b([^;]*);")
+_IDENT_RE = re.compile(r"[A-Za-z_]\w*")
+_RANGE_RE = re.compile(r"\[[^\]]*\]")
+_INT_RE = re.compile(r"(?:\d[\d_]*)?\s*'\s*[sS]?([bBoOdDhH])\s*([0-9a-fA-F_]+)\Z|(\d[\d_]*)\Z")
+_BASES = {"b": 2, "o": 8, "d": 10, "h": 16}
+
+# Identifiers that can precede "name (" or "#(" without being a module instance.
+_KEYWORDS = {
+    "module", "macromodule", "endmodule", "function", "task", "if", "else", "for", "while", "repeat",
+    "case", "casez", "casex", "begin", "end", "always", "initial", "assign", "wire", "reg", "logic",
+    "integer", "genvar", "generate", "input", "output", "inout", "parameter", "localparam", "return",
+    "signed", "unsigned", "posedge", "negedge", "or", "and", "not", "default", "forever", "wait",
+}  # fmt: skip
+_TYPE_WORDS = {"wire", "reg", "logic", "signed", "unsigned", "integer", "tri", "var"}
+
+
+@dataclass
+class Port:
+    name: str
+    direction: Optional[str]
+    line: int
+    guard: List[str]  # enclosing `ifdef conditions ("X", or "!X" for ifndef/else)
+
+
+@dataclass
+class Param:
+    name: str
+    kind: str  # "parameter" | "localparam"
+    expr: str
+    line: int
+
+
+@dataclass
+class Module:
+    name: str
+    line: int
+    ports: List[Port]
+    params: List[Param]
+
+
+@dataclass
+class Instance:
+    module: str
+    name: str
+    line: int
+    guard: List[str]
+    params: Dict[str, str]  # named parameter overrides: #(.NAME(expr))
+    ports: Dict[str, str]  # named connections: .port(expr)
+
+
+@dataclass
+class IfdefBlock:
+    cond: str
+    start: int
+    end: int
+
+
+@dataclass
+class Verilog:
+    path: str
+    modules: List[Module]
+    instances: List[Instance]
+    ifdefs: List[IfdefBlock]
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Verilog":
+        mods = [
+            Module(m["name"], m["line"], [Port(**p) for p in m["ports"]], [Param(**p) for p in m["params"]])
+            for m in d["modules"]
+        ]
+        return cls(d["path"], mods, [Instance(**i) for i in d["instances"]], [IfdefBlock(**b) for b in d["ifdefs"]])
+
+    def instances_of(self, module: str) -> List[Instance]:
+        return [i for i in self.instances if i.module == module]
+
+    def ifdef(self, cond: str) -> List[IfdefBlock]:
+        return [b for b in self.ifdefs if b.cond == cond]
+
+
+def _strip_comments(text: str) -> str:
+    """Blank out comments, keeping newlines (line numbers) and strings."""
+
+    def repl(m: "re.Match[str]") -> str:
+        s = m.group(0)
+        return s if s.startswith('"') else "\n" * s.count("\n")
+
+    return _COMMENT_RE.sub(repl, text)
+
+
+def _close_paren(s: str, i: int) -> int:
+    """Index of the ')' matching the '(' at s[i], or -1."""
+
+    depth = 0
+    for j in range(i, len(s)):
+        c = s[j]
+        if c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+            if depth == 0:
+                return j
+    return -1
+
+
+def _split_top(s: str) -> List[Tuple[int, str]]:
+    """(offset, part) for each comma-separated part outside (), [] and {}."""
+
+    parts: List[Tuple[int, str]] = []
+    depth, start = 0, 0
+    for i, c in enumerate(s):
+        if c in "([{":
+            depth += 1
+        elif c in ")]}":
+            depth -= 1
+        elif c == "," and depth == 0:
+            parts.append((start, s[start:i]))
+            start = i + 1
+    parts.append((start, s[start:]))
+    return parts
+
+
+def _named(s: str) -> Dict[str, str]:
+    out: Dict[str, str] = {}
+    for _, part in _split_top(s):
+        m = _NAMED_RE.match(part)
+        if m is not None:
+            out[m.group(1)] = " ".join(m.group(2).split())
+    return out
+
+
+def _params(s: str, base: int, line_of: Callable[[int], int], default_kind: str) -> List[Param]:
+    out: List[Param] = []
+    kind = default_kind
+    for off, part in _split_top(s):
+        words = part.split()
+        if words and words[0] in ("parameter", "localparam"):
+            kind = words[0]
+        a = _ASSIGN_RE.search(part)
+        if a is not None:
+            out.append(Param(a.group(1), kind, " ".join(a.group(2).split()), line_of(base + off + a.start(1))))
+    return out
+
+
+def parse_verilog(text: str, path: str) -> Verilog:
+    body = _strip_comments(text)
+    lines = body.split("\n")
+
+    # `ifdef nesting per line; directive lines are blanked for the scanners below.
+    guards: List[List[str]] = []
+    ifdefs: List[IfdefBlock] = []
+    stack: List[Tuple[str, int]] = []
+    for n, line in enumerate(lines, 1):
+        m = _DIRECTIVE_RE.match(line)
+        if m is not None:
+            kind, name = m.group(1), m.group(2) or ""
+            if kind in ("ifdef", "ifndef"):
+                stack.append((name if kind == "ifdef" else "!" + name, n))
+            elif stack:
+                cond, start = stack.pop()
+                ifdefs.append(IfdefBlock(cond, start, n))
+                if kind == "else":
+                    stack.append((cond[1:] if cond.startswith("!") else "!" + cond, n))
+                elif kind == "elsif":
+                    stack.append((name, n))
+            lines[n - 1] = ""
+        guards.append([c for c, _ in stack])
+    ifdefs.sort(key=lambda b: b.start)
+    body = "\n".join(lines)
+
+    newlines = [i for i, c in enumerate(body) if c == "\n"]
+    # Function/task arguments are not module ports; blank them (offsets kept).
+    decls = _SUBROUTINE_RE.sub(lambda m: re.sub(r"[^\n]", " ", m.group(0)), body)
+
+    def line_of(off: int) -> int:
+        return bisect.bisect_left(newlines, off) + 1
+
+    def guard_at(off: int) -> List[str]:
+        return guards[line_of(off) - 1]
+
+    modules: List[Module] = []
+    for m in _MODULE_RE.finditer(body):
+        i = m.end()
+        params: List[Param] = []
+        ports: List[Port] = []
+        if body.startswith("#", i):
+            open_ = body.find("(", i)
+            close = _close_paren(body, open_)
+            if close < 0:
+                continue
+            params = _params(body[open_ + 1 : close], open_ + 1, line_of, "parameter")
+            i = close + 1
+        while i < len(body) and body[i].isspace():
+            i += 1
+        if body.startswith("(", i):
+            close = _close_paren(body, i)
+            if close < 0:
+                continue
+            direction: Optional[str] = None
+            for off, part in _split_top(body[i + 1 : close]):
+                words = _RANGE_RE.sub(" ", part).split()
+                if not words:
+                    continue
+                if words[0] in ("input", "output", "inout"):
+                    direction = words[0]
+                at = i + 1 + off + len(part) - len(part.lstrip())
+                ports.append(Port(words[-1], direction, line_of(at), guard_at(at)))
+            i = close + 1
+        end = body.find("endmodule", i)
+        end = len(body) if end < 0 else end
+        for d in _PARAM_DECL_RE.finditer(body, i, end):
+            params.extend(_params(d.group(2), d.start(2), line_of, d.group(1)))
+        known = {p.name: p for p in ports}
+        for d in _PORT_DECL_RE.finditer(decls, i, end):
+            for off, part in _split_top(_RANGE_RE.sub(lambda r: " " * len(r.group(0)), d.group(2))):
+                names = [w for w in _IDENT_RE.findall(part) if w not in _TYPE_WORDS]
+                if not names:
+                    continue
+                at = d.start(2) + off
+                if names[-1] in known:
+                    known[names[-1]].direction = d.group(1)
+                else:
+                    ports.append(Port(names[-1], d.group(1), line_of(at), guard_at(at)))
+        modules.append(Module(m.group(1), line_of(m.start()), ports, params))
+
+    instances: List[Instance] = []
+    pos = 0
+    while True:
+        m = _INST_HEAD_RE.search(body, pos)
+        if m is None:
+            break
+        mod = m.group(1)
+        if mod in _KEYWORDS:
+            pos = m.end(1)
+            continue
+        overrides: Dict[str, str] = {}
+        if m.group(2) is None:  # "mod #(...) name ("
+            close = _close_paren(body, m.end() - 1)
+            n = _INST_NAME_RE.match(body, close + 1) if close >= 0 else None
+            if n is None:
+                pos = m.end()
+                continue
+            overrides = _named(body[m.end() : close])
+            name, open_ = n.group(1), n.end() - 1
+        else:
+            name, open_ = m.group(2), m.end() - 1
+        close = _close_paren(body, open_)
+        if name in _KEYWORDS or close < 0 or not body[close + 1 :].lstrip().startswith(";"):
+            pos = m.end(1)
+            continue
+        instances.append(
+            Instance(mod, name, line_of(m.start()), guard_at(m.start()), overrides, _named(body[open_ + 1 : close]))
+        )
+        pos = close + 1
+
+    return Verilog(path, modules, instances, ifdefs)
+
+
+def verilog_int(expr: str) -> Optional[int]:
+    """Integer value of a plain decimal or based literal (`24`, `8'd24`), else None."""
+
+    m = _INT_RE.match(expr.strip())
+    if m is None:
+        return None
+    if m.group(3) is not None:
+        return int(m.group(3).replace("_", ""))
+    return int(m.group(2).replace("_", ""), _BASES[m.group(1).lower()])
+
+
+# ---------------------------------------------------------------------------
+# Parsed-file store (the one read/parse per file, persisted)
+# ---------------------------------------------------------------------------
+
+_PARSERS: Dict[str, Callable[[str, str], Any]] = {"markdown": parse_markdown, "verilog": parse_verilog}
+_LOADERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {"markdown": Markdown.from_dict, "verilog": Verilog.from_dict}
+
+
+class ContractRepo:
+    """Parsed models of the repo files the contracts read, cached on disk."""
+
+    def __init__(self, root: Path, *, use_cache: bool = True) -> None:
+        self.root = root.resolve()
+        cdir = cache_dir() if use_cache else None
+        self._cache_path = cdir / _CACHE_FILE if cdir is not None else None
+        doc = self._load_cache()
+        self._files: Dict[str, Dict[str, Any]] = doc.get("files", {})
+        self.results: Dict[str, Dict[str, Any]] = doc.get("results", {})
+        self._seen: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._models: Dict[str, Any] = {}
+        self.parsed: List[str] = []
+        self._dirty = False
+
+    # -- persistence -------------------------------------------------------
+
+    def _load_cache(self) -> Dict[str, Any]:
+        if self._cache_path is None:
+            return {}
+        try:
+            doc = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        roots = doc.get("roots") if isinstance(doc, dict) else None
+        ent = roots.get(str(self.root)) if isinstance(roots, dict) else None
+        if not isinstance(ent, dict) or not isinstance(ent.get("files"), dict) or not isinstance(ent.get("results"), dict):
+            return {}
+        return ent
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def save(self) -> None:
+        if self._cache_path is None or not self._dirty:
+            return
+        try:
+            doc = json.loads(self._cache_path.read_text(encoding="utf-8"))
+            if not isinstance(doc, dict) or not isinstance(doc.get("roots"), dict):
+                raise ValueError
+        except (OSError, ValueError):
+            doc = {"roots": {}}
+        doc.setdefault("roots", {})[str(self.root)] = {"files": self._files, "results": self.results}
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._cache_path.parent, prefix=_CACHE_FILE, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(doc, f, separators=(",", ":"))
+            os.replace(tmp, self._cache_path)
+        except OSError:
+            pass  # read-only checkout / full disk: the cache is best-effort
+
+    # -- files -------------------------------------------------------------
+
+    def _entry(self, rel: str) -> Optional[Dict[str, Any]]:
+        if rel in self._seen:
+            return self._seen[rel]
+        p = self.root / rel
+        try:
+            st = p.stat()
+        except OSError:
+            st = None
+        ent = self._files.get(rel)
+        if st is None or not p.is_file():
+            if ent is not None:
+                del self._files[rel]
+                self._dirty = True
+            ent = None
+        elif ent is None or ent.get("mtime_ns") != st.st_mtime_ns or ent.get("size") != st.st_size:
+            sha = hashlib.sha256(p.read_bytes()).hexdigest()
+            if ent is None or ent.get("sha256") != sha:
+                ent = {"sha256": sha}  # content changed: the model is re-parsed on demand
+            ent = dict(ent, mtime_ns=st.st_mtime_ns, size=st.st_size)
+            self._files[rel] = ent
+            self._dirty = True
+        self._seen[rel] = ent
+        return ent
+
+    def sha(self, rel: str) -> Optional[str]:
+        """SHA-256 of a repo-relative file, or None when it does not exist."""
+
+        ent = self._entry(rel)
+        return ent["sha256"] if ent is not None else None
+
+    def exists(self, rel: str) -> bool:
+        return self._entry(rel) is not None
+
+    def _model(self, rel: str, kind: str) -> Any:
+        if rel in self._models:
+            return self._models[rel]
+        ent = self._entry(rel)
+        if ent is None:
+            return None
+        data = ent.get(kind)
+        if data is None or ent.get("parser") != source_hash():
+            if ent.get("parser") != source_hash():
+                for k in _PARSERS:  # models of the other kind are stale too
+                    ent.pop(k, None)
+            text = (self.root / rel).read_text(encoding="utf-8", errors="replace")
+            data = asdict(_PARSERS[kind](text, rel))
+            ent[kind] = data
+            ent["parser"] = source_hash()
+            self.parsed.append(rel)
+            self._dirty = True
+        model = self._models[rel] = _LOADERS[kind](data)
+        return model
+
+    def markdown(self, rel: str) -> Optional[Markdown]:
+        return self._model(rel, "markdown")
+
+    def verilog(self, rel: str) -> Optional[Verilog]:
+        return self._model(rel, "verilog")
+
+    def model(self, rel: str) -> Any:
+        """Markdown or Verilog model of `rel`, by suffix (None when missing)."""
+
+        return self._model(rel, "verilog" if rel.endswith((".v", ".vh", ".sv", ".svh")) else "markdown")
+
+
+# ---------------------------------------------------------------------------
+# Contracts
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Outcome:
+    code: int = 0
+    messages: List[Tuple[str, str]] = field(default_factory=list)  # (level, text); level "" = evidence line
+
+    def say(self, level: str, text: str) -> None:
+        self.messages.append((level, text))
+
+    def fail(self, code: int, text: str) -> "Outcome":
+        self.code = max(self.code, code)
+        self.say("ERROR", text)
+        return self
+
+    @property
+    def status(self) -> str:
+        if self.code:
+            return "FAIL"
+        return "WARN" if any(level == "WARN" for level, _ in self.messages) else "OK"
+
+
+@dataclass(frozen=True)
+class Contract:
+    id: str
+    title: str
+    inputs: Tuple[str, ...]
+    check: Optional[Callable[[ContractRepo, bool], Outcome]]  # None: harness-only
+    harness_audit: Optional[str] = None  # tools/harness_audit_rules.yaml audit, run once the repo side passes
+    harness_what: str = ""
+
+
+def _placeholders(
+    repo: ContractRepo,
+    strict: bool,
+    docs: Sequence[str],
+    patterns: Sequence[str],
+    msg: str,
+    *,
+    locked: Optional[str] = None,
+) -> Outcome:
+    """Grep `docs` for placeholder patterns; in strict mode only the `locked` section when given."""
+
+    out = Outcome()
+    missing = [d for d in docs if not repo.exists(d)]
+    if missing:
+        for d in missing:
+            out.fail(2, f"missing doc: {d}")
+        return out
+    section: Optional[Section] = None
+    if strict and locked is not None:
+        md = repo.markdown(docs[0])
+        section = md.section(locked, level=3)
+        if section is None:
+            return out.fail(1, f"missing required section in {docs[0]}: '### {locked}'")
+        if section.end - section.start + 1 < 3:
+            return out.fail(1, f"locked section in {docs[0]} appears empty; fill it before tapeout.")
+    hits = 0
+    for d in docs:
+        md = repo.markdown(d)
+        for pat in patterns:
+            found = md.grep(re.compile(pat), section)
+            if found:
+                hits += 1
+                out.say("", "")
+                out.say("", f"== Placeholder evidence in: {d} (pattern: {pat}) ==")
+                out.messages.extend(("", f"{n}:{line}") for n, line in found)
+    if hits == 0:
+        scope = f"'{section.title}' section of " if section is not None else ""
+        out.say("OK", f"no placeholders detected in {scope}{', '.join(docs)}")
+    elif strict:
+        out.fail(1, msg)
+    else:
+        out.say("WARN", msg)
+    return out
+
+
+def check_pinout(repo: ContractRepo, strict: bool) -> Outcome:
+    return _placeholders(
+        repo,
+        strict,
+        ["docs/ADC_PINOUT_CONTRACT.md"],
+        [r"io\[\?\]", r"io\[\*\]", r"io\[\?\?\]", r"-> \?\?\?", "TBD", "tbd"],
+        "ADC pinout contract still contains placeholders; fill docs/ADC_PINOUT_CONTRACT.md before tapeout.",
+        # Strict mode enforces only this block, so the doc can keep historical
+        # placeholder context once the real mapping is recorded.
+        locked="Tapeout-ready mapping (LOCKED)",
+    )
+
+
+def check_clkin(repo: ContractRepo, strict: bool) -> Outcome:
+    return _placeholders(
+        repo,
+        strict,
+        ["docs/ADC_CLOCKING_PLAN.md", "decisions/011-adc-clkin-source-and-frequency.md"],
+        [r"io\[\?\?\]", r"io\[\?\]", r"\?\?\?", "TBD", "tbd", "UNKNOWN", "unknown"],
+        "ADC CLKIN contract still contains placeholders; lock source + frequency before tapeout/cutoff.",
+    )
+
+
+def check_streaming(repo: ContractRepo, strict: bool) -> Outcome:
+    return _placeholders(
+        repo,
+        strict,
+        ["docs/ADC_STREAM_CONTRACT.md"],
+        [r"\?\?\?", "TBD", "tbd", "TODO", "todo", "FIXME", "fixme"],
+        "ADC streaming contract still contains placeholders; tighten docs/ADC_STREAM_CONTRACT.md before tapeout.",
+    )
+
+
+FRAMING_RTL = "rtl/home_inventory_wb.v"
+FRAMING_PARAMS = (
+    ("BITS_PER_WORD", 24, "ADS131M08 default word length on-wire"),
+    ("WORDS_PER_FRAME", 10, "STATUS+8ch+CRC"),
+    ("WORDS_OUT", 9, "CRC dropped before FIFO/regmap"),
+)
+
+
+def check_framing(repo: ContractRepo, strict: bool) -> Outcome:
+    # v1 framing assumptions (spec/ads131m08_interface.md), normative for first
+    # silicon: 24-bit words, 10 words per frame, OUTPUT_CRC dropped => 9 out.
+    out = Outcome()
+    v = repo.verilog(FRAMING_RTL)
+    if v is None:
+        return out.fail(2, f"missing {FRAMING_RTL}")
+    if not v.ifdef("USE_REAL_ADC_INGEST"):
+        return out.fail(2, f"expected USE_REAL_ADC_INGEST block not found in {FRAMING_RTL}")
+    insts = [i for i in v.instances_of("adc_streaming_ingest") if "USE_REAL_ADC_INGEST" in i.guard]
+    if not insts:
+        return out.fail(1, f"expected adc_streaming_ingest instantiation under `ifdef USE_REAL_ADC_INGEST in {FRAMING_RTL}")
+    for inst in insts:
+        for name, want, why in FRAMING_PARAMS:
+            got = inst.params.get(name)
+            if got is None or verilog_int(got) != want:
+                found = f".{name}({got})" if got is not None else "no override"
+                out.fail(1, f"v1 expects {name}={want} ({why}); {FRAMING_RTL}:{inst.line} {inst.name} has {found}")
+    if out.code == 0:
+        out.say("PASS", "ADC framing params match v1 assumptions (24-bit, 10 words/frame, 9 words out)")
+    return out
+
+
+REQUIRED_DECISIONS = (
+    "decisions/007-effective-resolution-definition.md",
+    "decisions/008-adc-part-selection.md",
+    "decisions/009-ads131m08-word-length-and-crc.md",
+    "decisions/010-adc-fifo-depth-and-overrun-policy.md",
+    "decisions/011-adc-clkin-source-and-frequency.md",
+)
+LOCKED_STATUSES = ("accepted", "decided", "locked", "final")
+
+
+def is_locked(status: str) -> bool:
+    # Templates add clarifiers ("Accepted (v1 baseline)"): a known prefix is enough.
+    return status.lower().startswith(LOCKED_STATUSES)
+
+
+def check_decisions(repo: ContractRepo, strict: bool) -> Outcome:
+    out = Outcome()
+    for d in REQUIRED_DECISIONS:
+        md = repo.markdown(d)
+        if md is None:
+            out.fail(1, f"missing decision file: {d}")
+        elif md.status is None:
+            out.fail(1, f"could not extract Status from: {d}")
+        elif is_locked(md.status):
+            out.say("OK", f"{d} status is locked: {md.status}")
+        else:
+            msg = f"{d} is not locked (Status: {md.status}). Mark it Accepted/Decided/Locked before cutoff."
+            if strict:
+                out.fail(1, msg)
+            else:
+                out.say("WARN", msg)
+    return out
+
+
+CLKIN_DECISION = "decisions/011-adc-clkin-source-and-frequency.md"
+CLKIN_EVIDENCE = (
+    (r"^[- ]+Source:\s*.+$", True, "Decision 011 is locked but contains no 'Source: <path>:<line>' evidence line"),
+    (r"^[- ]+Expected CLKIN frequency:\s*(TBD|\?\?\?|unknown)\b", False, "Decision 011 is locked but 'Expected CLKIN frequency' is still TBD"),
+    (r"^[- ]+CLKIN route:\s*(TBD|\?\?\?|unknown)?\s*$", False, "Decision 011 is locked but 'CLKIN route' is missing/TBD"),
+    (r"^[- ]+Expected CLKIN frequency:\s*[^0-9]*$", False, "Decision 011 'Expected CLKIN frequency' does not appear numeric (missing Hz value)"),
+)  # fmt: skip
+
+
+def check_clkin_evidence(repo: ContractRepo, strict: bool) -> Outcome:
+    out = Outcome()
+    md = repo.markdown(CLKIN_DECISION)
+    if md is None:
+        return out.fail(2, f"missing decision file: {CLKIN_DECISION}")
+    if md.status is None:
+        return out.fail(2, f"could not extract Status from: {CLKIN_DECISION}")
+    if not is_locked(md.status):
+        # Not locked yet; evidence fields are expected to be TBD.
+        out.say("OK", f"{CLKIN_DECISION} is not locked yet (Status: {md.status}); evidence check skipped")
+        return out
+    for pat, required, msg in CLKIN_EVIDENCE:
+        if bool(md.grep(re.compile(pat))) != required:
+            out.fail(1, msg)
+    if out.code == 0:
+        out.say("OK", "Decision 011 locked and includes minimum evidence fields")
+    return out
+
+
+CONTRACTS: Tuple[Contract, ...] = (
+    Contract(
+        "pinout",
+        "ADC pinout contract",
+        ("docs/ADC_PINOUT_CONTRACT.md",),
+        check_pinout,
+        "adc_pinout_placeholder",
+        "ADC pinout mapping",
+    ),
+    Contract(
+        "clkin",
+        "ADC CLKIN contract",
+        ("docs/ADC_CLOCKING_PLAN.md", CLKIN_DECISION),
+        check_clkin,
+        "adc_clocking_placeholder",
+        "ADC CLKIN evidence",
+    ),
+    Contract(
+        "streaming",
+        "ADC streaming contract",
+        ("docs/ADC_STREAM_CONTRACT.md",),
+        check_streaming,
+        "adc_streaming_placeholder",
+        "ADC streaming wiring",
+    ),
+    Contract("drdy", "ADC DRDY naming/polarity contract", (), None, "adc_drdy_placeholder", "ADC DRDY naming"),
+    Contract("framing", "ADC framing params", (FRAMING_RTL,), check_framing),
+    Contract("decisions", "Required decisions are locked", REQUIRED_DECISIONS, check_decisions),
+    Contract("clkin_evidence", "Decision 011 evidence fields", (CLKIN_DECISION,), check_clkin_evidence),
+)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Report:
+    contract: Contract
+    outcome: Outcome
+    cached: bool
+    inputs: Dict[str, Optional[str]]
+
+
+def evaluate(repo: ContractRepo, contracts: Sequence[Contract], *, strict: bool) -> List[Report]:
+    """Repo-side outcome of each contract, re-evaluated only when an input changed."""
+
+    reports: List[Report] = []
+    for c in contracts:
+        inputs = {rel: repo.sha(rel) for rel in c.inputs}
+        key = f"{c.id}:{'strict' if strict else 'default'}"
+        hit = repo.results.get(key)
+        if hit is not None and hit.get("inputs") == inputs and hit.get("source") == source_hash():
+            out = Outcome(hit["code"], [tuple(m) for m in hit["messages"]])
+            reports.append(Report(c, out, True, inputs))
+            continue
+        out = c.check(repo, strict) if c.check is not None else Outcome()
+        repo.results[key] = {"inputs": inputs, "source": source_hash(), "code": out.code, "messages": list(out.messages)}
+        repo.mark_dirty()
+        reports.append(Report(c, out, False, inputs))
+    return reports
+
+
+def harness_stage(reports: Sequence[Report], harness: Optional[str], *, strict: bool) -> Optional[Dict[str, Any]]:
+    """Run the harness-side audits of every contract whose repo side passed, in one pass."""
+
+    todo = [r for r in reports if r.contract.harness_audit and r.outcome.code == 0]
+    if not harness:
+        for r in todo:
+            if r.contract.check is None:  # harness-only contract
+                if strict:
+                    r.outcome.fail(2, "--strict requires a harness repo path (pass --harness PATH)")
+                else:
+                    r.outcome.say("WARN", "no harness repo found/passed; skipping (pass --harness PATH to enable)")
+        return None
+    if not todo:
+        return None
+
+    root = Path(harness).resolve()
+    failed: Dict[str, List[str]] = {}
+    missing: Dict[str, bool] = {}
+    stats: Optional[Dict[str, Any]] = None
+    if not root.is_dir():
+        for r in todo:
+            failed[r.contract.harness_audit] = [f"harness repo not found at: {root}"]
+            missing[r.contract.harness_audit] = True
+    else:
+        # Imported here so the repo-side contracts stay stdlib-only.
+        from harness_audit import DEFAULT_RULES, load_rules, run_audits
+
+        ids = {r.contract.harness_audit for r in todo}
+        audits = [a for a in load_rules(DEFAULT_RULES, root) if a.id in ids]
+        results, stats = run_audits(root, audits)
+        for res in results:
+            if res.status == "FAIL":
+                lines = failed.setdefault(res.audit, [])
+                lines.append(f"{res.rule}: {res.message}")
+                lines.extend(f"  {p}:{ln}: {t[:160]}" for p, ln, t in res.hits[:10])
+                if res.rule.endswith(".requires"):
+                    missing[res.audit] = True
+
+    for r in todo:
+        c, out = r.contract, r.outcome
+        problems = failed.get(c.harness_audit)
+        if not problems:
+            out.say("OK", f"Harness {c.harness_what} appears non-placeholder: {harness}")
+            continue
+        for line in problems:
+            out.say("", line)
+        msg = f"Harness {c.harness_what} still appears placeholder: {harness}"
+        hint = f"Run: python3 tools/harness_audit.py --audit {c.harness_audit} --show 10 '{harness}'"
+        if c.check is None:
+            out.fail(2 if missing.get(c.harness_audit) else 1, msg)
+            out.say("", hint)
+        elif strict:
+            out.fail(1, msg)
+            out.say("", hint)
+        else:
+            out.say("WARN", msg)
+            out.say("", hint)
+    return stats
+
+
+def _emit(level: str, text: str) -> None:
+    line = f"{level}: {text}" if level else text
+    if level == "ERROR":
+        sys.stdout.flush()
+        print(line, file=sys.stderr, flush=True)
+    else:
+        print(line)
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description="Evaluate the ADC and decision contracts in one pass over parsed docs/RTL.")
+    ap.add_argument(
+        "--contract",
+        action="append",
+        default=[],
+        metavar="ID",
+        help="run only this contract (repeatable; default: all, see --list)",
+    )
+    ap.add_argument("--strict", action="store_true", help="fail (instead of warn) on placeholders")
+    ap.add_argument("--harness", metavar="PATH", help="also run the harness-side checks against this checkout")
+    ap.add_argument(
+        "--default-harness",
+        action="store_true",
+        help=f"without --harness, use {DEFAULT_HARNESS.name} next to this repo when it exists",
+    )
+    ap.add_argument("--json", action="store_true", help="print the report as JSON")
+    ap.add_argument("--no-cache", action="store_true", help="ignore and do not update the parse/result cache")
+    ap.add_argument("--dump", metavar="FILE", help="print the parsed model of a repo file (.md or .v) as JSON, then exit")
+    ap.add_argument("--list", action="store_true", help="list contracts and their inputs, then exit")
+    args = ap.parse_args(argv)
+    if args.harness is None and args.default_harness and DEFAULT_HARNESS.is_dir():
+        args.harness = str(DEFAULT_HARNESS)
+
+    if args.list:
+        for c in CONTRACTS:
+            extra = f" [harness: {c.harness_audit}]" if c.harness_audit else ""
+            print(f"{c.id:<15} {c.title}{extra}")
+            for rel in c.inputs:
+                print(f"  {rel}")
+        return 0
+
+    repo = ContractRepo(ROOT, use_cache=not args.no_cache)
+
+    if args.dump:
+        rel = Path(args.dump).resolve().relative_to(ROOT).as_posix() if Path(args.dump).is_absolute() else args.dump
+        model = repo.model(rel)
+        if model is None:
+            print(f"ERROR: missing {rel}", file=sys.stderr)
+            return 2
+        json.dump(asdict(model), sys.stdout, indent=2)
+        print()
+        repo.save()
+        return 0
+
+    by_id = {c.id: c for c in CONTRACTS}
+    unknown = sorted(set(args.contract) - set(by_id))
+    if unknown:
+        print(f"ERROR: unknown contract id(s): {', '.join(unknown)} (see --list)", file=sys.stderr)
+        return 2
+    contracts = [c for c in CONTRACTS if not args.contract or c.id in args.contract]
+
+    t0 = time.perf_counter()
+    reports = evaluate(repo, contracts, strict=args.strict)
+    repo.save()
+    try:
+        hstats = harness_stage(reports, args.harness, strict=args.strict)
+    except ValueError as e:  # harness_audit.RulesError
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    total = time.perf_counter() - t0
+
+    code = next((r.outcome.code for r in reports if r.outcome.code), 0)
+    counts = {s: sum(1 for r in reports if r.outcome.status == s) for s in ("OK", "WARN", "FAIL")}
+    cached = sum(1 for r in reports if r.cached)
+
+    if args.json:
+        doc = {
+            "root": str(ROOT),
+            "strict": args.strict,
+            "harness": args.harness,
+            "summary": counts,
+            "evaluated": len(reports) - cached,
+            "cached": cached,
+            "parsed": repo.parsed,
+            "total_ms": round(total * 1e3, 3),
+            "harness_stats": hstats,
+            "contracts": [
+                {
+                    "id": r.contract.id,
+                    "title": r.contract.title,
+                    "status": r.outcome.status,
+                    "code": r.outcome.code,
+                    "cached": r.cached,
+                    "inputs": r.inputs,
+                    "messages": [{"level": lv, "text": t} for lv, t in r.outcome.messages],
+                }
+                for r in reports
+            ],
+        }
+        json.dump(doc, sys.stdout, indent=2)
+        print()
+        return code
+
+    for r in reports:
+        tag = " (STRICT)" if args.strict else ""
+        print(f"==> {r.contract.title}{tag}" + (" [cached]" if r.cached else ""))
+        for level, text in r.outcome.messages:
+            _emit(level, text)
+    print()
+    print(
+        f"== Summary: {counts['OK']} OK, {counts['WARN']} WARN, {counts['FAIL']} FAIL "
+        f"({len(reports) - cached} evaluated, {cached} cached, {len(repo.parsed)} files parsed, {total:.2f} s) =="
+    )
+    return code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -14,11 +14,12 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import datetime as _dt
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import List, Optional
 
-import yaml
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools" / "regmap"))
+from regmodel import ARRAY_MODES, RegMap, load_regmap  # noqa: E402
 
 PREFIX = "HOMEINV"
 
@@ -27,46 +28,11 @@ def _hex32(x: int) -> str:
     return f"0x{x:08X}u"
 
 
-def _field_mask(msb: int, lsb: int) -> int:
-    width = msb - lsb + 1
-    return ((1 << width) - 1) << lsb
-
-
-def _load_yaml(path: Path) -> Dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    if not isinstance(data, dict):
-        raise ValueError("YAML top-level must be a mapping")
-    return data
-
-
-def _parse_int_maybe(x: Any) -> int | None:
-    """Parse an int that may be encoded as int or hex-string; return None for null."""
-    if x is None:
-        return None
-    if isinstance(x, int):
-        return int(x)
-    if isinstance(x, str):
-        s = x.strip().lower()
-        base = 16 if s.startswith("0x") else 10
-        return int(s, base)
-    raise TypeError(f"Expected int|str|null, got: {type(x)}")
-
-
-def _collect_registers(spec: Dict[str, Any]) -> List[Tuple[str, int, Dict[str, Any]]]:
-    out: List[Tuple[str, int, Dict[str, Any]]] = []
-    for blk in spec.get("blocks", []):
-        base = int(blk["base"], 16) if isinstance(blk.get("base"), str) else int(blk.get("base", 0))
-        for reg in blk.get("registers", []):
-            name = reg["name"]
-            offset = int(reg["offset"], 16) if isinstance(reg.get("offset"), str) else int(reg.get("offset", 0))
-            addr = base + offset
-            out.append((name, addr, reg))
-    return out
-
-
-def _emit(spec_path: Path, spec: Dict[str, Any]) -> str:
-    regs = _collect_registers(spec)
-    regs_sorted = sorted(regs, key=lambda t: t[1])
+def _emit(spec_path: Path, rm: RegMap, arrays: str) -> str:
+    # "indexed" keeps each array as one entry (resets/fields under the array
+    # name); "flat" and "both" list every element under its own name.
+    regs_sorted = rm.sorted_by_addr(flat=arrays != "indexed")
+    array_regs = [r for r in rm.sorted_by_addr(flat=False) if r.is_array] if arrays != "flat" else []
 
     # Header prelude
     lines: List[str] = []
@@ -100,8 +66,29 @@ def _emit(spec_path: Path, spec: Dict[str, Any]) -> str:
 
     # Register defines
     lines += ["// -----------------------------", "// Registers (byte offsets)", "// -----------------------------"]
-    for name, addr, _reg in regs_sorted:
-        lines.append(f"#define {PREFIX}_REG_{name:<16} {_hex32(addr)}")
+    for reg in regs_sorted:
+        if reg.is_array:
+            continue
+        lines.append(f"#define {PREFIX}_REG_{reg.name:<16} {_hex32(reg.addr)}")
+
+    # Indexed accessors for register arrays (codegen.arrays: indexed|both)
+    if array_regs:
+        lines += [
+            "",
+            "// -----------------------------",
+            "// Register arrays (NAME(i) = byte offset of element i)",
+            "// -----------------------------",
+        ]
+        defs: List[tuple[str, str]] = []
+        for reg in array_regs:
+            n = f"{PREFIX}_REG_{reg.name}"
+            defs += [
+                (f"{n}(i)", f"({_hex32(reg.addr)} + {reg.stride}u * (uint32_t)(i))"),
+                (f"{n}_COUNT", f"{reg.count}u"),
+                (f"{n}_STRIDE", f"{reg.stride}u"),
+            ]
+        w = max(len(k) for k, _ in defs)
+        lines += [f"#define {k:<{w}} {v}" for k, v in defs]
 
     # Register reset defines (only when reset is specified in YAML)
     lines += [
@@ -111,8 +98,10 @@ def _emit(spec_path: Path, spec: Dict[str, Any]) -> str:
         "// -----------------------------",
         "// NOTE: Many RO registers are hard-tied in RTL, so YAML uses reset: null.",
     ]
-    for name, _addr, reg in regs_sorted:
-        r = _parse_int_maybe(reg.get("reset"))
+    for reg in regs_sorted:
+        if reg.reset_error is not None:
+            raise ValueError(f"{reg.name}: invalid reset {reg.reset_raw!r}: {reg.reset_error}")
+        r, name = reg.reset, reg.name
         if r is None:
             continue
         lines.append(f"#define {PREFIX}_REG_{name}_RESET{' ' * max(1, 9 - len(name))}{_hex32(r)}")
@@ -125,30 +114,28 @@ def _emit(spec_path: Path, spec: Dict[str, Any]) -> str:
         "// -----------------------------",
     ]
 
-    for reg_name, _addr, reg in regs_sorted:
-        fields = reg.get("fields")
-        if not fields:
+    for reg in regs_sorted:
+        if not reg.fields:
             continue
+        reg_name = reg.name
         lines += ["", f"// {reg_name} fields"]
-        for f in fields:
-            fname = f["name"]
-            bits = f["bits"]
-            if not (isinstance(bits, list) and len(bits) == 2):
+        for f in reg.fields:
+            fname = f.name
+            if not f.bits_ok:
                 raise ValueError(f"Field bits for {reg_name}.{fname} must be [msb, lsb]")
-            msb, lsb = int(bits[0]), int(bits[1])
+            lsb = f.lsb
 
             # Single-bit
-            if msb == lsb:
+            if f.msb == lsb:
                 lines.append(f"#define {PREFIX}_{reg_name}_{fname}_BIT    {lsb}u")
                 lines.append(f"#define {PREFIX}_{reg_name}_{fname}_SHIFT  {lsb}u")
                 lines.append(
                     f"#define {PREFIX}_{reg_name}_{fname}_MASK   (1u << {PREFIX}_{reg_name}_{fname}_BIT)"
                 )
             else:
-                mask = _field_mask(msb, lsb)
                 lines.append(f"#define {PREFIX}_{reg_name}_{fname}_LSB    {lsb}u")
-                lines.append(f"#define {PREFIX}_{reg_name}_{fname}_SHIFT  {lsb}u")
-                lines.append(f"#define {PREFIX}_{reg_name}_{fname}_MASK   {_hex32(mask)}")
+                lines.append(f"#define {PREFIX}_{reg_name}_{fname}_SHIFT  {f.shift}u")
+                lines.append(f"#define {PREFIX}_{reg_name}_{fname}_MASK   {_hex32(f.mask)}")
 
     # Handy constants section (kept tiny)
     lines += [
@@ -164,26 +151,39 @@ def _emit(spec_path: Path, spec: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def render(spec_path: Path, rm: RegMap, arrays: Optional[str] = None) -> str:
+    """Return the full generated file text (used by ops/regmap_gen.py too).
+
+    `arrays` overrides the spec's codegen.arrays (flat|indexed|both).
+    """
+
+    # Minimal sanity checks
+    if rm.version != 1:
+        raise ValueError(f"Unexpected regmap version: {rm.version}")
+    if rm.bus.get("type") != "wishbone":
+        raise ValueError("Only wishbone bus supported by this generator")
+    arrays = arrays or rm.arrays_mode
+    if arrays not in ARRAY_MODES:
+        raise ValueError(f"Unknown arrays mode: {arrays!r} (expected one of {', '.join(ARRAY_MODES)})")
+    return _emit(spec_path, rm, arrays) + "\n"
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--yaml", required=True, type=Path)
     ap.add_argument("--out", required=True, type=Path)
+    ap.add_argument("--arrays", choices=ARRAY_MODES, default=None, help="Override codegen.arrays from the YAML")
     args = ap.parse_args()
 
     spec_path: Path = args.yaml
     out_path: Path = args.out
 
-    spec = _load_yaml(spec_path)
-
-    # Minimal sanity checks
-    if spec.get("version") != 1:
-        raise SystemExit(f"Unexpected regmap version: {spec.get('version')}")
-    if spec.get("bus", {}).get("type") != "wishbone":
-        raise SystemExit("Only wishbone bus supported by this generator")
-
-    text = _emit(spec_path, spec)
+    try:
+        text = render(spec_path, load_regmap(spec_path), args.arrays)
+    except ValueError as e:
+        raise SystemExit(str(e))
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(text + "\n", encoding="utf-8")
+    out_path.write_text(text, encoding="utf-8")
     return 0
 
 
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""Generate a Python register-bank model of rtl/home_inventory_wb.v from the regmap YAML.
+
+Why:
+- Firmware drain loops, host tooling and the verify/model/ simulators need an
+  executable stand-in for the Wishbone register file that cannot drift from
+  spec/regmap_v1.yaml.
+
+The generated module is self-contained (stdlib only) and contains:
+- ADR_* constants and a FIELDS table (shift, mask) per register,
+- flat dispatch tables indexed by word address (addr >> 2): slot, reset value,
+  RW / W1C / W1P bit masks, so read32/write32 are a list index plus a few
+  integer ops (several million accesses per second in CPython),
+- class RegBank with the RTL access semantics: ro ignores writes, rw honours
+  wbs_sel_i byte lanes, w1p bits read 0 and are reported to write hooks as
+  pulses, w1c bits (e.g. ADC_FIFO_STATUS.OVERRUN on the ro_w1c register) clear
+  only in selected byte lanes. Side effects (FIFO pop, TIME_NOW, detector
+  readback) are attached with on_read / on_write hooks.
+
+Usage:
+  python3 ops/gen_regmap_py.py \
+    --yaml spec/regmap_v1.yaml \
+    --out  verify/model/home_inventory_regbank.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools" / "regmap"))
+from regmodel import RegMap, Register, load_regmap  # noqa: E402
+
+# Read-only registers whose value is hard-tied in RTL (YAML has reset: null).
+RTL_TIED: Dict[str, int] = {
+    "ID": 0x4849_4348,  # "HICH"
+    "VERSION": 0x0000_0001,
+}
+
+_FULL = 0xFFFF_FFFF
+
+_CLASS_SRC = '''
+_LANES = tuple(
+    (0xFF if s & 1 else 0) | (0xFF00 if s & 2 else 0) | (0xFF0000 if s & 4 else 0) | (0xFF000000 if s & 8 else 0)
+    for s in range(16)
+)
+_N_WORDS = len(SLOT_OF_WORD)
+_SLOT_OF_NAME = {n: i for i, n in enumerate(NAMES)}
+
+ReadHook = Callable[[], int]
+WriteHook = Callable[[int, int, int], None]
+
+
+class RegBank:
+    """Register file of home_inventory_wb with the spec's access semantics.
+
+    Storage is one int per register (`val`, indexed like NAMES). Hooks replace
+    storage for registers backed by other models:
+      on_read(reg, fn)   fn() -> value returned by read32 (e.g. FIFO pop)
+      on_write(reg, fn)  fn(value, w1p_bits, w1c_bits) after every write32 to
+                         reg; value is the updated storage, the bit sets are
+                         already masked by wbs_sel_i byte lanes.
+    `reg` is a register name or byte address. poke()/peek() access storage
+    directly (hardware side, no access rules, no hooks).
+    """
+
+    __slots__ = ("val", "_rd", "_wr")
+
+    def __init__(self) -> None:
+        self.val: List[int] = list(RESETS)
+        self._rd: List[Optional[ReadHook]] = [None] * len(NAMES)
+        self._wr: List[Optional[WriteHook]] = [None] * len(NAMES)
+
+    def reset(self) -> None:
+        """wb_rst_i: storage back to the spec reset values (hooks stay attached)."""
+
+        self.val[:] = RESETS
+
+    @staticmethod
+    def slot(reg: Union[str, int]) -> int:
+        if isinstance(reg, str):
+            return _SLOT_OF_NAME[reg]
+        w = reg >> 2
+        s = SLOT_OF_WORD[w] if 0 <= w < _N_WORDS else -1
+        if s < 0:
+            raise KeyError(f"no register at 0x{reg:08X}")
+        return s
+
+    def on_read(self, reg: Union[str, int], fn: Optional[ReadHook]) -> None:
+        self._rd[self.slot(reg)] = fn
+
+    def on_write(self, reg: Union[str, int], fn: Optional[WriteHook]) -> None:
+        self._wr[self.slot(reg)] = fn
+
+    def peek(self, reg: Union[str, int]) -> int:
+        return self.val[self.slot(reg)]
+
+    def poke(self, reg: Union[str, int], value: int) -> None:
+        self.val[self.slot(reg)] = value & 0xFFFFFFFF
+
+    # Wishbone accesses (adr[1:0] ignored like the RTL decode)
+
+    def read32(self, addr: int) -> int:
+        w = (addr & 0xFFFFFFFF) >> 2
+        s = SLOT_OF_WORD[w] if w < _N_WORDS else -1
+        if s < 0:
+            return 0
+        fn = self._rd[s]
+        return self.val[s] if fn is None else fn() & 0xFFFFFFFF
+
+    def write32(self, addr: int, data: int, sel: int = 0xF) -> None:
+        w = (addr & 0xFFFFFFFF) >> 2
+        s = SLOT_OF_WORD[w] if w < _N_WORDS else -1
+        if s < 0:
+            return
+        lanes = _LANES[sel & 0xF]
+        d = data & lanes
+        rw = RW_MASK[s]
+        w1c = d & W1C_MASK[s]
+        new = ((self.val[s] & ~(rw & lanes)) | (d & rw)) & ~w1c
+        self.val[s] = new
+        fn = self._wr[s]
+        if fn is not None:
+            fn(new, d & W1P_MASK[s], w1c)
+
+    def read_repeat(self, addr: int, n: int) -> List[int]:
+        """n back-to-back reads of one address (a FIFO drain burst)."""
+
+        w = (addr & 0xFFFFFFFF) >> 2
+        s = SLOT_OF_WORD[w] if w < _N_WORDS else -1
+        if s < 0:
+            return [0] * n
+        fn = self._rd[s]
+        if fn is None:
+            return [self.val[s]] * n
+        return [fn() & 0xFFFFFFFF for _ in range(n)]
+
+    def regs(self) -> Dict[str, int]:
+        """Storage snapshot keyed by register name (no hooks, no side effects)."""
+
+        return dict(zip(NAMES, self.val))
+
+
+def selftest() -> int:
+    """Check every register against the access tables with all 16 byte-lane masks."""
+
+    bank = RegBank()
+    fails = 0
+
+    def expect(got: int, exp: int, msg: str) -> None:
+        nonlocal fails
+        if got != exp:
+            fails += 1
+            print(f"FAIL: {msg}: got 0x{got:08X} expected 0x{exp:08X}")
+
+    for s, (name, addr) in enumerate(zip(NAMES, ADDRS)):
+        expect(bank.read32(addr), RESETS[s], f"{name} reset")
+        for sel in range(16):
+            lanes = _LANES[sel]
+            pulses: List[int] = []
+            bank.on_write(addr, lambda v, p, c: pulses.append(p))
+            bank.reset()
+            bank.poke(addr, 0xFFFFFFFF)
+            bank.write32(addr, 0x00000000, sel)
+            exp = 0xFFFFFFFF & ~(RW_MASK[s] & lanes)
+            expect(bank.read32(addr), exp, f"{name} write 0 sel={sel:04b}")
+            bank.write32(addr | 3, 0xFFFFFFFF, sel)
+            exp = (exp | (RW_MASK[s] & lanes)) & ~(W1C_MASK[s] & lanes)
+            expect(bank.read32(addr), exp, f"{name} write 1s sel={sel:04b} (w1c lanes)")
+            expect(pulses[-1], W1P_MASK[s] & lanes, f"{name} w1p pulse sel={sel:04b}")
+            bank.on_write(addr, None)
+    bank.reset()
+    for s, addr in enumerate(ADDRS):
+        bank.write32(addr, 0xFFFFFFFF)
+        expect(bank.read32(addr) & W1P_MASK[s], 0, f"{NAMES[s]} w1p bits read 0")
+    expect(bank.read32(ADDRS[-1] + 4), 0, "unmapped read")
+
+    # Hand-written from rtl/home_inventory_wb.v, independent of the generated
+    # RW/W1C/W1P tables the loop above checks against (a mask bug in the
+    # generator would pass that loop).
+    bank.reset()
+    bank.write32(ADR_CTRL, 0x00000003)
+    expect(bank.read32(ADR_CTRL), 0x00000001, "CTRL: ENABLE stored, START reads 0")
+    bank.write32(ADR_IRQ_EN, 0xFFFFFFFF)
+    expect(bank.read32(ADR_IRQ_EN), 0x00000007, "IRQ_EN stores bits [2:0] only")
+    for sel, exp in ((0b1011, 0x00010000), (0b0100, 0x00000000)):
+        bank.poke(ADR_ADC_FIFO_STATUS, 0x00010000)
+        bank.write32(ADR_ADC_FIFO_STATUS, 0x00010000, sel)
+        expect(bank.read32(ADR_ADC_FIFO_STATUS), exp, f"ADC_FIFO_STATUS OVERRUN W1C needs lane 2 (sel={sel:04b})")
+    bank.write32(ADR_EVT_CFG, 0x000003A5)
+    expect(bank.read32(ADR_EVT_CFG), 0x000000A5, "EVT_CFG: EVT_EN stored, CLEAR_COUNTS/CLEAR_HISTORY read 0")
+
+    print("regbank selftest: " + ("PASS" if fails == 0 else f"{fails} FAIL(s)") + f" ({len(NAMES)} registers)")
+    return 0 if fails == 0 else 1
+
+
+def bench(n: int = 1_000_000) -> None:
+    """Print read32/write32 throughput for a firmware-style mix."""
+
+    bank = RegBank()
+    rd, wr = bank.read32, bank.write32
+    addrs = ADDRS
+    t0 = time.perf_counter()
+    for i in range(n):
+        rd(addrs[i % len(addrs)])
+    t1 = time.perf_counter()
+    for i in range(n):
+        wr(addrs[i % len(addrs)], i, 0xF)
+    t2 = time.perf_counter()
+    print(f"read32:  {n / (t1 - t0) / 1e6:.2f} M/s")
+    print(f"write32: {n / (t2 - t1) / 1e6:.2f} M/s")
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description="Register-bank model of home_inventory_wb (generated)")
+    ap.add_argument("--selftest", action="store_true", help="Check access semantics for every register")
+    ap.add_argument("--bench", type=int, metavar="N", default=0, help="Time N reads and N writes")
+    args = ap.parse_args(argv)
+    rc = selftest() if args.selftest or not args.bench else 0
+    if args.bench:
+        bench(args.bench)
+    return rc
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
+'''
+
+
+def _hex32(x: int) -> str:
+    return f"0x{x:08X}"
+
+
+def _masks(reg: Register) -> Dict[str, int]:
+    """RW / W1C / W1P bit masks for one register (unlisted bits are reserved)."""
+
+    m = {"rw": 0, "w1c": 0, "w1p": 0}
+    if not reg.fields:
+        m["rw"] = _FULL if reg.access == "rw" else 0
+        return m
+    for f in reg.fields:
+        if not f.bits_ok:
+            raise ValueError(f"Field bits for {reg.name}.{f.name} must be [msb, lsb]")
+        if f.access in m:
+            m[f.access] |= f.mask
+    if reg.access == "ro":
+        m["rw"] = 0
+    return m
+
+
+def _tuple(name: str, items: List[str], per_line: int = 8) -> List[str]:
+    lines = [f"{name} = ("]
+    for i in range(0, len(items), per_line):
+        lines.append("    " + ", ".join(items[i : i + per_line]) + ",")
+    lines.append(")")
+    return lines
+
+
+def render(spec_path: Path, rm: RegMap) -> str:
+    """Return the full generated module text (used by ops/regmap_gen.py too)."""
+
+    if rm.version != 1:
+        raise ValueError(f"Unexpected regmap version: {rm.version}")
+    if rm.bus.get("type") != "wishbone" or rm.bus.get("data_width", 32) != 32:
+        raise ValueError("Only 32-bit wishbone bus supported by this generator")
+
+    regs = rm.sorted_by_addr()
+    gen_from = "spec/regmap_v1.yaml" if spec_path.name == "regmap_v1.yaml" else spec_path.as_posix()
+
+    resets: List[int] = []
+    masks: List[Dict[str, int]] = []
+    for reg in regs:
+        if reg.reset_error is not None:
+            raise ValueError(f"{reg.name}: invalid reset {reg.reset_raw!r}: {reg.reset_error}")
+        if reg.addr % 4 != 0:
+            raise ValueError(f"{reg.name}: address 0x{reg.addr:08X} not word-aligned")
+        resets.append(reg.reset if reg.reset is not None else RTL_TIED.get(reg.name, 0))
+        masks.append(_masks(reg))
+
+    n_words = regs[-1].addr // 4 + 1 if regs else 0
+    slot_of_word = [-1] * n_words
+    for i, reg in enumerate(regs):
+        slot_of_word[reg.addr // 4] = i
+
+    lines: List[str] = [
+        "#!/usr/bin/env python3",
+        "# AUTO-GENERATED FILE. DO NOT EDIT BY HAND.",
+        f"# Generated from: {gen_from}",
+        "# Generated by:   ops/gen_regmap_py.py",
+        '"""Executable register-bank model of rtl/home_inventory_wb.v (see RegBank).',
+        "",
+        "    bank = RegBank()",
+        "    bank.on_read(ADR_ADC_FIFO_DATA, fifo.pop)          # side effects via hooks",
+        "    bank.write32(ADR_ADC_FIFO_STATUS, 1 << 16, 0b0100) # W1C OVERRUN, lane 2 only",
+        "    level = bank.read32(ADR_ADC_FIFO_STATUS) & FIELDS['ADC_FIFO_STATUS']['LEVEL_WORDS'][1]",
+        "",
+        "Addresses are Wishbone byte addresses; unmapped words read 0 and ignore writes.",
+        "",
+        "Usage:",
+        "  python3 verify/model/home_inventory_regbank.py --selftest",
+        "  python3 verify/model/home_inventory_regbank.py --bench 1000000",
+        '"""',
+        "",
+        "from __future__ import annotations",
+        "",
+        "import argparse",
+        "import sys",
+        "import time",
+        "from typing import Callable, Dict, List, Optional, Tuple, Union",
+        "",
+        "# Register byte addresses",
+    ]
+    w = max(len(r.name) for r in regs)
+    lines += [f"ADR_{r.name:<{w}} = {_hex32(r.addr)}" for r in regs]
+
+    lines += ["", "# Per-register tables, in address order (a register's index is its slot)"]
+    lines += _tuple("NAMES", [f'"{r.name}"' for r in regs], 4)
+    lines += _tuple("ADDRS", [_hex32(r.addr) for r in regs])
+    lines += ["# Reset values (spec reset; RTL hard-tied value or 0 where the spec says null)"]
+    lines += _tuple("RESETS", [_hex32(v) for v in resets])
+    lines += ["# Bits written through wbs_sel_i byte lanes"]
+    lines += _tuple("RW_MASK", [_hex32(m["rw"]) for m in masks])
+    lines += ["# Write-1-to-clear bits (byte-lane masked)"]
+    lines += _tuple("W1C_MASK", [_hex32(m["w1c"]) for m in masks])
+    lines += ["# Write-1-to-pulse bits (byte-lane masked, always read 0)"]
+    lines += _tuple("W1P_MASK", [_hex32(m["w1p"]) for m in masks])
+    lines += ["# Word index (byte address >> 2) -> slot, -1 = unmapped"]
+    lines += _tuple("SLOT_OF_WORD", [str(s) for s in slot_of_word], 16)
+
+    lines += ["", "# Bitfields: FIELDS[reg][field] = (shift, mask)", "FIELDS: Dict[str, Dict[str, Tuple[int, int]]] = {"]
+    for reg in regs:
+        if not reg.fields:
+            continue
+        inner = ", ".join(f'"{f.name}": ({f.shift}, {_hex32(f.mask)})' for f in reg.fields)
+        lines.append(f'    "{reg.name}": {{{inner}}},')
+    lines.append("}")
+
+    return "\n".join(lines) + "\n" + _CLASS_SRC
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--yaml", required=True, type=Path)
+    ap.add_argument("--out", required=True, type=Path)
+    args = ap.parse_args()
+
+    try:
+        text = render(args.yaml, load_regmap(args.yaml))
+    except ValueError as e:
+        raise SystemExit(str(e))
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(text, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
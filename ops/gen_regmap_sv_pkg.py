@@ -18,10 +18,12 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import List, Optional
 
-import yaml
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools" / "regmap"))
+from regmodel import ARRAY_MODES, RegMap, load_regmap  # noqa: E402
 
 PKG_NAME = "home_inventory_regmap_pkg"
 PREFIX = "HOMEINV"
@@ -31,32 +33,10 @@ def _hex32(x: int) -> str:
     return f"32'h{x:08X}"
 
 
-def _field_mask(msb: int, lsb: int) -> int:
-    width = msb - lsb + 1
-    return ((1 << width) - 1) << lsb
-
-
-def _load_yaml(path: Path) -> Dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    if not isinstance(data, dict):
-        raise ValueError("YAML top-level must be a mapping")
-    return data
-
-
-def _collect_registers(spec: Dict[str, Any]) -> List[Tuple[str, int, Dict[str, Any]]]:
-    out: List[Tuple[str, int, Dict[str, Any]]] = []
-    for blk in spec.get("blocks", []):
-        base = int(blk["base"], 16) if isinstance(blk.get("base"), str) else int(blk.get("base", 0))
-        for reg in blk.get("registers", []):
-            name = reg["name"]
-            offset = int(reg["offset"], 16) if isinstance(reg.get("offset"), str) else int(reg.get("offset", 0))
-            addr = base + offset
-            out.append((name, addr, reg))
-    return out
-
-
-def _emit(spec_path: Path, spec: Dict[str, Any]) -> str:
-    regs = sorted(_collect_registers(spec), key=lambda t: t[1])
+def _emit(spec_path: Path, rm: RegMap, arrays: str) -> str:
+    # Same array handling as ops/gen_regmap_header.py.
+    regs = rm.sorted_by_addr(flat=arrays != "indexed")
+    array_regs = [r for r in rm.sorted_by_addr(flat=False) if r.is_array] if arrays != "flat" else []
 
     gen_from = "spec/regmap_v1.yaml" if spec_path.name == "regmap_v1.yaml" else spec_path.as_posix()
 
@@ -82,8 +62,42 @@ def _emit(spec_path: Path, spec: Dict[str, Any]) -> str:
         "  // -----------------------------",
     ]
 
-    for name, addr, _reg in regs:
-        lines.append(f"  localparam logic [31:0] {PREFIX}_ADR_{name} = {_hex32(addr)};")
+    for reg in regs:
+        if reg.is_array:
+            continue
+        lines.append(f"  localparam logic [31:0] {PREFIX}_ADR_{reg.name} = {_hex32(reg.addr)};")
+
+    if array_regs:
+        lines += [
+            "",
+            "  // -----------------------------",
+            "  // Register arrays (NAME(i) = byte address of element i)",
+            "  // -----------------------------",
+        ]
+        for reg in array_regs:
+            n = f"{PREFIX}_ADR_{reg.name}"
+            lines += [
+                f"  localparam logic [31:0] {n}_BASE   = {_hex32(reg.addr)};",
+                f"  localparam int unsigned {n}_COUNT  = {reg.count};",
+                f"  localparam int unsigned {n}_STRIDE = {reg.stride};",
+                f"  function automatic logic [31:0] {n}(input int unsigned i);",
+                f"    return {n}_BASE + {n}_STRIDE * i;",
+                "  endfunction",
+            ]
+
+    # Register reset values (only when reset is specified in YAML)
+    lines += [
+        "",
+        "  // -----------------------------",
+        "  // Register reset values",
+        "  // -----------------------------",
+    ]
+    for reg in regs:
+        if reg.reset_error is not None:
+            raise ValueError(f"{reg.name}: invalid reset {reg.reset_raw!r}: {reg.reset_error}")
+        if reg.reset is None:
+            continue
+        lines.append(f"  localparam logic [31:0] {PREFIX}_RST_{reg.name} = {_hex32(reg.reset)};")
 
     lines += [
         "",
@@ -92,27 +106,24 @@ def _emit(spec_path: Path, spec: Dict[str, Any]) -> str:
         "  // -----------------------------",
     ]
 
-    for reg_name, _addr, reg in regs:
-        fields = reg.get("fields")
-        if not fields:
+    for reg in regs:
+        if not reg.fields:
             continue
+        reg_name = reg.name
         lines += ["", f"  // {reg_name} fields"]
-        for f in fields:
-            fname = f["name"]
-            bits = f["bits"]
-            if not (isinstance(bits, list) and len(bits) == 2):
+        for f in reg.fields:
+            fname = f.name
+            if not f.bits_ok:
                 raise ValueError(f"Field bits for {reg_name}.{fname} must be [msb, lsb]")
-            msb, lsb = int(bits[0]), int(bits[1])
 
-            if msb == lsb:
-                lines.append(f"  localparam int unsigned {PREFIX}_{reg_name}_{fname}_BIT = {lsb};")
+            if f.msb == f.lsb:
+                lines.append(f"  localparam int unsigned {PREFIX}_{reg_name}_{fname}_BIT = {f.lsb};")
                 lines.append(
                     f"  localparam logic [31:0] {PREFIX}_{reg_name}_{fname}_MASK = (32'h1 << {PREFIX}_{reg_name}_{fname}_BIT);"
                 )
             else:
-                mask = _field_mask(msb, lsb)
-                lines.append(f"  localparam int unsigned {PREFIX}_{reg_name}_{fname}_LSB  = {lsb};")
-                lines.append(f"  localparam logic [31:0] {PREFIX}_{reg_name}_{fname}_MASK = {_hex32(mask)};")
+                lines.append(f"  localparam int unsigned {PREFIX}_{reg_name}_{fname}_LSB  = {f.lsb};")
+                lines.append(f"  localparam logic [31:0] {PREFIX}_{reg_name}_{fname}_MASK = {_hex32(f.mask)};")
 
     lines += [
         "",
@@ -129,25 +140,38 @@ def _emit(spec_path: Path, spec: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def render(spec_path: Path, rm: RegMap, arrays: Optional[str] = None) -> str:
+    """Return the full generated file text (used by ops/regmap_gen.py too).
+
+    `arrays` overrides the spec's codegen.arrays (flat|indexed|both).
+    """
+
+    if rm.version != 1:
+        raise ValueError(f"Unexpected regmap version: {rm.version}")
+    if rm.bus.get("type") != "wishbone":
+        raise ValueError("Only wishbone bus supported by this generator")
+    arrays = arrays or rm.arrays_mode
+    if arrays not in ARRAY_MODES:
+        raise ValueError(f"Unknown arrays mode: {arrays!r} (expected one of {', '.join(ARRAY_MODES)})")
+    return _emit(spec_path, rm, arrays) + "\n"
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--yaml", required=True, type=Path)
     ap.add_argument("--out", required=True, type=Path)
+    ap.add_argument("--arrays", choices=ARRAY_MODES, default=None, help="Override codegen.arrays from the YAML")
     args = ap.parse_args()
 
     spec_path: Path = args.yaml
     out_path: Path = args.out
 
-    spec = _load_yaml(spec_path)
-
-    if spec.get("version") != 1:
-        raise SystemExit(f"Unexpected regmap version: {spec.get('version')}")
-    if spec.get("bus", {}).get("type") != "wishbone":
-        raise SystemExit("Only wishbone bus supported by this generator")
-
-    text = _emit(spec_path, spec)
+    try:
+        text = render(spec_path, load_regmap(spec_path), args.arrays)
+    except ValueError as e:
+        raise SystemExit(str(e))
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(text + "\n", encoding="utf-8")
+    out_path.write_text(text, encoding="utf-8")
     return 0
 
 
@@ -110,19 +110,14 @@ say "[preflight] (2/2) home-inventory-chip-openmpw: sync filelist + verify drift
   fi
 
   # Grep-based audits (no toolchain): catch integration drift early even on low-disk setups.
+  # One pass over the harness for every rule in tools/harness_audit_rules.yaml;
+  # evidence gaps are WARN, placeholders FAIL only in strict mode.
   say "[preflight] Harness repo: grep-based audits (no toolchain)"
-  bash "${ROOT_DIR}/tools/harness_adc_clocking_audit.sh" .
-  bash "${ROOT_DIR}/tools/harness_adc_pinout_audit.sh" .
-  bash "${ROOT_DIR}/tools/harness_adc_streaming_audit.sh" .
-  bash "${ROOT_DIR}/tools/harness_event_detector_audit.sh" .
+  python3 "${ROOT_DIR}/tools/harness_audit.py" --suite audit .
 
   if [[ "${STRICT}" -eq 1 ]]; then
     say "[preflight] Harness repo: strict placeholder checks (fail-fast)"
-    bash "${ROOT_DIR}/tools/harness_adc_clocking_placeholder_check.sh" .
-    bash "${ROOT_DIR}/tools/harness_adc_pinout_placeholder_check.sh" .
-    bash "${ROOT_DIR}/tools/harness_adc_streaming_placeholder_check.sh" .
-    bash "${ROOT_DIR}/tools/harness_event_detector_placeholder_check.sh" .
-    bash "${ROOT_DIR}/tools/harness_wb_wiring_placeholder_check.sh" .
+    python3 "${ROOT_DIR}/tools/harness_audit.py" --suite placeholder .
   fi
 )
 
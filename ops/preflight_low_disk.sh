@@ -55,7 +55,7 @@ fi
 banner "RTL compile/elaboration (iverilog)"
 bash ops/rtl_compile_check.sh
 
-banner "ADC framing params (grep gate)"
+banner "ADC framing params (contract gate)"
 # Fail fast if our ADS131M08 capture framing assumptions drift.
 bash ops/check_adc_framing_params.sh
 
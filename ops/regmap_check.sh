@@ -1,8 +1,8 @@
 #!/usr/bin/env bash
 # Verify that all derived regmap artifacts are in sync with the YAML source-of-truth.
 #
-# This is CI-friendly and low-disk: it re-runs generation and then fails if git
-# shows any diffs.
+# This is CI-friendly and low-disk: it renders every artifact in memory and fails
+# if any committed file differs (nothing is written).
 #
 # Usage:
 #   bash ops/regmap_check.sh
@@ -24,47 +24,16 @@ need_cmd() {
 }
 
 need_cmd bash
-need_cmd git
 need_cmd python3
 
-banner "Regmap: validate + regenerate derived artifacts"
-bash ops/regmap_update.sh >/dev/null
-
-banner "Regmap: YAML  RTL address map consistency"
-# Ensure RTL decode constants match the YAML source-of-truth.
-# This catches cases where someone edits RTL decode addresses without updating
-# the YAML (or vice-versa) even if generated headers still look sane.
-python3 tools/regmap/check_regmap.py \
-  --yaml spec/regmap_v1.yaml \
-  --rtl  rtl/home_inventory_wb.v
-
-banner "Regmap: check for generation drift (git diff)"
-# Limit the diff check to derived artifacts to avoid false failures when other
-# files are dirty.
-PATHS=(
-  spec/regmap_v1_table.md
-  fw/include/home_inventory_regmap.h
-  rtl/include/home_inventory_regmap_pkg.sv
-  rtl/include/regmap_params.vh
-)
-
-# If any of these files are missing, that's also a failure.
-for p in "${PATHS[@]}"; do
-  [[ -f "$p" ]] || die "expected regmap artifact missing: $p"
-done
-
-if ! git diff --exit-code -- "${PATHS[@]}" >/dev/null; then
-  echo ""
-  echo "Regmap artifacts are OUT OF DATE relative to spec/regmap_v1.yaml."
-  echo "Run: bash ops/regmap_update.sh" 
-  echo "Then commit the updated artifacts."
-  echo ""
-  echo "Changed files:"
-  git diff --name-only -- "${PATHS[@]}" || true
-  echo ""
-  echo "Diff (first 200 lines):"
-  git diff -- "${PATHS[@]}" | sed -n '1,200p' || true
-  exit 2
-fi
+banner "Regmap: validate + drift check + YAML/RTL address map consistency"
+# Single interpreter: ops/regmap_gen.py parses the YAML once, validates it,
+# renders every derived artifact in memory and compares it with the file on
+# disk (no writes), then checks the RTL decode constants against the YAML.
+# The RTL check catches cases where someone edits RTL decode addresses without
+# updating the YAML (or vice-versa) even if generated headers still look sane.
+#
+# Exit 2 on drift; a missing artifact counts as drift.
+python3 ops/regmap_gen.py --check --quiet --rtl rtl/home_inventory_wb.v
 
 banner "Regmap: OK (no drift)"
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Validate spec/regmap_v1.yaml and (re)generate every derived artifact in one pass.
+
+Replaces running ops/regmap_validate.py, ops/gen_regmap_md.py,
+ops/gen_regmap_header.py, ops/gen_regmap_sv_pkg.py, ops/gen_regmap_py.py and
+tools/regmap/gen_verilog_params.py as separate interpreters: the YAML is parsed
+once (via the shared tools/regmap/regmodel cache) and each emitter renders from
+the same model in this process. The individual scripts still work on their own.
+
+Incremental:
+- Each artifact gets a hash stamp (YAML bytes + emitter/model sources ->
+  artifact bytes) in the regmodel cache directory. If the inputs are unchanged
+  and the file on disk still has the stamped hash, the emitter is skipped; if
+  every artifact (and the validation result) is fresh, the YAML is not even
+  parsed.
+- Files are only rewritten when their content changes, so mtimes (and
+  make/iverilog rebuilds) only move on real edits.
+
+Usage:
+  python3 ops/regmap_gen.py                 # validate + update artifacts
+  python3 ops/regmap_gen.py --check         # drift check only (exit 2 on drift)
+  python3 ops/regmap_gen.py --check --rtl rtl/home_inventory_wb.v
+                                            # + RTL constant consistency (check_regmap.py)
+
+Exit codes: 0 OK, 1 validation failed, 2 drift (--check) or RTL mismatch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools" / "regmap"))
+
+import check_regmap  # noqa: E402
+import gen_regmap_header  # noqa: E402
+import gen_regmap_md  # noqa: E402
+import gen_regmap_py  # noqa: E402
+import gen_regmap_sv_pkg  # noqa: E402
+import gen_verilog_params  # noqa: E402
+import regmap_validate  # noqa: E402
+import regmodel  # noqa: E402
+from regmodel import RegMap, cache_dir, load_regmap  # noqa: E402
+
+DEFAULT_YAML = "spec/regmap_v1.yaml"
+
+_STAMP_FILE = "stamps.json"
+
+
+@dataclass(frozen=True)
+class Emitter:
+    out: str  # repo-relative output path
+    module: ModuleType
+    render: Callable[[Path, RegMap], str]
+
+
+EMITTERS: List[Emitter] = [
+    Emitter("spec/regmap_v1_table.md", gen_regmap_md, gen_regmap_md.render),
+    Emitter("fw/include/home_inventory_regmap.h", gen_regmap_header, gen_regmap_header.render),
+    Emitter("rtl/include/home_inventory_regmap_pkg.sv", gen_regmap_sv_pkg, gen_regmap_sv_pkg.render),
+    Emitter("verify/model/home_inventory_regbank.py", gen_regmap_py, gen_regmap_py.render),
+    Emitter(
+        "rtl/include/regmap_params.vh",
+        gen_verilog_params,
+        lambda p, _rm: gen_verilog_params.render(p, gen_verilog_params.load_regs(p)),
+    ),
+]
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _source_hash(*modules: ModuleType) -> str:
+    h = hashlib.sha256()
+    for m in modules:
+        h.update(Path(m.__file__).read_bytes())
+    return h.hexdigest()
+
+
+def _input_key(yaml_sha: str, yaml_rel: str, *modules: ModuleType) -> str:
+    model_src = sorted((Path(regmodel.__file__).parent).glob("*.py"))
+    h = hashlib.sha256(f"{yaml_rel}\0{yaml_sha}\0{_source_hash(*modules)}".encode())
+    for p in model_src:
+        h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+class Stamps:
+    """Best-effort JSON stamp store next to the regmodel pickle cache."""
+
+    def __init__(self, enabled: bool) -> None:
+        cdir = cache_dir() if enabled else None
+        self.path = cdir / _STAMP_FILE if cdir is not None else None
+        self.data: Dict[str, Dict[str, str]] = {}
+        self.dirty = False
+        if self.path is not None:
+            try:
+                self.data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self.data = {}
+
+    def fresh(self, key: str, inputs: str, output: Optional[str] = None) -> bool:
+        st = self.data.get(key)
+        return st is not None and st.get("inputs") == inputs and st.get("output") == output
+
+    def record(self, key: str, inputs: str, output: Optional[str] = None) -> None:
+        st = {"inputs": inputs} if output is None else {"inputs": inputs, "output": output}
+        if self.data.get(key) != st:
+            self.data[key] = st
+            self.dirty = True
+
+    def save(self) -> None:
+        if self.path is None or not self.dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.data, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Validate the regmap YAML and regenerate all derived artifacts")
+    ap.add_argument("--yaml", type=Path, default=None, help=f"Regmap YAML (default: {DEFAULT_YAML})")
+    ap.add_argument("--check", action="store_true", help="Do not write; exit 2 if any artifact is out of date")
+    ap.add_argument("--rtl", type=Path, default=None, help="Also check RTL ADR_* localparams (e.g. rtl/home_inventory_wb.v)")
+    ap.add_argument("--force", action="store_true", help="Ignore hash stamps and re-render everything")
+    ap.add_argument("-q", "--quiet", action="store_true", help="Only print problems")
+    args = ap.parse_args()
+
+    # Generators embed the repo-relative YAML path in their output, so work
+    # from the repo root like ops/regmap_update.sh does.
+    yaml_abs = (args.yaml or ROOT / DEFAULT_YAML).resolve()
+    rtl_abs = args.rtl.resolve() if args.rtl else None
+    os.chdir(ROOT)
+    try:
+        yaml_rel = Path(os.path.relpath(yaml_abs, ROOT))
+    except ValueError:  # different drive (Windows)
+        yaml_rel = yaml_abs
+
+    def say(msg: str) -> None:
+        if not args.quiet:
+            print(msg)
+
+    yaml_sha = _sha(yaml_abs.read_bytes())
+    stamps = Stamps(enabled=not args.force)
+
+    # Decide what needs work before touching the YAML parser.
+    val_key = f"validate:{yaml_abs}"
+    val_inputs = _input_key(yaml_sha, yaml_rel.as_posix(), regmap_validate)
+    need_validate = not stamps.fresh(val_key, val_inputs)
+
+    pending = []
+    for em in EMITTERS:
+        out = ROOT / em.out
+        cur = out.read_bytes() if out.is_file() else None
+        inputs = _input_key(yaml_sha, yaml_rel.as_posix(), em.module)
+        if cur is not None and stamps.fresh(em.out, inputs, _sha(cur)):
+            say(f"regmap_gen: {em.out}: up to date (stamp)")
+            continue
+        pending.append((em, out, cur, inputs))
+
+    rm: Optional[RegMap] = None
+    if need_validate or pending or rtl_abs is not None:
+        rm = load_regmap(yaml_rel)
+
+    if need_validate:
+        assert rm is not None
+        errs, warns, n_regs = regmap_validate.validate(rm)
+        rc = regmap_validate.report(errs, warns, n_regs) if (errs or warns or not args.quiet) else 0
+        if errs:
+            stamps.save()
+            return rc
+        if not warns:
+            stamps.record(val_key, val_inputs)
+    else:
+        say("regmap_validate: OK (stamp)")
+
+    drift: List[str] = []
+    for em, out, cur, inputs in pending:
+        assert rm is not None
+        try:
+            text = em.render(yaml_rel, rm).encode("utf-8")
+        except ValueError as e:
+            print(f"regmap_gen: {em.out}: {e}", file=sys.stderr)
+            return 1
+        if cur == text:
+            say(f"regmap_gen: {em.out}: unchanged")
+            stamps.record(em.out, inputs, _sha(text))
+        elif args.check:
+            drift.append(em.out)
+            old = (cur or b"").decode("utf-8", "replace").splitlines(keepends=True)
+            diff = difflib.unified_diff(old, text.decode("utf-8").splitlines(keepends=True), f"a/{em.out}", f"b/{em.out}")
+            sys.stdout.writelines(list(diff)[:200])
+        else:
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out.write_bytes(text)
+            say(f"regmap_gen: {em.out}: written")
+            stamps.record(em.out, inputs, _sha(text))
+    stamps.save()
+
+    if drift:
+        print("")
+        print(f"Regmap artifacts are OUT OF DATE relative to {yaml_rel.as_posix()}:")
+        for p in drift:
+            print(f" - {p}")
+        print("Run: bash ops/regmap_update.sh")
+        print("Then commit the updated artifacts.")
+        return 2
+
+    if rtl_abs is not None:
+        assert rm is not None
+        n_regs, problems = check_regmap.run_checks(yaml_rel, rtl_abs)
+        if problems:
+            for p in problems:
+                print(f"ERROR[{p.kind}]: {p.msg}", file=sys.stderr)
+            return 2
+        say(f"OK: {n_regs} regs match between {yaml_rel.as_posix()} and {os.path.relpath(rtl_abs, ROOT)} (+ pkg/params constants)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -16,24 +16,11 @@ HDR_OUT="fw/include/home_inventory_regmap.h"
 SVPKG_OUT="rtl/include/home_inventory_regmap_pkg.sv"
 VH_OUT="rtl/include/regmap_params.vh"
 MD_OUT="spec/regmap_v1_table.md"
+PY_OUT="verify/model/home_inventory_regbank.py"
 
-python3 ops/regmap_validate.py --yaml "$YAML"
-
-python3 ops/gen_regmap_md.py \
-  --yaml "$YAML" \
-  --out  "$MD_OUT"
-
-python3 ops/gen_regmap_header.py \
-  --yaml "$YAML" \
-  --out  "$HDR_OUT"
-
-python3 ops/gen_regmap_sv_pkg.py \
-  --yaml "$YAML" \
-  --out  "$SVPKG_OUT"
-
-python3 tools/regmap/gen_verilog_params.py \
-  --yaml "$YAML" \
-  --out  "$VH_OUT"
+# One interpreter, one YAML parse: validates, then rewrites only the artifacts
+# whose content changed (hash stamps skip unchanged emitters entirely).
+python3 ops/regmap_gen.py --yaml "$YAML"
 
 echo ""
 echo "Regmap artifacts updated from: $YAML"
@@ -41,6 +28,7 @@ echo " - $MD_OUT"
 echo " - $HDR_OUT"
 echo " - $SVPKG_OUT"
 echo " - $VH_OUT"
+echo " - $PY_OUT"
 echo ""
 echo "Git status (if anything changed):"
 git status --porcelain=v1 || true
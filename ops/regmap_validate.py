@@ -1,13 +1,18 @@
 #!/usr/bin/env python3
 """Validate spec/regmap_v1.yaml for internal consistency.
 
-This is intentionally dependency-light (PyYAML only).
+This is intentionally dependency-light (PyYAML only, via the shared
+tools/regmap/regmodel loader).
 
 Usage:
   python3 ops/regmap_validate.py --yaml spec/regmap_v1.yaml
 
+Register arrays (`count: N`, optional `stride:`) are checked as address
+intervals, one per declaration, rather than expanded register by register.
+
 Hard checks (FAIL):
-- All register addresses are unique.
+- All register addresses are unique (array elements included).
+- Array declarations have count >= 1 and a word-multiple stride.
 - All register addresses are 32-bit word-aligned.
 - Block base addresses are 32-bit word-aligned.
 - Register and field access types are from an allowed set.
@@ -18,7 +23,7 @@ Hard checks (FAIL):
 - When both register reset and field reset are provided, they must agree.
 
 Soft checks (WARN):
-- Register names should be globally unique.
+- Register names should be globally unique (array element names included).
 - Every register should have a description string.
 
 The WARN checks are printed but do not cause failure (so they can be rolled out
@@ -28,25 +33,12 @@ incrementally without blocking tapeout).
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
-
-import yaml
-
-
-def _load_yaml(path: Path) -> Dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    if not isinstance(data, dict):
-        raise ValueError("YAML top-level must be a mapping")
-    return data
+from typing import Dict, List, Optional, Tuple
 
-
-def _parse_int(x: Any) -> int:
-    if isinstance(x, int):
-        return x
-    if isinstance(x, str):
-        return int(x, 16) if x.startswith("0x") else int(x)
-    raise TypeError(f"Unsupported int value: {x!r}")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools" / "regmap"))
+from regmodel import ARRAY_MODES, RegMap, Register, load_regmap  # noqa: E402
 
 
 _ALLOWED_REG_ACCESS = {"ro", "rw", "ro_w1c"}
@@ -57,6 +49,26 @@ def _check_u32(val: int) -> bool:
     return 0 <= val <= 0xFFFF_FFFF
 
 
+def _flat_name(fq: str, reg: Register, addr: int) -> str:
+    if not reg.is_array:
+        return fq
+    return f"{fq}{(addr - reg.addr) // reg.stride}"
+
+
+def _first_collision(a: Tuple[int, int, str, Register], b: Tuple[int, int, str, Register]) -> Optional[Tuple[int, str, str]]:
+    """Return (addr, name_a, name_b) for the lowest word two entries share, else None."""
+
+    ra, rb = a[3], b[3]
+    addrs_a = {r.addr for r in ra.expand()} if ra.is_array else {ra.addr}
+    # b starts at or after a; walk b's (usually few) words inside a's interval.
+    for r in rb.expand():
+        if r.addr >= a[1]:
+            break
+        if r.addr in addrs_a:
+            return r.addr, _flat_name(a[2], ra, r.addr), _flat_name(b[2], rb, r.addr)
+    return None
+
+
 def _allowed_field_access_for_reg(reg_access: str) -> set[str]:
     # Keep this conservative; it can always be relaxed later.
     if reg_access == "ro":
@@ -68,33 +80,27 @@ def _allowed_field_access_for_reg(reg_access: str) -> set[str]:
     return set()
 
 
-def _extract_bits(val: int, msb: int, lsb: int) -> int:
-    width = msb - lsb + 1
-    return (val >> lsb) & ((1 << width) - 1)
-
-
-def main() -> int:
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--yaml", required=True, type=Path)
-    args = ap.parse_args()
-
-    spec = _load_yaml(args.yaml)
+def validate(rm: RegMap) -> Tuple[List[str], List[str], int]:
+    """Return (errors, warnings, register count) for a loaded regmap."""
 
     errs: List[str] = []
     warns: List[str] = []
 
-    addrs: List[Tuple[str, int]] = []
+    spans: List[Tuple[int, int, str, Register]] = []
+    arrays: Dict[str, Register] = {}
     reg_names_global: Dict[str, str] = {}
 
-    for blk in spec.get("blocks", []):
-        bname = blk.get("name", "<unnamed>")
-        base = _parse_int(blk.get("base", 0))
+    if rm.arrays_mode not in ARRAY_MODES:
+        errs.append(f"codegen.arrays: invalid value {rm.arrays_mode!r} (allowed: {', '.join(ARRAY_MODES)})")
+
+    for blk in rm.blocks:
+        bname = blk.name
 
-        if base % 4 != 0:
-            errs.append(f"Block {bname}: base 0x{base:08X} not 32-bit aligned")
+        if blk.base % 4 != 0:
+            errs.append(f"Block {bname}: base 0x{blk.base:08X} not 32-bit aligned")
 
-        for reg in blk.get("registers", []):
-            rname = reg.get("name")
+        for reg in blk.registers:
+            rname = reg.name
             if not rname:
                 errs.append(f"Block {bname}: register missing name")
                 continue
@@ -109,50 +115,51 @@ def main() -> int:
                 warns.append(f"Register name reused: {rname!r} appears in {prev} and {fq}")
 
             # Soft check: description present
-            desc = reg.get("desc")
+            desc = reg.desc
             if not (isinstance(desc, str) and desc.strip()):
                 warns.append(f"{fq}: missing/empty desc")
 
             # Access + reset validation
-            racc = reg.get("access")
+            racc = reg.access
             if racc not in _ALLOWED_REG_ACCESS:
                 errs.append(
                     f"{fq}: invalid access {racc!r} (allowed: {', '.join(sorted(_ALLOWED_REG_ACCESS))})"
                 )
 
-            rreset = reg.get("reset", None)
-            rreset_int: int | None
-            if rreset is None:
-                rreset_int = None
-            else:
-                try:
-                    rr = _parse_int(rreset)
-                    if not _check_u32(rr):
-                        errs.append(f"{fq}: reset out of u32 range: {rreset!r}")
-                    rreset_int = rr
-                except Exception as e:
-                    errs.append(f"{fq}: invalid reset {rreset!r}: {e}")
-                    rreset_int = None
+            rreset_int = reg.reset
+            if reg.reset_error is not None:
+                errs.append(f"{fq}: invalid reset {reg.reset_raw!r}: {reg.reset_error}")
+            elif rreset_int is not None and not _check_u32(rreset_int):
+                errs.append(f"{fq}: reset out of u32 range: {reg.reset_raw!r}")
 
-            offset = _parse_int(reg.get("offset", 0))
-            if offset % 4 != 0:
-                errs.append(f"{fq}: offset 0x{offset:08X} not 32-bit aligned")
+            if reg.offset % 4 != 0:
+                errs.append(f"{fq}: offset 0x{reg.offset:08X} not 32-bit aligned")
 
-            addr = base + offset
+            addr = reg.addr
 
             if addr % 4 != 0:
                 errs.append(f"{fq}: address 0x{addr:08X} not 32-bit aligned")
 
-            addrs.append((fq, addr))
+            if reg.is_array:
+                if reg.count < 1:
+                    errs.append(f"{fq}: array count must be >= 1 (got {reg.count})")
+                    continue
+                if reg.stride < 4 or reg.stride % 4 != 0:
+                    errs.append(f"{fq}: array stride {reg.stride} is not a positive multiple of 4")
+                    continue
+                arrays[rname] = reg
+
+            start, end = reg.span
+            spans.append((start, end, fq, reg))
 
             # Fields
             used_mask = 0
             allowed_field_acc = _allowed_field_access_for_reg(str(racc))
 
-            for f in reg.get("fields", []) or []:
-                fname = f.get("name", "<unnamed>")
+            for f in reg.fields:
+                fname = f.name or "<unnamed>"
 
-                facc = f.get("access")
+                facc = f.access
                 if facc not in _ALLOWED_FIELD_ACCESS:
                     errs.append(
                         f"{fq}.{fname}: invalid access {facc!r} (allowed: {', '.join(sorted(_ALLOWED_FIELD_ACCESS))})"
@@ -161,11 +168,10 @@ def main() -> int:
                     if racc in _ALLOWED_REG_ACCESS and facc not in allowed_field_acc:
                         errs.append(f"{fq}.{fname}: field access {facc!r} incompatible with reg access {racc!r}")
 
-                bits = f.get("bits")
-                if not (isinstance(bits, list) and len(bits) == 2):
+                if not f.bits_ok:
                     errs.append(f"{fq}.{fname}: bits must be [msb, lsb]")
                     continue
-                msb, lsb = int(bits[0]), int(bits[1])
+                msb, lsb = f.msb, f.lsb
 
                 if not (0 <= lsb <= 31 and 0 <= msb <= 31):
                     errs.append(f"{fq}.{fname}: bit range out of 0..31: {msb}:{lsb}")
@@ -174,47 +180,57 @@ def main() -> int:
                     errs.append(f"{fq}.{fname}: msb<lsb: {msb}:{lsb}")
                     continue
 
-                width = msb - lsb + 1
-                mask = ((1 << width) - 1) << lsb
+                width, mask = f.width, f.mask
 
                 if used_mask & mask:
                     errs.append(f"{fq}: field overlap at {fname} ({msb}:{lsb})")
                 used_mask |= mask
 
                 # Reset validation (field reset must fit the field width)
-                fres = f.get("reset", None)
-                if fres is None:
+                if f.reset_error is not None:
+                    errs.append(f"{fq}.{fname}: invalid reset {f.reset_raw!r}: {f.reset_error}")
+                    continue
+                fr = f.reset
+                if fr is None:
+                    continue
+                if not _check_u32(fr):
+                    errs.append(f"{fq}.{fname}: reset out of u32 range: {f.reset_raw!r}")
+                    continue
+                if fr >= (1 << width):
+                    errs.append(f"{fq}.{fname}: reset 0x{fr:X} does not fit in field width {width} ({msb}:{lsb})")
                     continue
 
-                try:
-                    fr = _parse_int(fres)
-                    if not _check_u32(fr):
-                        errs.append(f"{fq}.{fname}: reset out of u32 range: {fres!r}")
-                        continue
-                    if fr >= (1 << width):
+                # If the parent register reset is present, it must match.
+                if rreset_int is not None:
+                    r_field = (rreset_int & mask) >> f.shift
+                    if r_field != fr:
                         errs.append(
-                            f"{fq}.{fname}: reset 0x{fr:X} does not fit in field width {width} ({msb}:{lsb})"
+                            f"{fq}.{fname}: field reset 0x{fr:X} disagrees with reg reset bits 0x{r_field:X}"
                         )
-                        continue
-
-                    # If the parent register reset is present, it must match.
-                    if rreset_int is not None:
-                        r_field = _extract_bits(rreset_int, msb, lsb)
-                        if r_field != fr:
-                            errs.append(
-                                f"{fq}.{fname}: field reset 0x{fr:X} disagrees with reg reset bits 0x{r_field:X}"
-                            )
-                except Exception as e:
-                    errs.append(f"{fq}.{fname}: invalid reset {fres!r}: {e}")
-
-    # Uniqueness of addresses
-    seen: Dict[int, str] = {}
-    for name, addr in addrs:
-        if addr in seen:
-            errs.append(f"Address collision: 0x{addr:08X} used by {seen[addr]} and {name}")
-        else:
-            seen[addr] = name
 
+    # Uniqueness of addresses: sweep the declaration intervals in address
+    # order; only intervals that overlap are compared element by element.
+    spans.sort(key=lambda t: (t[0], t[1]))
+    active: List[Tuple[int, int, str, Register]] = []
+    for span in spans:
+        active = [a for a in active if a[1] > span[0]]
+        for other in active:
+            clash = _first_collision(other, span)
+            if clash is not None:
+                errs.append(f"Address collision: 0x{clash[0]:08X} used by {clash[1]} and {clash[2]}")
+        active.append(span)
+
+    # Soft check: a plain register name that is also an array element name.
+    for name, fq in reg_names_global.items():
+        stem = name.rstrip("0123456789")
+        arr = arrays.get(stem) if stem != name else None
+        if arr is not None and int(name[len(stem) :]) < arr.count:
+            warns.append(f"Register name reused: {name!r} appears in {fq} and {arr.qualname}[{name[len(stem):]}]")
+
+    return errs, warns, rm.n_flat
+
+
+def report(errs: List[str], warns: List[str], n_regs: int) -> int:
     if warns:
         print("regmap_validate: WARN")
         for w in warns:
@@ -226,9 +242,17 @@ def main() -> int:
             print("- " + e)
         return 1
 
-    print(f"regmap_validate: OK ({len(addrs)} registers)")
+    print(f"regmap_validate: OK ({n_regs} registers)")
     return 0
 
 
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--yaml", required=True, type=Path)
+    args = ap.parse_args()
+
+    return report(*validate(load_regmap(args.yaml)))
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -86,6 +86,85 @@ package home_inventory_regmap_pkg;
   localparam logic [31:0] HOMEINV_ADR_EVT_THRESH_CH6 = 32'h00000498;
   localparam logic [31:0] HOMEINV_ADR_EVT_THRESH_CH7 = 32'h0000049C;
 
+  // -----------------------------
+  // Register arrays (NAME(i) = byte address of element i)
+  // -----------------------------
+  localparam logic [31:0] HOMEINV_ADR_ADC_RAW_CH_BASE   = 32'h00000210;
+  localparam int unsigned HOMEINV_ADR_ADC_RAW_CH_COUNT  = 8;
+  localparam int unsigned HOMEINV_ADR_ADC_RAW_CH_STRIDE = 4;
+  function automatic logic [31:0] HOMEINV_ADR_ADC_RAW_CH(input int unsigned i);
+    return HOMEINV_ADR_ADC_RAW_CH_BASE + HOMEINV_ADR_ADC_RAW_CH_STRIDE * i;
+  endfunction
+  localparam logic [31:0] HOMEINV_ADR_TARE_CH_BASE   = 32'h00000300;
+  localparam int unsigned HOMEINV_ADR_TARE_CH_COUNT  = 8;
+  localparam int unsigned HOMEINV_ADR_TARE_CH_STRIDE = 4;
+  function automatic logic [31:0] HOMEINV_ADR_TARE_CH(input int unsigned i);
+    return HOMEINV_ADR_TARE_CH_BASE + HOMEINV_ADR_TARE_CH_STRIDE * i;
+  endfunction
+  localparam logic [31:0] HOMEINV_ADR_SCALE_CH_BASE   = 32'h00000320;
+  localparam int unsigned HOMEINV_ADR_SCALE_CH_COUNT  = 8;
+  localparam int unsigned HOMEINV_ADR_SCALE_CH_STRIDE = 4;
+  function automatic logic [31:0] HOMEINV_ADR_SCALE_CH(input int unsigned i);
+    return HOMEINV_ADR_SCALE_CH_BASE + HOMEINV_ADR_SCALE_CH_STRIDE * i;
+  endfunction
+  localparam logic [31:0] HOMEINV_ADR_EVT_COUNT_CH_BASE   = 32'h00000400;
+  localparam int unsigned HOMEINV_ADR_EVT_COUNT_CH_COUNT  = 8;
+  localparam int unsigned HOMEINV_ADR_EVT_COUNT_CH_STRIDE = 4;
+  function automatic logic [31:0] HOMEINV_ADR_EVT_COUNT_CH(input int unsigned i);
+    return HOMEINV_ADR_EVT_COUNT_CH_BASE + HOMEINV_ADR_EVT_COUNT_CH_STRIDE * i;
+  endfunction
+  localparam logic [31:0] HOMEINV_ADR_EVT_LAST_DELTA_CH_BASE   = 32'h00000420;
+  localparam int unsigned HOMEINV_ADR_EVT_LAST_DELTA_CH_COUNT  = 8;
+  localparam int unsigned HOMEINV_ADR_EVT_LAST_DELTA_CH_STRIDE = 4;
+  function automatic logic [31:0] HOMEINV_ADR_EVT_LAST_DELTA_CH(input int unsigned i);
+    return HOMEINV_ADR_EVT_LAST_DELTA_CH_BASE + HOMEINV_ADR_EVT_LAST_DELTA_CH_STRIDE * i;
+  endfunction
+  localparam logic [31:0] HOMEINV_ADR_EVT_LAST_TS_CH_BASE   = 32'h00000448;
+  localparam int unsigned HOMEINV_ADR_EVT_LAST_TS_CH_COUNT  = 8;
+  localparam int unsigned HOMEINV_ADR_EVT_LAST_TS_CH_STRIDE = 4;
+  function automatic logic [31:0] HOMEINV_ADR_EVT_LAST_TS_CH(input int unsigned i);
+    return HOMEINV_ADR_EVT_LAST_TS_CH_BASE + HOMEINV_ADR_EVT_LAST_TS_CH_STRIDE * i;
+  endfunction
+  localparam logic [31:0] HOMEINV_ADR_EVT_THRESH_CH_BASE   = 32'h00000480;
+  localparam int unsigned HOMEINV_ADR_EVT_THRESH_CH_COUNT  = 8;
+  localparam int unsigned HOMEINV_ADR_EVT_THRESH_CH_STRIDE = 4;
+  function automatic logic [31:0] HOMEINV_ADR_EVT_THRESH_CH(input int unsigned i);
+    return HOMEINV_ADR_EVT_THRESH_CH_BASE + HOMEINV_ADR_EVT_THRESH_CH_STRIDE * i;
+  endfunction
+
+  // -----------------------------
+  // Register reset values
+  // -----------------------------
+  localparam logic [31:0] HOMEINV_RST_CTRL = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_IRQ_EN = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_ADC_CFG = 32'h00000008;
+  localparam logic [31:0] HOMEINV_RST_ADC_CMD = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_TARE_CH0 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_TARE_CH1 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_TARE_CH2 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_TARE_CH3 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_TARE_CH4 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_TARE_CH5 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_TARE_CH6 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_TARE_CH7 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_SCALE_CH0 = 32'h00010000;
+  localparam logic [31:0] HOMEINV_RST_SCALE_CH1 = 32'h00010000;
+  localparam logic [31:0] HOMEINV_RST_SCALE_CH2 = 32'h00010000;
+  localparam logic [31:0] HOMEINV_RST_SCALE_CH3 = 32'h00010000;
+  localparam logic [31:0] HOMEINV_RST_SCALE_CH4 = 32'h00010000;
+  localparam logic [31:0] HOMEINV_RST_SCALE_CH5 = 32'h00010000;
+  localparam logic [31:0] HOMEINV_RST_SCALE_CH6 = 32'h00010000;
+  localparam logic [31:0] HOMEINV_RST_SCALE_CH7 = 32'h00010000;
+  localparam logic [31:0] HOMEINV_RST_EVT_CFG = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_EVT_THRESH_CH0 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_EVT_THRESH_CH1 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_EVT_THRESH_CH2 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_EVT_THRESH_CH3 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_EVT_THRESH_CH4 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_EVT_THRESH_CH5 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_EVT_THRESH_CH6 = 32'h00000000;
+  localparam logic [31:0] HOMEINV_RST_EVT_THRESH_CH7 = 32'h00000000;
+
   // -----------------------------
   // Bitfields
   // -----------------------------
@@ -0,0 +1,28 @@
+"""On-disk cache locations shared by the repo's tools.
+
+Each cache is a subdirectory of $XDG_CACHE_HOME/home-inventory (default
+~/.cache/home-inventory), unless the tool's own environment variable names a
+directory; setting that variable to an empty string disables the cache.
+
+  regmap         REGMAP_CACHE_DIR     tools/regmap/regmodel, tools/regmap/rtl_index.py
+  contracts      CONTRACT_CACHE_DIR   ops/contract_gate.py
+  harness-index  HARNESS_INDEX_DIR    tools/harness_index.py
+
+Stdlib only, so it can be imported from anywhere once tools/ is on sys.path.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Optional
+
+
+def cache_dir(name: str, env_var: str) -> Optional[Path]:
+    """Cache directory `name`, overridden by $env_var; None when caching is disabled."""
+
+    env = os.environ.get(env_var)
+    if env is not None:
+        return Path(env) if env else None
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "home-inventory" / name
@@ -7,7 +7,10 @@ set -euo pipefail
 #   tools/harness/harness_audit_all.sh ../home-inventory-chip-openmpw
 #
 # This script is intentionally grep-based (no OpenLane / Docker) and should run
-# even when disk space is tight.
+# even when disk space is tight. The evidence audits (pinout, clocking, DRDY,
+# streaming, event detector, WB wiring) are the `suite: audit` entries in
+# tools/harness_audit_rules.yaml, evaluated in one pass by tools/harness_audit.py;
+# missing evidence is reported as WARN and does not fail the run.
 
 if [[ ${1:-} == "" ]]; then
   echo "Usage: $0 <path-to-harness-repo>" >&2
@@ -47,17 +50,8 @@ fail=0
 run_one "harness filelist audit" \
   "${REPO_ROOT}/tools/harness/audit_harness_filelist.sh" --harness-root "${HARNESS_DIR}" || fail=1
 
-run_one "ADC pinout audit" \
-  "${REPO_ROOT}/tools/harness_adc_pinout_audit.sh" "${HARNESS_DIR}" || fail=1
-
-run_one "ADC clocking audit" \
-  "${REPO_ROOT}/tools/harness_adc_clocking_audit.sh" "${HARNESS_DIR}" || fail=1
-
-run_one "ADC streaming audit" \
-  "${REPO_ROOT}/tools/harness_adc_streaming_audit.sh" "${HARNESS_DIR}" || fail=1
-
-run_one "event detector audit" \
-  "${REPO_ROOT}/tools/harness_event_detector_audit.sh" "${HARNESS_DIR}" || fail=1
+run_one "harness evidence audits (one pass)" \
+  python3 "${REPO_ROOT}/tools/harness_audit.py" --suite audit "${HARNESS_DIR}" || fail=1
 
 echo ""
 echo "===================="
@@ -0,0 +1,617 @@
+#!/usr/bin/env python3
+"""One-pass harness audit engine (replaces the per-script grep loops).
+
+Why:
+- tools/harness/harness_audit_all.sh and tools/harness_placeholder_suite.sh used
+  to run a dozen grep scripts in sequence, and each one walked and grepped the
+  harness checkout again (rg per term, per directory).
+- Here every audit's checks are rules in tools/harness_audit_rules.yaml. The
+  checkout is enumerated once, each file in the union of all rule scopes is read
+  once, and every rule that covers the file is evaluated against that read.
+
+How a file is evaluated:
+- The file is read once. Each rule covering it contributes the literals its
+  pattern cannot match without (harness_index.plan, the trigram index query
+  planner, run once per rule at load time); those are found with bytes.find in
+  the lowercased file, which is far faster than any case-insensitive regex
+  alternation. A rule without such literals contributes its full regex instead.
+- Only the lines containing a literal are decoded, and each rule's own pattern
+  (with its own case sensitivity) is matched on those lines. Matching is per
+  line and lines are LF-separated, like rg -n.
+- Files are processed on a thread pool (--jobs); results are merged in path
+  order, so the report does not depend on scheduling.
+
+Per-rule timing is the rule's share of the scans of the files in its scope (a
+file's scan time split evenly between the rules covering it) plus the time spent
+matching its own patterns, so wide-scope or expensive rules stand out.
+
+Statuses:
+- OK    the rule's expectation (present/absent) holds
+- WARN  it does not, and the rule has severity warn (evidence audits)
+- FAIL  it does not, and the rule has severity fail (placeholder gates), or an
+        audit's required file is missing
+
+Usage:
+  python3 tools/harness_audit.py ../home-inventory-chip-openmpw
+  python3 tools/harness_audit.py ../home-inventory-chip-openmpw --suite placeholder
+  python3 tools/harness_audit.py ../home-inventory-chip-openmpw --audit adc_pinout --show 10
+  python3 tools/harness_audit.py ../home-inventory-chip-openmpw --json > /tmp/harness_audit.json
+  python3 tools/harness_audit.py --list
+
+Exit codes:
+  0  no FAIL (and no WARN with --strict)
+  1  at least one FAIL (or WARN with --strict)
+  2  harness path missing, a required harness file missing, or a bad rules file
+
+Requires PyYAML for the rules file; the scan itself is stdlib-only (same file
+enumeration and binary-file rule as harness_evidence_snip.py).
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import itertools
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from harness_evidence_snip import SNIFF_BYTES, default_jobs, iter_files
+from harness_index import Plan, plan
+
+try:
+    import yaml
+except ImportError:  # reported when the rules are loaded, with an install hint
+    yaml = None
+
+
+DEFAULT_RULES = Path(__file__).resolve().with_name("harness_audit_rules.yaml")
+
+SUITES = ("audit", "placeholder")
+SEVERITIES = ("warn", "fail")
+EXPECTS = ("present", "absent")
+STATUSES = ("OK", "WARN", "FAIL")
+
+AUDIT_KEYS = {"id", "title", "suite", "source", "dirs", "fallback_dirs", "files", "exclude", "requires", "rules"}
+RULE_KEYS = {"id", "message", "severity", "expect", "pattern", "any_of", "exists", "ignore_case", "dirs", "files"}
+
+Hit = Tuple[str, int, str]  # (harness-relative path, 1-indexed line, line text)
+
+
+class RulesError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Scope:
+    dirs: Tuple[str, ...]
+    files: Tuple[str, ...]
+    exclude: Tuple[str, ...]
+
+    def covers(self, rel: str) -> bool:
+        if any(fnmatch.fnmatchcase(rel, pat) for pat in self.exclude):
+            return False
+        if any(d == "." or rel.startswith(d + "/") for d in self.dirs):
+            return True
+        return any(fnmatch.fnmatchcase(rel, pat) for pat in self.files)
+
+
+@dataclass
+class Leaf:
+    """One pattern of one rule, with the scope it is searched in."""
+
+    pattern: str
+    rx: "re.Pattern[str]"
+    scope: Scope
+    needles: Optional[Tuple[bytes, ...]]  # a matching line contains one of these (lowercased)
+
+
+@dataclass
+class Rule:
+    id: str  # "<audit>.<rule>"
+    severity: str
+    expect: str
+    message: str
+    clauses: List[List[Leaf]] = field(default_factory=list)  # any-of of all-of
+    exists: Optional[str] = None
+
+
+@dataclass
+class Audit:
+    id: str
+    title: str
+    suite: str
+    source: str
+    requires: List[str]
+    rules: List[Rule]
+
+
+@dataclass
+class Result:
+    audit: str
+    rule: str
+    status: str
+    severity: str
+    expect: str
+    message: str
+    hits: List[Hit]
+    seconds: float
+
+
+# ----------------------------------------------------------------- rules file
+
+
+def _str_list(value: Any, where: str) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise RulesError(f"{where}: expected a string or a list of strings")
+    return list(value)
+
+
+def _compile(pattern: Any, ignore_case: bool, where: str) -> "re.Pattern[str]":
+    if not isinstance(pattern, str) or not pattern:
+        raise RulesError(f"{where}: pattern must be a non-empty string")
+    try:
+        return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+    except re.error as e:
+        raise RulesError(f"{where}: bad pattern {pattern!r}: {e}") from None
+
+
+def _needles(p: Plan) -> Optional[List[bytes]]:
+    """Lowercased literals of which every line matching plan `p` contains one (None: unbounded)."""
+
+    if p is None:
+        return None
+    if isinstance(p, bytes):
+        return [p.lower()]
+    op, parts = p
+    subs = [_needles(q) for q in parts]
+    if op == "or":
+        if any(sub is None for sub in subs):
+            return None
+        lits = sorted({n for sub in subs for n in sub}, key=len)  # type: ignore[union-attr]
+        common = os.path.commonprefix(lits)
+        if len(lits) > 1 and len(common) >= 3:
+            return [common]  # one bytes.find pass instead of one per branch
+        return [n for i, n in enumerate(lits) if not any(m in n for m in lits[:i])]
+    # "and": any one conjunct bounds the line; take the most selective one.
+    usable = [sub for sub in subs if sub]
+    if not usable:
+        return None
+    return max(usable, key=lambda sub: (min(map(len, sub)), -len(sub)))
+
+
+def _bound(pattern: str) -> Optional[Tuple[bytes, ...]]:
+    if not pattern.isascii():
+        return None
+    found = _needles(plan(re.compile(pattern.encode("ascii"), re.IGNORECASE)))
+    return tuple(found) if found else None
+
+
+def _scope(root: Path, dirs: List[str], fallback: List[str], files: List[str], exclude: List[str]) -> Scope:
+    norm = [d.strip("/") or "." for d in dirs]
+    present = [d for d in norm if (root / d).is_dir()]
+    if norm and not present:
+        present = [d.strip("/") or "." for d in fallback if (root / d).is_dir()]
+    return Scope(dirs=tuple(present), files=tuple(files), exclude=tuple(exclude))
+
+
+def load_rules(path: Path, root: Path) -> List[Audit]:
+    """Parse the rules file; scopes are resolved against the harness checkout at `root`."""
+
+    if yaml is None:
+        raise SystemExit("PyYAML is required for the harness audit rules. Install with: pip install pyyaml")
+    try:
+        doc = yaml.load(path.read_text(encoding="utf-8"), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    except (OSError, yaml.YAMLError) as e:
+        raise RulesError(f"{path}: {e}") from None
+    if not isinstance(doc, dict) or doc.get("version") != 1 or not isinstance(doc.get("audits"), list):
+        raise RulesError(f"{path}: expected a mapping with version: 1 and an audits list")
+    default_exclude = _str_list((doc.get("defaults") or {}).get("exclude"), f"{path}: defaults.exclude")
+
+    audits: List[Audit] = []
+    seen: set = set()
+    for a in doc["audits"]:
+        if not isinstance(a, dict) or not isinstance(a.get("id"), str):
+            raise RulesError(f"{path}: every audit needs an id")
+        aid = a["id"]
+        where = f"{path}: audit {aid}"
+        if aid in seen:
+            raise RulesError(f"{where}: duplicate id")
+        seen.add(aid)
+        unknown = set(a) - AUDIT_KEYS
+        if unknown:
+            raise RulesError(f"{where}: unknown keys {sorted(unknown)}")
+        suite = a.get("suite", "audit")
+        if suite not in SUITES:
+            raise RulesError(f"{where}: suite must be one of {SUITES}")
+        exclude = default_exclude + _str_list(a.get("exclude"), f"{where}.exclude")
+        a_dirs = _str_list(a.get("dirs"), f"{where}.dirs")
+        a_files = _str_list(a.get("files"), f"{where}.files")
+        fallback = _str_list(a.get("fallback_dirs"), f"{where}.fallback_dirs")
+        a_scope = _scope(root, a_dirs, fallback, a_files, exclude)
+
+        rules: List[Rule] = []
+        for r in a.get("rules") or []:
+            if not isinstance(r, dict) or not isinstance(r.get("id"), str):
+                raise RulesError(f"{where}: every rule needs an id")
+            rid = f"{aid}.{r['id']}"
+            rwhere = f"{path}: rule {rid}"
+            unknown = set(r) - RULE_KEYS
+            if unknown:
+                raise RulesError(f"{rwhere}: unknown keys {sorted(unknown)}")
+            severity = r.get("severity", "fail" if suite == "placeholder" else "warn")
+            expect = r.get("expect", "present")
+            if severity not in SEVERITIES or expect not in EXPECTS:
+                raise RulesError(f"{rwhere}: severity must be one of {SEVERITIES}, expect one of {EXPECTS}")
+            rule = Rule(id=rid, severity=severity, expect=expect, message=str(r.get("message", "")).strip())
+
+            kinds = [k for k in ("pattern", "any_of", "exists") if k in r]
+            if len(kinds) != 1:
+                raise RulesError(f"{rwhere}: needs exactly one of pattern, any_of, exists")
+            if "exists" in r:
+                if not isinstance(r["exists"], str):
+                    raise RulesError(f"{rwhere}: exists must be a path")
+                rule.exists = r["exists"]
+                rules.append(rule)
+                continue
+
+            if "dirs" in r or "files" in r:
+                scope = _scope(
+                    root,
+                    _str_list(r.get("dirs"), f"{rwhere}.dirs"),
+                    fallback,
+                    _str_list(r.get("files"), f"{rwhere}.files"),
+                    exclude,
+                )
+            else:
+                scope = a_scope
+            icase = bool(r.get("ignore_case", False))
+            items = [r["pattern"]] if "pattern" in r else r["any_of"]
+            if not isinstance(items, list) or not items:
+                raise RulesError(f"{rwhere}: any_of must be a non-empty list")
+            for item in items:
+                pats = item["all_of"] if isinstance(item, dict) and set(item) == {"all_of"} else [item]
+                if not isinstance(pats, list) or not pats:
+                    raise RulesError(f"{rwhere}: all_of must be a non-empty list")
+                rule.clauses.append([Leaf(p, _compile(p, icase, rwhere), scope, _bound(p)) for p in pats])
+            rules.append(rule)
+
+        audits.append(
+            Audit(
+                id=aid,
+                title=str(a.get("title", aid)),
+                suite=suite,
+                source=str(a.get("source", "")),
+                requires=_str_list(a.get("requires"), f"{where}.requires"),
+                rules=rules,
+            )
+        )
+    return audits
+
+
+# --------------------------------------------------------------------- engine
+
+
+@dataclass(frozen=True)
+class _Prefilter:
+    needles: Tuple[bytes, ...]  # lowercased literals, searched in the lowercased file
+    regexes: Tuple["re.Pattern[bytes]", ...]  # leaves without usable literals
+    every_line: bool  # a non-ASCII leaf: no byte-level bound at all
+
+
+def _prefilter(leaves: Sequence[Leaf]) -> _Prefilter:
+    """What to look for in a file so that every line any of `leaves` matches is a candidate."""
+
+    lits: set = set()
+    regexes: List["re.Pattern[bytes]"] = []
+    every_line = False
+    for leaf in leaves:
+        if leaf.needles is not None:
+            lits.update(leaf.needles)
+        elif leaf.pattern.isascii():
+            regexes.append(re.compile(leaf.pattern.encode("ascii"), re.IGNORECASE | re.MULTILINE))
+        else:
+            every_line = True
+    ordered = sorted(lits, key=len)
+    needles = tuple(n for i, n in enumerate(ordered) if not any(m in n for m in ordered[:i]))
+    return _Prefilter(needles, tuple(regexes), every_line)
+
+
+def _candidate_lines(data: bytes, pre: _Prefilter) -> List[int]:
+    """Start offsets of the lines that can match, in file order."""
+
+    if pre.every_line:
+        lines = [0]
+        i = data.find(b"\n")
+        while 0 <= i < len(data) - 1:
+            lines.append(i + 1)
+            i = data.find(b"\n", i + 1)
+        return lines
+    starts = set()
+    if pre.needles:
+        low = data.lower()
+        for n in pre.needles:
+            i = low.find(n)
+            while i >= 0:
+                starts.add(low.rfind(b"\n", 0, i) + 1)
+                eol = low.find(b"\n", i)
+                i = -1 if eol < 0 else low.find(n, eol + 1)
+    for rx in pre.regexes:
+        m = rx.search(data)
+        while m is not None:
+            # A match running past the newline is only a candidate; the per-line check decides.
+            starts.add(data.rfind(b"\n", 0, m.start()) + 1)
+            eol = data.find(b"\n", m.start())
+            m = None if eol < 0 else rx.search(data, eol + 1)
+    return sorted(starts)
+
+
+@dataclass
+class _FileResult:
+    rel: str
+    hits: Dict[int, List[int]]  # leaf index -> hit line numbers
+    lines: Dict[int, str]  # line number -> text, for hit lines
+    seconds: Dict[int, float]  # leaf index -> attributed time
+
+
+def _evaluate_file(path: Path, rel: str, key: Tuple[int, ...], pre: _Prefilter, leaves: Sequence[Leaf]) -> _FileResult:
+    t0 = time.perf_counter()
+    try:
+        data = path.read_bytes()
+    except OSError:
+        data = b""
+    if b"\x00" in data[:SNIFF_BYTES]:
+        data = b""
+    text: Dict[int, str] = {}
+    line_no, prev = 1, 0
+    for bol in _candidate_lines(data, pre) if data else []:
+        line_no += data.count(b"\n", prev, bol)
+        prev = bol
+        eol = data.find(b"\n", bol)
+        text[line_no] = data[bol : len(data) if eol < 0 else eol].decode(errors="replace").rstrip("\r")
+    share = (time.perf_counter() - t0) / len(key)
+    seconds = {i: share for i in key}
+
+    hits: Dict[int, List[int]] = {}
+    for i in key:
+        t0 = time.perf_counter()
+        search = leaves[i].rx.search
+        found = [ln for ln, line in text.items() if search(line)]
+        seconds[i] += time.perf_counter() - t0
+        if found:
+            hits[i] = found
+    keep = {ln for found in hits.values() for ln in found}
+    return _FileResult(rel, hits, {ln: text[ln] for ln in keep}, seconds)
+
+
+def _enumerate(root: Path, scopes: Iterable[Scope], *, use_git: bool) -> List[Path]:
+    dirs: set = set()
+    globs: set = set()
+    for s in scopes:
+        dirs.update(s.dirs)
+        globs.update(s.files)
+    rel_dirs = ["."] if "." in dirs else sorted(dirs)
+    files = set(iter_files(root, rel_dirs, use_git=use_git)) if rel_dirs else set()
+    for pat in sorted(globs):
+        files.update(p for p in root.glob(pat) if p.is_file())
+    return sorted(files, key=str)
+
+
+def run_audits(root: Path, audits: Sequence[Audit], *, jobs: int = 0, use_git: bool = True) -> Tuple[List[Result], Dict[str, Any]]:
+    """Evaluate `audits` against the checkout in one enumeration + one read per file."""
+
+    t_start = time.perf_counter()
+    results: List[Result] = []
+    active: List[Audit] = []
+    missing_required: List[str] = []
+    for a in audits:
+        missing = [f for f in a.requires if not (root / f).is_file()]
+        missing_required.extend(missing)
+        if missing:
+            results.append(
+                Result(a.id, f"{a.id}.requires", "FAIL", "fail", "present", "missing required harness file(s): " + ", ".join(missing), [], 0.0)
+            )
+        else:
+            active.append(a)
+
+    leaves: List[Leaf] = [leaf for a in active for r in a.rules for c in r.clauses for leaf in c]
+    index = {id(leaf): i for i, leaf in enumerate(leaves)}
+
+    t0 = time.perf_counter()
+    paths = _enumerate(root, {leaf.scope for leaf in leaves}, use_git=use_git)
+    t_walk = time.perf_counter() - t0
+
+    # Which leaves cover each file; files sharing a leaf set share one prefilter.
+    by_scope: Dict[Scope, List[int]] = {}
+    for i, leaf in enumerate(leaves):
+        by_scope.setdefault(leaf.scope, []).append(i)
+    work: List[Tuple[Path, str, Tuple[int, ...]]] = []
+    for p in paths:
+        rel = p.relative_to(root).as_posix()
+        key = tuple(sorted(i for s, idxs in by_scope.items() if s.covers(rel) for i in idxs))
+        if key:
+            work.append((p, rel, key))
+    prefilters: Dict[Tuple[int, ...], _Prefilter] = {}
+    for _, _, key in work:
+        if key not in prefilters:
+            prefilters[key] = _prefilter([leaves[i] for i in key])
+
+    t0 = time.perf_counter()
+    args = ([p for p, _, _ in work], [r for _, r, _ in work], [k for _, _, k in work], [prefilters[k] for _, _, k in work])
+    jobs = jobs or default_jobs()
+    if jobs <= 1 or len(work) < 2:
+        file_results = list(map(_evaluate_file, *args, itertools.repeat(leaves)))
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            file_results = list(pool.map(_evaluate_file, *args, itertools.repeat(leaves)))
+    t_scan = time.perf_counter() - t0
+
+    leaf_hits: List[List[Hit]] = [[] for _ in leaves]
+    leaf_seconds = [0.0] * len(leaves)
+    for fr in file_results:
+        for i, s in fr.seconds.items():
+            leaf_seconds[i] += s
+        for i, lns in fr.hits.items():
+            leaf_hits[i].extend((fr.rel, ln, fr.lines[ln].strip()) for ln in lns)
+
+    for a in active:
+        for rule in a.rules:
+            t0 = time.perf_counter()
+            if rule.exists is not None:
+                present = (root / rule.exists).exists()
+                hits: List[Hit] = []
+                seconds = time.perf_counter() - t0
+            else:
+                idxs = [[index[id(leaf)] for leaf in c] for c in rule.clauses]
+                present = any(all(leaf_hits[i] for i in c) for c in idxs)
+                hits = sorted({h for c in idxs for i in c for h in leaf_hits[i]})
+                seconds = sum(leaf_seconds[i] for c in idxs for i in c)
+            ok = present if rule.expect == "present" else not present
+            status = "OK" if ok else rule.severity.upper()
+            results.append(Result(a.id, rule.id, status, rule.severity, rule.expect, rule.message, hits, seconds))
+
+    order = {a.id: n for n, a in enumerate(audits)}
+    results.sort(key=lambda r: order[r.audit])  # stable: rule order within an audit is kept
+    stats = {
+        "files_enumerated": len(paths),
+        "files_scanned": len(work),
+        "jobs": jobs,
+        "walk_ms": round(t_walk * 1e3, 3),
+        "scan_ms": round(t_scan * 1e3, 3),
+        "total_ms": round((time.perf_counter() - t_start) * 1e3, 3),
+        "missing_required": sorted(set(missing_required)),
+    }
+    return results, stats
+
+
+# --------------------------------------------------------------------- report
+
+
+def _summary(results: Sequence[Result]) -> Dict[str, int]:
+    return {s: sum(1 for r in results if r.status == s) for s in STATUSES}
+
+
+def print_text(root: Path, rules_path: Path, audits: Sequence[Audit], results: Sequence[Result], stats: Dict[str, Any], *, show: int) -> None:
+    print("== Harness audit ==")
+    print(f"Harness: {root}")
+    print(f"Rules:   {rules_path} ({len(audits)} audits, {sum(len(a.rules) for a in audits)} rules)")
+    print(
+        f"Files:   {stats['files_enumerated']} enumerated, {stats['files_scanned']} scanned "
+        f"(walk {stats['walk_ms']:.1f} ms, scan {stats['scan_ms']:.1f} ms, jobs {stats['jobs']})"
+    )
+    width = max((len(r.rule) for r in results), default=0)
+    by_audit = {a.id: a for a in audits}
+    current = None
+    for r in results:
+        if r.audit != current:
+            current = r.audit
+            a = by_audit[r.audit]
+            print()
+            print(f"-- {a.id}: {a.title}" + (f" ({a.source})" if a.source else ""))
+        print(f"{r.status:<5} {r.rule:<{width}}  {len(r.hits):5d} hits  {r.seconds * 1e3:8.2f} ms")
+        if r.status != "OK" and r.message:
+            print(f"      {r.message}")
+        for path, ln, text in r.hits[:show]:
+            print(f"      {path}:{ln}: {text[:160]}")
+        if show and len(r.hits) > show:
+            print(f"      ... {len(r.hits) - show} more")
+    s = _summary(results)
+    print()
+    print(f"== Summary: {s['OK']} OK, {s['WARN']} WARN, {s['FAIL']} FAIL ({stats['total_ms'] / 1e3:.2f} s) ==")
+
+
+def to_json(root: Path, rules_path: Path, results: Sequence[Result], stats: Dict[str, Any], *, max_hits: int) -> Dict[str, Any]:
+    return {
+        "harness": str(root),
+        "rules": str(rules_path),
+        **stats,
+        "summary": _summary(results),
+        "results": [
+            {
+                "audit": r.audit,
+                "rule": r.rule,
+                "status": r.status,
+                "severity": r.severity,
+                "expect": r.expect,
+                "message": r.message,
+                "ms": round(r.seconds * 1e3, 3),
+                "hit_count": len(r.hits),
+                "hits": [{"path": p, "line": ln, "text": t} for p, ln, t in r.hits[:max_hits]],
+            }
+            for r in results
+        ],
+    }
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description="Evaluate all harness audit rules in one pass over the harness checkout.")
+    ap.add_argument("harness_repo", nargs="?", default="../home-inventory-chip-openmpw")
+    ap.add_argument("--rules", type=Path, default=DEFAULT_RULES, help="rules file (default: tools/harness_audit_rules.yaml)")
+    ap.add_argument("--suite", choices=SUITES + ("all",), default="all", help="which audits to run (default: all)")
+    ap.add_argument("--audit", action="append", default=[], metavar="ID", help="run only this audit (repeatable)")
+    ap.add_argument("--json", action="store_true", help="print the report as JSON")
+    ap.add_argument("--show", type=int, default=3, help="hit lines shown per rule in the text report (0 = none)")
+    ap.add_argument("--max-hits", type=int, default=20, help="hit lines kept per rule in the JSON report")
+    ap.add_argument("--jobs", type=int, default=0, help="scanner threads (default: min(8, CPUs); 1 = serial)")
+    ap.add_argument(
+        "--no-git",
+        action="store_true",
+        help="enumerate with os.walk even in a git work tree (ignores .gitignore)",
+    )
+    ap.add_argument("--strict", action="store_true", help="exit 1 on WARN as well as FAIL")
+    ap.add_argument("--list", action="store_true", help="list audits and rules, then exit")
+    args = ap.parse_args(argv)
+
+    root = Path(args.harness_repo).resolve()
+    if not args.list and not root.is_dir():
+        print(f"ERROR: harness repo not found at: {root}", file=sys.stderr)
+        return 2
+    try:
+        audits = load_rules(args.rules, root)
+    except RulesError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    if args.audit:
+        unknown = set(args.audit) - {a.id for a in audits}
+        if unknown:
+            print(f"ERROR: unknown audit id(s): {', '.join(sorted(unknown))}", file=sys.stderr)
+            return 2
+        audits = [a for a in audits if a.id in args.audit]
+    if args.suite != "all":
+        audits = [a for a in audits if a.suite == args.suite]
+
+    if args.list:
+        for a in audits:
+            print(f"{a.id} [{a.suite}] {a.title}" + (f" ({a.source})" if a.source else ""))
+            for r in a.rules:
+                print(f"  {r.id} ({r.severity}, expect {r.expect})")
+        return 0
+
+    results, stats = run_audits(root, audits, jobs=args.jobs, use_git=not args.no_git)
+
+    if args.json:
+        json.dump(to_json(root, args.rules, results, stats, max_hits=args.max_hits), sys.stdout, indent=2)
+        print()
+    else:
+        print_text(root, args.rules, audits, results, stats, show=max(0, args.show))
+
+    if stats["missing_required"]:
+        return 2
+    if any(r.status == "FAIL" or (args.strict and r.status == "WARN") for r in results):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -29,6 +29,17 @@ Examples
 Notes
 -----
 - Stdlib-only; intended to run in low-disk environments.
+- Files are enumerated with `git ls-files` (tracked + untracked, .gitignore
+  honored) when the harness is a git checkout, else (or when git lists nothing)
+  with os.walk, and scanned on a thread pool (--jobs). Output is sorted by path
+  and line either way.
+- `--index` consults the persistent trigram index (tools/harness_index.py,
+  refreshed incrementally on every run) and only reads files that can match;
+  the output is identical to a full scan.
+- Each file is read exactly once (memory-mapped above 1 MiB). All terms are
+  matched with one combined pattern over the raw bytes, so a scan costs one
+  pass over the checkout; only files with hits are decoded into lines, and
+  those lines are reused for the excerpts.
 - This is *not* a replacement for schematics; it just surfaces any already-committed
   assumptions in the harness repo.
 """
@@ -36,12 +47,16 @@ Notes
 from __future__ import annotations
 
 import argparse
+import itertools
+import mmap
 import os
 import re
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 
 DEFAULT_DIRS = ["docs", "verilog"]
@@ -85,11 +100,13 @@ SKIP_EXTS = {
 }
 
 
-@dataclass(frozen=True)
-class Hit:
-    path: Path
-    line_no: int
-    line: str
+# Files at least this large are memory-mapped instead of read.
+MMAP_MIN_BYTES = 1 << 20
+
+# Binary sniff window (a NUL byte in it marks the file as binary).
+SNIFF_BYTES = 2048
+
+Pattern = Union["re.Pattern[bytes]", "re.Pattern[str]"]
 
 
 @dataclass
@@ -100,7 +117,211 @@ class Block:
     hit_lines: List[int]
 
 
-def iter_files(root: Path, rel_dirs: List[str]) -> Iterable[Path]:
+@dataclass
+class ScannedFile:
+    path: Path
+    hit_lines: List[int]
+    lines: List[str]  # decoded text, kept for excerpt rendering
+
+
+_GLOBAL_FLAGS_RE = re.compile(r"\(\?([aiLmsux]+)\)")
+_DIGITS = "0123456789"
+_OCTAL = "01234567"
+
+
+def _isolate(term: str, k: int, offset: int) -> str:
+    """Rewrite regex `term` (term number k) to sit after `offset` groups of an alternation.
+
+    Leading global flags such as (?i) become a scoped (?i:...) group, numbered
+    backreferences and (?(N)...) conditionals are shifted by `offset`, and group
+    names get a t<k>_ prefix, so the term matches exactly what it matches alone.
+    `term` must already compile on its own.
+    """
+
+    flags = ""
+    m = _GLOBAL_FLAGS_RE.match(term)
+    while m is not None:
+        flags += m.group(1)
+        term = term[m.end() :]
+        m = _GLOBAL_FLAGS_RE.match(term)
+    verbose = "x" in flags
+    out: List[str] = []
+    i, n = 0, len(term)
+    while i < n:
+        c = term[i]
+        if c == "\\":
+            d = term[i + 1 : i + 4]
+            if d[:1] not in _DIGITS[1:] or (len(d) == 3 and all(ch in _OCTAL for ch in d)):
+                j = i + 2  # ordinary or octal escape: copy as-is (octal digits are plain text)
+            else:
+                ref = d[:2] if d[1:2] and d[1] in _DIGITS else d[:1]
+                out.append(f"(?:\\{int(ref) + offset})")
+                i += 1 + len(ref)
+                continue
+        elif c == "[":
+            j = i + 1
+            j += term.startswith("^", j)
+            j += term.startswith("]", j)
+            while j < n and term[j] != "]":
+                j += 2 if term[j] == "\\" else 1
+            j += 1
+        elif c == "#" and verbose:
+            j = term.find("\n", i)
+            j = n if j < 0 else j
+        elif term.startswith(("(?P<", "(?P="), i):
+            j = term.index(">" if term[i + 3] == "<" else ")", i)
+            out.append(f"{term[i : i + 4]}t{k}_{term[i + 4 : j + 1]}")
+            i = j + 1
+            continue
+        elif term.startswith("(?(", i):
+            j = term.index(")", i)
+            ref = term[i + 3 : j]
+            out.append(f"(?({int(ref) + offset if ref.isdigit() else f't{k}_{ref}'})")
+            i = j + 1
+            continue
+        elif term.startswith("(?#", i):
+            j = term.index(")", i) + 1
+        else:
+            j = i + 1
+        out.append(term[i:j])
+        i = j
+    body = "".join(out)
+    if verbose:
+        body += "\n"  # a trailing comment must not swallow the closing parenthesis
+    return f"(?{flags}:{body})" if flags else f"(?:{body})"
+
+
+def compile_terms(terms: List[str], *, regex: bool) -> Pattern:
+    """One case-insensitive alternation of all terms.
+
+    ASCII terms compile to a bytes pattern that runs over the raw file bytes;
+    anything else falls back to a str pattern run on decoded lines. With
+    `regex`, each term is first compiled alone and then rewritten by `_isolate`,
+    so backreferences, group names and leading inline flags keep their meaning
+    inside the alternation.
+    """
+
+    if regex:
+        parts, groups = [], 0
+        for k, t in enumerate(terms):
+            alone = re.compile(t.encode("ascii") if t.isascii() else t, re.IGNORECASE | re.MULTILINE)
+            parts.append(_isolate(t, k, groups))
+            groups += alone.groups
+    else:
+        parts = [re.escape(t) for t in terms]
+    alt = "|".join(parts) if parts else "(?!)"
+    if alt.isascii():
+        return re.compile(alt.encode("ascii"), re.IGNORECASE | re.MULTILINE)
+    return re.compile(alt, re.IGNORECASE)
+
+
+def _read_once(path: Path) -> Optional[Union[bytes, mmap.mmap]]:
+    try:
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= MMAP_MIN_BYTES:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return f.read()
+    except (OSError, ValueError):
+        return None
+
+
+def _decode_lines(buf: Union[bytes, mmap.mmap]) -> List[str]:
+    # Same as Path.read_text(errors="replace").splitlines() (universal newlines).
+    return bytes(buf).decode(errors="replace").splitlines()
+
+
+def _count_nl(buf: Union[bytes, mmap.mmap], start: int, end: int) -> int:
+    # mmap has find()/rfind() but no count(); slicing copies only [start, end).
+    if isinstance(buf, bytes):
+        return buf.count(b"\n", start, end)
+    return buf[start:end].count(b"\n")
+
+
+def _text_hit_lines(lines: List[str], rx: "re.Pattern[str]") -> List[int]:
+    search = rx.search
+    return [i for i, line in enumerate(lines, start=1) if search(line)]
+
+
+def _byte_hit_lines(buf: Union[bytes, mmap.mmap], rx: "re.Pattern[bytes]") -> List[int]:
+    """Line numbers (LF-separated) with a match, in one pass over `buf`."""
+
+    hits: List[int] = []
+    search, find = rx.search, buf.find
+    pos = 0
+    line_no = 1
+    while True:
+        m = search(buf, pos)
+        if m is None:
+            return hits
+        start = m.start()
+        line_no += _count_nl(buf, pos, start)
+        bol = buf.rfind(b"\n", 0, start) + 1
+        eol = find(b"\n", start)
+        end = len(buf) if eol < 0 else eol
+        # A match running past the newline (regex terms like \s) only counts
+        # if the line matches on its own, as in a per-line search.
+        if m.end() <= end or search(buf[bol:end]):
+            hits.append(line_no)
+        if eol < 0:
+            return hits
+        pos = eol + 1
+        line_no += 1
+
+
+def scan_file(path: Path, rx: Pattern) -> Optional[ScannedFile]:
+    """Read `path` once; return its hit lines and decoded text, or None without hits."""
+
+    buf = _read_once(path)
+    if buf is None:
+        return None
+    try:
+        if b"\x00" in buf[:SNIFF_BYTES]:
+            return None
+        lines: Optional[List[str]] = None
+        if isinstance(rx.pattern, bytes) and buf.find(b"\r") < 0:
+            hit_lines = _byte_hit_lines(buf, rx)  # type: ignore[arg-type]
+            if not hit_lines:
+                return None
+            lines = _decode_lines(buf)
+            if len(lines) != _count_nl(buf, 0, len(buf)) + (0 if buf[-1:] == b"\n" else 1):
+                # Other line separators (FF, VT, NEL, ...): number lines like str.splitlines().
+                lines = None
+        if lines is None:
+            lines = _decode_lines(buf)
+            text_rx = rx if isinstance(rx.pattern, str) else re.compile(rx.pattern.decode("ascii"), rx.flags)
+            hit_lines = _text_hit_lines(lines, text_rx)  # type: ignore[arg-type]
+            if not hit_lines:
+                return None
+        return ScannedFile(path=path, hit_lines=hit_lines, lines=lines)
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+
+
+def _skipped(rel: Path) -> bool:
+    return rel.suffix in SKIP_EXTS or any(part in SKIP_DIR_NAMES for part in rel.parts[:-1])
+
+
+def _git_files(root: Path, rel_dirs: List[str]) -> Optional[List[Path]]:
+    """Tracked + untracked-but-not-ignored files under rel_dirs, or None when git fails."""
+
+    if not rel_dirs:
+        return []
+    try:
+        out = subprocess.run(
+            ["git", "-C", str(root), "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--", *rel_dirs],
+            capture_output=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    rels = {Path(os.fsdecode(p)) for p in out.split(b"\0") if p}
+    return [root / rel for rel in rels if not _skipped(rel)]
+
+
+def _walk_files(root: Path, rel_dirs: List[str]) -> List[Path]:
+    files: List[Path] = []
     for d in rel_dirs:
         base = root / d
         if not base.exists():
@@ -112,48 +333,47 @@ def iter_files(root: Path, rel_dirs: List[str]) -> Iterable[Path]:
                 p = Path(dirpath) / fn
                 if p.suffix in SKIP_EXTS:
                     continue
-                yield p
+                files.append(p)
+    return files
 
 
-def _looks_binary(path: Path, sniff_bytes: int = 2048) -> bool:
-    """Best-effort binary detection.
+def iter_files(root: Path, rel_dirs: List[str], *, use_git: bool = True) -> List[Path]:
+    """Files to scan under root/rel_dirs, sorted by path.
 
-    We already skip many binary extensions, but this catches odd cases.
+    In a git work tree the list comes from `git ls-files --cached --others
+    --exclude-standard`, so .gitignore'd build output (openlane runs, sim
+    dumps, ...) is never read. It falls back to os.walk outside a work tree and
+    whenever git lists nothing, e.g. a harness checkout nested in a parent repo
+    that ignores it. The SKIP_DIR_NAMES/SKIP_EXTS filters apply either way.
     """
-    try:
-        with path.open("rb") as f:
-            chunk = f.read(sniff_bytes)
-        return b"\x00" in chunk
-    except Exception:
-        return True
 
+    files = _git_files(root, rel_dirs) if use_git else None
+    if not files:
+        files = _walk_files(root, rel_dirs)
+    return sorted(set(files), key=str)
 
-def find_hits(path: Path, patterns: List[re.Pattern]) -> List[Hit]:
-    hits: List[Hit] = []
 
-    if _looks_binary(path):
-        return hits
+def default_jobs() -> int:
+    return min(8, os.cpu_count() or 1)
 
-    try:
-        text = path.read_text(errors="replace")
-    except Exception:
-        return hits
 
-    for i, line in enumerate(text.splitlines(), start=1):
-        for pat in patterns:
-            if pat.search(line):
-                hits.append(Hit(path=path, line_no=i, line=line.rstrip("\n")))
-                break
-    return hits
+def scan_files(paths: List[Path], rx: Pattern, *, jobs: int = 0) -> Iterator[ScannedFile]:
+    """scan_file() over `paths` on a thread pool; results come back in `paths` order.
 
+    The scan is dominated by I/O wait on large checkouts, which threads overlap
+    (file reads and mmap faults release the GIL); ordering is by input, so the
+    output does not depend on scheduling.
+    """
 
-def read_lines(path: Path) -> List[str]:
-    if _looks_binary(path):
-        return []
-    try:
-        return path.read_text(errors="replace").splitlines()
-    except Exception:
-        return []
+    jobs = jobs or default_jobs()
+    if jobs <= 1 or len(paths) < 2:
+        results: Iterable[Optional[ScannedFile]] = (scan_file(p, rx) for p in paths)
+        yield from (sf for sf in results if sf is not None)
+        return
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for sf in pool.map(scan_file, paths, itertools.repeat(rx)):
+            if sf is not None:
+                yield sf
 
 
 def merge_blocks_for_file(path: Path, hit_lines: List[int], context: int, total_lines: int) -> List[Block]:
@@ -207,6 +427,17 @@ def main(argv: List[str]) -> int:
         help="treat --terms as regex patterns (case-insensitive); otherwise terms are literals",
     )
     ap.add_argument("--context", type=int, default=2, help="lines of context before/after")
+    ap.add_argument("--jobs", type=int, default=0, help="scanner threads (default: min(8, CPUs); 1 = serial)")
+    ap.add_argument(
+        "--index",
+        action="store_true",
+        help="narrow the scan with the persistent trigram index (tools/harness_index.py)",
+    )
+    ap.add_argument(
+        "--no-git",
+        action="store_true",
+        help="enumerate with os.walk even in a git work tree (ignores .gitignore)",
+    )
     ap.add_argument("--max", type=int, default=120, help="max blocks to print")
     ap.add_argument(
         "--markdown",
@@ -224,55 +455,28 @@ def main(argv: List[str]) -> int:
     terms = [t.strip() for t in args.terms.split(",") if t.strip()]
 
     # By default treat terms as literals (fast, predictable). Use --regex for power users.
-    patterns: List[re.Pattern] = []
-    for t in terms:
-        if args.regex:
-            patterns.append(re.compile(t, re.IGNORECASE))
-        else:
-            patterns.append(re.compile(re.escape(t), re.IGNORECASE))
+    # Either way all terms go into one pattern, matched in a single pass per file.
+    rx = compile_terms(terms, regex=args.regex)
 
-    # First collect hits; keep scan deterministic.
-    all_hits: List[Hit] = []
-    for fp in iter_files(root, rel_dirs):
-        all_hits.extend(find_hits(fp, patterns))
+    # Scan every file once; keep the decoded lines of files with hits for rendering.
+    files = iter_files(root, rel_dirs, use_git=not args.no_git)
+    if args.index:
+        # Narrow to files whose trigrams can match; the scan below still verifies.
+        from harness_index import TrigramIndex
 
-    all_hits.sort(key=lambda h: (str(h.path), h.line_no))
+        idx = TrigramIndex(root, files, scope=rel_dirs)
+        files = idx.candidates(rx)
+        idx.close()
+    scanned: Dict[Path, ScannedFile] = {sf.path: sf for sf in scan_files(files, rx, jobs=args.jobs)}
+
+    n_hits = sum(len(sf.hit_lines) for sf in scanned.values())
 
     # Convert hits -> merged blocks per file.
     blocks: List[Block] = []
-    last_path: Path | None = None
-    file_hit_lines: List[int] = []
-    file_total_lines = 0
-
-    def flush() -> None:
-        nonlocal blocks, last_path, file_hit_lines, file_total_lines
-        if last_path is None:
-            return
-        blocks.extend(merge_blocks_for_file(last_path, file_hit_lines, args.context, file_total_lines))
-        last_path = None
-        file_hit_lines = []
-        file_total_lines = 0
-
-    for h in all_hits:
-        if last_path is None:
-            last_path = h.path
-            file_hit_lines = [h.line_no]
-            file_total_lines = len(read_lines(h.path))
-            if file_total_lines == 0:
-                file_total_lines = h.line_no  # best-effort
-            continue
-
-        if h.path != last_path:
-            flush()
-            last_path = h.path
-            file_hit_lines = [h.line_no]
-            file_total_lines = len(read_lines(h.path))
-            if file_total_lines == 0:
-                file_total_lines = h.line_no
-        else:
-            file_hit_lines.append(h.line_no)
-
-    flush()
+    for fp in sorted(scanned, key=str):
+        sf = scanned[fp]
+        total_lines = len(sf.lines) or sf.hit_lines[-1]
+        blocks.extend(merge_blocks_for_file(fp, sf.hit_lines, args.context, total_lines))
 
     # Sort blocks by path then starting line.
     blocks.sort(key=lambda b: (str(b.path), b.lo, b.hi))
@@ -282,7 +486,7 @@ def main(argv: List[str]) -> int:
         print(f"- Harness repo: `{root}`")
         print(f"- Dirs scanned: `{', '.join(rel_dirs) if rel_dirs else '(none)'}`")
         print(f"- Terms: `{', '.join(terms)}`")
-        print(f"- Total hits: **{len(all_hits)}**")
+        print(f"- Total hits: **{n_hits}**")
         print(f"- Total blocks (merged): **{len(blocks)}**")
         print()
     else:
@@ -290,7 +494,7 @@ def main(argv: List[str]) -> int:
         print(f"Harness repo: {root}")
         print(f"Dirs scanned: {', '.join(rel_dirs) if rel_dirs else '(none)'}")
         print(f"Terms: {', '.join(terms)}")
-        print(f"Total hits: {len(all_hits)}")
+        print(f"Total hits: {n_hits}")
         print(f"Total blocks (merged): {len(blocks)}")
         print()
 
@@ -300,7 +504,7 @@ def main(argv: List[str]) -> int:
             print(f"(stopping at --max {args.max})")
             break
 
-        lines = read_lines(b.path)
+        lines = scanned[b.path].lines
         rel = b.path.relative_to(root)
         hits = set(b.hit_lines)
 
@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""Persistent trigram index of a harness checkout, for repeated evidence queries.
+
+Why:
+- harness_evidence_snip.py and the harness audits run again and again against
+  the same home-inventory-chip-openmpw checkout with different terms, and each
+  run used to read every file.
+- This index records which (case-folded) byte trigrams occur in each text file
+  and keeps the inverted lists on disk. A query first narrows the files to
+  those that can contain every required literal of the pattern, and only those
+  candidates are read and matched (harness_evidence_snip.scan_files), so the
+  output is exactly that of a full scan.
+
+Invalidation (per file, like tools/regmap/rtl_index.py):
+- A file whose (mtime_ns, size) is unchanged is trusted without being read.
+- Otherwise it is read and hashed; if the SHA-256 still matches only the stat
+  is refreshed, else its trigrams are recomputed.
+- Files that left the enumerated set (deleted, newly ignored) are dropped.
+The inverted lists are only rewritten when some file's trigrams changed.
+
+Storage: $HARNESS_INDEX_DIR (default ~/.cache/home-inventory/harness-index),
+one subdirectory per checkout holding meta.json (per-file stat/hash/id) and
+postings.bin (sorted trigram table + offsets + file ids), which queries
+memory-map and bisect, so an unchanged index answers in milliseconds. Set
+HARNESS_INDEX_DIR to an empty string to disable it.
+
+Query planning: the pattern (the combined alternation from
+harness_evidence_snip.compile_terms, literal or --regex) is walked with the
+stdlib regex parser. Literal runs of 3+ ASCII characters become required
+substrings (a run directly before a group or alternation also continues into
+each branch); sequences AND them, alternations OR them; anything that cannot be
+bounded (classes, optional parts, non-ASCII literals) imposes no constraint, so
+the candidate set is always a superset of the matching files.
+
+NumPy (optional) vectorizes trigram extraction and the postings rebuild; the
+stdlib path gives the same index, only slower to build.
+
+Usage:
+  python3 tools/harness_index.py ../home-inventory-chip-openmpw --stats
+  python3 tools/harness_index.py ../home-inventory-chip-openmpw --terms adc_clkin,DRDY
+  tools/harness_evidence_snip.py ../home-inventory-chip-openmpw --index --terms adc_drdy
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from cache_paths import cache_dir
+
+try:
+    from re import _parser as sre_parse  # type: ignore[attr-defined]  # 3.11+
+    from re import _constants as sre_c  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover - older Pythons
+    import sre_constants as sre_c  # type: ignore[no-redef]
+    import sre_parse  # type: ignore[no-redef]
+
+try:
+    import numpy as np
+except ImportError:  # stdlib fallback
+    np = None  # type: ignore[assignment]
+
+# Bump when the on-disk layout or the trigram definition changes.
+INDEX_VERSION = 1
+
+SNIFF_BYTES = 2048  # same binary rule as harness_evidence_snip
+
+_META = "meta.json"
+_POSTINGS = "postings.bin"
+_HDR = struct.Struct("=4sIIII")  # magic, version, generation, n_grams, n_ids
+_MAGIC = b"HTG1"
+
+Pattern = Union["re.Pattern[bytes]", "re.Pattern[str]"]
+# Query plan: None (no constraint), b"lit", ("and", [...]) or ("or", [...]).
+Plan = Union[None, bytes, Tuple[str, list]]
+
+
+def index_dir(root: Path) -> Optional[Path]:
+    base = cache_dir("harness-index", "HARNESS_INDEX_DIR")
+    if base is None:
+        return None
+    return base / hashlib.sha1(str(root).encode()).hexdigest()[:16]
+
+
+# ---------------------------------------------------------------------------
+# Trigrams
+# ---------------------------------------------------------------------------
+
+
+def file_trigrams(data: bytes) -> "array[int]":
+    """Sorted distinct trigram codes (b0<<16 | b1<<8 | b2) of the ASCII-lowercased bytes."""
+
+    low = data.lower()
+    if len(low) < 3:
+        return array("I")
+    if np is not None:
+        a = np.frombuffer(low, dtype=np.uint8).astype(np.uint32)
+        return array("I", np.unique((a[:-2] << 16) | (a[1:-1] << 8) | a[2:]).tobytes())
+    grams = {low[i : i + 3] for i in range(len(low) - 2)}
+    return array("I", sorted(int.from_bytes(g, "big") for g in grams))
+
+
+def literal_trigrams(lit: bytes) -> List[int]:
+    low = lit.lower()
+    return sorted({int.from_bytes(low[i : i + 3], "big") for i in range(len(low) - 2)})
+
+
+# ---------------------------------------------------------------------------
+# Query planning
+# ---------------------------------------------------------------------------
+
+_REPEATS = {sre_c.MAX_REPEAT, sre_c.MIN_REPEAT}
+if hasattr(sre_c, "POSSESSIVE_REPEAT"):
+    _REPEATS.add(sre_c.POSSESSIVE_REPEAT)
+
+
+def _and(parts: List[Plan]) -> Plan:
+    parts = [p for p in parts if p is not None]
+    if not parts:
+        return None
+    return parts[0] if len(parts) == 1 else ("and", parts)
+
+
+def _plan_seq(items: Iterable[Tuple[object, object]], prefix: bytes = b"") -> Plan:
+    parts: List[Plan] = []
+    run = bytearray(prefix)
+
+    def flush() -> None:
+        if len(run) >= 3:
+            parts.append(bytes(run))
+        run.clear()
+
+    for op, av in items:
+        if op is sre_c.LITERAL and isinstance(av, int) and av < 128:
+            run.append(av)
+            continue
+        # A literal run directly before a group/alternation continues into it
+        # (the parser also hoists common prefixes out: "wishbone|wb_x" -> "w(?:ishbone|b_x)").
+        if op is sre_c.SUBPATTERN:
+            head = bytes(run)
+            run.clear()
+            parts.append(_plan_seq(av[-1], head))  # type: ignore[index]
+            continue
+        if op is sre_c.BRANCH:
+            alts = [_plan_seq(b, bytes(run)) for b in av[1]]  # type: ignore[index]
+            if all(a is not None for a in alts):
+                run.clear()
+                parts.append(("or", alts))
+                continue
+        flush()
+        if op in _REPEATS and av[0] >= 1:  # type: ignore[index]
+            parts.append(_plan_seq(av[2]))  # type: ignore[index]
+    flush()
+    return _and(parts)
+
+
+def plan(rx: Pattern) -> Plan:
+    """Literals a line must contain to match `rx` (None: no usable constraint)."""
+
+    if isinstance(rx.pattern, str):
+        # Non-ASCII terms: Unicode case folding can match bytes the ASCII-folded
+        # trigrams do not cover (e.g. KELVIN SIGN for "k").
+        return None
+    try:
+        parsed = sre_parse.parse(rx.pattern.decode("ascii"), rx.flags & (re.IGNORECASE | re.MULTILINE | re.VERBOSE | re.DOTALL))
+    except Exception:
+        return None
+    return _plan_seq(parsed)
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+class TrigramIndex:
+    """Trigram postings for the text files of one checkout, refreshed on open."""
+
+    def __init__(self, root: Path, files: Sequence[Path], *, scope: Sequence[str] = (), directory: Optional[Path] = None) -> None:
+        self.root = root.resolve()
+        self.dir = directory if directory is not None else index_dir(self.root)
+        # key -> [id, mtime_ns, size, sha256, binary]
+        self.entries: Dict[str, list] = {}
+        self.generation = 0
+        self.next_id = 0
+        self.reindexed: List[str] = []
+        self._grams = self._offs = self._ids = None  # type: Optional[memoryview]
+        self._mm: Optional[mmap.mmap] = None
+        self._keys = {p: p.relative_to(self.root).as_posix() for p in files}
+        self._load()
+        self._refresh(files, scope)
+
+    # -- persistence -------------------------------------------------------
+
+    def _load(self) -> None:
+        if self.dir is None:
+            return
+        try:
+            meta = json.loads((self.dir / _META).read_text(encoding="utf-8"))
+            with (self.dir / _POSTINGS).open("rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(meta, dict)
+            or meta.get("version") != INDEX_VERSION
+            or meta.get("root") != str(self.root)
+            or len(mm) < _HDR.size
+        ):
+            mm.close()
+            return
+        magic, version, gen, n_grams, n_ids = _HDR.unpack_from(mm, 0)
+        if magic != _MAGIC or version != INDEX_VERSION or gen != meta.get("generation"):
+            mm.close()  # torn write (meta and postings from different runs): rebuild
+            return
+        if len(mm) != _HDR.size + 4 * (2 * n_grams + 1 + n_ids):
+            mm.close()
+            return
+        view = memoryview(mm)[_HDR.size :].cast("I")
+        self._mm = mm
+        self._grams = view[:n_grams]
+        self._offs = view[n_grams : 2 * n_grams + 1]
+        self._ids = view[2 * n_grams + 1 :]
+        self.entries = meta["files"]
+        self.generation = gen
+        self.next_id = meta["next_id"]
+
+    def _meta(self) -> Dict[str, object]:
+        return {
+            "version": INDEX_VERSION,
+            "root": str(self.root),
+            "generation": self.generation,
+            "next_id": self.next_id,
+            "files": self.entries,
+        }
+
+    def _write(self, name: str, chunks: Sequence[bytes]) -> None:
+        assert self.dir is not None
+        fd, tmp = tempfile.mkstemp(dir=self.dir, prefix=name, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            for c in chunks:
+                f.write(c)
+        os.replace(tmp, self.dir / name)
+
+    def _save(self, grams: "array[int]", offs: "array[int]", ids: "array[int]") -> None:
+        # postings.bin first: meta.json then names its generation, so a torn
+        # update is detected on load and simply rebuilt.
+        self.generation += 1
+        hdr = _HDR.pack(_MAGIC, INDEX_VERSION, self.generation, len(grams), len(ids))
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)  # type: ignore[union-attr]
+            self._write(_POSTINGS, (hdr, grams.tobytes(), offs.tobytes(), ids.tobytes()))
+            self._save_meta()
+        except OSError:
+            pass  # read-only / full disk: the index is best-effort
+
+    def _save_meta(self) -> None:
+        try:
+            self._write(_META, (json.dumps(self._meta(), separators=(",", ":")).encode(),))
+        except OSError:
+            pass
+
+    # -- refresh -----------------------------------------------------------
+
+    def _refresh(self, files: Sequence[Path], scope: Sequence[str]) -> None:
+        seen: Set[str] = set()
+        removed: Set[int] = set()
+        changed: Dict[int, "array[int]"] = {}
+        stat_dirty = False
+        for p in files:
+            key = self._keys[p]
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            seen.add(key)
+            ent = self.entries.get(key)
+            if ent is not None and ent[1] == st.st_mtime_ns and ent[2] == st.st_size:
+                continue
+            try:
+                data = p.read_bytes()
+            except OSError:
+                continue
+            sha = hashlib.sha256(data).hexdigest()
+            if ent is not None and ent[3] == sha:
+                ent[1], ent[2] = st.st_mtime_ns, st.st_size
+                stat_dirty = True
+                continue
+            if ent is not None:
+                removed.add(ent[0])
+            binary = b"\x00" in data[:SNIFF_BYTES]
+            fid = self.next_id
+            self.next_id += 1
+            self.entries[key] = [fid, st.st_mtime_ns, st.st_size, sha, binary]
+            if not binary:
+                changed[fid] = file_trigrams(data)
+            self.reindexed.append(key)
+
+        # Files under the enumerated dirs that are gone (deleted / now ignored).
+        prefixes = tuple(d.rstrip("/") + "/" for d in scope)
+        for key in [k for k in self.entries if k not in seen and (not prefixes or k.startswith(prefixes))]:
+            removed.add(self.entries.pop(key)[0])
+
+        if changed or removed:
+            arrays = self._rebuild(removed, changed)
+            self._set(*arrays)
+            if self.dir is not None:
+                self._save(*arrays)
+        elif stat_dirty and self.dir is not None:
+            self._save_meta()
+
+    def _set(self, grams: "array[int]", offs: "array[int]", ids: "array[int]") -> None:
+        if self._mm is not None:
+            self._grams = self._offs = self._ids = None
+            self._mm.close()
+            self._mm = None
+        self._grams, self._offs, self._ids = memoryview(grams), memoryview(offs), memoryview(ids)
+
+    def _rebuild(self, removed: Set[int], changed: Dict[int, "array[int]"]) -> Tuple["array[int]", "array[int]", "array[int]"]:
+        old_g = array("I", self._grams) if self._grams is not None else array("I")
+        old_o = array("I", self._offs) if self._offs is not None else array("I", [0])
+        old_i = array("I", self._ids) if self._ids is not None else array("I")
+        if np is not None:
+            g = np.repeat(np.frombuffer(old_g, dtype=np.uint32), np.diff(np.frombuffer(old_o, dtype=np.uint32)))
+            i = np.frombuffer(old_i, dtype=np.uint32)
+            if removed:
+                keep = ~np.isin(i, np.fromiter(removed, dtype=np.uint32))
+                g, i = g[keep], i[keep]
+            if changed:
+                g = np.concatenate([g] + [np.frombuffer(v, dtype=np.uint32) for v in changed.values()])
+                i = np.concatenate([i] + [np.full(len(v), fid, dtype=np.uint32) for fid, v in changed.items()])
+            order = np.lexsort((i, g))
+            g, i = g[order], i[order]
+            ug, start = np.unique(g, return_index=True)
+            offs = np.append(start, len(g)).astype(np.uint32)
+            return array("I", ug.astype(np.uint32).tobytes()), array("I", offs.tobytes()), array("I", i.tobytes())
+        post: Dict[int, List[int]] = {}
+        for k, gram in enumerate(old_g):
+            keep_ids = [x for x in old_i[old_o[k] : old_o[k + 1]] if x not in removed]
+            if keep_ids:
+                post[gram] = keep_ids
+        for fid, gs in changed.items():
+            for gram in gs:
+                post.setdefault(gram, []).append(fid)
+        grams, offs, ids = array("I"), array("I", [0]), array("I")
+        for gram in sorted(post):
+            grams.append(gram)
+            ids.extend(sorted(post[gram]))
+            offs.append(len(ids))
+        return grams, offs, ids
+
+    # -- queries -----------------------------------------------------------
+
+    def _posting(self, gram: int) -> Set[int]:
+        g = self._grams
+        if g is None:
+            return set()
+        k = bisect.bisect_left(g, gram)  # type: ignore[arg-type]
+        if k == len(g) or g[k] != gram:
+            return set()
+        return set(self._ids[self._offs[k] : self._offs[k + 1]])  # type: ignore[index]
+
+    def _eval(self, node: Plan) -> Optional[Set[int]]:
+        if node is None:
+            return None
+        if isinstance(node, bytes):
+            out: Optional[Set[int]] = None
+            for gram in literal_trigrams(node):
+                ids = self._posting(gram)
+                out = ids if out is None else out & ids
+                if not out:
+                    return set()
+            return out
+        kind, parts = node
+        if kind == "or":
+            acc: Set[int] = set()
+            for p in parts:
+                r = self._eval(p)
+                if r is None:
+                    return None
+                acc |= r
+            return acc
+        res: Optional[Set[int]] = None
+        for p in parts:
+            r = self._eval(p)
+            if r is not None:
+                res = r if res is None else res & r
+        return res
+
+    def candidates(self, rx: Pattern) -> List[Path]:
+        """Files (in the order given at construction) that may contain a match of `rx`."""
+
+        ids = self._eval(plan(rx))
+        out: List[Path] = []
+        for p, key in self._keys.items():
+            ent = self.entries.get(key)
+            if ent is None:
+                out.append(p)  # unreadable at refresh time: let the scanner decide
+            elif not ent[4] and (ids is None or ent[0] in ids):
+                out.append(p)
+        return out
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "dir": str(self.dir) if self.dir is not None else None,
+            "files": len(self.entries),
+            "text_files": sum(1 for e in self.entries.values() if not e[4]),
+            "trigrams": len(self._grams) if self._grams is not None else 0,
+            "postings": len(self._ids) if self._ids is not None else 0,
+            "reindexed": len(self.reindexed),
+            "generation": self.generation,
+        }
+
+    def close(self) -> None:
+        self._grams = self._offs = self._ids = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+
+def main(argv: List[str]) -> int:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    from harness_evidence_snip import DEFAULT_DIRS, compile_terms, iter_files  # noqa: E402
+
+    ap = argparse.ArgumentParser(description="Build/refresh the harness trigram index and show candidate files")
+    ap.add_argument("harness_repo", nargs="?", default="../home-inventory-chip-openmpw")
+    ap.add_argument("--dirs", default=",".join(DEFAULT_DIRS), help="comma-separated subdirs to index")
+    ap.add_argument("--terms", help="comma-separated terms: list the candidate files for them")
+    ap.add_argument("--regex", action="store_true", help="treat --terms as regex patterns")
+    ap.add_argument("--stats", action="store_true", help="print index statistics as JSON")
+    args = ap.parse_args(argv)
+
+    root = Path(args.harness_repo).resolve()
+    if not root.is_dir():
+        print(f"ERROR: harness repo not found at: {root}", file=sys.stderr)
+        return 2
+    rel_dirs = [d.strip() for d in args.dirs.split(",") if d.strip()]
+    t0 = time.perf_counter()
+    idx = TrigramIndex(root, iter_files(root, rel_dirs), scope=rel_dirs)
+    t1 = time.perf_counter()
+    if args.terms:
+        terms = [t.strip() for t in args.terms.split(",") if t.strip()]
+        rx = compile_terms(terms, regex=args.regex)
+        cands = idx.candidates(rx)
+        for p in cands:
+            print(idx._keys[p])
+        print(f"{len(cands)} candidate file(s) of {len(idx._keys)}; plan: {plan(rx)!r}", file=sys.stderr)
+    if args.stats or not args.terms:
+        st = idx.stats()
+        st["refresh_ms"] = round((t1 - t0) * 1e3, 1)
+        print(json.dumps(st, indent=2))
+    idx.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -10,6 +10,13 @@ Checks:
   - Each YAML register has a corresponding ADR_* localparam in RTL
   - Each RTL ADR_* localparam corresponds to a YAML register
   - Addresses match exactly (byte address)
+  - rtl/include/home_inventory_regmap_pkg.sv: every address, reset value and
+    field BIT/LSB/MASK matches the YAML (no stale extras)
+  - rtl/include/regmap_params.vh: every ADR_* matches the YAML
+  - No other copy of ADR_<REG> / HOMEINV_ADR_<REG> anywhere under rtl/ disagrees
+
+RTL constants come from the persistent index in rtl_index.py (re-parses only
+files whose mtime/hash changed), so repeat runs do not re-read the tree.
 
 Usage:
   python3 tools/regmap/check_regmap.py \
@@ -27,14 +34,20 @@ import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+from regmodel import RegMap, load_regmap
+from rtl_index import RtlIndex
 
-import yaml
+PKG_PREFIX = "HOMEINV"
 
 
-ADR_RE = re.compile(
-    r"^\s*localparam\s+\[[^\]]+\]\s+(ADR_[A-Z0-9_]+)\s*=\s*32'h([0-9A-Fa-f_]+)\s*;\s*$"
-)
+ADR_NAME_RE = re.compile(r"ADR_[A-Z0-9_]+")
+# Generated names in the SV package that must all trace back to the YAML.
+PKG_EXTRA_RE = re.compile(PKG_PREFIX + r"_(?:ADR|RST)_[A-Z0-9_]+|" + PKG_PREFIX + r"_[A-Z0-9_]+_(?:BIT|LSB|MASK)")
+PKG_FILE = "home_inventory_regmap_pkg.sv"
+VH_FILE = "regmap_params.vh"
+MASK32 = 0xFFFFFFFF
 
 
 @dataclass(frozen=True)
@@ -44,30 +57,28 @@ class Problem:
 
 
 def load_yaml_regs(yaml_path: Path) -> Dict[str, int]:
-    data = yaml.safe_load(yaml_path.read_text())
-    if not isinstance(data, dict) or "blocks" not in data:
-        raise ValueError(f"Unexpected YAML shape in {yaml_path}")
+    try:
+        rm = load_regmap(yaml_path)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Unexpected YAML shape in {yaml_path}: {e}")
 
     regs: Dict[str, int] = {}
     problems: List[Problem] = []
 
-    for blk in data.get("blocks", []):
-        base = int(str(blk.get("base", "0")), 0)
-        for r in blk.get("registers", []):
-            name = r.get("name")
-            if not name:
-                problems.append(Problem("yaml", f"register missing name in block {blk.get('name')!r}"))
-                continue
-            offset = int(str(r.get("offset", "0")), 0)
-            addr = base + offset
-            key = f"ADR_{name}"
-            if key in regs:
-                problems.append(Problem("yaml", f"duplicate register name {name} (key {key})"))
-                continue
-            regs[key] = addr
+    for r in rm.iter_flat():
+        name = r.name
+        if not name:
+            problems.append(Problem("yaml", f"register missing name in block {r.block!r}"))
+            continue
+        addr = r.addr
+        key = f"ADR_{name}"
+        if key in regs:
+            problems.append(Problem("yaml", f"duplicate register name {name} (key {key})"))
+            continue
+        regs[key] = addr
 
-            if addr % 4 != 0:
-                problems.append(Problem("yaml", f"{name} address 0x{addr:08X} not word-aligned"))
+        if addr % 4 != 0:
+            problems.append(Problem("yaml", f"{name} address 0x{addr:08X} not word-aligned"))
 
     # also ensure unique addresses
     addr_to_keys: Dict[int, List[str]] = {}
@@ -85,62 +96,42 @@ def load_yaml_regs(yaml_path: Path) -> Dict[str, int]:
     return regs
 
 
-def _read_rtl_with_includes(path: Path, *, _seen: set[Path] | None = None) -> str:
-    """Return RTL text with simple `include expansion.
-
-    We expand `include "..." directives so ADR_* localparams can live in a
-    generated include file.
-
-    Rules:
-      - Only quote-form includes are supported.
-      - Include paths are resolved relative to the including file.
-      - Cycles are detected and rejected.
-    """
-
-    if _seen is None:
-        _seen = set()
-    path = path.resolve()
-    if path in _seen:
-        raise ValueError(f"include cycle detected at {path}")
-    _seen.add(path)
-
-    out_lines: list[str] = []
-    inc_re = re.compile(r"^\s*`include\s+\"([^\"]+)\"\s*$")
+def default_rtl_root(rtl_path: Path) -> Path:
+    """The `rtl/` directory containing rtl_path (else its parent directory)."""
 
-    for line in path.read_text().splitlines():
-        m = inc_re.match(line)
-        if not m:
-            out_lines.append(line)
-            continue
-        inc_path = (path.parent / m.group(1)).resolve()
-        out_lines.append(f"// BEGIN_INCLUDE {inc_path}")
-        out_lines.append(_read_rtl_with_includes(inc_path, _seen=_seen))
-        out_lines.append(f"// END_INCLUDE {inc_path}")
+    p = rtl_path.resolve()
+    for parent in p.parents:
+        if parent.name == "rtl":
+            return parent
+    return p.parent
 
-    return "\n".join(out_lines) + "\n"
 
+def load_rtl_adrs(rtl_path: Path, index: Optional[RtlIndex] = None) -> Dict[str, int]:
+    """ADR_* localparams visible in rtl_path (its own plus `include`d files)."""
 
-def load_rtl_adrs(rtl_path: Path) -> Dict[str, int]:
     regs: Dict[str, int] = {}
     problems: List[Problem] = []
 
     try:
-        rtl_text = _read_rtl_with_includes(rtl_path)
+        idx = index or RtlIndex(default_rtl_root(rtl_path))
+        key = idx.key(rtl_path)
+        files = idx.closure(key)
     except Exception as e:
         problems.append(Problem("rtl", f"failed to read RTL/includes: {e}"))
-        rtl_text = ""
+        idx, files = None, []
 
-    for ln, line in enumerate(rtl_text.splitlines(), start=1):
-        m = ADR_RE.match(line)
-        if not m:
-            continue
-        name, hexv = m.group(1), m.group(2)
-        hexv = hexv.replace("_", "")
-        addr = int(hexv, 16)
-        if name in regs:
-            problems.append(Problem("rtl", f"duplicate localparam {name} (expanded) at {rtl_path}:{ln}"))
-            continue
-        regs[name] = addr
+    for k in files:
+        for c in idx.consts(k):
+            if c.kind != "localparam" or not ADR_NAME_RE.fullmatch(c.name):
+                continue
+            if c.name in regs:
+                problems.append(Problem("rtl", f"duplicate localparam {c.name} (expanded) at {c.where}"))
+                continue
+            v = idx.value(c)
+            if v is None:
+                problems.append(Problem("rtl", f"cannot evaluate {c.name} = {c.expr} at {c.where}"))
+                continue
+            regs[c.name] = v & MASK32
 
     if not regs:
         problems.append(Problem("rtl", f"no ADR_* localparams found in {rtl_path} (after include expansion)"))
@@ -153,6 +144,120 @@ def load_rtl_adrs(rtl_path: Path) -> Dict[str, int]:
     return regs
 
 
+def expected_pkg_consts(rm: RegMap) -> Dict[str, int]:
+    """Constants ops/gen_regmap_sv_pkg.py should have emitted for this regmap."""
+
+    indexed = rm.arrays_mode == "indexed"
+    out: Dict[str, int] = {}
+    for r in rm.sorted_by_addr(flat=not indexed):
+        if not r.name:
+            continue
+        if r.is_array:
+            out[f"{PKG_PREFIX}_ADR_{r.name}_BASE"] = r.addr
+            out[f"{PKG_PREFIX}_ADR_{r.name}_COUNT"] = r.count
+            out[f"{PKG_PREFIX}_ADR_{r.name}_STRIDE"] = r.stride
+        else:
+            out[f"{PKG_PREFIX}_ADR_{r.name}"] = r.addr
+        if r.reset is not None:
+            out[f"{PKG_PREFIX}_RST_{r.name}"] = r.reset & MASK32
+        for f in r.fields:
+            if not (f.name and f.bits_ok):
+                continue
+            pre = f"{PKG_PREFIX}_{r.name}_{f.name}"
+            out[f"{pre}_BIT" if f.width == 1 else f"{pre}_LSB"] = f.shift
+            out[f"{pre}_MASK"] = f.mask & MASK32
+    if rm.arrays_mode == "both":
+        for r in rm.registers:
+            if r.is_array and r.name:
+                out[f"{PKG_PREFIX}_ADR_{r.name}_BASE"] = r.addr
+                out[f"{PKG_PREFIX}_ADR_{r.name}_COUNT"] = r.count
+                out[f"{PKG_PREFIX}_ADR_{r.name}_STRIDE"] = r.stride
+    return out
+
+
+def check_consts(expected: Dict[str, int], idx: RtlIndex, key: str, *, kind: str, extra_re: re.Pattern) -> List[Problem]:
+    """Compare expected constants with those visible in one indexed file.
+
+    Names matching extra_re that the file defines but `expected` lacks are
+    reported too (stale constants left behind after a YAML edit).
+    """
+
+    problems: List[Problem] = []
+    try:
+        scope = idx.scope(key)
+    except ValueError as e:
+        return [Problem(kind, str(e))]
+    for name in sorted(expected):
+        c = scope.get(name)
+        if c is None:
+            problems.append(Problem(kind, f"missing in {key}: {name} (expected 0x{expected[name]:08X})"))
+            continue
+        v = idx.value(c, scope)
+        if v is None:
+            problems.append(Problem(kind, f"cannot evaluate {name} = {c.expr} at {c.where}"))
+        elif v & MASK32 != expected[name]:
+            problems.append(Problem(kind, f"value mismatch {name}: YAML=0x{expected[name]:08X} RTL=0x{v & MASK32:08X} at {c.where}"))
+    for name in sorted(set(scope) - set(expected)):
+        if extra_re.fullmatch(name):
+            problems.append(Problem(kind, f"extra in {key}: {name} at {scope[name].where}"))
+    return problems
+
+
+def check_stray_adrs(yaml_regs: Dict[str, int], idx: RtlIndex, skip: Set[str] = frozenset()) -> List[Problem]:
+    """Any ADR_<REG> / HOMEINV_ADR_<REG> anywhere in the tree must match the YAML.
+
+    Files in `skip` (already checked in full) are not reported twice.
+    """
+
+    problems: List[Problem] = []
+    for name, addr in sorted(yaml_regs.items()):
+        for alias in (name, f"{PKG_PREFIX}_{name}"):
+            for c in idx.lookup(alias):
+                if c.path in skip:
+                    continue
+                v = idx.value(c)
+                if v is not None and v & MASK32 != addr:
+                    problems.append(Problem("mismatch", f"stale copy {alias}: YAML=0x{addr:08X} RTL=0x{v & MASK32:08X} at {c.where}"))
+    return problems
+
+
+def run_checks(
+    yaml_path: Path,
+    rtl_path: Path,
+    *,
+    root: Optional[Path] = None,
+    pkg: Optional[Path] = None,
+    vh: Optional[Path] = None,
+    use_cache: bool = True,
+) -> Tuple[int, List[Problem]]:
+    """All YAML-vs-RTL checks; returns (number of YAML registers, problems).
+
+    pkg/vh default to <root>/include/home_inventory_regmap_pkg.sv and
+    <root>/include/regmap_params.vh and are skipped if those do not exist.
+    """
+
+    root = (root or default_rtl_root(rtl_path)).resolve()
+    idx = RtlIndex(root, use_cache=use_cache)
+    rm = load_regmap(yaml_path)
+    yaml_regs = load_yaml_regs(yaml_path)
+
+    problems = diff_maps(yaml_regs, load_rtl_adrs(rtl_path, idx))
+    checked = set(idx.closure(idx.key(rtl_path)))
+    pkg = pkg or (root / "include" / PKG_FILE if (root / "include" / PKG_FILE).is_file() else None)
+    vh = vh or (root / "include" / VH_FILE if (root / "include" / VH_FILE).is_file() else None)
+    try:
+        if pkg is not None:
+            problems += check_consts(expected_pkg_consts(rm), idx, idx.key(pkg), kind="pkg", extra_re=PKG_EXTRA_RE)
+            checked.add(idx.key(pkg))
+        if vh is not None:
+            problems += check_consts(yaml_regs, idx, idx.key(vh), kind="vh", extra_re=ADR_NAME_RE)
+            checked.add(idx.key(vh))
+    except ValueError as e:
+        problems.append(Problem("rtl", str(e)))
+    problems += check_stray_adrs(yaml_regs, idx, checked)
+    return len(yaml_regs), problems
+
+
 def diff_maps(yaml_regs: Dict[str, int], rtl_regs: Dict[str, int]) -> List[Problem]:
     problems: List[Problem] = []
 
@@ -186,19 +291,22 @@ def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--yaml", required=True, type=Path)
     ap.add_argument("--rtl", required=True, type=Path)
+    ap.add_argument("--rtl-root", type=Path, default=None, help="Tree to index (default: the rtl/ dir containing --rtl)")
+    ap.add_argument("--pkg", type=Path, default=None, help=f"SV package to check (default: <rtl-root>/include/{PKG_FILE})")
+    ap.add_argument("--vh", type=Path, default=None, help=f"Verilog params include to check (default: <rtl-root>/include/{VH_FILE})")
+    ap.add_argument("--no-cache", action="store_true", help="Do not read or write the on-disk RTL index")
     args = ap.parse_args()
 
-    yaml_regs = load_yaml_regs(args.yaml)
-    rtl_regs = load_rtl_adrs(args.rtl)
-
-    problems = diff_maps(yaml_regs, rtl_regs)
+    n_regs, problems = run_checks(
+        args.yaml, args.rtl, root=args.rtl_root, pkg=args.pkg, vh=args.vh, use_cache=not args.no_cache
+    )
     if problems:
         for p in problems:
             print(f"ERROR[{p.kind}]: {p.msg}", file=sys.stderr)
         return 1
 
     # lightweight summary for CI logs
-    print(f"OK: {len(yaml_regs)} regs match between {args.yaml} and {args.rtl}")
+    print(f"OK: {n_regs} regs match between {args.yaml} and {args.rtl} (+ regmap pkg/params constants)")
     return 0
 
 
@@ -22,13 +22,7 @@ import argparse
 import datetime
 from pathlib import Path
 
-try:
-    import yaml  # type: ignore
-except Exception as e:
-    raise SystemExit(
-        "PyYAML is required to run this generator. Install with: pip install pyyaml\n"
-        f"Original import error: {e}"
-    )
+from regmodel import load_regmap
 
 
 def u32_hex(x: int) -> str:
@@ -48,16 +42,6 @@ def sanitize(name: str) -> str:
     return s.strip("_")
 
 
-def bits_to_shift_mask(bits) -> tuple[int, int]:
-    # bits: [msb, lsb]
-    msb, lsb = int(bits[0]), int(bits[1])
-    if msb < lsb:
-        msb, lsb = lsb, msb
-    width = msb - lsb + 1
-    mask = ((1 << width) - 1) << lsb
-    return lsb, mask
-
-
 def main() -> None:
     ap = argparse.ArgumentParser()
     ap.add_argument("--in", dest="inp", required=True)
@@ -67,17 +51,14 @@ def main() -> None:
     inp = Path(args.inp)
     outp = Path(args.outp)
 
-    data = yaml.safe_load(inp.read_text())
-
-    version = data.get("version")
-    blocks = data.get("blocks", [])
+    rm = load_regmap(inp)
 
     lines: list[str] = []
     lines.append("// AUTO-GENERATED FILE. DO NOT EDIT BY HAND.")
     lines.append(f"// Source: {inp.as_posix()}")
     now_utc = datetime.datetime.now(datetime.UTC)
     lines.append(f"// Generated: {now_utc.isoformat(timespec='seconds').replace('+00:00','Z')}")
-    lines.append(f"// Regmap version: {version}")
+    lines.append(f"// Regmap version: {rm.version}")
     lines.append("")
     guard = "HIP_REGMAP_V1_H_"
     lines.append(f"#ifndef {guard}")
@@ -88,25 +69,18 @@ def main() -> None:
     lines.append("// All addresses are byte offsets from the IP base address.")
     lines.append("")
 
-    for blk in blocks:
-        blk_name = blk.get("name", "")
-        base = int(blk.get("base", 0), 0) if isinstance(blk.get("base"), str) else int(blk.get("base", 0))
-        regs = blk.get("registers", [])
-
-        lines.append(f"// ---- block: {blk_name} (base {u32_hex(base)}) ----")
-        for reg in regs:
-            rname = sanitize(reg["name"])
-            offset = int(reg.get("offset", 0), 0) if isinstance(reg.get("offset"), str) else int(reg.get("offset", 0))
-            addr = base + offset
-            lines.append(f"#define HIP_REG_{rname:<24} {u32_hex(addr)}")
-
-            fields = reg.get("fields")
-            if fields:
-                for f in fields:
-                    fname = sanitize(f["name"])
-                    shift, mask = bits_to_shift_mask(f["bits"])
-                    lines.append(f"#define HIP_{rname}_{fname}_SHIFT{'' :<8} {shift}u")
-                    lines.append(f"#define HIP_{rname}_{fname}_MASK{'' :<9} {u32_hex(mask)}")
+    for blk in rm.blocks:
+        lines.append(f"// ---- block: {blk.name} (base {u32_hex(blk.base)}) ----")
+        for reg in (el for r in blk.registers for el in r.expand()):
+            rname = sanitize(reg.name)
+            lines.append(f"#define HIP_REG_{rname:<24} {u32_hex(reg.addr)}")
+
+            for f in reg.fields:
+                fname = sanitize(f.name)
+                if not f.bits_ok:
+                    raise ValueError(f"Field bits for {reg.name}.{f.name} must be [msb, lsb]")
+                lines.append(f"#define HIP_{rname}_{fname}_SHIFT{'' :<8} {f.shift}u")
+                lines.append(f"#define HIP_{rname}_{fname}_MASK{'' :<9} {u32_hex(f.mask)}")
 
         lines.append("")
 
@@ -22,27 +22,20 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-import yaml
+from regmodel import load_regmap
 
 
 def load_regs(yaml_path: Path) -> list[tuple[str, int]]:
-    data = yaml.safe_load(yaml_path.read_text())
-    if not isinstance(data, dict) or "blocks" not in data:
-        raise ValueError(f"Unexpected YAML shape in {yaml_path}")
+    rm = load_regmap(yaml_path)
 
     regs: list[tuple[str, int]] = []
 
-    for blk in data.get("blocks", []):
-        base = int(str(blk.get("base", "0")), 0)
-        for r in blk.get("registers", []):
-            name = r.get("name")
-            if not name:
-                raise ValueError(f"register missing name in block {blk.get('name')!r}")
-            offset = int(str(r.get("offset", "0")), 0)
-            addr = base + offset
-            if addr % 4 != 0:
-                raise ValueError(f"{name} address 0x{addr:08X} not word-aligned")
-            regs.append((f"ADR_{name}", addr))
+    for r in rm.iter_flat():
+        if not r.name:
+            raise ValueError(f"register missing name in block {r.block!r}")
+        if r.addr % 4 != 0:
+            raise ValueError(f"{r.name} address 0x{r.addr:08X} not word-aligned")
+        regs.append((f"ADR_{r.name}", r.addr))
 
     # stable ordering: by address, then name
     regs.sort(key=lambda kv: (kv[1], kv[0]))
@@ -58,8 +51,8 @@ def load_regs(yaml_path: Path) -> list[tuple[str, int]]:
     return regs
 
 
-def emit(out_path: Path, yaml_path: Path, regs: list[tuple[str, int]]) -> None:
-    out_path.parent.mkdir(parents=True, exist_ok=True)
+def render(yaml_path: Path, regs: list[tuple[str, int]]) -> str:
+    """Return the full include file text (used by ops/regmap_gen.py too)."""
 
     # Keep a stable, repo-root relative source path when generating from the
     # canonical spec file, even if invoked from subdirectories.
@@ -77,7 +70,12 @@ def emit(out_path: Path, yaml_path: Path, regs: list[tuple[str, int]]) -> None:
 
     lines.append("")
 
-    out_path.write_text("\n".join(lines))
+    return "\n".join(lines)
+
+
+def emit(out_path: Path, yaml_path: Path, regs: list[tuple[str, int]]) -> None:
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(render(yaml_path, regs))
 
 
 def main() -> int:
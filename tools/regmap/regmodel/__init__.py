@@ -0,0 +1,28 @@
+"""Shared register-map model for the regmap generators and checkers.
+
+    from regmodel import load_regmap
+    rm = load_regmap("spec/regmap_v1.yaml")
+    for reg in rm.sorted_by_addr():
+        print(reg.name, hex(reg.addr), [(f.name, hex(f.mask)) for f in reg.fields])
+
+Scripts under tools/regmap/ import this directly; scripts elsewhere (ops/)
+put tools/regmap on sys.path first.
+"""
+
+from .loader import cache_dir, load_regmap, load_yaml_text
+from .model import ARRAY_MODES, MODEL_VERSION, Block, Field, RegMap, Register, field_mask, parse_int, parse_int_maybe
+
+__all__ = [
+    "ARRAY_MODES",
+    "MODEL_VERSION",
+    "Block",
+    "Field",
+    "RegMap",
+    "Register",
+    "cache_dir",
+    "field_mask",
+    "load_regmap",
+    "load_yaml_text",
+    "parse_int",
+    "parse_int_maybe",
+]
@@ -0,0 +1,102 @@
+"""Load spec/regmap_v1.yaml into a RegMap, with an on-disk cache.
+
+Parsing uses PyYAML's libyaml-backed CSafeLoader when available (same result as
+yaml.safe_load, several times faster) and falls back to the pure-Python
+SafeLoader otherwise.
+
+The built model is pickled to a cache directory keyed by the SHA-256 of the
+YAML bytes (plus MODEL_VERSION), so a second tool run on an unchanged spec
+skips YAML entirely; any edit changes the key. Cache location:
+  $REGMAP_CACHE_DIR, else $XDG_CACHE_HOME/home-inventory/regmap, else
+  ~/.cache/home-inventory/regmap. Set REGMAP_CACHE_DIR to an empty string to
+  disable the cache. Unreadable or stale cache entries are ignored silently.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .model import MODEL_VERSION, RegMap
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+import cache_paths  # noqa: E402  (tools/cache_paths.py)
+
+try:
+    import yaml
+except ImportError:  # reported on first load with an install hint
+    yaml = None
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# In-process memo: one parse per (path, content) even if several emitters ask.
+_MEMO: Dict[Tuple[str, str], RegMap] = {}
+
+
+def cache_dir() -> Optional[Path]:
+    return cache_paths.cache_dir("regmap", "REGMAP_CACHE_DIR")
+
+
+def load_yaml_text(text: Union[str, bytes]) -> Dict[str, Any]:
+    """Parse regmap YAML text with the fastest available safe loader."""
+
+    if yaml is None:
+        raise SystemExit("PyYAML is required for the regmap tools. Install with: pip install pyyaml")
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(text, Loader=loader)
+    if not isinstance(data, dict):
+        raise ValueError("YAML top-level must be a mapping")
+    return data
+
+
+def _read_cache(path: Path) -> Optional[RegMap]:
+    try:
+        with path.open("rb") as f:
+            obj = pickle.load(f)
+    except Exception:
+        return None
+    return obj if isinstance(obj, RegMap) else None
+
+
+def _write_cache(path: Path, model: RegMap) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # read-only checkout / full disk: the cache is best-effort
+
+
+def load_regmap(path: PathLike, *, use_cache: bool = True) -> RegMap:
+    """Return the RegMap for a regmap YAML file.
+
+    `source` on the result is the path as given (generators print it in
+    headers), so cached models are re-labelled for the current caller.
+    """
+
+    raw = Path(path).read_bytes()
+    sha = hashlib.sha256(raw).hexdigest()
+    source = os.fspath(path)
+
+    memo = _MEMO.get((source, sha))
+    if memo is not None:
+        return memo
+
+    cdir = cache_dir() if use_cache else None
+    cpath = cdir / f"{sha}.v{MODEL_VERSION}.pickle" if cdir is not None else None
+    model = _read_cache(cpath) if cpath is not None else None
+    if model is None or model.sha256 != sha:
+        model = RegMap(load_yaml_text(raw), source=source, sha256=sha)
+        if cpath is not None:
+            _write_cache(cpath, model)
+    model.source = source
+
+    _MEMO[(source, sha)] = model
+    return model
@@ -0,0 +1,293 @@
+"""Compact in-memory model of spec/regmap_v1.yaml.
+
+The classes are slotted and carry everything the generators/checkers used to
+recompute on their own: absolute byte addresses, field masks/shifts/widths and
+parsed reset values. They are deliberately lenient: malformed entries (missing
+names, bad bit ranges, unparsable resets) are kept with the problem recorded,
+so ops/regmap_validate.py can report every issue instead of stopping at the
+first exception.
+
+Register arrays: a register entry with `count: N` (and optional `stride:`,
+default 4 bytes) stands for N registers NAME0..NAME{N-1} at offset + i*stride;
+`{i}` in its desc is replaced by the index. The model keeps such an entry as
+one Register (count/stride set) and only materializes the N element views when
+a caller asks for flat names (RegMap.iter_flat / Register.expand), so checks
+that can work on address intervals never pay for the expansion.
+
+The optional top-level `codegen: {arrays: flat|indexed|both}` tells the C/SV
+generators whether to emit one define per element (flat, the default), one
+indexed accessor per array, or both.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Bump when the model layout changes so stale on-disk caches are ignored.
+MODEL_VERSION = 2
+
+REG_BYTES = 4
+
+# Accepted values of the top-level codegen.arrays key.
+ARRAY_MODES = ("flat", "indexed", "both")
+
+
+def parse_int(x: Any) -> int:
+    """Parse an int that may be encoded as int or a hex ("0x...") / decimal string."""
+
+    if isinstance(x, bool):
+        raise TypeError(f"Unsupported int value: {x!r}")
+    if isinstance(x, int):
+        return x
+    if isinstance(x, str):
+        s = x.strip().lower()
+        return int(s, 16) if s.startswith("0x") else int(s, 10)
+    raise TypeError(f"Unsupported int value: {x!r}")
+
+
+def parse_int_maybe(x: Any) -> Optional[int]:
+    """Like parse_int(), but null stays None."""
+
+    return None if x is None else parse_int(x)
+
+
+def field_mask(msb: int, lsb: int) -> int:
+    width = msb - lsb + 1
+    return ((1 << width) - 1) << lsb
+
+
+class Field:
+    __slots__ = (
+        "name",
+        "bits",
+        "msb",
+        "lsb",
+        "width",
+        "shift",
+        "mask",
+        "access",
+        "reset_raw",
+        "reset",
+        "reset_error",
+        "desc",
+    )
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self.name: Optional[str] = raw.get("name")
+        self.bits: Any = raw.get("bits")
+        self.access: Optional[str] = raw.get("access")
+        self.desc: Any = raw.get("desc")
+        self.reset_raw: Any = raw.get("reset")
+        self.reset, self.reset_error = _parse_reset(self.reset_raw)
+
+        # msb/lsb are kept as written; width/shift/mask describe the covered
+        # bits even when msb < lsb (the validator flags that separately).
+        self.msb = self.lsb = self.width = self.shift = self.mask = None  # type: Optional[int]
+        if isinstance(self.bits, list) and len(self.bits) == 2:
+            try:
+                msb, lsb = int(self.bits[0]), int(self.bits[1])
+            except (TypeError, ValueError):
+                return
+            self.msb, self.lsb = msb, lsb
+            hi, lo = max(self.msb, self.lsb), min(self.msb, self.lsb)
+            self.width = hi - lo + 1
+            self.shift = lo
+            self.mask = field_mask(hi, lo)
+
+    @property
+    def bits_ok(self) -> bool:
+        return self.msb is not None
+
+    def __repr__(self) -> str:
+        return f"Field({self.name!r}, bits={self.bits!r})"
+
+
+class Register:
+    __slots__ = (
+        "name",
+        "block",
+        "offset",
+        "addr",
+        "access",
+        "reset_raw",
+        "reset",
+        "reset_error",
+        "desc",
+        "fields",
+        "count",
+        "stride",
+        "index",
+    )
+
+    def __init__(self, raw: Dict[str, Any], block: str, base: int) -> None:
+        self.name: Optional[str] = raw.get("name")
+        self.block = block
+        self.offset = parse_int(raw.get("offset", 0))
+        self.addr = base + self.offset
+        self.access: Optional[str] = raw.get("access")
+        self.desc: Any = raw.get("desc")
+        self.reset_raw: Any = raw.get("reset")
+        self.reset, self.reset_error = _parse_reset(self.reset_raw)
+        self.fields: List[Field] = [Field(f) for f in (raw.get("fields") or []) if isinstance(f, dict)]
+        # Array declaration (count is None for a plain register).
+        self.count: Optional[int] = parse_int(raw["count"]) if raw.get("count") is not None else None
+        self.stride: int = parse_int(raw.get("stride", REG_BYTES))
+        # Element index when this object is one expanded element of an array.
+        self.index: Optional[int] = None
+
+    @property
+    def is_array(self) -> bool:
+        return self.count is not None
+
+    @property
+    def n_flat(self) -> int:
+        """Number of flat registers this entry stands for."""
+
+        return self.count if self.count is not None else 1
+
+    @property
+    def span(self) -> Tuple[int, int]:
+        """Covered byte-address interval [start, end)."""
+
+        if self.count is None:
+            return self.addr, self.addr + REG_BYTES
+        return self.addr, self.addr + max(self.count - 1, 0) * self.stride + REG_BYTES
+
+    @property
+    def qualname(self) -> str:
+        return f"{self.block}.{self.name}"
+
+    def element(self, i: int) -> "Register":
+        """Return the i-th element of an array as a plain (count=None) register."""
+
+        if self.count is None or not 0 <= i < self.count:
+            raise IndexError(f"{self.name}: element {i} out of range")
+        el = object.__new__(Register)
+        for slot in Register.__slots__:
+            setattr(el, slot, getattr(self, slot))
+        el.name = f"{self.name}{i}"
+        el.addr = self.addr + i * self.stride
+        el.offset = self.offset + i * self.stride
+        el.desc = self.desc.replace("{i}", str(i)) if isinstance(self.desc, str) else self.desc
+        el.count, el.index = None, i
+        return el
+
+    def expand(self) -> Iterator["Register"]:
+        """Yield the flat register(s) for this entry (itself for a plain register)."""
+
+        if self.count is None:
+            yield self
+        else:
+            for i in range(self.count):
+                yield self.element(i)
+
+    def __repr__(self) -> str:
+        if self.count is not None:
+            return f"Register({self.name!r}, addr=0x{self.addr:08X}, count={self.count}, stride={self.stride})"
+        return f"Register({self.name!r}, addr=0x{self.addr:08X})"
+
+
+class Block:
+    __slots__ = ("name", "base", "registers")
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self.name: str = raw.get("name", "<unnamed>")
+        self.base = parse_int(raw.get("base", 0))
+        self.registers: List[Register] = [
+            Register(r, self.name, self.base) for r in (raw.get("registers") or []) if isinstance(r, dict)
+        ]
+
+    def __repr__(self) -> str:
+        return f"Block({self.name!r}, base=0x{self.base:08X}, {len(self.registers)} registers)"
+
+
+class RegMap:
+    __slots__ = ("source", "sha256", "version", "bus", "codegen", "blocks", "registers", "by_name", "_spans")
+
+    def __init__(self, doc: Dict[str, Any], *, source: str = "", sha256: str = "") -> None:
+        self.source = source
+        self.sha256 = sha256
+        self.version: Any = doc.get("version")
+        bus = doc.get("bus")
+        self.bus: Dict[str, Any] = bus if isinstance(bus, dict) else {}
+        codegen = doc.get("codegen")
+        self.codegen: Dict[str, Any] = codegen if isinstance(codegen, dict) else {}
+        self.blocks: List[Block] = [Block(b) for b in (doc.get("blocks") or []) if isinstance(b, dict)]
+        # Declared entries: an array is a single Register here.
+        self.registers: List[Register] = [r for b in self.blocks for r in b.registers]
+        # First definition wins; duplicates are a validator concern.
+        self.by_name: Dict[str, Register] = {}
+        for r in self.registers:
+            if r.name:
+                self.by_name.setdefault(r.name, r)
+        # (start, end, entry) sorted by start, for address lookups.
+        self._spans: List[Tuple[int, int, Register]] = sorted(
+            ((*r.span, r) for r in self.registers), key=lambda t: (t[0], t[1])
+        )
+
+    @property
+    def arrays_mode(self) -> str:
+        """How generators emit arrays: "flat" (default), "indexed" or "both"."""
+
+        return str(self.codegen.get("arrays") or "flat")
+
+    @property
+    def n_flat(self) -> int:
+        return sum(r.n_flat for r in self.registers)
+
+    def iter_flat(self) -> Iterator[Register]:
+        """Yield flat registers in declaration order, expanding arrays on the fly."""
+
+        for r in self.registers:
+            yield from r.expand()
+
+    def sorted_by_addr(self, *, flat: bool = True) -> List[Register]:
+        """Registers in address order (stable for equal addresses).
+
+        flat=False keeps arrays as single entries (ordered by their first element).
+        """
+
+        regs = self.iter_flat() if flat else self.registers
+        return sorted(regs, key=lambda r: r.addr)
+
+    def find(self, name: str) -> Optional[Register]:
+        """Look up a register by flat name (NAME or array element NAMEi)."""
+
+        r = self.by_name.get(name)
+        if r is not None and r.count is None:
+            return r
+        stem = name.rstrip("0123456789")
+        if stem != name:
+            arr = self.by_name.get(stem)
+            if arr is not None and arr.count is not None:
+                i = int(name[len(stem) :])
+                if i < arr.count:
+                    return arr.element(i)
+        return None
+
+    def at(self, addr: int) -> Optional[Register]:
+        """Return the flat register whose word contains byte address `addr`."""
+
+        # Spans are sorted by start; strided arrays may interleave, so every
+        # entry starting at or below addr is a candidate.
+        for i in range(bisect.bisect_right(self._spans, addr, key=lambda t: t[0]) - 1, -1, -1):
+            start, end, r = self._spans[i]
+            if not start <= addr < end:
+                continue
+            if r.count is None:
+                return r
+            k, rem = divmod(addr - start, r.stride)
+            if rem < REG_BYTES:
+                return r.element(k)
+        return None
+
+    def __repr__(self) -> str:
+        return f"RegMap({self.source!r}, {len(self.blocks)} blocks, {len(self.registers)} entries, {self.n_flat} registers)"
+
+
+def _parse_reset(raw: Any) -> "tuple[Optional[int], Optional[str]]":
+    try:
+        return parse_int_maybe(raw), None
+    except Exception as e:
+        return None, str(e)
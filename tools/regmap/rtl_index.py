@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""Persistent index of `localparam` / `define` constants across the RTL tree.
+
+Why:
+- check_regmap.py used to re-read and textually expand `include`s on every
+  run, and could only see ADR_* in one file.
+- This index parses every rtl/**/*.v, rtl/**/*.vh, rtl/**/*.sv and
+  rtl/include/* file once, records each file's constants and `include`s, and
+  stores the result in the regmodel cache directory (rtl_index.json).
+
+Invalidation:
+- A file whose (mtime_ns, size) is unchanged is reused without being read.
+- Otherwise it is hashed; if the SHA-256 still matches (touch, checkout) only
+  the stat is refreshed, else the file is re-parsed.
+- Files that disappeared are dropped; new files are parsed.
+
+Values are kept as expression text plus the integer value when it can be
+evaluated from the file alone; `value()` re-evaluates with the constants of
+included files in scope (e.g. `(32'h1 << HOMEINV_X_BIT)`).
+
+Usage:
+  python3 tools/regmap/rtl_index.py [--root rtl] [NAME ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from regmodel import cache_dir
+
+# Bump when the on-disk entry layout or the parser changes.
+INDEX_VERSION = 1
+
+_INDEX_FILE = "rtl_index.json"
+_SUFFIXES = (".v", ".vh", ".sv", ".svh")
+
+_INCLUDE_RE = re.compile(r'^[ \t]*`include[ \t]+"([^"]+)"', re.M)
+_DEFINE_RE = re.compile(r"^[ \t]*`define[ \t]+([A-Za-z_]\w*)(\([^)]*\))?[ \t]*((?:[^\n\\]|\\.|\\\n)*)", re.M)
+_LOCALPARAM_RE = re.compile(r"\blocalparam\b(.*?);", re.S)
+_ASSIGN_RE = re.compile(r"(?<![\w$])([A-Za-z_]\w*)\s*=(?!=)\s*(.*)\Z", re.S)
+_LITERAL_RE = re.compile(r"(\d[\d_]*)?\s*'\s*[sS]?([bBoOdDhH])\s*([0-9a-fA-F_xXzZ?]+)")
+_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<lit>(?:\d[\d_]*)?\s*'\s*[sS]?[bBoOdDhH]\s*[0-9a-fA-F_xXzZ?]+)"
+    r"|(?P<num>\d[\d_]*)"
+    r"|(?P<clog2>\$clog2)"
+    r"|(?P<name>`?[A-Za-z_]\w*)"
+    r"|(?P<op><<<|>>>|<<|>>|[-+*/%&|^~()])"
+    r")"
+)
+_BASES = {"b": 2, "o": 8, "d": 10, "h": 16}
+
+
+@dataclass(frozen=True)
+class Const:
+    name: str
+    kind: str  # "localparam" | "define"
+    expr: str
+    value: Optional[int]  # None when it needs other files (or is not numeric)
+    path: str
+    line: int
+
+    @property
+    def where(self) -> str:
+        return f"{self.path}:{self.line}"
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+
+def _strip_comments(text: str) -> str:
+    """Blank out // and /* */ comments, keeping newlines (line numbers) and strings."""
+
+    out: List[str] = []
+    i, n = 0, len(text)
+    while i < n:
+        c = text[i]
+        if c == '"':
+            j = i + 1
+            while j < n and text[j] != '"' and text[j] != "\n":
+                j += 2 if text[j] == "\\" else 1
+            out.append(text[i : j + 1])
+            i = j + 1
+        elif text.startswith("//", i):
+            j = text.find("\n", i)
+            i = n if j < 0 else j
+        elif text.startswith("/*", i):
+            j = text.find("*/", i + 2)
+            j = n if j < 0 else j + 2
+            out.append("\n" * text.count("\n", i, j))
+            i = j
+        else:
+            j = i
+            while j < n and text[j] not in '"/':
+                j += 1
+            if j == i:  # a lone '/'
+                j += 1
+            out.append(text[i:j])
+            i = j
+    return "".join(out)
+
+
+def _split_top(s: str) -> List[str]:
+    """Split a declaration list on commas outside (), [] and {}."""
+
+    parts: List[str] = []
+    depth, start = 0, 0
+    for i, c in enumerate(s):
+        if c in "([{":
+            depth += 1
+        elif c in ")]}":
+            depth -= 1
+        elif c == "," and depth == 0:
+            parts.append(s[start:i])
+            start = i + 1
+    parts.append(s[start:])
+    return parts
+
+
+def _literal(text: str) -> int:
+    m = _LITERAL_RE.fullmatch(text.strip())
+    if m is None:
+        raise ValueError(f"bad literal {text!r}")
+    digits = m.group(3).replace("_", "")
+    if any(ch in "xXzZ?" for ch in digits):
+        raise ValueError(f"x/z literal {text!r}")
+    return int(digits, _BASES[m.group(2).lower()])
+
+
+_OPS = {"<<<": "<<", ">>>": ">>", "/": "//"}
+_ALLOWED = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.LShift,
+    ast.RShift,
+    ast.BitAnd,
+    ast.BitOr,
+    ast.BitXor,
+    ast.Invert,
+    ast.USub,
+    ast.UAdd,
+    ast.Call,
+    ast.Name,
+    ast.Load,
+)
+
+
+def _clog2(x: int) -> int:
+    return max(int(x) - 1, 0).bit_length()
+
+
+def evaluate(expr: str, lookup) -> int:
+    """Evaluate a constant Verilog integer expression.
+
+    `lookup(name)` returns the int value of an identifier (or raises KeyError).
+    Only literals, + - * / % << >> & | ^ ~, parentheses and $clog2 are accepted.
+    """
+
+    py: List[str] = []
+    pos, expr = 0, expr.strip()
+    while pos < len(expr):
+        m = _TOKEN_RE.match(expr, pos)
+        if m is None or m.end() == pos:
+            raise ValueError(f"unsupported expression {expr!r}")
+        pos = m.end()
+        kind = m.lastgroup
+        tok = m.group(kind)
+        if kind == "lit":
+            py.append(str(_literal(tok)))
+        elif kind == "num":
+            py.append(str(int(tok.replace("_", ""))))
+        elif kind == "clog2":
+            py.append("clog2")
+        elif kind == "name":
+            py.append(str(lookup(tok.lstrip("`"))))
+        else:
+            py.append(_OPS.get(tok, tok))
+    tree = ast.parse(" ".join(py), mode="eval")
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED):
+            raise ValueError(f"unsupported expression {expr!r}")
+        if isinstance(node, ast.Name) and node.id != "clog2":
+            raise ValueError(f"unsupported expression {expr!r}")
+    return int(eval(compile(tree, "<verilog>", "eval"), {"__builtins__": {}}, {"clog2": _clog2}))
+
+
+def parse_text(text: str, path: str) -> Tuple[List[Const], List[str]]:
+    """Return (constants, quoted include targets) for one source file."""
+
+    body = _strip_comments(text)
+    found: List[Tuple[int, str, str, str]] = []  # (offset, kind, name, expr)
+
+    for m in _DEFINE_RE.finditer(body):
+        if m.group(2):  # function-like macro: not a constant
+            continue
+        found.append((m.start(), "define", m.group(1), m.group(3).replace("\\\n", " ").strip()))
+    for m in _LOCALPARAM_RE.finditer(body):
+        off = m.start(1)
+        for part in _split_top(m.group(1)):
+            a = _ASSIGN_RE.search(part)
+            if a is not None:
+                found.append((off + a.start(1), "localparam", a.group(1), " ".join(a.group(2).split())))
+            off += len(part) + 1
+    found.sort()
+
+    # Evaluate in source order with file-local scope only; cross-file
+    # references stay None here and are resolved by RtlIndex.value().
+    local: Dict[str, int] = {}
+    consts: List[Const] = []
+    for off, kind, name, expr in found:
+        try:
+            v: Optional[int] = evaluate(expr, local.__getitem__)
+        except (KeyError, ValueError, SyntaxError, ZeroDivisionError):
+            v = None
+        if v is not None:
+            local[name] = v
+        consts.append(Const(name, kind, expr, v, path, body.count("\n", 0, off) + 1))
+    return consts, _INCLUDE_RE.findall(body)
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+
+def _sha_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def iter_sources(root: Path) -> Iterator[Path]:
+    """rtl/**/*.{v,vh,sv,svh} plus everything directly in rtl/include/."""
+
+    seen = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d != "__pycache__")
+        inc_dir = Path(dirpath) == root / "include"
+        for fn in sorted(filenames):
+            if fn.endswith(_SUFFIXES) or (inc_dir and not fn.startswith(".")):
+                p = Path(dirpath) / fn
+                if p not in seen:
+                    seen.add(p)
+                    yield p
+
+
+class RtlIndex:
+    """Constants and include edges for every RTL source under `root`."""
+
+    def __init__(self, root: Path, *, use_cache: bool = True) -> None:
+        self.root = root.resolve()
+        cdir = cache_dir() if use_cache else None
+        self._cache_path = cdir / _INDEX_FILE if cdir is not None else None
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.reparsed: List[str] = []
+        self._refresh()
+        self._by_name: Dict[str, List[Const]] = {}
+        self._consts: Dict[str, List[Const]] = {}
+        for key in sorted(self.files):
+            ent = self.files[key]
+            cs = [Const(c[0], c[1], c[2], c[3], key, c[4]) for c in ent["consts"]]
+            self._consts[key] = cs
+            for c in cs:
+                self._by_name.setdefault(c.name, []).append(c)
+
+    # -- persistence -------------------------------------------------------
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self._cache_path is None:
+            return {}
+        try:
+            doc = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(doc, dict) or doc.get("version") != INDEX_VERSION:
+            return {}
+        roots = doc.get("roots")
+        files = roots.get(str(self.root)) if isinstance(roots, dict) else None
+        return files if isinstance(files, dict) else {}
+
+    def _save_cache(self) -> None:
+        if self._cache_path is None:
+            return
+        try:
+            doc = json.loads(self._cache_path.read_text(encoding="utf-8"))
+            if not isinstance(doc, dict) or doc.get("version") != INDEX_VERSION:
+                raise ValueError
+        except (OSError, ValueError):
+            doc = {"version": INDEX_VERSION, "roots": {}}
+        doc.setdefault("roots", {})[str(self.root)] = self.files
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._cache_path.parent, prefix=_INDEX_FILE, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(doc, f, separators=(",", ":"))
+            os.replace(tmp, self._cache_path)
+        except OSError:
+            pass  # read-only checkout / full disk: the cache is best-effort
+
+    def _refresh(self) -> None:
+        cached = self._load_cache()
+        dirty = False
+        for p in iter_sources(self.root):
+            key = p.relative_to(self.root).as_posix()
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            ent = cached.get(key)
+            if ent is not None and ent.get("mtime_ns") == st.st_mtime_ns and ent.get("size") == st.st_size:
+                self.files[key] = ent
+                continue
+            sha = _sha_file(p)
+            if ent is not None and ent.get("sha256") == sha:
+                ent = dict(ent, mtime_ns=st.st_mtime_ns, size=st.st_size)
+            else:
+                consts, incs = parse_text(p.read_text(encoding="utf-8", errors="replace"), key)
+                ent = {
+                    "sha256": sha,
+                    "consts": [[c.name, c.kind, c.expr, c.value, c.line] for c in consts],
+                    "includes": incs,
+                }
+                ent.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+                self.reparsed.append(key)
+            self.files[key] = ent
+            dirty = True
+        if dirty or set(cached) != set(self.files):
+            self._save_cache()
+
+    # -- queries -----------------------------------------------------------
+
+    def key(self, path: Path) -> str:
+        """Index key (root-relative posix path) for a file path."""
+
+        try:
+            return path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            raise ValueError(f"{path} is outside the indexed tree {self.root}")
+
+    def consts(self, key: str) -> List[Const]:
+        return self._consts.get(key, [])
+
+    def lookup(self, name: str) -> List[Const]:
+        """Every definition of `name` across the tree (sorted by path)."""
+
+        return self._by_name.get(name, [])
+
+    def _resolve_include(self, from_key: str, target: str) -> Optional[str]:
+        # Relative to the including file first, then the usual -I dirs.
+        for base in ((self.root / from_key).parent, self.root, self.root / "include"):
+            try:
+                k = (base / target).resolve().relative_to(self.root).as_posix()
+            except ValueError:
+                continue
+            if k in self.files:
+                return k
+        return None
+
+    def closure(self, key: str) -> List[str]:
+        """`key` followed by every file it (transitively) includes, in include order."""
+
+        order: List[str] = []
+        stack: List[Tuple[str, Tuple[str, ...]]] = [(key, ())]
+        while stack:
+            k, chain = stack.pop()
+            if k in chain:
+                raise ValueError(f"include cycle detected at {k}")
+            if k in order:
+                continue
+            order.append(k)
+            ent = self.files.get(k)
+            if ent is None:
+                raise ValueError(f"{k}: not in the RTL index")
+            for inc in reversed(ent["includes"]):
+                target = self._resolve_include(k, inc)
+                if target is None:
+                    raise ValueError(f"{k}: cannot resolve `include \"{inc}\"")
+                stack.append((target, chain + (k,)))
+        return order
+
+    def scope(self, key: str) -> Dict[str, Const]:
+        """Constants visible in `key` (its own plus included ones; first wins)."""
+
+        out: Dict[str, Const] = {}
+        for k in self.closure(key):
+            for c in self.consts(k):
+                out.setdefault(c.name, c)
+        return out
+
+    def value(self, c: Const, scope: Optional[Dict[str, Const]] = None) -> Optional[int]:
+        """Integer value of `c`, resolving names through `scope` when needed."""
+
+        if c.value is not None:
+            return c.value
+        sc = scope if scope is not None else self.scope(c.path)
+        busy: set = set()
+
+        def lookup(name: str) -> int:
+            d = sc.get(name)
+            if d is None or name in busy:
+                raise KeyError(name)
+            if d.value is not None:
+                return d.value
+            busy.add(name)
+            try:
+                return evaluate(d.expr, lookup)
+            finally:
+                busy.discard(name)
+
+        try:
+            return evaluate(c.expr, lookup)
+        except (KeyError, ValueError, SyntaxError, ZeroDivisionError):
+            return None
+
+    def __iter__(self) -> Iterable[Const]:
+        for key in sorted(self._consts):
+            yield from self._consts[key]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Build/refresh the RTL constant index and query it")
+    ap.add_argument("--root", type=Path, default=Path(__file__).resolve().parents[2] / "rtl")
+    ap.add_argument("--no-cache", action="store_true", help="Do not read or write the on-disk index")
+    ap.add_argument("names", nargs="*", help="Constants to print (default: summary only)")
+    args = ap.parse_args()
+
+    idx = RtlIndex(args.root, use_cache=not args.no_cache)
+    n = sum(len(idx.consts(k)) for k in idx.files)
+    print(f"rtl_index: {len(idx.files)} files, {n} constants, {len(idx.reparsed)} re-parsed")
+    rc = 0
+    for name in args.names:
+        defs = idx.lookup(name)
+        if not defs:
+            print(f"{name}: not found", file=sys.stderr)
+            rc = 1
+        for c in defs:
+            v = idx.value(c)
+            shown = "?" if v is None else f"0x{v & 0xFFFFFFFF:08X}"
+            print(f"{c.name} = {c.expr}  [{shown}]  {c.kind} @ {c.where}")
+    return rc
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
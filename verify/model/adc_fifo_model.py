@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""Cycle-level model of the ADC streaming path: adc_frame_to_fifo -> adc_stream_fifo.
+
+Used to size firmware drain loops against decision 010 (16-word FIFO, sticky
+OVERRUN, empty reads return 0, OVERRUN is W1C). The model is event driven: it
+only visits wb_clk_i cycles in which something happens (a frame_valid pulse, a
+sequencer push beat or a firmware Wishbone access), so simulating thousands of
+frames takes milliseconds.
+
+Modelled RTL behaviour:
+  adc_frame_to_fifo (WORDS_OUT=9):
+    - frame_valid while idle starts pushing on the next cycle, 1 word/cycle;
+      a frame arriving while busy goes to the 1-frame skid buffer, a third one
+      pulses frame_dropped.
+    - A word pushed while the FIFO is full is dropped (and sets OVERRUN).
+    - A frame that lands on the last push beat of the current frame is parked
+      in the skid buffer while the sequencer goes idle; it is only pushed after
+      the *next* frame (out of order). Reported as `stranded`.
+  adc_stream_fifo (DEPTH_WORDS=16):
+    - push_ready = !full at the start of the cycle (a same-cycle pop does not
+      make room); OVERRUN is sticky until the firmware's W1C write.
+    - LEVEL_WORDS reads the count at the start of the cycle; FIFO_DATA reads
+      when empty return 0 and change nothing.
+
+Firmware drain strategies (one Wishbone access = --wb-cycles clocks):
+  poll-all     every --poll-us: read ADC_FIFO_STATUS, pop LEVEL_WORDS words
+  poll-frame   same, but only pop whole 9-word frames
+  blind:N      every --poll-us: pop N words without reading status first
+Whenever a status read shows OVERRUN, the firmware clears it with a W1C write.
+
+Usage:
+  python3 verify/model/adc_fifo_model.py --odr-hz 4000,8000,16000,32000 --poll-us 50,100,250,500 \\
+      --strategy poll-all,poll-frame,blind:9 --wb-cycles 4,8,16 --trials 20 --jobs 0
+  python3 verify/model/adc_fifo_model.py --odr-hz 32000 --poll-us 300 --csv sweep.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from typing import Generator, Iterable, List, Optional, Tuple
+
+WORDS_PER_FRAME = 9
+FIFO_DEPTH_WORDS = 16  # decisions/010
+
+INF = float("inf")
+
+# Firmware operations
+_STATUS, _POP, _CLEAR = 0, 1, 2
+
+
+@dataclass(frozen=True)
+class Config:
+    """One point of the sweep."""
+
+    odr_hz: float
+    poll_us: float
+    strategy: str = "poll-all"
+    wb_cycles: int = 4
+    clk_hz: float = 25e6
+    depth: int = FIFO_DEPTH_WORDS
+    jitter_cycles: int = 0
+    frames: int = 2000
+    trials: int = 10
+    seed: int = 1
+
+
+@dataclass
+class TrialResult:
+    words_pushed: int = 0
+    words_dropped: int = 0
+    frames_lost: int = 0  # any word dropped, or rejected by the skid buffer
+    frames_dropped: int = 0  # frame_dropped pulses (skid buffer full)
+    stranded: int = 0  # frames parked in the skid buffer by the last-beat race
+    max_level: int = 0
+    overrun_seen: int = 0  # status reads that returned OVERRUN=1
+    empty_reads: int = 0
+
+
+@dataclass
+class SweepResult:
+    odr_hz: float
+    poll_us: float
+    strategy: str
+    wb_cycles: int
+    overrun_prob: float  # fraction of trials with at least one dropped word
+    worst_level: int
+    frames_lost_mean: float
+    frames_lost_max: int
+    frame_loss_rate: float
+    stranded: int
+    empty_reads_mean: float
+
+
+def _firmware(cfg: Config, start: int, poll: int) -> Generator[Tuple[int, int], Tuple[int, bool], None]:
+    """Yields (cycle, op); receives (level_words, overrun) back for _STATUS."""
+
+    wb = cfg.wb_cycles
+    kind, _, arg = cfg.strategy.partition(":")
+    t = start
+    while True:
+        t_poll = t
+        if kind == "blind":
+            n, overrun = int(arg), False
+        else:
+            level, overrun = yield (t, _STATUS)
+            t += wb
+            n = level if kind == "poll-all" else level - level % WORDS_PER_FRAME
+        for _ in range(n):
+            yield (t, _POP)
+            t += wb
+        if overrun:
+            yield (t, _CLEAR)
+            t += wb
+        t = max(t, t_poll + poll)
+
+
+def run_trial(cfg: Config, rng: random.Random) -> TrialResult:
+    """Simulate cfg.frames ADC frames through sequencer + FIFO + firmware."""
+
+    res = TrialResult()
+    period = cfg.clk_hz / cfg.odr_hz
+    poll = max(1, round(cfg.poll_us * 1e-6 * cfg.clk_hz))
+    j = cfg.jitter_cycles
+    phase = rng.random() * period
+    arrivals: List[int] = []
+    last = -1
+    for k in range(cfg.frames):
+        a = int(phase + k * period) + (rng.randint(-j, j) if j else 0)
+        last = max(a, last + 1)
+        arrivals.append(last)
+    end = arrivals[-1] + 2 * max(period, poll) + WORDS_PER_FRAME * 2
+
+    fw = _firmware(cfg, rng.randrange(poll), poll)
+    fw_t, fw_op = next(fw)
+
+    depth = cfg.depth
+    count = 0
+    overrun = False
+    # Sequencer state: frame ids (None = empty); `cur` is pushed while active.
+    active, idx = False, 0
+    cur: Optional[int] = None
+    pend: Optional[int] = None
+    lost = set()
+    next_frame = 0
+    t = 0
+
+    while True:
+        t_frame = arrivals[next_frame] if next_frame < len(arrivals) else INF
+        t = min(t_frame, t + 1 if active else INF, fw_t)
+        if t > end:
+            break
+
+        # Firmware access sampled at the start of the cycle.
+        do_pop = False
+        status = None
+        if fw_t == t:
+            if fw_op == _STATUS:
+                status = (count, overrun)
+            elif fw_op == _POP:
+                if count:
+                    do_pop = True
+                else:
+                    res.empty_reads += 1
+
+        # Push beat.
+        do_push = False
+        if active:
+            if count == depth:
+                overrun = True
+                res.words_dropped += 1
+                lost.add(cur)
+            else:
+                do_push = True
+                res.words_pushed += 1
+
+        if fw_t == t and fw_op == _CLEAR:
+            overrun = False  # W1C; a same-cycle overflow attempt wins below
+            if active and not do_push:
+                overrun = True
+
+        count += do_push - do_pop
+        if count > res.max_level:
+            res.max_level = count
+
+        # Sequencer update (nonblocking semantics of adc_frame_to_fifo.v).
+        fv = t_frame == t
+        n_active, n_idx, n_cur, n_pend = active, idx, cur, pend
+        if fv:
+            if not active:
+                n_cur, n_active, n_idx = next_frame, True, 0
+            elif pend is None:
+                n_pend = next_frame
+            else:
+                res.frames_dropped += 1
+                lost.add(next_frame)
+            next_frame += 1
+        if active:
+            if idx == WORDS_PER_FRAME - 1:
+                if pend is not None:
+                    n_cur, n_pend, n_idx, n_active = pend, None, 0, True
+                else:
+                    n_active, n_idx = False, 0
+                    if fv and n_pend is not None:
+                        res.stranded += 1
+            else:
+                n_idx = idx + 1
+        active, idx, cur, pend = n_active, n_idx, n_cur, n_pend
+
+        if fw_t == t:
+            fw_t, fw_op = fw.send(status) if status is not None else next(fw)
+            if status is not None and status[1]:
+                res.overrun_seen += 1
+
+    # Frames still parked or in flight at the end count as delivered.
+    res.frames_lost = len(lost)
+    return res
+
+
+def run_config(cfg: Config) -> SweepResult:
+    """All trials of one configuration (the unit of work per process)."""
+
+    rng = random.Random(f"{cfg.seed}:{cfg.odr_hz}:{cfg.poll_us}:{cfg.strategy}:{cfg.wb_cycles}")
+    trials = [run_trial(cfg, rng) for _ in range(cfg.trials)]
+    lost = [r.frames_lost for r in trials]
+    return SweepResult(
+        odr_hz=cfg.odr_hz,
+        poll_us=cfg.poll_us,
+        strategy=cfg.strategy,
+        wb_cycles=cfg.wb_cycles,
+        overrun_prob=sum(r.words_dropped > 0 for r in trials) / len(trials),
+        worst_level=max(r.max_level for r in trials),
+        frames_lost_mean=sum(lost) / len(trials),
+        frames_lost_max=max(lost),
+        frame_loss_rate=sum(lost) / (len(trials) * cfg.frames),
+        stranded=sum(r.stranded for r in trials),
+        empty_reads_mean=sum(r.empty_reads for r in trials) / len(trials),
+    )
+
+
+def sweep(configs: Iterable[Config], *, jobs: int = 1) -> List[SweepResult]:
+    """Run every configuration, in parallel when jobs > 1; order is preserved."""
+
+    configs = list(configs)
+    if jobs <= 1 or len(configs) <= 1:
+        return [run_config(c) for c in configs]
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        return list(ex.map(run_config, configs, chunksize=max(1, len(configs) // (jobs * 8))))
+
+
+def _floats(s: str) -> List[float]:
+    return [float(x) for x in s.split(",") if x]
+
+
+def _ints(s: str) -> List[int]:
+    return [int(x, 0) for x in s.split(",") if x]
+
+
+def _strategies(s: str) -> List[str]:
+    out = [x.strip() for x in s.split(",") if x.strip()]
+    for st in out:
+        kind, _, arg = st.partition(":")
+        if kind in ("poll-all", "poll-frame") and not arg:
+            continue
+        if kind == "blind" and arg.isdigit() and int(arg) > 0:
+            continue
+        raise argparse.ArgumentTypeError(f"unknown strategy {st!r} (poll-all, poll-frame, blind:N)")
+    return out
+
+
+def _format_table(results: List[SweepResult]) -> str:
+    lines = [
+        f"{'odr_hz':>8} {'poll_us':>8} {'strategy':>11} {'wb_cyc':>6} {'p_overrun':>9} {'worst_lvl':>9} "
+        f"{'lost_mean':>9} {'lost_max':>8} {'loss_rate':>9} {'stranded':>8}"
+    ]
+    for r in results:
+        lines.append(
+            f"{r.odr_hz:>8g} {r.poll_us:>8g} {r.strategy:>11} {r.wb_cycles:>6} {r.overrun_prob:>9.3f} "
+            f"{r.worst_level:>9} {r.frames_lost_mean:>9.2f} {r.frames_lost_max:>8} {r.frame_loss_rate:>9.5f} "
+            f"{r.stranded:>8}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description="Sweep firmware drain strategies against the v1 ADC FIFO model")
+    ap.add_argument("--odr-hz", type=_floats, default=[1000.0, 4000.0, 8000.0, 16000.0, 32000.0], help="ADC output data rates (comma list)")
+    ap.add_argument("--poll-us", type=_floats, default=[50.0, 100.0, 250.0, 500.0, 1000.0], help="Firmware poll intervals in us (comma list)")
+    ap.add_argument("--strategy", type=_strategies, default=["poll-all", "poll-frame"], help="Drain strategies: poll-all, poll-frame, blind:N (comma list)")
+    ap.add_argument("--wb-cycles", type=_ints, default=[4], help="wb_clk_i cycles per firmware Wishbone access (comma list, default: 4)")
+    ap.add_argument("--clk-hz", type=float, default=25e6, help="wb_clk_i frequency (default: 25e6)")
+    ap.add_argument("--depth", type=int, default=FIFO_DEPTH_WORDS, help=f"FIFO depth in words (default: {FIFO_DEPTH_WORDS}, decision 010)")
+    ap.add_argument("--jitter-cycles", type=int, default=0, help="Uniform +/- jitter on frame arrival, in cycles (default: 0)")
+    ap.add_argument("--frames", type=int, default=2000, help="Frames per trial (default: 2000)")
+    ap.add_argument("--trials", type=int, default=10, help="Trials (random phases) per configuration (default: 10)")
+    ap.add_argument("--seed", type=int, default=1, help="Base random seed (default: 1)")
+    ap.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = one per CPU, default: 0)")
+    ap.add_argument("--csv", default=None, help="Also write results as CSV")
+    ap.add_argument("--json", action="store_true", help="Print results as JSON instead of a table")
+    args = ap.parse_args(argv)
+
+    if args.depth < 2:
+        raise SystemExit("--depth must be >= 2")
+    if args.frames < 1 or args.trials < 1:
+        raise SystemExit("--frames and --trials must be >= 1")
+    if min(args.odr_hz) <= 0 or min(args.poll_us) <= 0:
+        raise SystemExit("--odr-hz and --poll-us values must be > 0")
+    if min(args.wb_cycles) < 1:
+        raise SystemExit("--wb-cycles values must be >= 1")
+    if args.clk_hz <= 0:
+        raise SystemExit("--clk-hz must be > 0")
+    if args.jitter_cycles < 0:
+        raise SystemExit("--jitter-cycles must be >= 0")
+
+    configs = [
+        Config(
+            odr_hz=odr,
+            poll_us=poll,
+            strategy=st,
+            wb_cycles=wb,
+            clk_hz=args.clk_hz,
+            depth=args.depth,
+            jitter_cycles=args.jitter_cycles,
+            frames=args.frames,
+            trials=args.trials,
+            seed=args.seed,
+        )
+        for odr, poll, st, wb in itertools.product(args.odr_hz, args.poll_us, args.strategy, args.wb_cycles)
+    ]
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    results = sweep(configs, jobs=jobs)
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as f:
+            w = csv.writer(f)
+            w.writerow([fl.name for fl in fields(SweepResult)])
+            for r in results:
+                w.writerow(list(asdict(r).values()))
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        sys.stdout.write(_format_table(results))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
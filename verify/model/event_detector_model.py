@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""Vectorized reference model of rtl/home_inventory_event_detector.v.
+
+Replays decoded ADC frames plus a TIME_NOW tick per sample through the v1 event
+detector semantics (docs/EVENT_DETECTOR_SPEC.md) for all 8 channels at once and
+reports the final register state and a per-event log. A million samples take
+well under a second, so recorded captures can be checked against many
+detector configurations without running iverilog.
+
+Modelled behaviour (matches the RTL, cycle for cycle where it matters):
+  - hit[ch] = EVT_EN[ch] && sample >= EVT_THRESH_CHx, evaluated per sample_valid.
+    The RTL compares the 32-bit buses *unsigned*; `--signed-compare` models the
+    signed comparison the spec describes instead.
+  - EVT_COUNT_CHx saturates at 0xFFFF_FFFF.
+  - EVT_LAST_DELTA_CHx = ts - last_ts_ch (mod 2**32), 0 for the first event after
+    reset, CLEAR_HISTORY or a 0->1 enable edge.
+  - EVT_LAST_TS / EVT_LAST_TS_CHx follow the most recent event.
+  - Enable edges are latched and consumed at the next sample; an enable pulse
+    that drops again before any sample clears nothing.
+  - CLEAR_COUNTS / CLEAR_HISTORY are pulses; a sample in the same cycle is
+    ignored (callers simply do not feed it).
+
+Input:
+  - `.npz` from `fw/tools/decode_adc_fifo.py --out` (columns ch0..ch7, an
+    optional `ts` column is used as TIME_NOW), or
+  - raw little-endian u32 FIFO words (`.bin`/`.u32`, 9 words per frame).
+Ticks default to `--tick-start + i * --tick-step` (TIME_NOW counts wb_clk_i
+cycles, so the step is the number of clock cycles per sample); `--ticks FILE`
+(.npy or one value per line) overrides that.
+
+Usage:
+  python3 verify/model/event_detector_model.py frames.npz --evt-en 0xFF --thresh 1000 --tick-step 2500
+  python3 verify/model/event_detector_model.py frames.npz --thresh 0=120,3=-50 --events events.csv --json
+  python3 verify/model/event_detector_model.py --selftest   # replays verify/event_detector_tb.v
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    raise SystemExit("event_detector_model.py requires NumPy (pip install numpy)")
+
+N_CHANNELS = 8
+WORDS_PER_FRAME = 9
+U32_MAX = 0xFFFF_FFFF
+
+# Chunk size for replaying long captures; bounds the temporaries per step().
+_STEP_SAMPLES = 1 << 20
+
+EVENT_DTYPE = np.dtype(
+    [("sample", "<i8"), ("channel", "<u1"), ("ts", "<u4"), ("count", "<u4"), ("delta", "<u4")]
+)
+
+
+class EventDetectorModel:
+    """State of one home_inventory_event_detector instance.
+
+    Configuration calls (`set_enable`, `set_thresh`, `clear`) each stand for one
+    or more clock cycles without sample_valid; `step` feeds a block of samples.
+    """
+
+    def __init__(
+        self,
+        *,
+        thresh: Sequence[int] = (0,) * N_CHANNELS,
+        evt_en: int = 0,
+        signed_compare: bool = False,
+    ) -> None:
+        self.signed_compare = signed_compare
+        self.thresh = np.zeros(N_CHANNELS, dtype=np.uint32)
+        for ch, v in enumerate(thresh):
+            self.set_thresh(ch, v)
+        self.reset()
+        self.set_enable(evt_en)
+
+    def reset(self) -> None:
+        self.en = np.zeros(N_CHANNELS, dtype=bool)
+        self.pending = np.zeros(N_CHANNELS, dtype=bool)  # latched 0->1 enable edges
+        self.seen = np.zeros(N_CHANNELS, dtype=bool)
+        self.count = np.zeros(N_CHANNELS, dtype=np.uint64)
+        self.last_delta = np.zeros(N_CHANNELS, dtype=np.uint32)
+        self.last_ts_ch = np.zeros(N_CHANNELS, dtype=np.uint32)
+        self.last_ts = 0
+        self.samples = 0  # sample_valid pulses consumed so far
+
+    # Configuration
+
+    def set_enable(self, mask: int) -> None:
+        new = (mask >> np.arange(N_CHANNELS)) & 1 == 1
+        self.pending = (self.pending | (new & ~self.en)) & new
+        self.en = new
+
+    def set_thresh(self, ch: int, value: int) -> None:
+        self.thresh[ch] = value & U32_MAX
+
+    def clear(self, *, counts: bool = False, history: bool = False) -> None:
+        if counts:
+            self.count[:] = 0
+        if history:
+            self.pending[:] = False
+            self.seen[:] = False
+            self.last_delta[:] = 0
+            self.last_ts_ch[:] = 0
+            self.last_ts = 0
+
+    # Samples
+
+    def step(self, samples: "np.ndarray", ts: "np.ndarray") -> "np.ndarray":
+        """Feed (N, 8) samples (any integer dtype, taken mod 2**32) with their
+        (N,) TIME_NOW ticks; returns the events as an EVENT_DTYPE array in
+        (sample, channel) order."""
+
+        samples = np.asarray(samples).astype(np.uint32, copy=False).reshape(-1, N_CHANNELS)
+        ts = np.asarray(ts).astype(np.uint32, copy=False)
+        if len(ts) != len(samples):
+            raise ValueError(f"{len(samples)} samples but {len(ts)} ticks")
+        n = len(samples)
+        if n == 0:
+            return np.empty(0, dtype=EVENT_DTYPE)
+
+        # Pending enable edges are consumed at the first sample, hit or not.
+        if self.pending.any():
+            self.seen &= ~self.pending
+            self.last_ts_ch[self.pending] = 0
+            self.last_delta[self.pending] = 0
+            self.pending[:] = False
+
+        if self.signed_compare:
+            hit = samples.view(np.int32) >= self.thresh.view(np.int32)
+        else:
+            hit = samples >= self.thresh
+        hit &= self.en
+
+        base = self.samples
+        self.samples += n
+        rows, chs = np.nonzero(hit)
+        if len(rows) == 0:
+            return np.empty(0, dtype=EVENT_DTYPE)
+
+        # Walk the hits channel by channel (stable, so time order is kept).
+        order = np.lexsort((rows, chs))
+        r, c = rows[order], chs[order]
+        t = ts[r]
+        m = len(r)
+        first = np.ones(m, dtype=bool)
+        first[1:] = c[1:] != c[:-1]
+        last = np.ones(m, dtype=bool)
+        last[:-1] = first[1:]
+
+        prev_ts = np.empty(m, dtype=np.uint32)
+        prev_ts[1:] = t[:-1]
+        prev_ts[first] = self.last_ts_ch[c[first]]
+        delta = t - prev_ts  # wraps mod 2**32 like the RTL subtraction
+        delta[first & ~self.seen[c]] = 0
+
+        idx = np.arange(m)
+        rank = idx - np.maximum.accumulate(np.where(first, idx, 0)) + 1
+        count = np.minimum(self.count[c] + rank.astype(np.uint64), U32_MAX)
+
+        lc = c[last]
+        self.count[lc] = count[last]
+        self.last_ts_ch[lc] = t[last]
+        self.last_delta[lc] = delta[last]
+        self.seen[lc] = True
+        self.last_ts = int(ts[rows[-1]])
+
+        events = np.empty(m, dtype=EVENT_DTYPE)
+        events["sample"] = base + r
+        events["channel"] = c
+        events["ts"] = t
+        events["count"] = count
+        events["delta"] = delta
+        return events[np.lexsort((c, r))]
+
+    # Readback
+
+    def regs(self) -> Dict[str, int]:
+        """Register readback, keyed by spec/regmap_v1.yaml names."""
+
+        out: Dict[str, int] = {}
+        for ch in range(N_CHANNELS):
+            out[f"EVT_COUNT_CH{ch}"] = int(self.count[ch])
+        for ch in range(N_CHANNELS):
+            out[f"EVT_LAST_DELTA_CH{ch}"] = int(self.last_delta[ch])
+        out["EVT_LAST_TS"] = self.last_ts
+        out["EVT_CFG"] = int(np.dot(self.en, 1 << np.arange(N_CHANNELS)))  # W1P bits read 0
+        for ch in range(N_CHANNELS):
+            out[f"EVT_LAST_TS_CH{ch}"] = int(self.last_ts_ch[ch])
+        for ch in range(N_CHANNELS):
+            out[f"EVT_THRESH_CH{ch}"] = int(self.thresh[ch])
+        return out
+
+
+def replay(
+    model: EventDetectorModel,
+    samples: "np.ndarray",
+    ts: "np.ndarray",
+    *,
+    chunk: int = _STEP_SAMPLES,
+) -> List["np.ndarray"]:
+    """Feed a whole capture in bounded chunks; returns the event arrays."""
+
+    return [model.step(samples[i : i + chunk], ts[i : i + chunk]) for i in range(0, len(samples), chunk)]
+
+
+# Input helpers
+
+
+def load_frames(path: str) -> "tuple[np.ndarray, Optional[np.ndarray]]":
+    """(N, 8) channel samples and the optional `ts` column of a capture."""
+
+    if path.endswith(".npz"):
+        d = np.load(path)
+        missing = [f"ch{i}" for i in range(N_CHANNELS) if f"ch{i}" not in d.files]
+        if missing:
+            raise SystemExit(f"{path}: missing column(s) {', '.join(missing)}")
+        samples = np.stack([d[f"ch{i}"] for i in range(N_CHANNELS)], axis=1)
+        return samples, (d["ts"] if "ts" in d.files else None)
+
+    words = np.memmap(path, dtype="<u4", mode="r") if path != "-" else np.frombuffer(sys.stdin.buffer.read(), "<u4")
+    n = len(words) // WORDS_PER_FRAME
+    if len(words) % WORDS_PER_FRAME:
+        print(f"[warn] {len(words) % WORDS_PER_FRAME} trailing word(s) ignored", file=sys.stderr)
+    return np.asarray(words[: n * WORDS_PER_FRAME]).reshape(n, WORDS_PER_FRAME)[:, 1:], None
+
+
+def load_ticks(path: str) -> "np.ndarray":
+    if path.endswith(".npy"):
+        return np.load(path)
+    return np.loadtxt(path, dtype=np.int64, ndmin=1, converters=lambda s: int(s, 0))
+
+
+def _parse_thresh(specs: List[str]) -> List[int]:
+    """`--thresh V` (all channels), `--thresh V0,...,V7` or `--thresh CH=V,...`."""
+
+    thresh = [0] * N_CHANNELS
+    for spec in specs:
+        parts = spec.split(",")
+        if all("=" in p for p in parts):
+            for p in parts:
+                ch, v = p.split("=", 1)
+                thresh[int(ch)] = int(v, 0)
+        elif len(parts) == 1:
+            thresh = [int(parts[0], 0)] * N_CHANNELS
+        elif len(parts) == N_CHANNELS:
+            thresh = [int(p, 0) for p in parts]
+        else:
+            raise SystemExit(f"--thresh {spec!r}: expected V, {N_CHANNELS} comma-separated values or CH=V pairs")
+    return thresh
+
+
+def write_events(path: str, events: "np.ndarray") -> None:
+    if path.endswith(".npz"):
+        np.savez(path, **{name: events[name] for name in EVENT_DTYPE.names})
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(",".join(EVENT_DTYPE.names) + "\n")
+        if len(events):
+            np.savetxt(f, np.stack([events[n].astype(np.int64) for n in EVENT_DTYPE.names], axis=1), fmt="%d", delimiter=",")
+
+
+# Self-test: the directed sequence of verify/event_detector_tb.v
+
+
+def selftest() -> int:
+    """Replay verify/event_detector_tb.v's stimulus and expectations."""
+
+    failures = 0
+
+    def expect(got: int, exp: int, msg: str) -> None:
+        nonlocal failures
+        if got != exp:
+            print(f"ASSERT FAIL: {msg} got=0x{got:08x} exp=0x{exp:08x}")
+            failures += 1
+
+    def sample(ch_vals: Dict[int, int], ts: int) -> None:
+        for ch, v in ch_vals.items():
+            cur[ch] = v
+        m.step(np.array([cur]), np.array([ts]))
+
+    m = EventDetectorModel(thresh=[100, 1000, 0, 0, 0, 0, 0, 0])
+    cur = [0] * N_CHANNELS
+    r = m.regs
+    expect(r()["EVT_COUNT_CH0"], 0, "count ch0 after reset")
+    expect(r()["EVT_COUNT_CH1"], 0, "count ch1 after reset")
+    expect(r()["EVT_LAST_TS"], 0, "last_ts after reset")
+    expect(r()["EVT_LAST_DELTA_CH0"], 0, "last_delta ch0 after reset")
+
+    m.set_enable(0x01)
+    sample({0: 150}, 10)
+    expect(r()["EVT_COUNT_CH0"], 1, "count ch0 after first hit")
+    expect(r()["EVT_LAST_TS"], 10, "last_ts updates on any event")
+    expect(r()["EVT_LAST_TS_CH0"], 10, "last_ts_ch0 after first hit")
+    expect(r()["EVT_LAST_DELTA_CH0"], 0, "delta is 0 for first event after enable")
+
+    sample({0: 101}, 25)
+    expect(r()["EVT_COUNT_CH0"], 2, "count ch0 after second hit")
+    expect(r()["EVT_LAST_TS"], 25, "last_ts after second hit")
+    expect(r()["EVT_LAST_TS_CH0"], 25, "last_ts_ch0 after second hit")
+    expect(r()["EVT_LAST_DELTA_CH0"], 15, "delta between hits")
+
+    sample({0: 99}, 40)
+    expect(r()["EVT_COUNT_CH0"], 2, "count unchanged on miss")
+    expect(r()["EVT_LAST_TS"], 25, "last_ts unchanged on miss")
+    expect(r()["EVT_LAST_TS_CH0"], 25, "last_ts_ch0 unchanged on miss")
+    expect(r()["EVT_LAST_DELTA_CH0"], 15, "delta unchanged on miss")
+
+    m.set_enable(0x01)
+    m.set_enable(0x00)
+    sample({0: 150}, 50)
+    expect(r()["EVT_COUNT_CH0"], 2, "disabled sample does not increment count")
+    expect(r()["EVT_LAST_TS"], 25, "disabled sample does not update global last_ts")
+    expect(r()["EVT_LAST_TS_CH0"], 25, "disabled sample does not clear per-ch last_ts")
+    expect(r()["EVT_LAST_DELTA_CH0"], 15, "disabled sample does not clear per-ch delta")
+
+    m.set_enable(0x03)
+    sample({0: 0, 1: 2000}, 60)
+    expect(r()["EVT_COUNT_CH0"], 2, "ch0 count unchanged on ch1-only hit")
+    expect(r()["EVT_COUNT_CH1"], 1, "ch1 count increments on hit")
+    expect(r()["EVT_LAST_TS"], 60, "last_ts updates on any-channel event")
+    expect(r()["EVT_LAST_TS_CH1"], 60, "last_ts_ch1 updates on ch1 hit")
+    expect(r()["EVT_LAST_DELTA_CH1"], 0, "ch1 delta is 0 for first event")
+
+    m.count[1] = U32_MAX  # the TB forces the counter to max
+    sample({1: 3000}, 70)
+    expect(r()["EVT_COUNT_CH1"], U32_MAX, "saturating count holds at max")
+
+    m.clear(counts=True)
+    expect(r()["EVT_COUNT_CH0"], 0, "clear_counts resets ch0 count")
+    expect(r()["EVT_COUNT_CH1"], 0, "clear_counts resets ch1 count")
+    expect(r()["EVT_LAST_TS"], 70, "clear_counts does not clear global last_ts")
+    expect(r()["EVT_LAST_TS_CH0"], 0, "clear_counts does not clear per-ch last_ts")
+    expect(r()["EVT_LAST_TS_CH1"], 70, "clear_counts does not clear ch1 last_ts")
+    expect(r()["EVT_LAST_DELTA_CH1"], 10, "clear_counts does not clear ch1 delta")
+    expect(r()["EVT_LAST_DELTA_CH0"], 0, "clear_counts does not clear per-ch delta")
+
+    m.clear(history=True)
+    expect(r()["EVT_LAST_TS"], 0, "clear_history clears global last_ts")
+    expect(r()["EVT_LAST_TS_CH0"], 0, "clear_history clears per-ch last_ts")
+    expect(r()["EVT_LAST_DELTA_CH0"], 0, "clear_history clears per-ch delta")
+
+    # Clear + sample_valid in one cycle: the clear wins and the sample is dropped.
+    m.set_enable(0x01)
+    cur[0] = 500
+    m.clear(counts=True, history=True)
+    expect(r()["EVT_COUNT_CH0"], 0, "clear wins over sample_valid: count remains 0")
+    expect(r()["EVT_LAST_TS"], 0, "clear wins over sample_valid: last_ts remains 0")
+
+    m.set_enable(0x00)
+    m.set_enable(0x01)
+    sample({0: 200}, 90)
+    expect(r()["EVT_COUNT_CH0"], 1, "count after hit post re-enable (post-clear)")
+    expect(r()["EVT_LAST_DELTA_CH0"], 0, "delta resets to 0 after re-enable")
+
+    if failures:
+        print(f"FAIL: event_detector_model selftest ({failures} mismatch(es))")
+        return 1
+    print("PASS: event_detector_model selftest (verify/event_detector_tb.v sequence)")
+    return 0
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description="Replay ADC frames through the v1 event detector model")
+    ap.add_argument("path", nargs="?", help="Capture: .npz from decode_adc_fifo.py --out, or raw LE u32 FIFO words")
+    ap.add_argument("--evt-en", type=lambda s: int(s, 0), default=0xFF, help="EVT_CFG.EVT_EN mask (default: 0xFF)")
+    ap.add_argument(
+        "--thresh",
+        action="append",
+        default=[],
+        help="EVT_THRESH_CHx: one value for all channels, 8 comma-separated values, or CH=V pairs (repeatable)",
+    )
+    ap.add_argument("--signed-compare", action="store_true", help="Compare signed (spec) instead of unsigned (RTL)")
+    ap.add_argument("--ticks", default=None, help="TIME_NOW per sample (.npy, or one value per line)")
+    ap.add_argument("--tick-start", type=lambda s: int(s, 0), default=0, help="TIME_NOW of the first sample (default: 0)")
+    ap.add_argument("--tick-step", type=lambda s: int(s, 0), default=1, help="TIME_NOW ticks between samples (default: 1)")
+    ap.add_argument("--events", default=None, help="Write the event log (.csv or .npz)")
+    ap.add_argument("--json", action="store_true", help="Print final registers as JSON")
+    ap.add_argument("--selftest", action="store_true", help="Replay verify/event_detector_tb.v and check its expectations")
+    args = ap.parse_args(argv)
+
+    if args.selftest:
+        return selftest()
+    if not args.path:
+        ap.error("path is required (or use --selftest)")
+
+    samples, ts = load_frames(args.path)
+    if args.ticks:
+        ts = load_ticks(args.ticks)
+    elif ts is None:
+        ts = (args.tick_start + np.arange(len(samples), dtype=np.int64) * args.tick_step) & U32_MAX
+    if len(ts) < len(samples):
+        raise SystemExit(f"{len(samples)} samples but only {len(ts)} ticks")
+
+    model = EventDetectorModel(thresh=_parse_thresh(args.thresh), evt_en=args.evt_en, signed_compare=args.signed_compare)
+    parts = replay(model, samples, ts[: len(samples)])
+    events = np.concatenate(parts) if parts else np.empty(0, dtype=EVENT_DTYPE)
+
+    if args.events:
+        write_events(args.events, events)
+
+    regs = model.regs()
+    if args.json:
+        print(json.dumps({"samples": model.samples, "events": int(len(events)), "regs": regs}, indent=2))
+    else:
+        print(f"samples={model.samples} events={len(events)}")
+        for name, v in regs.items():
+            print(f"{name:<20} 0x{v:08X}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+# AUTO-GENERATED FILE. DO NOT EDIT BY HAND.
+# Generated from: spec/regmap_v1.yaml
+# Generated by:   ops/gen_regmap_py.py
+"""Executable register-bank model of rtl/home_inventory_wb.v (see RegBank).
+
+    bank = RegBank()
+    bank.on_read(ADR_ADC_FIFO_DATA, fifo.pop)          # side effects via hooks
+    bank.write32(ADR_ADC_FIFO_STATUS, 1 << 16, 0b0100) # W1C OVERRUN, lane 2 only
+    level = bank.read32(ADR_ADC_FIFO_STATUS) & FIELDS['ADC_FIFO_STATUS']['LEVEL_WORDS'][1]
+
+Addresses are Wishbone byte addresses; unmapped words read 0 and ignore writes.
+
+Usage:
+  python3 verify/model/home_inventory_regbank.py --selftest
+  python3 verify/model/home_inventory_regbank.py --bench 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+# Register byte addresses
+ADR_ID                 = 0x00000000
+ADR_VERSION            = 0x00000004
+ADR_CTRL               = 0x00000100
+ADR_IRQ_EN             = 0x00000104
+ADR_STATUS             = 0x00000108
+ADR_TIME_NOW           = 0x0000010C
+ADR_ADC_CFG            = 0x00000200
+ADR_ADC_CMD            = 0x00000204
+ADR_ADC_FIFO_STATUS    = 0x00000208
+ADR_ADC_FIFO_DATA      = 0x0000020C
+ADR_ADC_RAW_CH0        = 0x00000210
+ADR_ADC_RAW_CH1        = 0x00000214
+ADR_ADC_RAW_CH2        = 0x00000218
+ADR_ADC_RAW_CH3        = 0x0000021C
+ADR_ADC_RAW_CH4        = 0x00000220
+ADR_ADC_RAW_CH5        = 0x00000224
+ADR_ADC_RAW_CH6        = 0x00000228
+ADR_ADC_RAW_CH7        = 0x0000022C
+ADR_ADC_SNAPSHOT_COUNT = 0x00000230
+ADR_TARE_CH0           = 0x00000300
+ADR_TARE_CH1           = 0x00000304
+ADR_TARE_CH2           = 0x00000308
+ADR_TARE_CH3           = 0x0000030C
+ADR_TARE_CH4           = 0x00000310
+ADR_TARE_CH5           = 0x00000314
+ADR_TARE_CH6           = 0x00000318
+ADR_TARE_CH7           = 0x0000031C
+ADR_SCALE_CH0          = 0x00000320
+ADR_SCALE_CH1          = 0x00000324
+ADR_SCALE_CH2          = 0x00000328
+ADR_SCALE_CH3          = 0x0000032C
+ADR_SCALE_CH4          = 0x00000330
+ADR_SCALE_CH5          = 0x00000334
+ADR_SCALE_CH6          = 0x00000338
+ADR_SCALE_CH7          = 0x0000033C
+ADR_EVT_COUNT_CH0      = 0x00000400
+ADR_EVT_COUNT_CH1      = 0x00000404
+ADR_EVT_COUNT_CH2      = 0x00000408
+ADR_EVT_COUNT_CH3      = 0x0000040C
+ADR_EVT_COUNT_CH4      = 0x00000410
+ADR_EVT_COUNT_CH5      = 0x00000414
+ADR_EVT_COUNT_CH6      = 0x00000418
+ADR_EVT_COUNT_CH7      = 0x0000041C
+ADR_EVT_LAST_DELTA_CH0 = 0x00000420
+ADR_EVT_LAST_DELTA_CH1 = 0x00000424
+ADR_EVT_LAST_DELTA_CH2 = 0x00000428
+ADR_EVT_LAST_DELTA_CH3 = 0x0000042C
+ADR_EVT_LAST_DELTA_CH4 = 0x00000430
+ADR_EVT_LAST_DELTA_CH5 = 0x00000434
+ADR_EVT_LAST_DELTA_CH6 = 0x00000438
+ADR_EVT_LAST_DELTA_CH7 = 0x0000043C
+ADR_EVT_LAST_TS        = 0x00000440
+ADR_EVT_CFG            = 0x00000444
+ADR_EVT_LAST_TS_CH0    = 0x00000448
+ADR_EVT_LAST_TS_CH1    = 0x0000044C
+ADR_EVT_LAST_TS_CH2    = 0x00000450
+ADR_EVT_LAST_TS_CH3    = 0x00000454
+ADR_EVT_LAST_TS_CH4    = 0x00000458
+ADR_EVT_LAST_TS_CH5    = 0x0000045C
+ADR_EVT_LAST_TS_CH6    = 0x00000460
+ADR_EVT_LAST_TS_CH7    = 0x00000464
+ADR_EVT_THRESH_CH0     = 0x00000480
+ADR_EVT_THRESH_CH1     = 0x00000484
+ADR_EVT_THRESH_CH2     = 0x00000488
+ADR_EVT_THRESH_CH3     = 0x0000048C
+ADR_EVT_THRESH_CH4     = 0x00000490
+ADR_EVT_THRESH_CH5     = 0x00000494
+ADR_EVT_THRESH_CH6     = 0x00000498
+ADR_EVT_THRESH_CH7     = 0x0000049C
+
+# Per-register tables, in address order (a register's index is its slot)
+NAMES = (
+    "ID", "VERSION", "CTRL", "IRQ_EN",
+    "STATUS", "TIME_NOW", "ADC_CFG", "ADC_CMD",
+    "ADC_FIFO_STATUS", "ADC_FIFO_DATA", "ADC_RAW_CH0", "ADC_RAW_CH1",
+    "ADC_RAW_CH2", "ADC_RAW_CH3", "ADC_RAW_CH4", "ADC_RAW_CH5",
+    "ADC_RAW_CH6", "ADC_RAW_CH7", "ADC_SNAPSHOT_COUNT", "TARE_CH0",
+    "TARE_CH1", "TARE_CH2", "TARE_CH3", "TARE_CH4",
+    "TARE_CH5", "TARE_CH6", "TARE_CH7", "SCALE_CH0",
+    "SCALE_CH1", "SCALE_CH2", "SCALE_CH3", "SCALE_CH4",
+    "SCALE_CH5", "SCALE_CH6", "SCALE_CH7", "EVT_COUNT_CH0",
+    "EVT_COUNT_CH1", "EVT_COUNT_CH2", "EVT_COUNT_CH3", "EVT_COUNT_CH4",
+    "EVT_COUNT_CH5", "EVT_COUNT_CH6", "EVT_COUNT_CH7", "EVT_LAST_DELTA_CH0",
+    "EVT_LAST_DELTA_CH1", "EVT_LAST_DELTA_CH2", "EVT_LAST_DELTA_CH3", "EVT_LAST_DELTA_CH4",
+    "EVT_LAST_DELTA_CH5", "EVT_LAST_DELTA_CH6", "EVT_LAST_DELTA_CH7", "EVT_LAST_TS",
+    "EVT_CFG", "EVT_LAST_TS_CH0", "EVT_LAST_TS_CH1", "EVT_LAST_TS_CH2",
+    "EVT_LAST_TS_CH3", "EVT_LAST_TS_CH4", "EVT_LAST_TS_CH5", "EVT_LAST_TS_CH6",
+    "EVT_LAST_TS_CH7", "EVT_THRESH_CH0", "EVT_THRESH_CH1", "EVT_THRESH_CH2",
+    "EVT_THRESH_CH3", "EVT_THRESH_CH4", "EVT_THRESH_CH5", "EVT_THRESH_CH6",
+    "EVT_THRESH_CH7",
+)
+ADDRS = (
+    0x00000000, 0x00000004, 0x00000100, 0x00000104, 0x00000108, 0x0000010C, 0x00000200, 0x00000204,
+    0x00000208, 0x0000020C, 0x00000210, 0x00000214, 0x00000218, 0x0000021C, 0x00000220, 0x00000224,
+    0x00000228, 0x0000022C, 0x00000230, 0x00000300, 0x00000304, 0x00000308, 0x0000030C, 0x00000310,
+    0x00000314, 0x00000318, 0x0000031C, 0x00000320, 0x00000324, 0x00000328, 0x0000032C, 0x00000330,
+    0x00000334, 0x00000338, 0x0000033C, 0x00000400, 0x00000404, 0x00000408, 0x0000040C, 0x00000410,
+    0x00000414, 0x00000418, 0x0000041C, 0x00000420, 0x00000424, 0x00000428, 0x0000042C, 0x00000430,
+    0x00000434, 0x00000438, 0x0000043C, 0x00000440, 0x00000444, 0x00000448, 0x0000044C, 0x00000450,
+    0x00000454, 0x00000458, 0x0000045C, 0x00000460, 0x00000464, 0x00000480, 0x00000484, 0x00000488,
+    0x0000048C, 0x00000490, 0x00000494, 0x00000498, 0x0000049C,
+)
+# Reset values (spec reset; RTL hard-tied value or 0 where the spec says null)
+RESETS = (
+    0x48494348, 0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000008, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00010000, 0x00010000, 0x00010000, 0x00010000, 0x00010000,
+    0x00010000, 0x00010000, 0x00010000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+)
+# Bits written through wbs_sel_i byte lanes
+RW_MASK = (
+    0x00000000, 0x00000000, 0x00000001, 0x00000007, 0x00000000, 0x00000000, 0x0000000F, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF,
+    0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF,
+    0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x000000FF, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF,
+    0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF,
+)
+# Write-1-to-clear bits (byte-lane masked)
+W1C_MASK = (
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00010000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+)
+# Write-1-to-pulse bits (byte-lane masked, always read 0)
+W1P_MASK = (
+    0x00000000, 0x00000000, 0x00000002, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000001,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000300, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+    0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+)
+# Word index (byte address >> 2) -> slot, -1 = unmapped
+SLOT_OF_WORD = (
+    0, 1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    2, 3, 4, 5, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50,
+    51, 52, 53, 54, 55, 56, 57, 58, 59, 60, -1, -1, -1, -1, -1, -1,
+    61, 62, 63, 64, 65, 66, 67, 68,
+)
+
+# Bitfields: FIELDS[reg][field] = (shift, mask)
+FIELDS: Dict[str, Dict[str, Tuple[int, int]]] = {
+    "CTRL": {"ENABLE": (0, 0x00000001), "START": (1, 0x00000002)},
+    "IRQ_EN": {"IRQ_EN": (0, 0x00000007)},
+    "STATUS": {"CORE_STATUS": (0, 0x000000FF)},
+    "ADC_CFG": {"NUM_CH": (0, 0x0000000F)},
+    "ADC_CMD": {"SNAPSHOT": (0, 0x00000001)},
+    "ADC_FIFO_STATUS": {"LEVEL_WORDS": (0, 0x0000FFFF), "OVERRUN": (16, 0x00010000), "CAPTURE_BUSY": (17, 0x00020000)},
+    "EVT_CFG": {"EVT_EN": (0, 0x000000FF), "CLEAR_COUNTS": (8, 0x00000100), "CLEAR_HISTORY": (9, 0x00000200)},
+}
+
+_LANES = tuple(
+    (0xFF if s & 1 else 0) | (0xFF00 if s & 2 else 0) | (0xFF0000 if s & 4 else 0) | (0xFF000000 if s & 8 else 0)
+    for s in range(16)
+)
+_N_WORDS = len(SLOT_OF_WORD)
+_SLOT_OF_NAME = {n: i for i, n in enumerate(NAMES)}
+
+ReadHook = Callable[[], int]
+WriteHook = Callable[[int, int, int], None]
+
+
+class RegBank:
+    """Register file of home_inventory_wb with the spec's access semantics.
+
+    Storage is one int per register (`val`, indexed like NAMES). Hooks replace
+    storage for registers backed by other models:
+      on_read(reg, fn)   fn() -> value returned by read32 (e.g. FIFO pop)
+      on_write(reg, fn)  fn(value, w1p_bits, w1c_bits) after every write32 to
+                         reg; value is the updated storage, the bit sets are
+                         already masked by wbs_sel_i byte lanes.
+    `reg` is a register name or byte address. poke()/peek() access storage
+    directly (hardware side, no access rules, no hooks).
+    """
+
+    __slots__ = ("val", "_rd", "_wr")
+
+    def __init__(self) -> None:
+        self.val: List[int] = list(RESETS)
+        self._rd: List[Optional[ReadHook]] = [None] * len(NAMES)
+        self._wr: List[Optional[WriteHook]] = [None] * len(NAMES)
+
+    def reset(self) -> None:
+        """wb_rst_i: storage back to the spec reset values (hooks stay attached)."""
+
+        self.val[:] = RESETS
+
+    @staticmethod
+    def slot(reg: Union[str, int]) -> int:
+        if isinstance(reg, str):
+            return _SLOT_OF_NAME[reg]
+        w = reg >> 2
+        s = SLOT_OF_WORD[w] if 0 <= w < _N_WORDS else -1
+        if s < 0:
+            raise KeyError(f"no register at 0x{reg:08X}")
+        return s
+
+    def on_read(self, reg: Union[str, int], fn: Optional[ReadHook]) -> None:
+        self._rd[self.slot(reg)] = fn
+
+    def on_write(self, reg: Union[str, int], fn: Optional[WriteHook]) -> None:
+        self._wr[self.slot(reg)] = fn
+
+    def peek(self, reg: Union[str, int]) -> int:
+        return self.val[self.slot(reg)]
+
+    def poke(self, reg: Union[str, int], value: int) -> None:
+        self.val[self.slot(reg)] = value & 0xFFFFFFFF
+
+    # Wishbone accesses (adr[1:0] ignored like the RTL decode)
+
+    def read32(self, addr: int) -> int:
+        w = (addr & 0xFFFFFFFF) >> 2
+        s = SLOT_OF_WORD[w] if w < _N_WORDS else -1
+        if s < 0:
+            return 0
+        fn = self._rd[s]
+        return self.val[s] if fn is None else fn() & 0xFFFFFFFF
+
+    def write32(self, addr: int, data: int, sel: int = 0xF) -> None:
+        w = (addr & 0xFFFFFFFF) >> 2
+        s = SLOT_OF_WORD[w] if w < _N_WORDS else -1
+        if s < 0:
+            return
+        lanes = _LANES[sel & 0xF]
+        d = data & lanes
+        rw = RW_MASK[s]
+        w1c = d & W1C_MASK[s]
+        new = ((self.val[s] & ~(rw & lanes)) | (d & rw)) & ~w1c
+        self.val[s] = new
+        fn = self._wr[s]
+        if fn is not None:
+            fn(new, d & W1P_MASK[s], w1c)
+
+    def read_repeat(self, addr: int, n: int) -> List[int]:
+        """n back-to-back reads of one address (a FIFO drain burst)."""
+
+        w = (addr & 0xFFFFFFFF) >> 2
+        s = SLOT_OF_WORD[w] if w < _N_WORDS else -1
+        if s < 0:
+            return [0] * n
+        fn = self._rd[s]
+        if fn is None:
+            return [self.val[s]] * n
+        return [fn() & 0xFFFFFFFF for _ in range(n)]
+
+    def regs(self) -> Dict[str, int]:
+        """Storage snapshot keyed by register name (no hooks, no side effects)."""
+
+        return dict(zip(NAMES, self.val))
+
+
+def selftest() -> int:
+    """Check every register against the access tables with all 16 byte-lane masks."""
+
+    bank = RegBank()
+    fails = 0
+
+    def expect(got: int, exp: int, msg: str) -> None:
+        nonlocal fails
+        if got != exp:
+            fails += 1
+            print(f"FAIL: {msg}: got 0x{got:08X} expected 0x{exp:08X}")
+
+    for s, (name, addr) in enumerate(zip(NAMES, ADDRS)):
+        expect(bank.read32(addr), RESETS[s], f"{name} reset")
+        for sel in range(16):
+            lanes = _LANES[sel]
+            pulses: List[int] = []
+            bank.on_write(addr, lambda v, p, c: pulses.append(p))
+            bank.reset()
+            bank.poke(addr, 0xFFFFFFFF)
+            bank.write32(addr, 0x00000000, sel)
+            exp = 0xFFFFFFFF & ~(RW_MASK[s] & lanes)
+            expect(bank.read32(addr), exp, f"{name} write 0 sel={sel:04b}")
+            bank.write32(addr | 3, 0xFFFFFFFF, sel)
+            exp = (exp | (RW_MASK[s] & lanes)) & ~(W1C_MASK[s] & lanes)
+            expect(bank.read32(addr), exp, f"{name} write 1s sel={sel:04b} (w1c lanes)")
+            expect(pulses[-1], W1P_MASK[s] & lanes, f"{name} w1p pulse sel={sel:04b}")
+            bank.on_write(addr, None)
+    bank.reset()
+    for s, addr in enumerate(ADDRS):
+        bank.write32(addr, 0xFFFFFFFF)
+        expect(bank.read32(addr) & W1P_MASK[s], 0, f"{NAMES[s]} w1p bits read 0")
+    expect(bank.read32(ADDRS[-1] + 4), 0, "unmapped read")
+
+    # Hand-written from rtl/home_inventory_wb.v, independent of the generated
+    # RW/W1C/W1P tables the loop above checks against (a mask bug in the
+    # generator would pass that loop).
+    bank.reset()
+    bank.write32(ADR_CTRL, 0x00000003)
+    expect(bank.read32(ADR_CTRL), 0x00000001, "CTRL: ENABLE stored, START reads 0")
+    bank.write32(ADR_IRQ_EN, 0xFFFFFFFF)
+    expect(bank.read32(ADR_IRQ_EN), 0x00000007, "IRQ_EN stores bits [2:0] only")
+    for sel, exp in ((0b1011, 0x00010000), (0b0100, 0x00000000)):
+        bank.poke(ADR_ADC_FIFO_STATUS, 0x00010000)
+        bank.write32(ADR_ADC_FIFO_STATUS, 0x00010000, sel)
+        expect(bank.read32(ADR_ADC_FIFO_STATUS), exp, f"ADC_FIFO_STATUS OVERRUN W1C needs lane 2 (sel={sel:04b})")
+    bank.write32(ADR_EVT_CFG, 0x000003A5)
+    expect(bank.read32(ADR_EVT_CFG), 0x000000A5, "EVT_CFG: EVT_EN stored, CLEAR_COUNTS/CLEAR_HISTORY read 0")
+
+    print("regbank selftest: " + ("PASS" if fails == 0 else f"{fails} FAIL(s)") + f" ({len(NAMES)} registers)")
+    return 0 if fails == 0 else 1
+
+
+def bench(n: int = 1_000_000) -> None:
+    """Print read32/write32 throughput for a firmware-style mix."""
+
+    bank = RegBank()
+    rd, wr = bank.read32, bank.write32
+    addrs = ADDRS
+    t0 = time.perf_counter()
+    for i in range(n):
+        rd(addrs[i % len(addrs)])
+    t1 = time.perf_counter()
+    for i in range(n):
+        wr(addrs[i % len(addrs)], i, 0xF)
+    t2 = time.perf_counter()
+    print(f"read32:  {n / (t1 - t0) / 1e6:.2f} M/s")
+    print(f"write32: {n / (t2 - t1) / 1e6:.2f} M/s")
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description="Register-bank model of home_inventory_wb (generated)")
+    ap.add_argument("--selftest", action="store_true", help="Check access semantics for every register")
+    ap.add_argument("--bench", type=int, metavar="N", default=0, help="Time N reads and N writes")
+    args = ap.parse_args(argv)
+    rc = selftest() if args.selftest or not args.bench else 0
+    if args.bench:
+        bench(args.bench)
+    return rc
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""Streaming VCD reader: Wishbone accesses and ADC FIFO traffic as a table.
+
+The verify/*_tb.v benches only print PASS/FAIL. This tool turns their VCD dumps
+(`$dumpfile`/`$dumpvars`) into one row per bus-level event, so long
+adc_streaming_ingest / wb runs can be diffed against the Python models
+(model/adc_fifo_model.py, model/event_detector_model.py, fw/tools/decode_adc_fifo.py)
+and measured for throughput without opening a waveform viewer.
+
+Events (sampled on the rising edge of the group's clock, using the values
+settled before that edge, i.e. what the RTL's flops see):
+  WR / RD  Wishbone access acknowledged (wbs_ack_o high): address, data
+           (wbs_dat_i for writes, wbs_dat_o for reads) and wbs_sel_i
+  PUSH     adc_stream_fifo push_valid && push_ready: pushed word
+  DROP     push_valid && !push_ready: word lost to a full FIFO (OVERRUN)
+  POP      pop_valid && pop_ready: popped word
+PUSH/POP/DROP rows carry the FIFO occupancy after the edge as seen from the
+tracked push/pop strobes.
+
+Signals are found by name. The Wishbone group is the shallowest scope that has
+wbs_ack_o (override with `--wb-scope tb.dut`); the FIFO group is the shallowest
+scope with push_valid/push_ready/pop_valid/pop_ready (`--fifo-scope`). Each
+group is clocked by the first of wb_clk_i/clk/clk_i in its scope (`--clk`).
+Only those identifier codes are decoded; every other value change is skipped
+without parsing, and the file is read in fixed-size chunks, so memory stays
+flat however long the simulation ran.
+
+Usage:
+  python3 verify/model/vcd_transactions.py adc_streaming_ingest_tb.vcd
+  python3 verify/model/vcd_transactions.py wb.vcd --csv txn.csv --words pop fifo_words.txt
+  python3 verify/model/vcd_transactions.py wb.vcd --summary   # counts + throughput only
+
+`--words push|pop FILE` writes the pushed or popped FIFO words one 0x%08X per
+line, which fw/tools/decode_adc_fifo.py reads directly.
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import csv
+import sys
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Iterator, List, Optional, Sequence, TextIO
+
+_READ_CHUNK_BYTES = 1 << 22
+
+_CLK_NAMES = ("wb_clk_i", "clk", "clk_i")
+_WB_ROLES = ("wbs_cyc_i", "wbs_stb_i", "wbs_we_i", "wbs_sel_i", "wbs_adr_i", "wbs_dat_i", "wbs_dat_o", "wbs_ack_o")
+_FIFO_ROLES = ("push_valid", "push_ready", "push_data", "pop_valid", "pop_ready", "pop_data")
+_FIFO_REQUIRED = ("push_valid", "push_ready", "pop_valid", "pop_ready")
+
+KINDS = ("WR", "RD", "PUSH", "DROP", "POP")
+
+
+@dataclass
+class Txn:
+    time: int
+    cycle: int
+    kind: str
+    addr: Optional[int] = None
+    data: Optional[int] = None
+    sel: Optional[int] = None
+    level: Optional[int] = None
+
+
+@dataclass
+class _Group:
+    name: str
+    scope: str
+    clk: str
+    ids: Dict[str, str]  # role -> VCD identifier code
+    cycle: int = 0
+    level: int = 0
+
+
+@dataclass
+class VcdHeader:
+    timescale: str = ""
+    # scope path ("tb.dut") -> {signal name -> identifier code}
+    scopes: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+
+def _tokens(stream: BinaryIO) -> Iterator[bytes]:
+    """Yield whitespace-separated VCD tokens, reading in large chunks."""
+
+    tail = b""
+    while True:
+        chunk = stream.read(_READ_CHUNK_BYTES)
+        if not chunk:
+            break
+        parts = (tail + chunk).split()
+        if chunk[-1:].isspace():
+            tail = b""
+        else:
+            tail = parts.pop() if parts else b""
+        yield from parts
+    if tail:
+        yield tail
+
+
+def read_header(tokens: Iterator[bytes]) -> VcdHeader:
+    """Consume declarations up to $enddefinitions and return the signal map."""
+
+    hdr = VcdHeader()
+    path: List[str] = []
+    for tok in tokens:
+        if tok == b"$scope":
+            next(tokens)  # scope kind
+            path.append(next(tokens).decode())
+            _skip_end(tokens)
+        elif tok == b"$upscope":
+            path.pop()
+            _skip_end(tokens)
+        elif tok == b"$var":
+            body = _until_end(tokens)
+            if len(body) < 4:
+                raise ValueError(f"malformed $var: {b' '.join(body)!r}")
+            code, name = body[2].decode(), body[3].decode().split("[", 1)[0]
+            hdr.scopes.setdefault(".".join(path), {}).setdefault(name, code)
+        elif tok == b"$timescale":
+            hdr.timescale = b"".join(_until_end(tokens)).decode()
+        elif tok == b"$enddefinitions":
+            _skip_end(tokens)
+            return hdr
+        elif tok.startswith(b"$"):
+            _skip_end(tokens)
+    raise ValueError("no $enddefinitions (truncated or not a VCD file)")
+
+
+def _until_end(tokens: Iterator[bytes]) -> List[bytes]:
+    out = []
+    for tok in tokens:
+        if tok == b"$end":
+            return out
+        out.append(tok)
+    raise ValueError("unterminated $ section")
+
+
+def _skip_end(tokens: Iterator[bytes]) -> None:
+    _until_end(tokens)
+
+
+def _find_group(hdr: VcdHeader, name: str, roles: Sequence[str], required: Sequence[str], scope: Optional[str], clk: Optional[str]) -> Optional[_Group]:
+    if scope is not None:
+        if scope not in hdr.scopes:
+            raise ValueError(f"scope {scope!r} not in VCD")
+        cands = [scope]
+    else:
+        cands = sorted((s for s, sig in hdr.scopes.items() if all(r in sig for r in required)), key=lambda s: (s.count("."), s))
+    for s in cands:
+        sig = hdr.scopes[s]
+        clk_name = clk if clk is not None else next((c for c in _CLK_NAMES if c in sig), None)
+        missing = [r for r in required if r not in sig]
+        if missing or clk_name not in sig:
+            if scope is not None:
+                raise ValueError(f"scope {scope!r} lacks {', '.join(missing) or clk_name or 'a clock'}")
+            continue
+        ids = {r: sig[r] for r in roles if r in sig}
+        return _Group(name=name, scope=s, clk=sig[clk_name], ids=ids)
+    return None
+
+
+def _value(v: bytes) -> Optional[int]:
+    try:
+        return int(v, 2)
+    except ValueError:  # x / z bits
+        return None
+
+
+def iter_transactions(tokens: Iterator[bytes], groups: Sequence[_Group]) -> Iterator[Txn]:
+    """Replay the value-change section and yield Txn rows in time order."""
+
+    watched = {g.clk for g in groups}
+    for g in groups:
+        watched.update(g.ids.values())
+    cur: Dict[str, Optional[int]] = {c: None for c in watched}
+    pre: Dict[str, Optional[int]] = {}  # values before the current timestep
+    time = 0
+
+    def step() -> Iterator[Txn]:
+        for g in groups:
+            if g.clk not in pre or pre[g.clk] != 0 or cur[g.clk] != 1:
+                continue
+            g.cycle += 1
+            v = {r: (pre[c] if c in pre else cur[c]) for r, c in g.ids.items()}
+            if g.name == "wb":
+                if v.get("wbs_ack_o") == 1:
+                    we = v.get("wbs_we_i")
+                    yield Txn(
+                        time,
+                        g.cycle,
+                        "WR" if we else "RD",
+                        addr=v.get("wbs_adr_i"),
+                        data=v.get("wbs_dat_i") if we else v.get("wbs_dat_o"),
+                        sel=v.get("wbs_sel_i"),
+                    )
+            else:
+                do_push = v["push_valid"] == 1 and v["push_ready"] == 1
+                do_pop = v["pop_valid"] == 1 and v["pop_ready"] == 1
+                g.level += int(do_push) - int(do_pop)
+                if v["push_valid"] == 1 and v["push_ready"] == 0:
+                    yield Txn(time, g.cycle, "DROP", data=v.get("push_data"), level=g.level)
+                if do_pop:
+                    yield Txn(time, g.cycle, "POP", data=v.get("pop_data"), level=g.level)
+                if do_push:
+                    yield Txn(time, g.cycle, "PUSH", data=v.get("push_data"), level=g.level)
+
+    pending: Optional[bytes] = None
+    for tok in tokens:
+        if pending is not None:
+            code = tok.decode()
+            if code in cur:
+                pre.setdefault(code, cur[code])
+                cur[code] = _value(pending[1:]) if pending[:1] in b"bB" else None
+            pending = None
+            continue
+        c = tok[:1]
+        if c == b"#":
+            if pre:
+                yield from step()
+                pre.clear()
+            time = int(tok[1:])
+        elif c in b"01xXzZ" and len(tok) > 1:
+            code = tok[1:].decode()
+            if code in cur:
+                pre.setdefault(code, cur[code])
+                cur[code] = 1 if c == b"1" else 0 if c == b"0" else None
+        elif c in b"bBrR":
+            pending = tok
+        # $dumpvars / $dumpall / $end / $comment keywords carry no state here;
+        # their value changes are handled by the branches above.
+    if pre:
+        yield from step()
+
+
+def _fmt(v: Optional[int], width: int = 8) -> str:
+    return "" if v is None else f"0x{v:0{width}X}"
+
+
+class Summary:
+    def __init__(self) -> None:
+        self.counts: Dict[str, int] = collections.Counter()
+        self.first: Optional[Txn] = None
+        self.last: Optional[Txn] = None
+        self.max_level = 0
+
+    def update(self, t: Txn) -> None:
+        self.counts[t.kind] += 1
+        if t.kind in ("PUSH", "POP", "DROP"):
+            if self.first is None:
+                self.first = t
+            self.last = t
+            self.max_level = max(self.max_level, t.level or 0)
+
+    def format(self, timescale: str) -> str:
+        lines = ["kind   count"]
+        lines += [f"{k:<5} {self.counts.get(k, 0):>7}" for k in KINDS]
+        if self.first is not None and self.last is not None:
+            cycles = self.last.cycle - self.first.cycle + 1
+            push = self.counts.get("PUSH", 0)
+            lines.append(
+                f"fifo: {cycles} cycles ({self.last.time - self.first.time} x {timescale or '1'}), "
+                f"{push / cycles:.4f} pushed words/cycle, max level {self.max_level}"
+            )
+        return "\n".join(lines)
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description="Extract Wishbone and ADC FIFO transactions from a VCD dump")
+    ap.add_argument("vcd", help="VCD file, or '-' for stdin")
+    ap.add_argument("--wb-scope", default=None, help="Scope of the Wishbone slave ports (default: shallowest with wbs_ack_o)")
+    ap.add_argument("--fifo-scope", default=None, help="Scope of the adc_stream_fifo ports (default: shallowest with push/pop strobes)")
+    ap.add_argument("--clk", default=None, help=f"Clock signal name in each scope (default: first of {', '.join(_CLK_NAMES)})")
+    ap.add_argument("--no-wb", action="store_true", help="Do not track Wishbone accesses")
+    ap.add_argument("--no-fifo", action="store_true", help="Do not track FIFO pushes/pops")
+    ap.add_argument("--csv", default=None, help="Write the transaction table as CSV to this file ('-' = stdout)")
+    ap.add_argument("--words", nargs=2, metavar=("push|pop", "FILE"), default=None, help="Write pushed or popped FIFO words, one 0x%%08X per line")
+    ap.add_argument("--summary", action="store_true", help="Only print per-kind counts and FIFO throughput")
+    args = ap.parse_args(argv)
+
+    if args.words and args.words[0] not in ("push", "pop"):
+        raise SystemExit("--words expects 'push' or 'pop'")
+
+    stream = sys.stdin.buffer if args.vcd == "-" else open(args.vcd, "rb")
+    out_csv: Optional[TextIO] = None
+    words_out: Optional[TextIO] = None
+    try:
+        tokens = _tokens(stream)
+        try:
+            hdr = read_header(tokens)
+            groups: List[_Group] = []
+            if not args.no_wb:
+                g = _find_group(hdr, "wb", _WB_ROLES, ("wbs_ack_o",), args.wb_scope, args.clk)
+                if g is not None:
+                    groups.append(g)
+            if not args.no_fifo:
+                g = _find_group(hdr, "fifo", _FIFO_ROLES, _FIFO_REQUIRED, args.fifo_scope, args.clk)
+                if g is not None:
+                    groups.append(g)
+        except (ValueError, StopIteration) as e:
+            print(f"[error] {args.vcd}: {e or 'truncated header'}", file=sys.stderr)
+            return 2
+        if not groups:
+            print(f"[error] {args.vcd}: no Wishbone or FIFO signals found", file=sys.stderr)
+            return 2
+        for g in groups:
+            print(f"[info] {g.name}: scope {g.scope}", file=sys.stderr)
+
+        writer = None
+        if args.csv:
+            out_csv = sys.stdout if args.csv == "-" else open(args.csv, "w", newline="")
+            writer = csv.writer(out_csv)
+            writer.writerow(["time", "cycle", "kind", "addr", "data", "sel", "level"])
+        if args.words:
+            words_out = open(args.words[1], "w")
+        words_kind = args.words[0].upper() if args.words else None
+        table = not args.summary and not args.csv
+
+        summary = Summary()
+        unknown_words = 0
+        if table:
+            print(f"{'time':>12} {'cycle':>9} kind  {'addr':>10} {'data':>10} sel lvl")
+        for t in iter_transactions(tokens, groups):
+            summary.update(t)
+            if writer is not None:
+                writer.writerow([t.time, t.cycle, t.kind, _fmt(t.addr), _fmt(t.data), "" if t.sel is None else f"{t.sel:X}", "" if t.level is None else t.level])
+            if table:
+                sel = "" if t.sel is None else f"{t.sel:X}"
+                lvl = "" if t.level is None else str(t.level)
+                print(f"{t.time:>12} {t.cycle:>9} {t.kind:<5} {_fmt(t.addr):>10} {_fmt(t.data) or 'x':>10} {sel:>3} {lvl:>3}")
+            if t.kind == words_kind and words_out is not None:
+                if t.data is None:
+                    unknown_words += 1
+                else:
+                    words_out.write(f"0x{t.data:08X}\n")
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+        if out_csv is not None and out_csv is not sys.stdout:
+            out_csv.close()
+        if words_out is not None:
+            words_out.close()
+
+    if unknown_words:
+        print(f"[warn] {unknown_words} {words_kind} word(s) with x/z bits not written to {args.words[1]}", file=sys.stderr)
+    print(summary.format(hdr.timescale), file=sys.stderr if not args.summary else sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
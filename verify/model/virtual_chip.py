@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""Local virtual chip: serves the home_inventory_wb register map over a Unix socket.
+
+Stand-in for silicon during firmware-in-the-loop runs. A host build of
+fw/examples/*.c (fw/host/, -DHOMEINV_HOST_SIM) turns mmio_read32/mmio_write32
+into requests on the socket; this process answers them from the generated
+register bank (home_inventory_regbank.py) with the ADC FIFO, the event detector
+(event_detector_model.py) and TIME_NOW attached behind it.
+
+ADC frame sources (9 words: STATUS + CH0..CH7):
+  --mode stub     ADC_CMD.SNAPSHOT pushes the RTL stub ramp frame (default RTL build)
+  --mode start    each CTRL.START captures the next source frame after
+                  --capture-cycles (USE_REAL_ADC_INGEST today; CAPTURE_BUSY is high
+                  meanwhile)
+  --mode stream   after the first CTRL.START, source frames arrive every
+                  clk/--odr-hz cycles (DRDY-paced streaming) until the source ends
+                  (or forever with --loop)
+  Source: --frames FILE (.npz from fw/tools/decode_adc_fifo.py --out, or raw
+  little-endian u32 words) or --synthetic (per-channel sines, 24-bit signed).
+
+Time: every Wishbone access costs --wb-cycles of chip time. With --clock wall
+(default) the wall time of idle gaps between accesses (firmware sleeps, polling
+periods) is added on top, minus the first --idle-us of each gap, which covers
+the socket round trip and Python dispatch of the simulator itself; a burst of
+back-to-back accesses therefore costs bus cycles only, not IPC time. With
+--clock bus only the --wb-cycles per access count (deterministic, but firmware
+sleeps take no chip time at all). TIME_NOW reads this chip time.
+Frames due since the last access are delivered in one vectorized step before
+each access, so high data rates cost nothing while the firmware is not polling,
+and the FIFO sees exactly the push/pop order the RTL would: words pushed into a
+full 16-word FIFO are dropped and set the sticky OVERRUN.
+
+On exit (Ctrl-C, or the STATS request) it reports frames delivered and lost,
+OVERRUN events, the worst FIFO level and the drain latency (push -> pop) of
+every word.
+
+Wire protocol: the batched register-transaction format of fw/tools/homeinv_txn.py
+(12-byte READ/WRITE/READ_N/DRAIN/STATS/RESET records, replies in order), so
+homeinv_txn.SocketTransport is also the Python client. Addresses are CPU
+addresses; --base (default 0x30000000) is subtracted.
+
+Usage:
+  python3 verify/model/virtual_chip.py --mode stream --synthetic --odr-hz 4000 --loop
+  python3 verify/model/virtual_chip.py --mode stream --frames frames.npz --odr-hz 8000 --stats-json run.json
+  make -C fw/host && HOMEINV_SOCK=/tmp/homeinv_vchip.sock fw/host/homeinv_host drain 5 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import json
+import os
+import signal
+import socketserver
+import sys
+import threading
+import time
+from array import array
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:
+    raise SystemExit("virtual_chip.py requires NumPy (pip install numpy)")
+
+from event_detector_model import EventDetectorModel
+from home_inventory_regbank import (
+    ADR_ADC_CMD,
+    ADR_ADC_FIFO_DATA,
+    ADR_ADC_FIFO_STATUS,
+    ADR_ADC_SNAPSHOT_COUNT,
+    ADR_CTRL,
+    ADR_EVT_CFG,
+    ADR_EVT_LAST_TS,
+    ADR_TIME_NOW,
+    FIELDS,
+    NAMES,
+    RegBank,
+)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "fw" / "tools"))
+from homeinv_txn import DEFAULT_BASE, DEFAULT_SOCK, REQ, execute  # noqa: E402
+
+WORDS_PER_FRAME = 9
+N_CHANNELS = 8
+FIFO_DEPTH_WORDS = 16  # decisions/010
+
+# 10 words x 24 bits, SCLK = clk / (2 * SCLK_DIV=4), plus CS framing.
+CAPTURE_CYCLES = 10 * 24 * 2 * 4 + 16
+
+_START = FIELDS["CTRL"]["START"][1]
+_SNAPSHOT = FIELDS["ADC_CMD"]["SNAPSHOT"][1]
+_OVERRUN = FIELDS["ADC_FIFO_STATUS"]["OVERRUN"]
+_BUSY_SHIFT = FIELDS["ADC_FIFO_STATUS"]["CAPTURE_BUSY"][0]
+_EVT_EN = FIELDS["EVT_CFG"]["EVT_EN"][1]
+_CLEAR_COUNTS = FIELDS["EVT_CFG"]["CLEAR_COUNTS"][1]
+_CLEAR_HISTORY = FIELDS["EVT_CFG"]["CLEAR_HISTORY"][1]
+
+
+@dataclass
+class Stats:
+    accesses: int = 0
+    frames_delivered: int = 0
+    frames_lost: int = 0  # at least one word dropped
+    words_pushed: int = 0
+    words_dropped: int = 0
+    overrun_events: int = 0  # OVERRUN 0 -> 1 transitions
+    overrun_clears: int = 0
+    words_popped: int = 0
+    empty_pops: int = 0
+    max_level: int = 0
+    events: int = 0  # event detector hits
+
+
+# ---------------------------------------------------------------------------
+# Frame sources
+# ---------------------------------------------------------------------------
+
+
+def load_source(path: str) -> "np.ndarray":
+    """(N, 9) u32 FIFO frames from a decode_adc_fifo .npz or a raw u32 word file."""
+
+    if path.endswith(".npz"):
+        d = np.load(path)
+        missing = [f"ch{i}" for i in range(N_CHANNELS) if f"ch{i}" not in d.files]
+        if missing:
+            raise SystemExit(f"{path}: missing column(s) {', '.join(missing)}")
+        n = len(d["ch0"])
+        out = np.zeros((n, WORDS_PER_FRAME), dtype=np.uint32)
+        if "status" in d.files:
+            out[:, 0] = d["status"].astype(np.uint32)
+        for i in range(N_CHANNELS):
+            out[:, 1 + i] = d[f"ch{i}"].astype(np.int64).astype(np.uint32)
+        return out
+    words = np.fromfile(path, dtype="<u4")
+    n = len(words) // WORDS_PER_FRAME
+    if len(words) % WORDS_PER_FRAME:
+        print(f"[warn] {len(words) % WORDS_PER_FRAME} trailing word(s) ignored", file=sys.stderr)
+    return words[: n * WORDS_PER_FRAME].reshape(n, WORDS_PER_FRAME).astype(np.uint32)
+
+
+def synthetic_source(odr_hz: float, *, seconds: float = 1.0, seed: int = 1) -> "np.ndarray":
+    """Per-channel sines (1..8 Hz, 1/8 full scale) plus noise, sign-extended 24-bit."""
+
+    n = max(int(odr_hz * seconds), 1)
+    t = np.arange(n) / odr_hz
+    rng = np.random.default_rng(seed)
+    ch = np.stack([(1 << 20) * np.sin(2 * np.pi * (k + 1) * t) + rng.normal(0, 64, n) for k in range(N_CHANNELS)], axis=1)
+    out = np.zeros((n, WORDS_PER_FRAME), dtype=np.uint32)
+    out[:, 1:] = np.clip(ch, -(1 << 23), (1 << 23) - 1).astype(np.int64).astype(np.uint32)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Chip model
+# ---------------------------------------------------------------------------
+
+
+class VirtualChip:
+    """RegBank + ADC FIFO + event detector + TIME_NOW, advanced lazily per access."""
+
+    def __init__(
+        self,
+        *,
+        mode: str = "stub",
+        source: Optional["np.ndarray"] = None,
+        loop: bool = False,
+        odr_hz: float = 4000.0,
+        clk_hz: float = 25e6,
+        clock: str = "wall",
+        wb_cycles: int = 4,
+        idle_us: float = 50.0,
+        depth: int = FIFO_DEPTH_WORDS,
+        capture_cycles: int = CAPTURE_CYCLES,
+    ) -> None:
+        if mode != "stub" and (source is None or len(source) == 0):
+            raise ValueError(f"--mode {mode} needs a frame source (--frames or --synthetic)")
+        self.mode = mode
+        self.source = source
+        self.loop = loop
+        self.period = clk_hz / odr_hz
+        self.clk_hz = clk_hz
+        self.clock = clock
+        self.wb_cycles = wb_cycles
+        self.idle_s = idle_us * 1e-6
+        self.depth = depth
+        self.capture_cycles = capture_cycles
+
+        self.bank = RegBank()
+        self.det = EventDetectorModel()
+        self._attach()
+        self.reset()
+
+    def reset(self) -> None:
+        self.bank.reset()
+        self.det.reset()
+        self.det.thresh[:] = 0
+        self.fifo: Deque[int] = collections.deque()
+        self.fifo_t: Deque[int] = collections.deque()  # push cycle per word
+        self.overrun = False
+        self.src_pos = 0
+        self.stream_t0: Optional[float] = None  # cycle of frame 0 (stream mode)
+        self.stream_k = 0  # next frame index
+        self.capture_done: Optional[int] = None  # start mode: cycle the pending capture lands
+        self.stats = Stats()
+        self.latency = array("I")  # push -> pop cycles per popped word
+        self._t0 = time.perf_counter()
+        self._t_last = self._t0
+        self._cyc = 0
+
+    # -- time ------------------------------------------------------------
+
+    def _tick(self) -> int:
+        self._cyc += self.wb_cycles
+        if self.clock == "wall":
+            now = time.perf_counter()
+            idle = now - self._t_last - self.idle_s
+            self._t_last = now
+            if idle > 0:
+                self._cyc += int(idle * self.clk_hz)
+        return self._cyc
+
+    # -- register-bank hooks ---------------------------------------------
+
+    def _attach(self) -> None:
+        b = self.bank
+        b.on_read(ADR_TIME_NOW, lambda: self._cyc)
+        b.on_read(ADR_ADC_FIFO_STATUS, self._fifo_status)
+        b.on_write(ADR_ADC_FIFO_STATUS, self._fifo_status_w)
+        b.on_read(ADR_ADC_FIFO_DATA, self._pop)
+        b.on_write(ADR_CTRL, self._ctrl_w)
+        b.on_write(ADR_ADC_CMD, self._adc_cmd_w)
+        b.on_write(ADR_EVT_CFG, self._evt_cfg_w)
+        b.on_read(ADR_EVT_LAST_TS, lambda: self.det.last_ts)
+        det = self.det
+        for ch in range(N_CHANNELS):
+            b.on_read(f"EVT_COUNT_CH{ch}", lambda ch=ch: int(det.count[ch]))
+            b.on_read(f"EVT_LAST_DELTA_CH{ch}", lambda ch=ch: int(det.last_delta[ch]))
+            b.on_read(f"EVT_LAST_TS_CH{ch}", lambda ch=ch: int(det.last_ts_ch[ch]))
+            b.on_write(f"EVT_THRESH_CH{ch}", lambda v, _p, _c, ch=ch: det.set_thresh(ch, v))
+
+    def _fifo_status(self) -> int:
+        busy = self.capture_done is not None and self._cyc < self.capture_done
+        return len(self.fifo) | (_OVERRUN[1] if self.overrun else 0) | (int(busy) << _BUSY_SHIFT)
+
+    def _fifo_status_w(self, _v: int, _p: int, w1c: int) -> None:
+        if w1c & _OVERRUN[1] and self.overrun:
+            self.overrun = False
+            self.stats.overrun_clears += 1
+
+    def _pop(self) -> int:
+        if not self.fifo:
+            self.stats.empty_pops += 1
+            return 0
+        self.stats.words_popped += 1
+        self.latency.append(max(self._cyc - self.fifo_t.popleft(), 0))
+        return self.fifo.popleft()
+
+    def _ctrl_w(self, _v: int, pulse: int, _c: int) -> None:
+        if not pulse & _START:
+            return
+        if self.mode == "stream" and self.stream_t0 is None:
+            self.stream_t0 = self._cyc + self.period
+        elif self.mode == "start" and self.capture_done is None:
+            self.capture_done = self._cyc + self.capture_cycles
+
+    def _adc_cmd_w(self, _v: int, pulse: int, _c: int) -> None:
+        if pulse & _SNAPSHOT and self.mode == "stub":
+            n = self.bank.peek(ADR_ADC_SNAPSHOT_COUNT) + 1
+            frame = np.zeros((1, WORDS_PER_FRAME), dtype=np.uint32)
+            frame[0, 1:] = (0x1000 + n + np.arange(N_CHANNELS)) & 0xFFFFFFFF
+            self._deliver(frame, np.array([self._cyc], dtype=np.int64))
+
+    def _evt_cfg_w(self, v: int, pulse: int, _c: int) -> None:
+        if pulse & (_CLEAR_COUNTS | _CLEAR_HISTORY):
+            self.det.clear(counts=bool(pulse & _CLEAR_COUNTS), history=bool(pulse & _CLEAR_HISTORY))
+        self.det.set_enable(v & _EVT_EN)
+
+    # -- frame delivery ----------------------------------------------------
+
+    def _take(self, n: int) -> "np.ndarray":
+        """Next n source frames (fewer at the end of a non-looping source)."""
+
+        src = self.source
+        assert src is not None
+        if self.loop:
+            idx = (self.src_pos + np.arange(n)) % len(src)
+            self.src_pos = int((self.src_pos + n) % len(src))
+            return src[idx]
+        rows = src[self.src_pos : self.src_pos + n]
+        self.src_pos += len(rows)
+        return rows
+
+    def _deliver(self, frames: "np.ndarray", ts: "np.ndarray") -> None:
+        """Frames captured at cycles `ts`: ADC_RAW mirror, detector, FIFO push."""
+
+        n = len(frames)
+        if n == 0:
+            return
+        st = self.stats
+        st.frames_delivered += n
+        b = self.bank
+        b.poke(ADR_ADC_SNAPSHOT_COUNT, b.peek(ADR_ADC_SNAPSHOT_COUNT) + n)
+        for ch in range(N_CHANNELS):
+            b.poke(f"ADC_RAW_CH{ch}", int(frames[-1, 1 + ch]))
+        st.events += len(self.det.step(frames[:, 1:], (ts & 0xFFFFFFFF).astype(np.uint32)))
+
+        # adc_frame_to_fifo pushes one word per cycle starting the cycle after
+        # the frame; a full FIFO drops the word and sets OVERRUN. All of these
+        # pushes precede the current access, so a prefix fits and the rest drops.
+        room = self.depth - len(self.fifo)
+        total = n * WORDS_PER_FRAME
+        take = min(room, total)
+        if take > 0:
+            words = frames.reshape(-1)[:take]
+            t_words = (ts[:, None] + 1 + np.arange(WORDS_PER_FRAME)).reshape(-1)[:take]
+            self.fifo.extend(words.tolist())
+            self.fifo_t.extend(t_words.tolist())
+            st.words_pushed += take
+            st.max_level = max(st.max_level, len(self.fifo))
+        if take < total:
+            st.words_dropped += total - take
+            st.frames_lost += n - take // WORDS_PER_FRAME
+            if not self.overrun:
+                st.overrun_events += 1
+            self.overrun = True
+
+    def _advance(self, now: int) -> None:
+        if self.stream_t0 is not None:
+            due = int((now - self.stream_t0) // self.period) + 1 - self.stream_k
+            if due > 0:
+                k = self.stream_k + np.arange(due)
+                ts = (self.stream_t0 + k * self.period).astype(np.int64)
+                frames = self._take(due)
+                self.stream_k += due
+                self._deliver(frames, ts[: len(frames)])
+                if len(frames) < due:  # source exhausted
+                    self.stream_t0 = None
+        if self.capture_done is not None and now >= self.capture_done:
+            t = self.capture_done
+            self.capture_done = None
+            self._deliver(self._take(1), np.array([t], dtype=np.int64))
+
+    # -- bus accesses --------------------------------------------------------
+
+    def read32(self, off: int) -> int:
+        self.stats.accesses += 1
+        self._advance(self._tick())
+        return self.bank.read32(off)
+
+    def write32(self, off: int, data: int, sel: int = 0xF) -> None:
+        self.stats.accesses += 1
+        self._advance(self._tick())
+        self.bank.write32(off, data, sel)
+
+    def report(self) -> Dict[str, object]:
+        out: Dict[str, object] = dict(asdict(self.stats))
+        out["elapsed_s"] = self._cyc / self.clk_hz
+        out["wall_s"] = round(time.perf_counter() - self._t0, 6)
+        out["fifo_level"] = len(self.fifo)
+        out["overrun"] = self.overrun
+        if len(self.latency):
+            lat = np.frombuffer(self.latency, dtype=np.uint32) / self.clk_hz * 1e6
+            out["drain_latency_us"] = {
+                "mean": round(float(lat.mean()), 3),
+                "p50": round(float(np.percentile(lat, 50)), 3),
+                "p99": round(float(np.percentile(lat, 99)), 3),
+                "max": round(float(lat.max()), 3),
+            }
+        return out
+
+
+# ---------------------------------------------------------------------------
+# Socket server / client
+# ---------------------------------------------------------------------------
+
+
+def serve_requests(
+    chip: VirtualChip,
+    recv: Callable[[int], bytes],
+    send: Callable[[bytes], None],
+    base: int,
+    lock: Optional[threading.Lock] = None,
+) -> None:
+    """Process requests until EOF; replies for one received chunk go out together.
+
+    `lock` is held while one chunk executes, so clients sharing the chip
+    interleave batch by batch.
+    """
+
+    if lock is None:
+        lock = threading.Lock()
+    buf = b""
+    while True:
+        data = recv(1 << 16)
+        if not data:
+            return
+        buf += data
+        n = len(buf) // REQ.size * REQ.size
+        if n == 0:
+            continue
+        with lock:
+            out = execute(chip, buf[:n], base)
+        buf = buf[n:]
+        if out:
+            send(out)
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        srv = self.server
+        try:
+            serve_requests(srv.chip, self.request.recv, self.request.sendall, srv.base, srv.lock)  # type: ignore[attr-defined]
+        except (ConnectionError, ValueError) as e:
+            print(f"[virtual_chip] client dropped: {e}", file=sys.stderr)
+
+
+def main(argv: List[str]) -> int:
+    ap = argparse.ArgumentParser(description="Serve a virtual home_inventory chip over a Unix socket")
+    ap.add_argument("--sock", default=os.environ.get("HOMEINV_SOCK", DEFAULT_SOCK))
+    ap.add_argument("--base", type=lambda s: int(s, 0), default=DEFAULT_BASE, help="CPU address of register 0")
+    ap.add_argument("--mode", choices=("stub", "start", "stream"), default="stub")
+    src = ap.add_mutually_exclusive_group()
+    src.add_argument("--frames", help="Frame source: .npz (decode_adc_fifo --out) or raw LE u32 words")
+    src.add_argument("--synthetic", action="store_true", help="Synthetic per-channel sines")
+    ap.add_argument("--loop", action="store_true", help="Restart the frame source when it ends")
+    ap.add_argument("--odr-hz", type=float, default=4000.0, help="Frame rate in stream mode")
+    ap.add_argument("--clk-hz", type=float, default=25e6, help="wb_clk_i (TIME_NOW rate)")
+    ap.add_argument(
+        "--clock",
+        choices=("wall", "bus"),
+        default="wall",
+        help="wall: --wb-cycles per access plus idle gaps between accesses; bus: --wb-cycles per access only "
+        "(reproducible, but firmware sleeps take no chip time)",
+    )
+    ap.add_argument("--wb-cycles", type=int, default=4, help="Chip cycles charged per Wishbone access")
+    ap.add_argument(
+        "--idle-us",
+        type=float,
+        default=50.0,
+        help="With --clock wall, the first N us of each gap between accesses are simulator/IPC overhead, "
+        "not chip time (default: 50)",
+    )
+    ap.add_argument("--capture-cycles", type=int, default=CAPTURE_CYCLES, help="CAPTURE_BUSY time in start mode")
+    ap.add_argument("--stats-json", help="Write the final statistics here")
+    args = ap.parse_args(argv)
+    if args.wb_cycles < 1:
+        raise SystemExit("--wb-cycles must be >= 1")
+    if args.idle_us < 0:
+        raise SystemExit("--idle-us must be >= 0")
+
+    source = None
+    if args.frames:
+        source = load_source(args.frames)
+    elif args.synthetic:
+        source = synthetic_source(args.odr_hz)
+    try:
+        chip = VirtualChip(
+            mode=args.mode,
+            source=source,
+            loop=args.loop,
+            odr_hz=args.odr_hz,
+            clk_hz=args.clk_hz,
+            clock=args.clock,
+            wb_cycles=args.wb_cycles,
+            idle_us=args.idle_us,
+            capture_cycles=args.capture_cycles,
+        )
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    if os.path.exists(args.sock):
+        os.unlink(args.sock)
+    srv = socketserver.ThreadingUnixStreamServer(args.sock, _Handler)
+    srv.daemon_threads = True
+    srv.chip, srv.base, srv.lock = chip, args.base, threading.Lock()  # type: ignore[attr-defined]
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=srv.shutdown).start())
+    n_src = 0 if source is None else len(source)
+    print(f"[virtual_chip] {args.mode} mode, {n_src} source frames, {len(NAMES)} registers, listening on {args.sock}", file=sys.stderr)
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.server_close()
+        os.unlink(args.sock)
+    rep = chip.report()
+    print(json.dumps(rep, indent=2))
+    if args.stats_json:
+        with open(args.stats_json, "w", encoding="utf-8") as f:
+            json.dump(rep, f, indent=2)
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))